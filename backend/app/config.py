@@ -23,6 +23,15 @@ class Settings(BaseSettings):
     ]
     UPLOAD_DIR: str = "uploads"
 
+    # Boards
+    # 게시판 레지스트리 캐시 TTL(초). 같은 프로세스의 변경은 즉시 무효화되고, TTL은 다른 워커의 변경 반영용 (0이면 만료 없음)
+    BOARD_REGISTRY_TTL_SECONDS: float = 300.0
+    # 게시글 조회수 write-behind 버퍼 (조회 요청은 메모리에만 기록하고 주기적으로 일괄 반영, False면 요청마다 즉시 반영)
+    BOARD_VIEW_BUFFER_ENABLED: bool = True
+    BOARD_VIEW_FLUSH_INTERVAL_SECONDS: float = 5.0
+    BOARD_VIEW_BUFFER_MAX_PENDING: int = 10000
+    BOARD_VIEW_DEDUP_CACHE_SIZE: int = 100000
+
     # AI Model Settings
     OPENAI_API_KEY: str = "your_openai_api_key"
     AI_CREDENTIAL_KEY: str = "your_credential_key"
@@ -52,7 +61,31 @@ class Settings(BaseSettings):
     AI_IMAGE_MODEL_NAME: str = ""
     AI_IMAGE_MODEL_PROMPT: str = "이미지를 상세히 한글로 설명해주세요."
     AI_IMAGE_MODEL_MAX_IMAGES: int = 3
+    # [chatbot] 이미지 설명 병렬 생성 동시 호출 수와 이미지당 timeout(초, 대체 스키마 재시도 포함)
+    AI_IMAGE_CAPTION_CONCURRENCY: int = 3
+    AI_IMAGE_CAPTION_TIMEOUT_SECONDS: float = 30.0
     AI_FEATURES_ENABLED: bool = True
+    # AI 요약/Q&A 증분 생성 (이전 결과 + 이후 신규/수정 노트만 전달, N회 증분 후 전체 재생성)
+    AI_INCREMENTAL_SUMMARY_ENABLED: bool = True
+    AI_INCREMENTAL_MAX_UPDATES: int = 4
+    # 차수 일괄 AI 요약/Q&A 생성 작업의 동시 생성 수 (모든 작업이 공유하는 워커 풀 크기)
+    AI_SUMMARY_JOB_CONCURRENCY: int = 4
+    # AI 호출 기본 제한 시간(초)과 SDK 자체 재시도 횟수 (0 이하 제한 시간은 SDK 기본값 사용)
+    AI_CALL_TIMEOUT_SECONDS: float = 120.0
+    AI_CALL_MAX_RETRIES: int = 1
+    # 모델 슬롯별 서킷 브레이커 (연속 실패 N회 시 열고, 재시도 대기 후 시험 호출 1건으로 복구 확인)
+    AI_CIRCUIT_BREAKER_ENABLED: bool = True
+    AI_CIRCUIT_FAILURE_THRESHOLD: int = 3
+    AI_CIRCUIT_RESET_SECONDS: float = 30.0
+    # 응답이 N초 안에 오지 않으면 다른 정상 슬롯에도 같은 요청을 보냄 (0이면 헤지 비활성, 비스트리밍 호출만 적용)
+    AI_HEDGE_AFTER_SECONDS: float = 0.0
+    # 동시에 진행할 수 있는 헤지 요청 수 (첫 요청은 호출 스레드에서 실행하므로 전체 LLM 동시 호출 수와는 무관)
+    AI_HEDGE_MAX_WORKERS: int = 8
+    # [chatbot] RAG/LLM 호출 공유 연결 풀 (호스트별 keep-alive, h2 설치 시 HTTP/2)
+    HTTP_POOL_MAX_CONNECTIONS: int = 100
+    HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_POOL_HTTP2: bool = True
 
     # [chatbot] RAG/챗봇 설정
     CHATBOT_ENABLED: bool = False
@@ -66,6 +99,66 @@ class Settings(BaseSettings):
     RAG_INDEX_NAME: str = "rp-ssp"
     RAG_PERMISSION_GROUP: str = "rag-public"
     RAG_TIMEOUT_SECONDS: float = 10.0
+    # [chatbot] RAG 입력 비동기 큐(outbox) 설정
+    RAG_INGEST_QUEUE_ENABLED: bool = False
+    RAG_INGEST_MAX_ATTEMPTS: int = 5
+    RAG_INGEST_RETRY_BASE_SECONDS: float = 5.0
+    RAG_INGEST_RETRY_MAX_SECONDS: float = 600.0
+    RAG_INGEST_LEASE_SECONDS: float = 300.0
+    RAG_INGEST_POLL_INTERVAL_SECONDS: float = 2.0
+    RAG_INGEST_EMBEDDED_WORKERS: int = 0
+    # [chatbot] 같은 doc_id 이벤트를 모아 마지막 상태만 재색인(윈도우 내 디바운스, 최대 대기 상한)
+    RAG_INGEST_COALESCE_SECONDS: float = 10.0
+    RAG_INGEST_COALESCE_MAX_WAIT_SECONDS: float = 60.0
+    # [chatbot] 본문 해시 기반 요약/엔티티 추출 캐시 (TTL 만료 + 저장 순 상한)
+    RAG_SUMMARY_CACHE_ENABLED: bool = True
+    RAG_SUMMARY_CACHE_TTL_SECONDS: float = 30 * 24 * 3600
+    RAG_SUMMARY_CACHE_MAX_ENTRIES: int = 5000
+    # [chatbot] 이미지 설명 캐시 (로컬 파일 digest/불변 업로드 URL 기준, TTL 0이면 만료 없음)
+    RAG_IMAGE_CAPTION_CACHE_ENABLED: bool = True
+    RAG_IMAGE_CAPTION_CACHE_TTL_SECONDS: float = 0
+    RAG_IMAGE_CAPTION_CACHE_MAX_ENTRIES: int = 20000
+    # [chatbot] 반복 질문 답변 캐시 (정규화 질문 + 권한 그룹 기준, 문서 재동기화 시 해당 그룹 무효화)
+    CHATBOT_ANSWER_CACHE_ENABLED: bool = True
+    CHATBOT_ANSWER_CACHE_TTL_SECONDS: float = 600.0
+    CHATBOT_ANSWER_CACHE_MAX_ENTRIES: int = 2000
+    # [chatbot] 원격 RAG 장애/지연 대비 로컬 하이브리드 검색 인덱스 (fallback: 원격 실패 시만, primary: 항상 로컬)
+    RAG_LOCAL_INDEX_ENABLED: bool = False  # 기본 비활성(opt-in)
+    RAG_LOCAL_INDEX_MODE: str = "fallback"
+    RAG_LOCAL_INDEX_REMOTE_TIMEOUT_SECONDS: float = 0  # 0이면 RAG_TIMEOUT_SECONDS 사용
+    RAG_LOCAL_INDEX_NGRAM_SIZE: int = 2
+    RAG_LOCAL_INDEX_MAX_CHARS: int = 4000  # 문서당 색인할 본문 최대 길이(0이면 전체)
+    RAG_LOCAL_INDEX_RRF_K: int = 60
+    RAG_LOCAL_INDEX_REFRESH_SECONDS: float = 5.0  # 다른 프로세스 입력분을 DB에서 가져오는 주기
+    # [chatbot] 원격 retrieve-rrf 결과 캐시 (정규화 질의 + 권한 그룹 기준, 문서 재동기화 시 해당 그룹 무효화)
+    RAG_RETRIEVE_CACHE_ENABLED: bool = True
+    RAG_RETRIEVE_CACHE_TTL_SECONDS: float = 300.0
+    RAG_RETRIEVE_CACHE_MAX_ENTRIES: int = 2000
+    # [chatbot] RAG 답변 검색 문맥 토큰 예산 (AI_MODEL{n}_CONTEXT_TOKENS가 0이면 공통 예산 사용)
+    RAG_CONTEXT_TOKEN_BUDGET: int = 6000
+    RAG_CONTEXT_TOKENIZER: str = "approx"  # approx / tiktoken[:encoding] / 패키지.모듈:함수
+    AI_MODEL1_CONTEXT_TOKENS: int = 0
+    AI_MODEL2_CONTEXT_TOKENS: int = 0
+    AI_MODEL3_CONTEXT_TOKENS: int = 0
+    AI_MODEL4_CONTEXT_TOKENS: int = 0
+    # [chatbot] 관리자 질문 라우팅 로컬 분류기 (규칙 → 경량 모델 → 확신이 낮을 때만 LLM 라우터)
+    CHATBOT_ROUTE_LOCAL_ENABLED: bool = True
+    CHATBOT_ROUTE_RULE_MIN_CONFIDENCE: float = 0.8
+    CHATBOT_ROUTE_MODEL_ENABLED: bool = True
+    CHATBOT_ROUTE_MODEL_MIN_CONFIDENCE: float = 0.9
+    CHATBOT_ROUTE_MODEL_MIN_SAMPLES: int = 50
+    CHATBOT_ROUTE_MODEL_RETRAIN_EVERY: int = 20
+    CHATBOT_ROUTE_LOG_MAX_ENTRIES: int = 5000
+    # [chatbot] LLM 단계별/RAG 지연·토큰 지표 (프로세스 메모리 집계, 토큰을 지정하면 Prometheus가 Bearer 토큰으로 수집)
+    CHATBOT_METRICS_ENABLED: bool = True
+    CHATBOT_METRICS_TOKEN: str = ""
+    # [chatbot] 관리자 SQL 답변 전용 읽기 전용 실행 (URL을 비우면 기본 DB URL로 별도 엔진 생성, 읽기 복제본 권장)
+    CHATBOT_SQL_DATABASE_URL: str = ""
+    CHATBOT_SQL_TIMEOUT_SECONDS: float = 5.0
+    CHATBOT_SQL_MAX_ROWS: int = 50
+    CHATBOT_SQL_MAX_BYTES: int = 256 * 1024
+    # [chatbot] EXPLAIN 사전 점검: 예상 행 수가 이 값을 넘는 테이블 전체 스캔은 실행하지 않음 (0이면 점검 생략)
+    CHATBOT_SQL_MAX_SCAN_ROWS: int = 100000
 
     def ai_model_base_urls(self) -> Dict[str, str]:
         # [chatbot] 신규 슬롯 우선, 레거시 변수는 비어있지 않을 때만 fallback으로 사용
@@ -4,10 +4,11 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 from app.config import settings
-from app.database import Base, engine
+from app.database import Base, SessionLocal, engine
 from app.utils.schema_sync import sync_missing_schema_objects
+from app.services import chatbot_schema_service
 import app.models  # noqa: F401 - 모델 import로 metadata 등록
 from app.routers import (
     auth, batches, projects, coaching_notes, documents,
@@ -31,6 +32,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],  # 목록 API 전체 건수 / 다음 페이지 커서
 )
 
 # Register all routers
@@ -60,13 +62,38 @@ app.include_router(lectures.router)
 app.include_router(chatbot.router)  # [chatbot] 챗봇 API 라우터 등록
 
 
+def _comment_counter_columns_missing() -> bool:
+    inspector = inspect(engine)
+    for table_name in ("board_post", "coaching_notes"):
+        columns = {str(row.get("name")) for row in inspector.get_columns(table_name)}
+        if "comment_count" not in columns or "last_comment_at" not in columns:
+            return True
+    return False
+
+
+def _backfill_comment_counters():
+    # 댓글 수 비정규화 컬럼이 새로 추가된 경우 기존 댓글 기준으로 한 번 채웁니다.
+    from app.services import comment_counter_service
+
+    db = SessionLocal()
+    try:
+        comment_counter_service.recompute_all(db)
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 def ensure_schema():
     # 신규 기능 배포 시 누락된 테이블을 자동 생성합니다.
     Base.metadata.create_all(bind=engine)
+    backfill_comment_counters = _comment_counter_columns_missing()
     if "sqlite" not in settings.DATABASE_URL:
         # MySQL 포함 non-sqlite DB는 모델 기준으로 누락 컬럼/인덱스를 자동 보정합니다.
-        sync_missing_schema_objects(engine, Base.metadata)
+        if sync_missing_schema_objects(engine, Base.metadata):
+            # [chatbot] 컬럼/인덱스가 보정되면 챗봇 SQL 스키마 가이드 캐시를 다시 만든다.
+            chatbot_schema_service.invalidate(engine)
+        if backfill_comment_counters:
+            _backfill_comment_counters()
         return
     with engine.begin() as conn:
         rows = conn.execute(text("PRAGMA table_info(batch)")).fetchall()
@@ -119,6 +146,10 @@ def ensure_schema():
         ai_content_columns = {str(row[1]) for row in ai_content_rows}
         if "week_number" not in ai_content_columns:
             conn.execute(text("ALTER TABLE ai_generated_content ADD COLUMN week_number INTEGER"))
+        if "generation_mode" not in ai_content_columns:
+            conn.execute(text("ALTER TABLE ai_generated_content ADD COLUMN generation_mode VARCHAR(20)"))
+        if "incremental_count" not in ai_content_columns:
+            conn.execute(text("ALTER TABLE ai_generated_content ADD COLUMN incremental_count INTEGER"))
         # [FEEDBACK7] 게시판 차수 분리 컬럼 자동 보정
         board_post_rows = conn.execute(text("PRAGMA table_info(board_post)")).fetchall()
         board_post_columns = {str(row[1]) for row in board_post_rows}
@@ -127,12 +158,129 @@ def ensure_schema():
         if "is_batch_private" not in board_post_columns:
             conn.execute(text("ALTER TABLE board_post ADD COLUMN is_batch_private BOOLEAN"))
             conn.execute(text("UPDATE board_post SET is_batch_private = 0 WHERE is_batch_private IS NULL"))
+        # 댓글 수/최근 댓글 시각 비정규화 컬럼 자동 보정 (값은 아래 _backfill_comment_counters에서 채움)
+        if "comment_count" not in board_post_columns:
+            conn.execute(text("ALTER TABLE board_post ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0"))
+        if "last_comment_at" not in board_post_columns:
+            conn.execute(text("ALTER TABLE board_post ADD COLUMN last_comment_at DATETIME"))
+        note_rows = conn.execute(text("PRAGMA table_info(coaching_notes)")).fetchall()
+        note_columns = {str(row[1]) for row in note_rows}
+        if "comment_count" not in note_columns:
+            conn.execute(text("ALTER TABLE coaching_notes ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0"))
+        if "last_comment_at" not in note_columns:
+            conn.execute(text("ALTER TABLE coaching_notes ADD COLUMN last_comment_at DATETIME"))
         # [feedback8] 설문 응답 저장/제출 상태 컬럼 자동 보정
         survey_response_rows = conn.execute(text("PRAGMA table_info(survey_response)")).fetchall()
         survey_response_columns = {str(row[1]) for row in survey_response_rows}
         if "summitted" not in survey_response_columns:
             conn.execute(text("ALTER TABLE survey_response ADD COLUMN summitted BOOLEAN"))
             conn.execute(text("UPDATE survey_response SET summitted = 0 WHERE summitted IS NULL"))
+        # [chatbot] RAG 입력 큐 이벤트 병합 카운터 컬럼 자동 보정
+        rag_ingest_rows = conn.execute(text("PRAGMA table_info(rag_ingest_job)")).fetchall()
+        rag_ingest_columns = {str(row[1]) for row in rag_ingest_rows}
+        if "coalesced_count" not in rag_ingest_columns:
+            conn.execute(text("ALTER TABLE rag_ingest_job ADD COLUMN coalesced_count INTEGER NOT NULL DEFAULT 0"))
+        # 목록 keyset 페이지네이션 복합 인덱스 자동 보정 (create_all은 기존 테이블에 인덱스를 추가하지 않음)
+        from app.models.board import BoardPost
+        from app.models.notification import Notification
+
+        for table in (BoardPost.__table__, Notification.__table__):
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+    if backfill_comment_counters:
+        _backfill_comment_counters()
+
+
+@app.on_event("startup")
+def sync_standard_boards():
+    # 표준 게시판 정합화는 기동 시 한 번만 수행하고, 이후 조회는 게시판 레지스트리 캐시를 사용한다.
+    from app.services import board_service
+
+    db = SessionLocal()
+    try:
+        board_service.sync_standard_boards(db)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+def close_interrupted_ai_summary_jobs():
+    # 재시작으로 중단된 차수 AI 일괄 생성 작업이 진행 조회에서 계속 "running"으로 남지 않도록 실패로 닫습니다.
+    from app.services import ai_summary_job_service
+
+    db = SessionLocal()
+    try:
+        ai_summary_job_service.fail_interrupted_jobs(db)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+def warm_chatbot_schema_guide():
+    # [chatbot] SQL 생성/라우팅 프롬프트용 스키마 가이드를 기동 시 한 번만 introspect한다.
+    chatbot_schema_service.warm_up(engine)
+
+
+@app.on_event("startup")
+def warm_local_rag_index():
+    # [chatbot] 로컬 RAG 인덱스를 기동 시 적재해 첫 검색 요청이 전체 문서 적재를 기다리지 않게 한다.
+    from app.services import rag_local_index_service
+
+    if not rag_local_index_service.is_enabled():
+        return
+    db = SessionLocal()
+    try:
+        rag_local_index_service.warm_up(db)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+def start_board_view_flusher():
+    # 게시글 조회수 버퍼를 주기적으로 DB에 일괄 반영합니다.
+    if not settings.BOARD_VIEW_BUFFER_ENABLED:
+        return
+    from app.services import view_counter_service
+
+    view_counter_service.start_flusher(SessionLocal)
+
+
+@app.on_event("shutdown")
+def stop_board_view_flusher():
+    from app.services import view_counter_service
+
+    view_counter_service.stop_flusher(SessionLocal)
+
+
+# [chatbot] RAG 입력 큐 내장 워커 (운영에서는 별도 프로세스 `python -m app.services.rag_ingest_worker` 권장)
+_rag_ingest_pool = None
+
+
+@app.on_event("startup")
+def start_rag_ingest_workers():
+    global _rag_ingest_pool
+    if not settings.RAG_INGEST_QUEUE_ENABLED or int(settings.RAG_INGEST_EMBEDDED_WORKERS) <= 0:
+        return
+    from app.services.rag_ingest_worker import RagIngestWorkerPool
+
+    _rag_ingest_pool = RagIngestWorkerPool(threads=int(settings.RAG_INGEST_EMBEDDED_WORKERS))
+    _rag_ingest_pool.start()
+
+
+@app.on_event("shutdown")
+def stop_rag_ingest_workers():
+    global _rag_ingest_pool
+    if _rag_ingest_pool is not None:
+        _rag_ingest_pool.stop()
+        _rag_ingest_pool = None
+
+
+@app.on_event("shutdown")
+async def close_http_pools():
+    # [chatbot] RAG/LLM 공유 연결 풀을 닫아 keep-alive 연결을 정리한다.
+    from app.services import http_pool
+
+    await http_pool.aclose_all()
 
 
 @app.get("/api/health")
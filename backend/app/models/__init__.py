@@ -13,6 +13,7 @@ from app.models.schedule import ProgramSchedule
 from app.models.board import Board, BoardPost, PostComment, BoardPostView
 from app.models.notification import Notification, NotificationPreference
 from app.models.ai_content import AIGeneratedContent
+from app.models.ai_summary_job import AISummaryJob, AISummaryJobItem
 from app.models.content_version import ContentVersion
 from app.models.coaching_template import CoachingNoteTemplate
 from app.models.site_content import SiteContent
@@ -24,6 +25,9 @@ from app.models.lecture import Lecture, LectureRegistration
 from app.models.coaching_plan import CoachDailyPlan, CoachActualOverride
 from app.models.access_scope import UserBatchAccess, UserProjectAccess
 from app.models.attendance import DailyAttendanceLog
+from app.models.rag_ingest_job import RagIngestJob  # [chatbot] RAG 입력 큐
+from app.models.rag_cache import RagCacheEntry  # [chatbot] RAG 입력 보조 결과 캐시
+from app.models.rag_local_document import RagLocalDocument  # [chatbot] 로컬 하이브리드 검색 인덱스 원본
 
 __all__ = [
     "User", "Coach",
@@ -39,6 +43,7 @@ __all__ = [
     "Board", "BoardPost", "PostComment", "BoardPostView",
     "Notification", "NotificationPreference",
     "AIGeneratedContent",
+    "AISummaryJob", "AISummaryJobItem",
     "ContentVersion",
     "CoachingNoteTemplate",
     "SiteContent",
@@ -49,6 +54,9 @@ __all__ = [
     "CoachDailyPlan", "CoachActualOverride",
     "UserBatchAccess", "UserProjectAccess",
     "DailyAttendanceLog",
+    "RagIngestJob",
+    "RagCacheEntry",
+    "RagLocalDocument",
 ]
 
 
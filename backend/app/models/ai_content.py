@@ -17,6 +17,8 @@ class AIGeneratedContent(Base):
     content = Column(Text, nullable=False)             # JSON or text
     model_used = Column(String(50))
     source_notes = Column(Text)                        # JSON list of note_ids
+    generation_mode = Column(String(20), default="full")  # full/incremental
+    incremental_count = Column(Integer, default=0)     # 마지막 전체 생성 이후 누적 증분 갱신 횟수
     generated_by = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
@@ -0,0 +1,47 @@
+"""차수 단위 AI 요약/Q&A 일괄 생성 작업 SQLAlchemy 모델 정의입니다."""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class AISummaryJob(Base):
+    __tablename__ = "ai_summary_job"
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    batch_id = Column(Integer, nullable=False)
+    week_number = Column(Integer, nullable=True)
+    content_types = Column(String(50), nullable=False)  # comma separated: summary,qa_set
+    force_regenerate = Column(Boolean, default=False)
+    status = Column(String(20), nullable=False, default="pending")  # pending/running/done
+    total_count = Column(Integer, nullable=False, default=0)
+    done_count = Column(Integer, nullable=False, default=0)
+    skipped_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    requested_by = Column(Integer, ForeignKey("users.user_id"), nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_ai_summary_job_batch", "batch_id", "status"),
+    )
+
+
+class AISummaryJobItem(Base):
+    __tablename__ = "ai_summary_job_item"
+
+    item_id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("ai_summary_job.job_id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(Integer, nullable=False)
+    content_type = Column(String(30), nullable=False)  # summary/qa_set
+    status = Column(String(20), nullable=False, default="pending")  # pending/running/done/skipped/failed
+    content_id = Column(Integer)                          # 생성된 ai_generated_content
+    generation_mode = Column(String(20))                  # full/incremental
+    message = Column(Text)                                # 건너뛴 사유 또는 오류
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_ai_summary_job_item_job", "job_id", "project_id"),
+    )
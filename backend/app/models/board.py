@@ -31,6 +31,9 @@ class BoardPost(Base):
     is_batch_private = Column(Boolean, default=False)  # [FEEDBACK7] 해당 차수에게만 공개
     attachments = Column(Text)  # JSON
     view_count = Column(Integer, default=0)
+    # 댓글 수/최근 댓글 시각 비정규화 (댓글 작성·삭제 트랜잭션에서 갱신, scripts/repair_comment_counters.py로 재계산)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_comment_at = Column(DateTime)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
@@ -41,6 +44,10 @@ class BoardPost(Base):
 
     __table_args__ = (
         Index("idx_post_board", "board_id", "created_at"),
+        # keyset 페이지네이션: 게시판별 (created_at desc, post_id desc)
+        # 전체 글은 공지/일반 글을 나눠 is_notice 동등 조건 + post_id 역순으로 읽는다(CASE 정렬 없이 인덱스 사용)
+        Index("idx_post_board_created_id", "board_id", "created_at", "post_id"),
+        Index("idx_post_notice_id", "is_notice", "post_id"),
     )
 
 
@@ -18,6 +18,9 @@ class CoachingNote(Base):
     progress_rate = Column(Integer)
     main_issue = Column(Text)
     next_action = Column(Text)
+    # 공개 댓글 수/최근 공개 댓글 시각 비정규화 (코치 전용 댓글 제외)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_comment_at = Column(DateTime)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
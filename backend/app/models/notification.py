@@ -23,6 +23,8 @@ class Notification(Base):
 
     __table_args__ = (
         Index("idx_notification_user", "user_id", "is_read", "created_at"),
+        # keyset 페이지네이션: (created_at desc, noti_id desc)
+        Index("idx_notification_user_created", "user_id", "created_at", "noti_id"),
     )
 
 
@@ -0,0 +1,21 @@
+"""[chatbot] RAG 입력 보조 결과(요약/엔티티/이미지 설명)와 챗봇 답변 영속 캐시 SQLAlchemy 모델 정의입니다."""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, UniqueConstraint
+from app.database import Base
+
+
+class RagCacheEntry(Base):
+    __tablename__ = "rag_cache_entry"
+
+    entry_id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(30), nullable=False)  # summary/image_caption/answer/route_decision/retrieve
+    cache_key = Column(String(64), nullable=False)  # sha256 hex
+    payload = Column(Text, nullable=False)  # JSON
+    tags = Column(Text)  # 무효화 단위 태그 "|batch-1|rag-public|" (관리자/코치는 전체 batch를 가지므로 길이 제한 없음)
+    created_at = Column(DateTime, nullable=False)  # TTL/상한 정리 기준
+    last_used_at = Column(DateTime, nullable=False)  # 마지막 저장 시각
+
+    __table_args__ = (
+        UniqueConstraint("namespace", "cache_key", name="uq_rag_cache_entry_key"),
+        Index("idx_rag_cache_entry_created", "namespace", "created_at"),
+    )
@@ -0,0 +1,32 @@
+"""[chatbot] RAG 입력 비동기 큐(outbox) SQLAlchemy 모델 정의입니다."""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class RagIngestJob(Base):
+    __tablename__ = "rag_ingest_job"
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    doc_key = Column(String(80), nullable=False)  # board_post:{id}/coaching_note:{id}/project_document:{id}
+    source_type = Column(String(30), nullable=False)
+    source_id = Column(Integer, nullable=False)
+    event_type = Column(String(30), nullable=False)
+    requested_by = Column(String(50))
+    status = Column(String(20), nullable=False, default="pending")  # pending/running/done/dead
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    coalesced_count = Column(Integer, nullable=False, default=0)  # 대기 중 병합된 후속 이벤트 수
+    next_run_at = Column(DateTime, nullable=False)
+    locked_by = Column(String(100))
+    locked_at = Column(DateTime)
+    last_error = Column(Text)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_rag_ingest_job_status_next", "status", "next_run_at"),
+        Index("idx_rag_ingest_job_doc_key", "doc_key", "status"),
+    )
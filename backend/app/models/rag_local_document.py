@@ -0,0 +1,15 @@
+"""[chatbot] 로컬 하이브리드 검색 인덱스의 원본 문서(insert-doc payload) SQLAlchemy 모델 정의입니다."""
+
+from sqlalchemy import Column, String, Text, DateTime, Index
+from app.database import Base
+
+
+class RagLocalDocument(Base):
+    __tablename__ = "rag_local_document"
+
+    doc_id = Column(String(80), primary_key=True)  # board_post:{id}/coaching_note:{id}/project_document:{id}
+    permission_groups = Column(String(500))  # "|rag-public|batch-1|"
+    payload = Column(Text, nullable=False)  # insert-doc data JSON
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (Index("idx_rag_local_document_updated", "updated_at"),)
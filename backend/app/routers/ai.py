@@ -1,7 +1,7 @@
 """AI 기능 API 라우터입니다. 요청을 검증하고 서비스 레이어로 비즈니스 로직을 위임합니다."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from typing import List, Optional
 from app.database import get_db
 from app.schemas.ai_content import (
@@ -9,9 +9,11 @@ from app.schemas.ai_content import (
     AIGenerateRequest,
     AINoteEnhanceRequest,
     AINoteEnhanceResponse,
+    AISummaryJobOut,
+    AISummaryJobRequest,
 )
 from app.services.ai_service import AIService
-from app.services import coaching_service
+from app.services import ai_summary_job_service, coaching_service
 from app.middleware.auth_middleware import get_current_user
 from app.models.user import User
 from app.utils.permissions import is_admin_or_coach
@@ -35,6 +37,7 @@ def generate_summary(
             str(current_user.user_id),
             req.force_regenerate,
             req.week_number,
+            full_rebuild=req.full_rebuild,
         )
     except HTTPException:
         raise
@@ -72,6 +75,7 @@ def generate_qa_set(
             str(current_user.user_id),
             req.force_regenerate,
             req.week_number,
+            full_rebuild=req.full_rebuild,
         )
     except HTTPException:
         raise
@@ -117,3 +121,36 @@ def enhance_coaching_note(
         raise HTTPException(status_code=503, detail=f"AI 서비스 오류: {str(e)}")
 
 
+@router.post("/api/batches/{batch_id}/ai-summary-jobs", response_model=AISummaryJobOut, status_code=202)
+def create_ai_summary_job(
+    batch_id: int,
+    req: AISummaryJobRequest = AISummaryJobRequest(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if not is_admin_or_coach(current_user):
+        raise HTTPException(status_code=403, detail="관리자/코치만 AI 일괄 생성을 실행할 수 있습니다.")
+    job, created = ai_summary_job_service.create_job(
+        db,
+        batch_id=batch_id,
+        requested_by=current_user.user_id,
+        week_number=req.week_number,
+        content_types=req.content_types,
+        force_regenerate=req.force_regenerate,
+    )
+    if created:
+        # 작업 스레드는 요청 세션과 같은 DB에 별도 세션으로 접속한다.
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
+        ai_summary_job_service.start_job(session_factory, job.job_id, str(current_user.user_id))
+    return ai_summary_job_service.get_job(db, job.job_id)
+
+
+@router.get("/api/ai-summary-jobs/{job_id}", response_model=AISummaryJobOut)
+def get_ai_summary_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if not is_admin_or_coach(current_user):
+        raise HTTPException(status_code=403, detail="관리자/코치만 AI 일괄 생성 작업을 조회할 수 있습니다.")
+    return ai_summary_job_service.get_job(db, job_id)
@@ -1,6 +1,6 @@
 """Boards 기능 API 라우터입니다. 요청을 검증하고 서비스 레이어로 비즈니스 로직을 위임합니다."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
@@ -16,8 +16,9 @@ from app.schemas.board import (
 )
 from app.schemas.version import ContentVersionOut
 from app.services import board_service
-from app.middleware.auth_middleware import get_current_user
+from app.middleware.auth_middleware import get_current_user, require_roles
 from app.models.user import User
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/api/boards", tags=["boards"])
 
@@ -27,30 +28,59 @@ def list_boards(db: Session = Depends(get_db), current_user: User = Depends(get_
     return board_service.get_boards(db)
 
 
+@router.post("/sync", response_model=List[BoardOut])
+def sync_boards(db: Session = Depends(get_db), current_user: User = Depends(require_roles("admin"))):
+    # 표준 게시판 정합화(생성/이름 보정/중복 병합)를 다시 실행하고 게시판 레지스트리를 갱신합니다.
+    return board_service.sync_standard_boards(db)
+
+
 @router.get("/{board_id}/posts", response_model=List[BoardPostOut])
 def list_posts(
     board_id: int,
+    response: Response,
     skip: int = 0,
     limit: int = 20,
     # [FEEDBACK7] 게시판 차수 분리 필터
     batch_id: int | None = Query(None, ge=1),
+    after: str | None = Query(None, max_length=200),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return board_service.get_posts(db, board_id, current_user, skip, limit, batch_id=batch_id)
+    # 열람 권한 조건은 페이지 나누기 전에 SQL로 적용되며, 전체 열람 가능 건수는 X-Total-Count로 반환합니다.
+    # after에 직전 응답의 X-Next-Cursor를 넘기면 skip 없이 keyset으로 다음 페이지를 읽습니다.
+    # 전체 건수는 첫 요청(after 없음)에서만 세고, 커서 페이지에서는 COUNT를 생략합니다.
+    if not after:
+        total = board_service.count_posts(db, board_id, current_user, batch_id=batch_id)
+        response.headers["X-Total-Count"] = str(total)
+    posts = board_service.get_posts(db, board_id, current_user, skip, limit, batch_id=batch_id, after=after)
+    next_cursor = board_service.next_posts_cursor(posts, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return posts
 
 
 @router.get("/posts", response_model=List[BoardPostOut])
 def list_all_posts(
+    response: Response,
     skip: int = 0,
     limit: int = 40,
     category: str = None,
     batch_id: int | None = Query(None, ge=1),
     q: str | None = Query(None, max_length=100),
+    after: str | None = Query(None, max_length=200),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return board_service.get_all_posts(db, current_user, skip, limit, category, search_q=q, batch_id=batch_id)
+    if not after:
+        total = board_service.count_all_posts(db, current_user, category, search_q=q, batch_id=batch_id)
+        response.headers["X-Total-Count"] = str(total)
+    posts = board_service.get_all_posts(
+        db, current_user, skip, limit, category, search_q=q, batch_id=batch_id, after=after
+    )
+    next_cursor = board_service.next_all_posts_cursor(posts, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return posts
 
 
 @router.get("/mention-candidates", response_model=List[MentionCandidateOut])
@@ -75,9 +105,10 @@ def create_post(
 
 @router.get("/posts/{post_id}", response_model=BoardPostOut)
 def get_post(post_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    board_service.get_post_with_meta(db, post_id, current_user=current_user)
+    post = board_service.get_post_with_meta(db, post_id, current_user=current_user)
+    # 조회 기록은 write-behind 버퍼로 넘기고, 응답 조회수에는 아직 반영 전인 조회를 더해 보여줍니다.
     board_service.increment_view(db, post_id, current_user.user_id)
-    return board_service.get_post_with_meta(db, post_id, current_user=current_user)
+    return board_service.apply_pending_views(post)
 
 
 @router.put("/posts/{post_id}", response_model=BoardPostOut)
@@ -1,17 +1,44 @@
 """[chatbot] 챗봇 API 라우터입니다."""
 
+import hmac
+import json
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.database import get_db
-from app.middleware.auth_middleware import get_current_user
+from app.database import SessionLocal, get_db
+from app.middleware.auth_middleware import get_current_user, get_optional_user, require_roles
 from app.models.user import User
-from app.schemas.chatbot import ChatbotAskRequest, ChatbotAskResponse, ChatbotConfigResponse
+from app.schemas.chatbot import (
+    ChatbotAskRequest,
+    ChatbotAskResponse,
+    ChatbotCacheStatsOut,
+    ChatbotConfigResponse,
+    ChatbotMetricsOut,
+    ChatbotRouteStatsOut,
+    RagIngestJobOut,
+    RagIngestStatusOut,
+)
+from app.services import chatbot_metrics_service, chatbot_route_service, rag_cache_service, rag_ingest_service
 from app.services.chatbot_service import ChatbotService
 from app.utils.permissions import is_admin
 
 router = APIRouter(prefix="/api/chatbot", tags=["chatbot"])
+logger = logging.getLogger(__name__)
+
+
+def _open_stream_session(bind) -> Session:
+    # 요청 세션과 같은 엔진(테스트의 get_db 오버라이드 포함)에 묶인 스트림 전용 세션
+    return SessionLocal(bind=bind)
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
 
 
 @router.get("/config", response_model=ChatbotConfigResponse)
@@ -36,3 +63,144 @@ def ask_chatbot(
         question=data.question,
         num_result_doc=data.num_result_doc,
     )
+
+
+@router.post("/ask/stream")
+async def ask_chatbot_stream(
+    data: ChatbotAskRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # [chatbot] SSE 스트리밍 질문 API: references → token* → done (실패 시 error) 이벤트 순으로 전송
+    if not settings.CHATBOT_ENABLED and not is_admin(current_user):
+        raise HTTPException(status_code=503, detail="챗봇 기능이 비활성화되어 있습니다.")
+    svc = ChatbotService(db)
+    if not svc._normalize_text(data.question):
+        raise HTTPException(status_code=400, detail="질문을 입력해주세요.")
+    # 권한 그룹 조회(DB)는 스트리밍 시작 전에 끝내 이벤트 루프를 막지 않도록 한다.
+    permission_groups = await run_in_threadpool(svc._permission_groups_for_user, current_user)
+
+    bind = db.get_bind()
+
+    async def _events():
+        # [chatbot] Depends(get_db) 세션은 응답 본문 스트리밍 전에 닫히므로 스트림 전용 세션을 열고 끝나면 닫는다.
+        stream_db = _open_stream_session(bind)
+        try:
+            stream_svc = ChatbotService(stream_db)
+            async for event, payload in stream_svc.stream_answer_with_rag(
+                current_user=current_user,
+                question=data.question,
+                num_result_doc=data.num_result_doc,
+                permission_groups=permission_groups,
+            ):
+                yield _sse_event(event, payload)
+        except HTTPException as exc:
+            yield _sse_event("error", {"status_code": exc.status_code, "detail": exc.detail})
+        except Exception as exc:
+            logger.warning("[chatbot] stream answer failed: %s", exc)
+            yield _sse_event("error", {"status_code": 500, "detail": "답변 생성 중 오류가 발생했습니다."})
+        finally:
+            await run_in_threadpool(stream_db.close)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/ingest/status", response_model=RagIngestStatusOut)
+def get_rag_ingest_status(
+    dead_limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_roles("admin")),
+):
+    # [chatbot] RAG 입력 큐 상태(상태별 건수/가장 오래된 대기 작업/dead-letter 목록)
+    return rag_ingest_service.get_queue_status(db, dead_limit=dead_limit)
+
+
+@router.post("/ingest/jobs/{job_id}/retry", response_model=RagIngestJobOut)
+def retry_rag_ingest_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_roles("admin")),
+):
+    # [chatbot] dead-letter 작업을 다시 대기열로 되돌린다.
+    return rag_ingest_service.retry_job(db, job_id)
+
+
+@router.get("/cache/stats", response_model=ChatbotCacheStatsOut)
+def get_chatbot_cache_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_roles("admin")),
+):
+    # [chatbot] RAG 입력 요약/엔티티, 이미지 설명, 챗봇 답변, 검색 결과 캐시 적중 통계
+    return {
+        "summary": rag_cache_service.get_stats(
+            db,
+            rag_cache_service.NAMESPACE_SUMMARY,
+            enabled=bool(settings.RAG_SUMMARY_CACHE_ENABLED),
+        ),
+        "image_caption": rag_cache_service.get_stats(
+            db,
+            rag_cache_service.NAMESPACE_IMAGE_CAPTION,
+            enabled=bool(settings.RAG_IMAGE_CAPTION_CACHE_ENABLED),
+        ),
+        "answer": rag_cache_service.get_stats(
+            db,
+            rag_cache_service.NAMESPACE_ANSWER,
+            enabled=bool(settings.CHATBOT_ANSWER_CACHE_ENABLED),
+        ),
+        "retrieve": rag_cache_service.get_stats(
+            db,
+            rag_cache_service.NAMESPACE_RETRIEVE,
+            enabled=bool(settings.RAG_RETRIEVE_CACHE_ENABLED),
+        ),
+    }
+
+
+@router.get("/route/stats", response_model=ChatbotRouteStatsOut)
+def get_chatbot_route_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_roles("admin")),
+):
+    # [chatbot] 관리자 질문 라우팅이 규칙/로컬 모델/LLM 중 어디서 결정되었는지 집계
+    return chatbot_route_service.get_stats(db)
+
+
+_metrics_bearer = HTTPBearer(auto_error=False)
+
+
+def _require_metrics_access(
+    credentials: HTTPAuthorizationCredentials | None = Depends(_metrics_bearer),
+    current_user: User | None = Depends(get_optional_user),
+) -> None:
+    # [chatbot] Prometheus 수집기는 CHATBOT_METRICS_TOKEN을 Bearer로 보내고, 그 외에는 관리자 로그인만 허용한다.
+    token = str(settings.CHATBOT_METRICS_TOKEN or "").strip()
+    if token and credentials is not None and hmac.compare_digest(credentials.credentials, token):
+        return
+    if current_user is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not is_admin(current_user):
+        raise HTTPException(status_code=403, detail="Requires role: admin")
+
+
+@router.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(_require_metrics_access)])
+def get_chatbot_metrics_prometheus():
+    # [chatbot] LLM 단계/RAG 입력·검색 지연 히스토그램, 토큰, 오류 수 (Prometheus text format)
+    return PlainTextResponse(
+        chatbot_metrics_service.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@router.get("/metrics/stats", response_model=ChatbotMetricsOut)
+def get_chatbot_metrics_stats(current_user: User = Depends(require_roles("admin"))):
+    # [chatbot] 관리자 화면용 JSON 집계 (총 소요 시간이 큰 단계부터)
+    return chatbot_metrics_service.get_snapshot()
+
+
+@router.post("/metrics/reset", response_model=ChatbotMetricsOut)
+def reset_chatbot_metrics(current_user: User = Depends(require_roles("admin"))):
+    chatbot_metrics_service.reset()
+    return chatbot_metrics_service.get_snapshot()
@@ -1,6 +1,6 @@
 """Notifications 기능 API 라우터입니다. 요청을 검증하고 서비스 레이어로 비즈니스 로직을 위임합니다."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
@@ -12,17 +12,25 @@ from app.schemas.notification import (
 from app.services import notification_service
 from app.middleware.auth_middleware import get_current_user
 from app.models.user import User
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
 
 @router.get("", response_model=List[NotificationOut])
 def list_notifications(
+    response: Response,
     unread_only: bool = False,
+    limit: int = Query(50, ge=1, le=200),
+    after: str | None = Query(None, max_length=200),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return notification_service.get_notifications(db, current_user.user_id, unread_only)
+    rows = notification_service.get_notifications(db, current_user.user_id, unread_only, limit=limit, after=after)
+    next_cursor = notification_service.next_notifications_cursor(rows, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
 
 
 @router.patch("/{noti_id}/read", response_model=NotificationOut)
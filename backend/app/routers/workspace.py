@@ -4,7 +4,7 @@ import re
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Set
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
@@ -17,11 +17,20 @@ from app.models.project import Project
 from app.models.session import CoachingSession
 from app.models.task import ProjectTask
 from app.models.user import User
+from app.utils.pagination import anchor_value, cursor_int, decode_cursor, encode_cursor, keyset_desc, parse_cursor_datetime
 from app.utils.permissions import can_view_batch, can_view_project
 
 router = APIRouter(prefix="/api", tags=["workspace"])
 
 ALLOWED_SEARCH_TYPES = {"project", "note", "document", "board"}
+# 통합 검색 병합 정렬: created_at desc → 유형 순서 → id desc (커서 페이지네이션도 같은 순서를 따른다)
+SEARCH_TYPE_ORDER = {"project": 0, "note": 1, "document": 2, "board": 3}
+SEARCH_TYPE_COLUMNS = {
+    "project": (Project.created_at, Project.project_id),
+    "note": (CoachingNote.created_at, CoachingNote.note_id),
+    "document": (ProjectDocument.created_at, ProjectDocument.doc_id),
+    "board": (BoardPost.created_at, BoardPost.post_id),
+}
 
 
 def _strip_html(text: Optional[str]) -> str:
@@ -37,6 +46,35 @@ def _excerpt(text: Optional[str], limit: int = 160) -> str:
     return plain[: limit - 1].rstrip() + "…"
 
 
+def _decode_search_cursor(token: Optional[str]):
+    if not token:
+        return None
+    item_type, item_id, created_at = decode_cursor("search", token, 3)
+    if item_type not in SEARCH_TYPE_ORDER:
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+    return item_type, cursor_int(item_id), parse_cursor_datetime(created_at)
+
+
+def _search_after_condition(search_type: str, cursor) -> Any:
+    """cursor 항목 다음(병합 정렬 기준)에 오는 search_type 행 조건."""
+    cursor_type, cursor_id, cursor_created = cursor
+    created_col, id_col = SEARCH_TYPE_COLUMNS[search_type]
+    anchor_created_col, anchor_id_col = SEARCH_TYPE_COLUMNS[cursor_type]
+    # 기준 시각은 커서 항목의 테이블에서 다시 읽어 DB 저장 형식끼리 비교한다.
+    anchor = anchor_value(anchor_created_col, anchor_id_col, cursor_id, cursor_created)
+    rank, cursor_rank = SEARCH_TYPE_ORDER[search_type], SEARCH_TYPE_ORDER[cursor_type]
+    if rank == cursor_rank:
+        return keyset_desc(created_col, id_col, anchor, cursor_id)
+    if rank > cursor_rank:
+        return created_col <= anchor
+    return created_col < anchor
+
+
+def _search_cursor(item: Dict[str, Any]) -> str:
+    created_at = item.get("created_at")
+    return encode_cursor("search", [item["type"], int(item["id"]), created_at.isoformat() if created_at else None])
+
+
 def _parse_types(raw: Optional[str]) -> Set[str]:
     if not raw:
         return set(ALLOWED_SEARCH_TYPES)
@@ -199,21 +237,23 @@ def search_workspace(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     limit: int = Query(40, ge=1, le=200),
+    after: Optional[str] = Query(None, max_length=300, description="직전 응답의 next_cursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     keyword = (q or "").strip()
     if len(keyword) < 2:
-        return {"query": keyword, "count": 0, "results": []}
+        return {"query": keyword, "count": 0, "results": [], "next_cursor": None}
 
     search_types = _parse_types(types)
+    cursor = _decode_search_cursor(after)
     like = f"%{keyword}%"
     results: List[Dict[str, Any]] = []
 
     project_scope_q = db.query(Project)
     if batch_id:
         if not can_view_batch(db, batch_id, current_user):
-            return {"query": keyword, "count": 0, "results": []}
+            return {"query": keyword, "count": 0, "results": [], "next_cursor": None}
         project_scope_q = project_scope_q.filter(Project.batch_id == batch_id)
     visible_project_ids = [
         p.project_id
@@ -238,7 +278,9 @@ def search_workspace(
                 Project.category.ilike(like),
             )
         )
-        for p in projects_q.order_by(Project.created_at.desc()).limit(limit).all():
+        if cursor:
+            projects_q = projects_q.filter(_search_after_condition("project", cursor))
+        for p in projects_q.order_by(Project.created_at.desc(), Project.project_id.desc()).limit(limit).all():
             results.append(
                 {
                     "type": "project",
@@ -273,7 +315,10 @@ def search_workspace(
                 CoachingNote.next_action.ilike(like),
             )
         )
-        for note, project, author in notes_q.order_by(CoachingNote.created_at.desc()).limit(limit).all():
+        if cursor:
+            notes_q = notes_q.filter(_search_after_condition("note", cursor))
+        notes_q = notes_q.order_by(CoachingNote.created_at.desc(), CoachingNote.note_id.desc())
+        for note, project, author in notes_q.limit(limit).all():
             merged = " ".join(
                 filter(None, [note.current_status or "", note.main_issue or "", note.next_action or ""])
             )
@@ -312,7 +357,10 @@ def search_workspace(
                 ProjectDocument.content.ilike(like),
             )
         )
-        for doc, project, author in docs_q.order_by(ProjectDocument.created_at.desc()).limit(limit).all():
+        if cursor:
+            docs_q = docs_q.filter(_search_after_condition("document", cursor))
+        docs_q = docs_q.order_by(ProjectDocument.created_at.desc(), ProjectDocument.doc_id.desc())
+        for doc, project, author in docs_q.limit(limit).all():
             results.append(
                 {
                     "type": "document",
@@ -342,7 +390,9 @@ def search_workspace(
                 BoardPost.content.ilike(like),
             )
         )
-        for post, author in posts_q.order_by(BoardPost.created_at.desc()).limit(limit).all():
+        if cursor:
+            posts_q = posts_q.filter(_search_after_condition("board", cursor))
+        for post, author in posts_q.order_by(BoardPost.created_at.desc(), BoardPost.post_id.desc()).limit(limit).all():
             results.append(
                 {
                     "type": "board",
@@ -356,13 +406,16 @@ def search_workspace(
                 }
             )
 
-    def _sort_key(item: Dict[str, Any]) -> datetime:
+    def _sort_key(item: Dict[str, Any]):
         value = item.get("created_at")
         if isinstance(value, datetime):
-            return value
-        if isinstance(value, date):
-            return datetime.combine(value, datetime.min.time())
-        return datetime.min
+            created = value
+        elif isinstance(value, date):
+            created = datetime.combine(value, datetime.min.time())
+        else:
+            created = datetime.min
+        # reverse 정렬이므로 유형 순서는 음수로 넣어 오름차순이 되게 한다.
+        return created, -SEARCH_TYPE_ORDER[item["type"]], item["id"]
 
     results.sort(key=_sort_key, reverse=True)
     clipped = results[:limit]
@@ -370,4 +423,5 @@ def search_workspace(
         "query": keyword,
         "count": len(clipped),
         "results": clipped,
+        "next_cursor": _search_cursor(clipped[-1]) if len(clipped) == limit else None,
     }
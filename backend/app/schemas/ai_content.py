@@ -1,7 +1,7 @@
 """AI Content 요청/응답 계약을 위한 Pydantic 스키마입니다."""
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -14,6 +14,8 @@ class AIContentOut(BaseModel):
     content: str
     model_used: Optional[str]
     source_notes: Optional[str]
+    generation_mode: Optional[str] = None
+    incremental_count: Optional[int] = None
     generated_by: int
     created_at: datetime
     updated_at: Optional[datetime]
@@ -25,6 +27,8 @@ class AIContentOut(BaseModel):
 class AIGenerateRequest(BaseModel):
     force_regenerate: bool = False
     week_number: Optional[int] = None
+    # 증분 갱신 대신 전체 코칭노트로 다시 생성
+    full_rebuild: bool = False
 
 
 class AINoteEnhanceRequest(BaseModel):
@@ -43,3 +47,39 @@ class AINoteEnhanceResponse(BaseModel):
     model_config = {"protected_namespaces": ()}
 
 
+class AISummaryJobRequest(BaseModel):
+    week_number: Optional[int] = None
+    content_types: List[str] = ["summary", "qa_set"]
+    # 변경된 코칭노트가 없는 과제도 다시 생성
+    force_regenerate: bool = False
+
+
+class AISummaryJobItemOut(BaseModel):
+    item_id: int
+    project_id: int
+    project_name: Optional[str] = None
+    content_type: str
+    status: str
+    content_id: Optional[int] = None
+    generation_mode: Optional[str] = None
+    message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class AISummaryJobOut(BaseModel):
+    job_id: int
+    batch_id: int
+    week_number: Optional[int] = None
+    content_types: List[str]
+    force_regenerate: bool
+    status: str
+    total_count: int
+    done_count: int
+    skipped_count: int
+    failed_count: int
+    progress_rate: int
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    items: List[AISummaryJobItemOut] = []
@@ -48,6 +48,7 @@ class BoardPostOut(BoardPostBase):
     board_type: Optional[str] = None
     author_name: Optional[str] = None
     comment_count: Optional[int] = None
+    last_comment_at: Optional[datetime] = None
     post_no: Optional[int] = None
 
     model_config = {"from_attributes": True}
@@ -1,6 +1,7 @@
 """[chatbot] 챗봇 API 스키마입니다."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,3 +27,122 @@ class ChatbotAskResponse(BaseModel):
 
 class ChatbotConfigResponse(BaseModel):
     enabled: bool
+
+
+class RagIngestJobOut(BaseModel):
+    # [chatbot] RAG 입력 큐 작업 조회 응답
+    job_id: int
+    doc_key: str
+    source_type: str
+    source_id: int
+    event_type: str
+    requested_by: Optional[str] = None
+    status: str
+    attempts: int
+    max_attempts: int
+    coalesced_count: int = 0
+    next_run_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class RagIngestStatusOut(BaseModel):
+    queue_enabled: bool
+    counts: Dict[str, int] = Field(default_factory=dict)
+    coalesced_events: int = 0
+    oldest_pending_at: Optional[datetime] = None
+    dead_jobs: List[RagIngestJobOut] = Field(default_factory=list)
+
+
+class RagCacheStatsOut(BaseModel):
+    # [chatbot] 캐시 적중 통계 (hits/misses/stores/evictions는 프로세스 기동 이후 누적)
+    enabled: bool
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    hit_ratio: float = 0.0
+
+
+class ChatbotCacheStatsOut(BaseModel):
+    summary: RagCacheStatsOut
+    image_caption: RagCacheStatsOut  # hits = 절감된 이미지 인식 모델 호출 수
+    answer: RagCacheStatsOut  # hits = LLM 없이 응답한 반복 질문 수
+    retrieve: RagCacheStatsOut  # hits = 생략한 원격 retrieve-rrf 호출 수
+
+
+class ChatbotLatencyStatsOut(BaseModel):
+    count: int = 0
+    errors: int = 0
+    avg_ms: float = 0.0
+    p50_ms: float = 0.0  # 히스토그램 구간 보간 추정치
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    total_seconds: float = 0.0
+
+
+class ChatbotLlmStageStatsOut(ChatbotLatencyStatsOut):
+    stage: str  # rag_answer/rag_answer_stream/route_decision/sql_generation/...
+    slot: str  # model1~model4, image
+    model: str
+    prompt_tokens: int = 0  # 근사 토큰 수(system + user)
+    completion_tokens: int = 0
+    first_token_p50_ms: Optional[float] = None  # 스트리밍 단계만
+
+
+class ChatbotRagOpStatsOut(ChatbotLatencyStatsOut):
+    operation: str  # insert/retrieve
+    source: str  # remote/local/cache
+
+
+class AISlotHealthOut(BaseModel):
+    slot: str
+    state: str  # closed/open/half_open
+    consecutive_failures: int = 0
+    successes: int = 0
+    failures: int = 0
+    short_circuits: int = 0  # 회로가 열려 건너뛴 호출 수
+    hedges: int = 0  # 이 슬롯으로 보낸 헤지 요청 수
+    hedge_wins: int = 0
+    ewma_ms: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class ChatbotContextStatsOut(BaseModel):
+    # [chatbot] RAG 답변 프롬프트 크기 (근사 토큰 수)
+    requests: int = 0
+    prompt_tokens_total: int = 0
+    prompt_tokens_max: int = 0
+    prompt_tokens_avg: float = 0.0
+    context_tokens_total: int = 0
+    truncated: int = 0  # 토큰 예산 때문에 검색 문맥을 잘라낸 요청 수
+
+
+class ChatbotMetricsOut(BaseModel):
+    # [chatbot] LLM/RAG 단계별 지연 시간 (프로세스 기동 또는 초기화 이후 누적, 총 소요 시간 순)
+    enabled: bool
+    started_at: datetime
+    llm: list[ChatbotLlmStageStatsOut]
+    rag: list[ChatbotRagOpStatsOut]
+    slots: list[AISlotHealthOut] = []  # 모델 슬롯 서킷 브레이커 상태 (지표 초기화와 무관)
+    context: ChatbotContextStatsOut = Field(default_factory=ChatbotContextStatsOut)
+
+
+class ChatbotRouteStatsOut(BaseModel):
+    # [chatbot] 관리자 질문 라우팅 단계별 결정 건수 (프로세스 기동 이후 누적)
+    model_config = {"protected_namespaces": ()}
+
+    local_enabled: bool
+    model_enabled: bool
+    decisions: int = 0
+    tiers: dict[str, int]  # rule/model/llm
+    routes: dict[str, int]  # sql/rag
+    local_ratio: float = 0.0  # LLM 라우터 호출 없이 결정한 비율
+    logged_samples: int = 0  # 로컬 모델 학습용 LLM 라우팅 로그 수
+    model_trained_samples: int = 0
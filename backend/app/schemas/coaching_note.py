@@ -31,6 +31,8 @@ class CoachingNoteOut(CoachingNoteBase):
     note_id: int
     project_id: int
     author_id: int
+    comment_count: int = 0
+    last_comment_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime]
 
@@ -1,17 +1,111 @@
 """AI Client 도메인 서비스 레이어입니다. 비즈니스 규칙과 데이터 접근 흐름을 캡슐화합니다."""
 
+import logging
+import threading
+import time
 import uuid
-from typing import Optional, List, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, AsyncIterator, Set
 from app.config import settings
+from app.services import ai_slot_health_service, http_pool
+
+logger = logging.getLogger(__name__)
+
+# 헤지(지연 시 다른 슬롯으로 보내는 중복 요청) 전용 스레드 풀. 첫 요청은 호출 스레드에서 실행한다.
+_HEDGE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_HEDGE_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _HEDGE_EXECUTOR
+    with _HEDGE_EXECUTOR_LOCK:
+        if _HEDGE_EXECUTOR is None:
+            workers = max(1, int(getattr(settings, "AI_HEDGE_MAX_WORKERS", 8) or 1))
+            _HEDGE_EXECUTOR = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-hedge")
+        return _HEDGE_EXECUTOR
+
+
+class _HedgeLost(Exception):
+    """헤지 경쟁에서 다른 요청이 먼저 성공해 이 요청을 중단했다."""
+
+
+class _HedgeRace:
+    """첫 요청과 헤지 요청 중 먼저 성공한 쪽을 정하고, 진 쪽 스트림을 닫는다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.winner: Optional[str] = None
+        self.result = ""
+        self.hedge: Optional[Future] = None
+        self._streams: Dict[str, Any] = {}
+
+    def lost(self, role: str) -> bool:
+        return self.winner is not None and self.winner != role
+
+    def attach(self, role: str, stream: Any) -> bool:
+        with self.lock:
+            if self.lost(role):
+                return False
+            self._streams[role] = stream
+            return True
+
+    def finish(self, role: str, text: str) -> bool:
+        with self.lock:
+            if self.winner is not None:
+                return self.winner == role
+            self.winner = role
+            self.result = text
+            losers = [stream for key, stream in self._streams.items() if key != role]
+            self._streams.clear()
+        for stream in losers:
+            try:
+                stream.close()
+            except Exception as exc:
+                logger.debug("hedge loser stream close failed: %s", exc)
+        return True
+
+
+MODEL_SLOTS = ("model1", "model2", "model3", "model4")
+
+
+def resolve_slot(model_name: str) -> str:
+    """모델 이름을 model1~model4 슬롯으로 해석한다(클라이언트 생성 없이 설정만 사용)."""
+    key = (model_name or "").strip().lower()
+    if key in MODEL_SLOTS:
+        return key
+    configured = settings.ai_model_names()
+    for slot in MODEL_SLOTS:
+        normalized_name = str(configured.get(slot) or slot).strip().lower()
+        if key and key == normalized_name:
+            return slot
+    for slot in MODEL_SLOTS:
+        if key.startswith(f"{slot}/") or key.endswith(f"/{slot}"):
+            return slot
+    if "qwen" in key:
+        return "model1"
+    if "gemma" in key:
+        return "model2"
+    if "deepseek" in key:
+        return "model3"
+    if "gpt-oss" in key or "gpt_oss" in key:
+        return "model4"
+    return "model1"
 
 
 class AIClient:
     """생성형 AI 모델 클라이언트 (OpenAI 호환 API 직접 호출)"""
 
-    def __init__(self, model_name: Optional[str] = None, user_id: Optional[str] = None):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        user_id: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+    ):
         self.model_name = model_name or settings.AI_DEFAULT_MODEL
         self.user_id = user_id or "system"
+        self.timeout_seconds = timeout_seconds
         self._clients = {}
+        self._async_clients = {}
 
     def _model_urls(self) -> Dict[str, str]:
         urls = settings.ai_model_base_urls()
@@ -32,31 +126,7 @@ class AIClient:
         }
 
     def _resolve_slot(self, model_name: str) -> str:
-        key = (model_name or "").strip().lower()
-        urls = self._model_urls()
-        names = {slot: str(name).strip().lower() for slot, name in self._model_names().items()}
-        if key in urls:
-            return key
-        for slot, normalized_name in names.items():
-            if key and key == normalized_name:
-                return slot
-        if key.startswith("model1/") or key.endswith("/model1"):
-            return "model1"
-        if key.startswith("model2/") or key.endswith("/model2"):
-            return "model2"
-        if key.startswith("model3/") or key.endswith("/model3"):
-            return "model3"
-        if key.startswith("model4/") or key.endswith("/model4"):
-            return "model4"
-        if "qwen" in key:
-            return "model1"
-        if "gemma" in key:
-            return "model2"
-        if "deepseek" in key:
-            return "model3"
-        if "gpt-oss" in key or "gpt_oss" in key:
-            return "model4"
-        return "model1"
+        return resolve_slot(model_name)
 
     def _resolve_base_url(self, model_name: str) -> str:
         urls = self._model_urls()
@@ -91,9 +161,50 @@ class AIClient:
                 api_key=settings.OPENAI_API_KEY,
                 base_url=base_url,
                 default_headers=self._build_headers(),
+                http_client=http_pool.get_client(base_url),
+                max_retries=self._max_retries(),
             )
         return self._clients[base_url]
 
+    def _get_async_client(self, model_name: Optional[str] = None):
+        base_url = self._resolve_base_url(model_name or self.model_name)
+        if base_url not in self._async_clients:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                raise RuntimeError("openai is not installed.")
+            self._async_clients[base_url] = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=base_url,
+                default_headers=self._build_headers(),
+                http_client=http_pool.get_async_client(base_url),
+                max_retries=self._max_retries(),
+            )
+        return self._async_clients[base_url]
+
+    def _build_messages(self, prompt: str, system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _candidate_models(self) -> List[str]:
+        fallback_models = [
+            settings.AI_DEFAULT_MODEL,
+            settings.AI_QA_MODEL,
+            "model1",
+        ]
+        return [self.model_name] + [m for m in fallback_models if m and m != self.model_name]
+
+    @staticmethod
+    def _is_invalid_model_error(text: str) -> bool:
+        return (
+            "does not exist" in text
+            or '"code":404' in text
+            or "NotFoundError" in text
+        )
+
     def _normalize_content(self, content: Any) -> str:
         if isinstance(content, str):
             return content
@@ -105,47 +216,257 @@ class AIClient:
             return "".join(chunks)
         return str(content or "")
 
-    def invoke(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        fallback_models = [
-            settings.AI_DEFAULT_MODEL,
-            settings.AI_QA_MODEL,
-            "model1",
-        ]
-        tried = []
-        candidates = [self.model_name] + [m for m in fallback_models if m and m != self.model_name]
+    @staticmethod
+    def _max_retries() -> int:
+        # SDK 자체 재시도는 같은 슬롯에 반복되므로 작게 두고, 장애 슬롯은 다음 후보 슬롯으로 넘긴다.
+        return max(0, int(getattr(settings, "AI_CALL_MAX_RETRIES", 1) or 0))
+
+    def _call_timeout(self, timeout: Optional[float] = None) -> Optional[float]:
+        # 우선순위: 호출 인자 > 클라이언트 생성 인자 > AI_CALL_TIMEOUT_SECONDS (0 이하면 SDK 기본값 사용)
+        for value in (timeout, self.timeout_seconds, getattr(settings, "AI_CALL_TIMEOUT_SECONDS", 0)):
+            if value is not None:
+                return float(value) if float(value) > 0 else None
+        return None
+
+    def _record_failure(self, slot: str, exc: BaseException) -> bool:
+        """슬롯 장애로 기록했으면 True. 존재하지 않는 모델 오류는 슬롯 상태와 무관하므로 기록하지 않는다."""
+        text = str(exc)
+        if self._is_invalid_model_error(text):
+            ai_slot_health_service.release(slot)
+            return False
+        ai_slot_health_service.record_failure(slot, text)
+        return True
+
+    def _invoke_once(self, candidate: str, messages: List[Dict[str, str]], timeout: Optional[float]) -> str:
+        slot = self._resolve_slot(candidate)
+        started = time.monotonic()
+        options: Dict[str, Any] = {"timeout": timeout} if timeout else {}
+        try:
+            client = self._get_client(candidate)
+            response = client.chat.completions.create(
+                model=self._resolve_api_model(candidate),
+                messages=messages,
+                temperature=0.7,
+                max_tokens=2048,
+                extra_headers=self._build_headers(),
+                **options,
+            )
+        except Exception as exc:
+            self._record_failure(slot, exc)
+            raise
+        ai_slot_health_service.record_success(slot, time.monotonic() - started)
+        if not response.choices:
+            return ""
+        message = response.choices[0].message
+        return self._normalize_content(message.content if message else "")
+
+    def _invoke_racing(
+        self,
+        candidate: str,
+        messages: List[Dict[str, str]],
+        timeout: Optional[float],
+        race: _HedgeRace,
+        role: str,
+    ) -> str:
+        """헤지 경쟁 중인 호출. 진 쪽을 바로 끊을 수 있도록 스트리밍으로 받고, 조각마다 승패를 확인한다."""
+        slot = self._resolve_slot(candidate)
+        started = time.monotonic()
+        options: Dict[str, Any] = {"timeout": timeout} if timeout else {}
+        chunks: List[str] = []
+        try:
+            client = self._get_client(candidate)
+            stream = client.chat.completions.create(
+                model=self._resolve_api_model(candidate),
+                messages=messages,
+                temperature=0.7,
+                max_tokens=2048,
+                extra_headers=self._build_headers(),
+                stream=True,
+                **options,
+            )
+            if not race.attach(role, stream):
+                stream.close()
+                raise _HedgeLost()
+            for chunk in stream:
+                if race.lost(role):
+                    stream.close()
+                    raise _HedgeLost()
+                if not getattr(chunk, "choices", None):
+                    continue
+                delta = getattr(chunk.choices[0], "delta", None)
+                chunks.append(self._normalize_content(getattr(delta, "content", None) or ""))
+        except Exception as exc:
+            # 상대가 이겨서 닫힌 스트림의 오류는 슬롯 장애가 아니다.
+            if isinstance(exc, _HedgeLost) or race.lost(role):
+                ai_slot_health_service.release(slot)
+                raise _HedgeLost() from exc
+            self._record_failure(slot, exc)
+            raise
+        ai_slot_health_service.record_success(slot, time.monotonic() - started)
+        if not race.finish(role, "".join(chunks)):
+            raise _HedgeLost()
+        return race.result
+
+    def _hedge_candidate(self, primary: str, remaining: List[str], excluded_slots: Set[str]) -> Optional[str]:
+        if float(getattr(settings, "AI_HEDGE_AFTER_SECONDS", 0) or 0) <= 0:
+            return None
+        primary_url = self._resolve_base_url(primary)
+        for candidate in remaining:
+            slot = self._resolve_slot(candidate)
+            if slot in excluded_slots or self._resolve_base_url(candidate) == primary_url:
+                continue
+            if ai_slot_health_service.is_available(slot):
+                return candidate
+        return None
+
+    def _invoke_hedged(
+        self,
+        primary: str,
+        secondary: str,
+        messages: List[Dict[str, str]],
+        timeout: Optional[float],
+        tried: List[str],
+        failed_slots: Set[str],
+    ) -> str:
+        """primary는 호출 스레드에서 실행하고, AI_HEDGE_AFTER_SECONDS 안에 끝나지 않으면 secondary 슬롯 요청만 헤지 풀에 보낸다.
+
+        먼저 성공한 응답을 쓰고 진 쪽 스트림은 닫는다.
+        """
+        race = _HedgeRace()
+        hedge_slot = self._resolve_slot(secondary)
+
+        def _launch_hedge() -> None:
+            with race.lock:
+                if race.winner is not None or not ai_slot_health_service.acquire(hedge_slot):
+                    return
+                tried.append(secondary)
+                race.hedge = _get_hedge_executor().submit(
+                    self._invoke_racing, secondary, messages, timeout, race, "hedge"
+                )
+
+        timer = threading.Timer(float(settings.AI_HEDGE_AFTER_SECONDS), _launch_hedge)
+        timer.daemon = True
+        timer.start()
+        try:
+            text = self._invoke_racing(primary, messages, timeout, race, "primary")
+        except _HedgeLost:
+            ai_slot_health_service.record_hedge(hedge_slot, won=True)
+            return race.result
+        except Exception as primary_exc:
+            timer.cancel()
+            timer.join()
+            if race.hedge is None:
+                raise
+            try:
+                text = race.hedge.result()
+            except Exception as hedge_exc:
+                ai_slot_health_service.record_hedge(hedge_slot, won=False)
+                if not self._is_invalid_model_error(str(hedge_exc)):
+                    failed_slots.add(hedge_slot)
+                raise primary_exc
+            ai_slot_health_service.record_hedge(hedge_slot, won=True)
+            return text
+        timer.cancel()
+        # race.finish 이후에는 헤지가 새로 시작되지 않으므로 race.hedge 값이 확정되어 있다.
+        if race.hedge is not None:
+            ai_slot_health_service.record_hedge(hedge_slot, won=False)
+        return text
+
+    def invoke(self, prompt: str, system_prompt: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        """후보 모델을 순서대로 호출한다. 회로가 열린 슬롯은 건너뛰고, 장애 슬롯은 다음 후보의 다른 슬롯으로 넘긴다."""
+        messages = self._build_messages(prompt, system_prompt)
+        call_timeout = self._call_timeout(timeout)
+        tried: List[str] = []
+        failed_slots: Set[str] = set()
+        last_exc: Optional[Exception] = None
+        candidates = self._candidate_models()
+
+        for idx, candidate in enumerate(candidates):
+            slot = self._resolve_slot(candidate)
+            if slot in failed_slots or not ai_slot_health_service.acquire(slot):
+                continue
+            tried.append(candidate)
+            hedge = self._hedge_candidate(candidate, candidates[idx + 1:], failed_slots | {slot})
+            try:
+                if hedge:
+                    return self._invoke_hedged(candidate, hedge, messages, call_timeout, tried, failed_slots)
+                return self._invoke_once(candidate, messages, call_timeout)
+            except Exception as exc:
+                last_exc = exc
+                if not self._is_invalid_model_error(str(exc)):
+                    failed_slots.add(slot)
+        if last_exc is None:
+            raise RuntimeError(
+                f"AI 모델 호출 실패(시도 모델: {', '.join(candidates)}): 모든 모델 슬롯의 서킷 브레이커가 열려 있습니다."
+            )
+        raise RuntimeError(f"AI 모델 호출 실패(시도 모델: {', '.join(tried)}): {last_exc}") from last_exc
+
+    async def astream(
+        self, prompt: str, system_prompt: Optional[str] = None, timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """[chatbot] 비동기 스트리밍 호출. 응답 토큰(delta)을 도착하는 대로 반환합니다."""
+        messages = self._build_messages(prompt, system_prompt)
+        call_timeout = self._call_timeout(timeout)
+        options: Dict[str, Any] = {"timeout": call_timeout} if call_timeout else {}
+        tried: List[str] = []
+        failed_slots: Set[str] = set()
+        last_exc: Optional[Exception] = None
+        candidates = self._candidate_models()
 
         for candidate in candidates:
+            slot = self._resolve_slot(candidate)
+            if slot in failed_slots or not ai_slot_health_service.acquire(slot):
+                continue
             tried.append(candidate)
+            emitted = False
+            settled = False
+            started = time.monotonic()
             try:
-                client = self._get_client(candidate)
-                response = client.chat.completions.create(
+                client = self._get_async_client(candidate)
+                stream = await client.chat.completions.create(
                     model=self._resolve_api_model(candidate),
                     messages=messages,
                     temperature=0.7,
                     max_tokens=2048,
                     extra_headers=self._build_headers(),
+                    stream=True,
+                    **options,
                 )
-                if not response.choices:
-                    return ""
-                message = response.choices[0].message
-                return self._normalize_content(message.content if message else "")
+                async for chunk in stream:
+                    if not getattr(chunk, "choices", None):
+                        continue
+                    delta = getattr(chunk.choices[0], "delta", None)
+                    piece = self._normalize_content(getattr(delta, "content", None) or "")
+                    if piece:
+                        if not emitted:
+                            # 스트리밍은 첫 토큰까지의 시간을 슬롯 응답 시간으로 본다.
+                            ai_slot_health_service.record_success(slot, time.monotonic() - started)
+                            settled = True
+                        emitted = True
+                        yield piece
+                if not settled:
+                    ai_slot_health_service.record_success(slot, time.monotonic() - started)
+                    settled = True
+                return
             except Exception as exc:
-                text = str(exc)
-                invalid_model_error = (
-                    "does not exist" in text
-                    or '"code":404' in text
-                    or "NotFoundError" in text
-                )
-                if invalid_model_error and candidate != candidates[-1]:
-                    continue
-                raise RuntimeError(
-                    f"AI 모델 호출 실패(시도 모델: {', '.join(tried)}): {text}"
-                ) from exc
-        return ""
+                settled = True
+                if self._record_failure(slot, exc):
+                    failed_slots.add(slot)
+                # 토큰을 이미 내보낸 뒤에는 다른 모델로 이어 쓸 수 없으므로 모델 폴백은 첫 토큰 전까지만 허용한다.
+                if emitted:
+                    raise RuntimeError(
+                        f"AI 모델 호출 실패(시도 모델: {', '.join(tried)}): {exc}"
+                    ) from exc
+                last_exc = exc
+            finally:
+                # 첫 토큰 전에 소비자가 스트림을 닫으면 시험 호출 자리만 풀어준다.
+                if not settled:
+                    ai_slot_health_service.release(slot)
+        if last_exc is None:
+            raise RuntimeError(
+                f"AI 모델 호출 실패(시도 모델: {', '.join(candidates)}): 모든 모델 슬롯의 서킷 브레이커가 열려 있습니다."
+            )
+        raise RuntimeError(f"AI 모델 호출 실패(시도 모델: {', '.join(tried)}): {last_exc}") from last_exc
 
     @classmethod
     def get_client(cls, purpose: str, user_id: Optional[str] = None) -> "AIClient":
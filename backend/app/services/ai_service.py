@@ -2,7 +2,7 @@
 
 import json
 import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from fastapi import HTTPException
@@ -31,11 +31,85 @@ class AIService:
         if rec:
             return {"content_id": rec.content_id, "content": rec.content,
                     "title": rec.title, "model_used": rec.model_used, "week_number": rec.week_number,
-                    "created_at": rec.created_at}
+                    "generation_mode": rec.generation_mode, "created_at": rec.created_at}
         return None
 
+    def _load_notes(self, project_id: int, week_number: Optional[int] = None) -> List[CoachingNote]:
+        query = self.db.query(CoachingNote).filter(CoachingNote.project_id == project_id)
+        if week_number is not None:
+            query = query.filter(CoachingNote.week_number == week_number)
+        return query.order_by(CoachingNote.coaching_date).all()
+
+    def _get_active_record(self, project_id: int, content_type: str, week_number: Optional[int] = None) -> Optional[AIGeneratedContent]:
+        # _save의 비활성화 범위와 같게 week_number가 None이면 전체(주차 미지정) 레코드만 찾는다.
+        conds = [
+            AIGeneratedContent.project_id == project_id,
+            AIGeneratedContent.content_type == content_type,
+            AIGeneratedContent.is_active == True,
+        ]
+        if week_number is None:
+            conds.append(AIGeneratedContent.week_number.is_(None))
+        else:
+            conds.append(AIGeneratedContent.week_number == week_number)
+        return (
+            self.db.query(AIGeneratedContent)
+            .filter(and_(*conds))
+            .order_by(AIGeneratedContent.created_at.desc(), AIGeneratedContent.content_id.desc())
+            .first()
+        )
+
+    def _source_note_ids(self, rec: AIGeneratedContent) -> Set[int]:
+        try:
+            return {int(note_id) for note_id in json.loads(rec.source_notes or "[]")}
+        except (TypeError, ValueError):
+            return set()
+
+    def _plan_incremental(
+        self,
+        project_id: int,
+        content_type: str,
+        notes: List[CoachingNote],
+        week_number: Optional[int] = None,
+        full_rebuild: bool = False,
+    ) -> Tuple[Optional[AIGeneratedContent], List[CoachingNote]]:
+        """증분 갱신 기준이 될 이전 결과와, 그 이후 새로 작성/수정된 노트를 반환한다.
+
+        이전 결과가 없거나, 증분 횟수가 상한에 도달했거나, 원본 노트가 삭제된 경우에는
+        (None, 전체 노트)를 반환해 전체 재생성하도록 한다.
+        """
+        if full_rebuild or not settings.AI_INCREMENTAL_SUMMARY_ENABLED:
+            return None, notes
+        previous = self._get_active_record(project_id, content_type, week_number=week_number)
+        if previous is None or int(previous.incremental_count or 0) >= int(settings.AI_INCREMENTAL_MAX_UPDATES):
+            return None, notes
+        source_ids = self._source_note_ids(previous)
+        if not source_ids or not source_ids.issubset({n.note_id for n in notes}):
+            return None, notes
+        generated_at = previous.created_at
+        delta = [
+            n for n in notes
+            if n.note_id not in source_ids
+            or (generated_at is not None and n.updated_at is not None and n.updated_at >= generated_at)
+        ]
+        return previous, delta
+
+    def has_note_changes(self, project_id: int, content_type: str, week_number: Optional[int] = None) -> bool:
+        """활성 결과 생성 이후 원본 노트가 추가/수정/삭제되었으면 True. 활성 결과가 없어도 True."""
+        previous = self._get_active_record(project_id, content_type, week_number=week_number)
+        if previous is None:
+            return True
+        notes = self._load_notes(project_id, week_number)
+        if self._source_note_ids(previous) != {n.note_id for n in notes}:
+            return True
+        generated_at = previous.created_at
+        return any(
+            generated_at is not None and n.updated_at is not None and n.updated_at >= generated_at
+            for n in notes
+        )
+
     def _save(self, project_id: int, content_type: str, title: str, content: str,
-              model_used: str, source_notes: List[int], generated_by: int, week_number: Optional[int] = None) -> AIGeneratedContent:
+              model_used: str, source_notes: List[int], generated_by: int, week_number: Optional[int] = None,
+              generation_mode: str = "full", incremental_count: int = 0) -> AIGeneratedContent:
         # deactivate previous
         deactivate_conds = [
             AIGeneratedContent.project_id == project_id,
@@ -55,6 +129,8 @@ class AIService:
             content=content,
             model_used=model_used,
             source_notes=json.dumps(source_notes),
+            generation_mode=generation_mode,
+            incremental_count=incremental_count,
             generated_by=generated_by,
         )
         self.db.add(rec)
@@ -239,25 +315,26 @@ class AIService:
         user_id: str,
         force: bool = False,
         week_number: Optional[int] = None,
+        full_rebuild: bool = False,
     ) -> Dict[str, Any]:
         if not settings.AI_FEATURES_ENABLED:
             raise HTTPException(status_code=503, detail="AI 기능이 비활성화되어 있습니다.")
-        if not force:
+        if not force and not full_rebuild:
             existing = self._get_existing(project_id, "summary", week_number=week_number)
             if existing:
                 return existing
 
-        query = self.db.query(CoachingNote).filter(CoachingNote.project_id == project_id)
-        if week_number is not None:
-            query = query.filter(CoachingNote.week_number == week_number)
-        notes = query.order_by(CoachingNote.coaching_date).all()
+        notes = self._load_notes(project_id, week_number)
         if not notes:
             if week_number is None:
                 raise HTTPException(status_code=400, detail="요약할 코칭노트가 없습니다.")
             raise HTTPException(status_code=400, detail=f"{week_number}주차 코칭노트가 없습니다.")
 
         project = self.db.query(Project).filter(Project.project_id == project_id).first()
-        notes_text = self._format_notes(notes)
+        previous, delta = self._plan_incremental(project_id, "summary", notes, week_number, full_rebuild)
+        if previous is None or not delta:
+            previous, delta = None, notes
+        notes_text = self._format_notes(delta)
 
         system_prompt = (
             "당신은 AI 과제 코칭 프로그램의 전문 분석가입니다.\n"
@@ -269,7 +346,17 @@ class AIService:
             "5. **다음 단계 제안**: 향후 진행 방향 권고 (2-3문장)"
         )
         week_label = f"{week_number}주차" if week_number is not None else "전체"
-        prompt = f"다음은 '{project.project_name}' 과제의 {week_label} 코칭노트입니다.\n\n=== 코칭노트 ===\n{notes_text}"
+        if previous is None:
+            prompt = f"다음은 '{project.project_name}' 과제의 {week_label} 코칭노트입니다.\n\n=== 코칭노트 ===\n{notes_text}"
+        else:
+            system_prompt += (
+                "\n\n기존 요약이 함께 주어지면 새로 추가되거나 수정된 코칭노트를 반영해 같은 형식의 전체 요약으로 갱신하세요. "
+                "기존 요약과 수정된 노트 내용이 다르면 노트 내용을 따르세요."
+            )
+            prompt = (
+                f"다음은 '{project.project_name}' 과제의 {week_label} 기존 요약과, 그 이후 추가/수정된 코칭노트입니다.\n\n"
+                f"=== 기존 요약 ===\n{previous.content}\n\n=== 추가/수정된 코칭노트 ===\n{notes_text}"
+            )
 
         client = AIClient.get_client("summary", user_id)
         summary_text = client.invoke(prompt, system_prompt)
@@ -283,6 +370,8 @@ class AIService:
             source_notes=[n.note_id for n in notes],
             generated_by=int(user_id) if user_id.isdigit() else 0,
             week_number=week_number,
+            generation_mode="full" if previous is None else "incremental",
+            incremental_count=0 if previous is None else int(previous.incremental_count or 0) + 1,
         )
         # update project ai_summary shortcut
         if week_number is None:
@@ -290,7 +379,8 @@ class AIService:
             self.db.commit()
 
         return {"content_id": rec.content_id, "content": rec.content,
-                "title": rec.title, "model_used": rec.model_used, "week_number": rec.week_number, "created_at": rec.created_at}
+                "title": rec.title, "model_used": rec.model_used, "week_number": rec.week_number,
+                "generation_mode": rec.generation_mode, "created_at": rec.created_at}
 
     def generate_qa_set(
         self,
@@ -298,25 +388,26 @@ class AIService:
         user_id: str,
         force: bool = False,
         week_number: Optional[int] = None,
+        full_rebuild: bool = False,
     ) -> Dict[str, Any]:
         if not settings.AI_FEATURES_ENABLED:
             raise HTTPException(status_code=503, detail="AI 기능이 비활성화되어 있습니다.")
-        if not force:
+        if not force and not full_rebuild:
             existing = self._get_existing(project_id, "qa_set", week_number=week_number)
             if existing:
                 return existing
 
-        query = self.db.query(CoachingNote).filter(CoachingNote.project_id == project_id)
-        if week_number is not None:
-            query = query.filter(CoachingNote.week_number == week_number)
-        notes = query.order_by(CoachingNote.coaching_date).all()
+        notes = self._load_notes(project_id, week_number)
         if not notes:
             if week_number is None:
                 raise HTTPException(status_code=400, detail="코칭노트가 없습니다.")
             raise HTTPException(status_code=400, detail=f"{week_number}주차 코칭노트가 없습니다.")
 
         project = self.db.query(Project).filter(Project.project_id == project_id).first()
-        notes_text = self._format_notes(notes)
+        previous, delta = self._plan_incremental(project_id, "qa_set", notes, week_number, full_rebuild)
+        if previous is None or not delta:
+            previous, delta = None, notes
+        notes_text = self._format_notes(delta)
 
         system_prompt = (
             "당신은 코칭 기록에서 핵심 Q&A를 추출하는 전문가입니다.\n"
@@ -325,7 +416,17 @@ class AIService:
             "카테고리 예: 기술적 문제, 프로세스, 팀 협업, 데이터, 기타"
         )
         week_label = f"{week_number}주차" if week_number is not None else "전체"
-        prompt = f"'{project.project_name}' 과제의 {week_label} 코칭노트에서 Q&A를 추출해주세요.\n\n{notes_text}"
+        if previous is None:
+            prompt = f"'{project.project_name}' 과제의 {week_label} 코칭노트에서 Q&A를 추출해주세요.\n\n{notes_text}"
+        else:
+            system_prompt += (
+                "\n기존 Q&A가 함께 주어지면 추가/수정된 코칭노트에서 나온 Q&A를 더하고, "
+                "내용이 바뀐 항목은 고쳐서 전체 JSON 배열로 반환하세요."
+            )
+            prompt = (
+                f"'{project.project_name}' 과제의 {week_label} 기존 Q&A와, 그 이후 추가/수정된 코칭노트입니다.\n\n"
+                f"=== 기존 Q&A ===\n{previous.content}\n\n=== 추가/수정된 코칭노트 ===\n{notes_text}"
+            )
 
         client = AIClient.get_client("qa", user_id)
         qa_text = client.invoke(prompt, system_prompt)
@@ -339,9 +440,12 @@ class AIService:
             source_notes=[n.note_id for n in notes],
             generated_by=int(user_id) if user_id.isdigit() else 0,
             week_number=week_number,
+            generation_mode="full" if previous is None else "incremental",
+            incremental_count=0 if previous is None else int(previous.incremental_count or 0) + 1,
         )
         return {"content_id": rec.content_id, "content": rec.content,
-                "title": rec.title, "model_used": rec.model_used, "week_number": rec.week_number, "created_at": rec.created_at}
+                "title": rec.title, "model_used": rec.model_used, "week_number": rec.week_number,
+                "generation_mode": rec.generation_mode, "created_at": rec.created_at}
 
     def get_contents(self, project_id: int, content_type: str, week_number: Optional[int] = None) -> List[AIGeneratedContent]:
         conds = [
@@ -0,0 +1,164 @@
+"""AI 모델 슬롯(model1~4)별 호출 상태를 추적하는 서킷 브레이커 서비스입니다. 연속 실패한 슬롯은 일정 시간 호출 대상에서 제외합니다."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from app.config import settings
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+# 지연 시간 지수 이동 평균 가중치
+EWMA_ALPHA = 0.2
+
+
+class _SlotHealth:
+    __slots__ = (
+        "state",
+        "consecutive_failures",
+        "opened_at",
+        "probing",
+        "ewma_seconds",
+        "successes",
+        "failures",
+        "short_circuits",
+        "hedges",
+        "hedge_wins",
+        "last_error",
+    )
+
+    def __init__(self) -> None:
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.ewma_seconds: float | None = None
+        self.successes = 0
+        self.failures = 0
+        self.short_circuits = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.last_error = ""
+
+
+_LOCK = threading.Lock()
+_SLOTS: dict[str, _SlotHealth] = {}
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, "AI_CIRCUIT_BREAKER_ENABLED", True))
+
+
+def _get(slot: str) -> _SlotHealth:
+    health = _SLOTS.get(slot)
+    if health is None:
+        health = _SLOTS[slot] = _SlotHealth()
+    return health
+
+
+def _reset_seconds() -> float:
+    return max(0.0, float(getattr(settings, "AI_CIRCUIT_RESET_SECONDS", 30.0) or 0.0))
+
+
+def is_available(slot: str) -> bool:
+    """호출 가능 여부만 확인한다(상태를 바꾸지 않음). 열린 회로도 재시도 대기 시간이 지나면 가능으로 본다."""
+    if not is_enabled():
+        return True
+    with _LOCK:
+        health = _SLOTS.get(slot)
+        if health is None or health.state == STATE_CLOSED:
+            return True
+        if health.state == STATE_OPEN:
+            return time.monotonic() - health.opened_at >= _reset_seconds()
+        return not health.probing
+
+
+def acquire(slot: str) -> bool:
+    """슬롯 호출 허가를 받는다. 재시도 대기 시간이 지난 열린 회로는 반열림으로 바꾸고 시험 호출 1건만 허용한다."""
+    if not is_enabled():
+        return True
+    with _LOCK:
+        health = _get(slot)
+        if health.state == STATE_CLOSED:
+            return True
+        if health.state == STATE_OPEN and time.monotonic() - health.opened_at >= _reset_seconds():
+            health.state = STATE_HALF_OPEN
+            health.probing = False
+        if health.state == STATE_HALF_OPEN and not health.probing:
+            health.probing = True
+            return True
+        health.short_circuits += 1
+        return False
+
+
+def record_success(slot: str, seconds: float) -> None:
+    with _LOCK:
+        health = _get(slot)
+        health.successes += 1
+        health.consecutive_failures = 0
+        health.state = STATE_CLOSED
+        health.probing = False
+        value = max(0.0, float(seconds))
+        health.ewma_seconds = value if health.ewma_seconds is None else (
+            EWMA_ALPHA * value + (1 - EWMA_ALPHA) * health.ewma_seconds
+        )
+
+
+def record_failure(slot: str, error: str = "") -> None:
+    """타임아웃/연결 오류/5xx 등 슬롯 장애로 볼 수 있는 실패를 기록한다(존재하지 않는 모델 오류는 호출하지 않음)."""
+    threshold = max(1, int(getattr(settings, "AI_CIRCUIT_FAILURE_THRESHOLD", 3) or 1))
+    with _LOCK:
+        health = _get(slot)
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.last_error = str(error or "")[:300]
+        # 반열림 상태의 시험 호출이 실패하면 임계치와 관계없이 다시 연다.
+        if health.state == STATE_HALF_OPEN or health.consecutive_failures >= threshold:
+            health.state = STATE_OPEN
+            health.opened_at = time.monotonic()
+        health.probing = False
+
+
+def release(slot: str) -> None:
+    # 결과를 판단할 수 없이 끝난 호출(모델 없음 오류 등)이 시험 호출 자리를 잡고 있지 않도록 풀어준다.
+    with _LOCK:
+        health = _SLOTS.get(slot)
+        if health is not None:
+            health.probing = False
+
+
+def record_hedge(slot: str, won: bool) -> None:
+    with _LOCK:
+        health = _get(slot)
+        health.hedges += 1
+        if won:
+            health.hedge_wins += 1
+
+
+def reset_state() -> None:
+    with _LOCK:
+        _SLOTS.clear()
+
+
+def get_snapshot() -> list[dict[str, Any]]:
+    with _LOCK:
+        rows = [
+            {
+                "slot": slot,
+                "state": health.state,
+                "consecutive_failures": health.consecutive_failures,
+                "successes": health.successes,
+                "failures": health.failures,
+                "short_circuits": health.short_circuits,
+                "hedges": health.hedges,
+                "hedge_wins": health.hedge_wins,
+                "ewma_ms": round(health.ewma_seconds * 1000, 1) if health.ewma_seconds is not None else None,
+                "last_error": health.last_error or None,
+            }
+            for slot, health in _SLOTS.items()
+        ]
+    rows.sort(key=lambda row: row["slot"])
+    return rows
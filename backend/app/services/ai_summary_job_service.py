@@ -0,0 +1,296 @@
+"""차수 단위 AI 요약/Q&A 일괄 생성 작업 서비스입니다. 과제별 생성을 공유 워커 풀에서 병렬 실행하고 진행 상황을 DB에 기록합니다."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.ai_summary_job import AISummaryJob, AISummaryJobItem
+from app.models.batch import Batch
+from app.models.project import Project
+from app.services.ai_service import AIService
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = ("summary", "qa_set")
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+ACTIVE_JOB_STATUSES = (JOB_PENDING, JOB_RUNNING)
+# 프로세스 재시작 등으로 완료 처리되지 못한 작업이 새 작업 생성을 계속 막지 않도록 하는 기준 시간
+STALE_JOB_SECONDS = 3600
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _clip_error(value: Any, limit: int = 1000) -> str:
+    raw = str(value or "")
+    return raw if len(raw) <= limit else f"{raw[:limit]}...(truncated)"
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # 모든 작업이 하나의 풀을 공유하므로 동시에 여러 차수 작업이 돌아도 LLM 동시 호출 수는 상한을 넘지 않는다.
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            workers = max(1, int(settings.AI_SUMMARY_JOB_CONCURRENCY))
+            _EXECUTOR = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-summary-job")
+        return _EXECUTOR
+
+
+def reset_state() -> None:
+    # 설정 변경 후 워커 풀을 다시 만들 때(테스트 포함) 사용한다.
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def create_job(
+    db: Session,
+    *,
+    batch_id: int,
+    requested_by: int,
+    week_number: Optional[int] = None,
+    content_types: Optional[List[str]] = None,
+    force_regenerate: bool = False,
+) -> tuple[AISummaryJob, bool]:
+    """차수의 모든 과제 × 콘텐츠 유형 항목으로 작업을 만든다. 같은 조건의 작업이 진행 중이면 그 작업을 반환한다."""
+    if not settings.AI_FEATURES_ENABLED:
+        raise HTTPException(status_code=503, detail="AI 기능이 비활성화되어 있습니다.")
+    if not db.query(Batch).filter(Batch.batch_id == batch_id).first():
+        raise HTTPException(status_code=404, detail="차수를 찾을 수 없습니다.")
+    types = [t for t in CONTENT_TYPES if t in (content_types or CONTENT_TYPES)]
+    invalid = sorted(set(content_types or []) - set(CONTENT_TYPES))
+    if invalid or not types:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 콘텐츠 유형입니다: {', '.join(invalid) or '-'}")
+    types_key = ",".join(types)
+
+    week_cond = AISummaryJob.week_number.is_(None) if week_number is None else AISummaryJob.week_number == week_number
+    active = (
+        db.query(AISummaryJob)
+        .filter(
+            AISummaryJob.batch_id == batch_id,
+            week_cond,
+            AISummaryJob.content_types == types_key,
+            AISummaryJob.status.in_(ACTIVE_JOB_STATUSES),
+            AISummaryJob.created_at >= _utcnow() - timedelta(seconds=STALE_JOB_SECONDS),
+        )
+        .order_by(AISummaryJob.job_id.desc())
+        .first()
+    )
+    if active:
+        return active, False
+
+    project_ids = [
+        row.project_id
+        for row in db.query(Project.project_id).filter(Project.batch_id == batch_id).order_by(Project.project_id).all()
+    ]
+    job = AISummaryJob(
+        batch_id=batch_id,
+        week_number=week_number,
+        content_types=types_key,
+        force_regenerate=bool(force_regenerate),
+        status=JOB_PENDING,
+        total_count=len(project_ids) * len(types),
+        requested_by=requested_by,
+    )
+    db.add(job)
+    db.flush()
+    db.add_all(
+        AISummaryJobItem(job_id=job.job_id, project_id=project_id, content_type=content_type)
+        for project_id in project_ids
+        for content_type in types
+    )
+    db.commit()
+    db.refresh(job)
+    return job, True
+
+
+def _finish_item(db: Session, item: AISummaryJobItem, status: str, **fields: Any) -> None:
+    item.status = status
+    item.finished_at = _utcnow()
+    for key, value in fields.items():
+        setattr(item, key, value)
+    counter = {
+        "done": AISummaryJob.done_count,
+        "skipped": AISummaryJob.skipped_count,
+        "failed": AISummaryJob.failed_count,
+    }[status]
+    # 여러 워커가 같은 작업 행을 갱신하므로 카운터는 SQL 증분으로 올린다.
+    db.query(AISummaryJob).filter(AISummaryJob.job_id == item.job_id).update(
+        {counter: counter + 1}, synchronize_session=False
+    )
+    db.commit()
+
+
+def _run_item(session_factory: Callable[[], Session], item_id: int, user_id: str) -> None:
+    db = session_factory()
+    try:
+        item = db.query(AISummaryJobItem).filter(AISummaryJobItem.item_id == item_id).first()
+        job = db.query(AISummaryJob).filter(AISummaryJob.job_id == item.job_id).first()
+        item.status = "running"
+        item.started_at = _utcnow()
+        db.commit()
+
+        svc = AIService(db)
+        if not svc._load_notes(item.project_id, job.week_number):
+            _finish_item(db, item, "skipped", message="코칭노트가 없습니다.")
+            return
+        if not job.force_regenerate and not svc.has_note_changes(item.project_id, item.content_type, job.week_number):
+            _finish_item(db, item, "skipped", message="이전 생성 이후 변경된 코칭노트가 없습니다.")
+            return
+        # 사용자 재생성 요청과 같은 경로로 생성(가능하면 증분 갱신)하고 결과 저장은 AIService._save가 맡는다.
+        generate = svc.generate_summary if item.content_type == "summary" else svc.generate_qa_set
+        result = generate(item.project_id, user_id, force=True, week_number=job.week_number)
+        _finish_item(db, item, "done", content_id=result["content_id"], generation_mode=result.get("generation_mode"))
+    except Exception as exc:
+        db.rollback()
+        logger.warning("AI summary job item %s failed: %s", item_id, exc)
+        item = db.query(AISummaryJobItem).filter(AISummaryJobItem.item_id == item_id).first()
+        if item is not None:
+            _finish_item(db, item, "failed", message=_clip_error(getattr(exc, "detail", None) or exc))
+    finally:
+        db.close()
+
+
+def run_job(session_factory: Callable[[], Session], job_id: int, user_id: str) -> None:
+    """작업의 대기 항목을 공유 워커 풀에 넣고 모두 끝날 때까지 기다린 뒤 작업을 완료 처리한다."""
+    db = session_factory()
+    try:
+        job = db.query(AISummaryJob).filter(AISummaryJob.job_id == job_id).first()
+        if job is None:
+            return
+        job.status = JOB_RUNNING
+        job.started_at = job.started_at or _utcnow()
+        item_ids = [
+            row.item_id
+            for row in db.query(AISummaryJobItem.item_id)
+            .filter(AISummaryJobItem.job_id == job_id, AISummaryJobItem.status == "pending")
+            .order_by(AISummaryJobItem.item_id)
+            .all()
+        ]
+        db.commit()
+    finally:
+        db.close()
+
+    executor = _get_executor()
+    wait([executor.submit(_run_item, session_factory, item_id, user_id) for item_id in item_ids])
+
+    db = session_factory()
+    try:
+        db.query(AISummaryJob).filter(AISummaryJob.job_id == job_id).update(
+            {AISummaryJob.status: JOB_DONE, AISummaryJob.finished_at: _utcnow()}, synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def fail_interrupted_jobs(db: Session) -> int:
+    """기동 시 호출한다. 이전 프로세스에서 pending/running으로 남은 작업의 미완료 항목을 실패로 닫고 작업을 완료 처리한다.
+
+    작업은 요청을 받은 프로세스의 조정 스레드에서만 실행되므로, 기동 시점에 진행 중 상태인 작업은 이어서 실행될 수 없다.
+    반환값은 정리한 작업 수다.
+    """
+    job_ids = [
+        row.job_id
+        for row in db.query(AISummaryJob.job_id).filter(AISummaryJob.status.in_(ACTIVE_JOB_STATUSES)).all()
+    ]
+    if not job_ids:
+        return 0
+    finished_at = _utcnow()
+    for job_id in job_ids:
+        interrupted = (
+            db.query(AISummaryJobItem)
+            .filter(AISummaryJobItem.job_id == job_id, AISummaryJobItem.status.in_(("pending", "running")))
+            .update(
+                {
+                    AISummaryJobItem.status: "failed",
+                    AISummaryJobItem.message: "서버 재시작으로 작업이 중단되었습니다.",
+                    AISummaryJobItem.finished_at: finished_at,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.query(AISummaryJob).filter(AISummaryJob.job_id == job_id).update(
+            {
+                AISummaryJob.status: JOB_DONE,
+                AISummaryJob.failed_count: AISummaryJob.failed_count + int(interrupted or 0),
+                AISummaryJob.finished_at: finished_at,
+            },
+            synchronize_session=False,
+        )
+    db.commit()
+    logger.warning("closed %s AI summary job(s) interrupted by restart", len(job_ids))
+    return len(job_ids)
+
+
+def start_job(session_factory: Callable[[], Session], job_id: int, user_id: str) -> threading.Thread:
+    # 요청 스레드를 LLM 지연 동안 붙잡지 않도록 조정 스레드에서 실행한다(실제 생성은 공유 워커 풀에서 수행).
+    thread = threading.Thread(
+        target=run_job,
+        args=(session_factory, job_id, user_id),
+        name=f"ai-summary-job-{job_id}",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def get_job(db: Session, job_id: int) -> dict[str, Any]:
+    job = db.query(AISummaryJob).filter(AISummaryJob.job_id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="AI 일괄 생성 작업을 찾을 수 없습니다.")
+    rows = (
+        db.query(AISummaryJobItem, Project.project_name)
+        .outerjoin(Project, Project.project_id == AISummaryJobItem.project_id)
+        .filter(AISummaryJobItem.job_id == job_id)
+        .order_by(AISummaryJobItem.project_id, AISummaryJobItem.item_id)
+        .all()
+    )
+    finished = int(job.done_count or 0) + int(job.skipped_count or 0) + int(job.failed_count or 0)
+    return {
+        "job_id": job.job_id,
+        "batch_id": job.batch_id,
+        "week_number": job.week_number,
+        "content_types": job.content_types.split(","),
+        "force_regenerate": bool(job.force_regenerate),
+        "status": job.status,
+        "total_count": job.total_count,
+        "done_count": job.done_count,
+        "skipped_count": job.skipped_count,
+        "failed_count": job.failed_count,
+        "progress_rate": round(finished * 100 / job.total_count) if job.total_count else 100,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "items": [
+            {
+                "item_id": item.item_id,
+                "project_id": item.project_id,
+                "project_name": project_name,
+                "content_type": item.content_type,
+                "status": item.status,
+                "content_id": item.content_id,
+                "generation_mode": item.generation_mode,
+                "message": item.message,
+                "started_at": item.started_at,
+                "finished_at": item.finished_at,
+            }
+            for item, project_name in rows
+        ],
+    }
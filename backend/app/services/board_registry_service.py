@@ -0,0 +1,125 @@
+"""게시판 메타데이터(board 테이블) 프로세스 캐시입니다. 버전 번호로 무효화하고 정상 상태의 조회 요청은 board 테이블을 읽지 않습니다."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.board import Board
+
+
+@dataclass(frozen=True)
+class BoardInfo:
+    board_id: int
+    board_name: str
+    board_type: str
+    description: Optional[str]
+    created_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class BoardRegistry:
+    version: int
+    loaded_at: float
+    boards: tuple[BoardInfo, ...]  # 전체 게시판 (board_id 순)
+    standard: tuple[BoardInfo, ...]  # 표준 게시판 (노출 순서)
+
+    def get(self, board_id: int) -> Optional[BoardInfo]:
+        for board in self.boards:
+            if board.board_id == int(board_id):
+                return board
+        return None
+
+    def ids_where(self, predicate: Callable[[BoardInfo], bool]) -> list[int]:
+        return [board.board_id for board in self.boards if predicate(board)]
+
+
+_LOCK = threading.Lock()
+_VERSION = 0
+_REGISTRY: Optional[BoardRegistry] = None
+
+
+def invalidate() -> None:
+    global _VERSION
+    with _LOCK:
+        _VERSION += 1
+
+
+def current_version() -> int:
+    with _LOCK:
+        return _VERSION
+
+
+def _is_fresh(registry: Optional[BoardRegistry]) -> bool:
+    if registry is None or registry.version != _VERSION:
+        return False
+    # 다른 워커 프로세스의 변경은 이벤트로 알 수 없으므로 TTL이 지나면 다시 읽는다(0이면 만료 없음).
+    ttl = float(getattr(settings, "BOARD_REGISTRY_TTL_SECONDS", 0) or 0)
+    return ttl <= 0 or time.monotonic() - registry.loaded_at < ttl
+
+
+def get_registry(loader: Callable[[], tuple[Iterable[Board], Iterable[Board]]]) -> BoardRegistry:
+    """캐시가 유효하면 그대로, 아니면 loader()가 돌려준 (전체 게시판, 표준 게시판 노출 순)으로 다시 만든다."""
+    global _REGISTRY
+    with _LOCK:
+        registry = _REGISTRY
+        if _is_fresh(registry):
+            return registry
+        version = _VERSION
+    # 읽는 도중 무효화되면 이 결과는 이전 버전으로 저장되어 다음 조회에서 다시 읽는다.
+    all_rows, standard_rows = loader()
+    snapshot = BoardRegistry(
+        version=version,
+        loaded_at=time.monotonic(),
+        boards=tuple(sorted((_to_info(row) for row in all_rows), key=lambda board: board.board_id)),
+        standard=tuple(_to_info(row) for row in standard_rows),
+    )
+    with _LOCK:
+        if _REGISTRY is None or _REGISTRY.version <= version:
+            _REGISTRY = snapshot
+    return snapshot
+
+
+def _to_info(row: Board) -> BoardInfo:
+    return BoardInfo(
+        board_id=int(row.board_id),
+        board_name=row.board_name,
+        board_type=row.board_type,
+        description=row.description,
+        created_at=row.created_at,
+    )
+
+
+def reset_state() -> None:
+    global _REGISTRY
+    with _LOCK:
+        _REGISTRY = None
+    invalidate()
+
+
+def _mark_board_changed(_mapper, _connection, target) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        session.info["board_registry_dirty"] = True
+        if not session.info.get("board_registry_hooked"):
+            # board를 변경한 세션에만 커밋 후 무효화 리스너를 건다(모든 세션 커밋에 전역 리스너를 두지 않음).
+            session.info["board_registry_hooked"] = True
+            event.listen(session, "after_commit", _invalidate_after_commit)
+    invalidate()
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    # flush 시점 무효화 후 커밋 전에 다른 세션이 이전 값을 다시 읽어 갔을 수 있으므로 커밋 후 한 번 더 무효화한다.
+    if session.info.pop("board_registry_dirty", False):
+        invalidate()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Board, _event_name, _mark_board_changed)
@@ -1,19 +1,36 @@
 """Board Service 도메인 서비스 레이어입니다. 비즈니스 규칙과 데이터 접근 흐름을 캡슐화합니다."""
 
 from sqlalchemy.orm import Session
-from sqlalchemy import case, func, or_
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, case, exists, func, not_, or_, select
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
+from app.config import settings
 from app.models.board import Board, BoardPost, PostComment, BoardPostView
 from app.models.batch import Batch
 from app.models.project import Project, ProjectMember
 from app.models.access_scope import UserBatchAccess
 from app.models.user import User
 from app.schemas.board import BoardPostCreate, BoardPostUpdate, PostCommentCreate, PostCommentUpdate
-from app.services import mention_service, version_service
+from app.services import (
+    board_registry_service,
+    comment_counter_service,
+    mention_service,
+    version_service,
+    view_counter_service,
+)
+from app.services.board_registry_service import BoardInfo, BoardRegistry
 from app.services import notification_service
 from app.services.chatbot_service import ChatbotService  # [chatbot] 게시글 RAG 동기화
 from typing import List
+from app.utils.pagination import (
+    anchor_value,
+    cursor_int,
+    decode_cursor,
+    encode_cursor,
+    keyset_desc,
+    parse_cursor_datetime,
+)
 from app.utils.permissions import is_admin_or_coach, is_participant
 
 STANDARD_BOARDS = (
@@ -79,6 +96,31 @@ def _participant_batch_ids(db: Session, current_user: User) -> set[int]:
     return membership_scope
 
 
+def _participant_batch_scope(current_user: User):
+    """_participant_batch_ids와 같은 규칙(직접 권한 우선, 없으면 소속 과제 차수)을 SQL 조건으로 만든다."""
+    direct = select(UserBatchAccess.batch_id).where(UserBatchAccess.user_id == current_user.user_id)
+    membership = (
+        select(Project.batch_id)
+        .join(ProjectMember, ProjectMember.project_id == Project.project_id)
+        .where(ProjectMember.user_id == current_user.user_id)
+    )
+    has_direct = exists().where(UserBatchAccess.user_id == current_user.user_id)
+    return or_(
+        BoardPost.batch_id.in_(direct),
+        and_(not_(has_direct), BoardPost.batch_id.in_(membership)),
+    )
+
+
+def _visible_posts_condition(current_user: User):
+    """_can_view_post의 목록용 SQL 버전. 페이지 나누기 전에 적용해 한 페이지가 항상 limit건을 채우도록 한다."""
+    if is_admin_or_coach(current_user):
+        return None
+    public = or_(BoardPost.is_batch_private == False, BoardPost.is_batch_private.is_(None))  # noqa: E712
+    if not is_participant(current_user):
+        return public
+    return or_(public, and_(BoardPost.batch_id.is_not(None), _participant_batch_scope(current_user)))
+
+
 def _ensure_can_write_batch(db: Session, current_user: User, batch_id: int | None):
     if batch_id is None:
         return
@@ -186,13 +228,48 @@ def _sync_standard_boards(db: Session) -> List[Board]:
     )
 
 
-def get_boards(db: Session) -> List[Board]:
-    return _sync_standard_boards(db)
+def sync_standard_boards(db: Session) -> List[Board]:
+    """표준 게시판 정합화(생성/이름 보정/중복 병합). 기동 시와 관리자 요청 시에만 실행한다."""
+    boards = _sync_standard_boards(db)
+    board_registry_service.invalidate()
+    return boards
 
 
-def get_board(db: Session, board_id: int) -> Board:
-    _sync_standard_boards(db)
-    board = db.query(Board).filter(Board.board_id == board_id).first()
+def _load_board_registry(db: Session):
+    rows = db.query(Board).order_by(Board.board_id.asc()).all()
+    standard_types = [row["board_type"] for row in STANDARD_BOARDS]
+    present = {row.board_type for row in rows}
+    if not all(board_type in present for board_type in standard_types):
+        # 기동 시 정합화 전이거나 표준 게시판이 지워진 경우에만 조회 경로에서 정합화한다.
+        _sync_standard_boards(db)
+        rows = db.query(Board).order_by(Board.board_id.asc()).all()
+    standard = sorted(
+        (row for row in rows if row.board_type in standard_types),
+        key=lambda row: (BOARD_PRIORITY.get(row.board_type, 99), row.board_id),
+    )
+    return rows, standard
+
+
+def _board_registry(db: Session) -> BoardRegistry:
+    return board_registry_service.get_registry(lambda: _load_board_registry(db))
+
+
+def _board_lookup(db: Session, board_ids) -> dict[int, BoardInfo]:
+    registry = _board_registry(db)
+    wanted = {int(board_id) for board_id in board_ids}
+    if any(registry.get(board_id) is None for board_id in wanted):
+        # 다른 프로세스에서 추가된 게시판이면 한 번 다시 읽는다.
+        board_registry_service.invalidate()
+        registry = _board_registry(db)
+    return {board_id: board for board_id in wanted if (board := registry.get(board_id)) is not None}
+
+
+def get_boards(db: Session) -> List[BoardInfo]:
+    return list(_board_registry(db).standard)
+
+
+def get_board(db: Session, board_id: int) -> BoardInfo:
+    board = _board_lookup(db, [board_id]).get(int(board_id))
     if not board:
         raise HTTPException(status_code=404, detail="게시판을 찾을 수 없습니다.")
     return board
@@ -203,7 +280,6 @@ def _serialize_post(
     board_name: str | None = None,
     board_type: str | None = None,
     author_name: str | None = None,
-    comment_count: int | None = None,
 ) -> BoardPost:
     if board_name is not None:
         setattr(post, "board_name", board_name)
@@ -211,8 +287,6 @@ def _serialize_post(
         setattr(post, "board_type", board_type)
     if author_name is not None:
         setattr(post, "author_name", author_name)
-    if comment_count is not None:
-        setattr(post, "comment_count", int(comment_count))
     setattr(post, "post_no", None if bool(post.is_notice) else int(post.post_id))
     return post
 
@@ -226,21 +300,47 @@ def _serialize_comment(comment: PostComment, author_name: str | None = None) ->
 
 
 def _posts_query(db: Session):
-    return (
-        db.query(
-            BoardPost,
-            Board.board_name,
-            Board.board_type,
-            User.name.label("author_name"),
-            func.count(PostComment.comment_id).label("comment_count"),
+    # 게시판 이름/유형은 board 조인 대신 게시판 레지스트리에서 채운다(_serialize_rows).
+    # 댓글 수는 board_post.comment_count 비정규화 컬럼을 그대로 쓴다(댓글 조인/GROUP BY 없음).
+    return db.query(BoardPost, User.name.label("author_name")).join(User, User.user_id == BoardPost.author_id)
+
+
+def _serialize_rows(db: Session, rows) -> List[BoardPost]:
+    boards = _board_lookup(db, {post.board_id for post, _ in rows}) if rows else {}
+    result = []
+    for post, author_name in rows:
+        board = boards.get(int(post.board_id))
+        result.append(
+            _serialize_post(
+                post,
+                board.board_name if board else None,
+                board.board_type if board else None,
+                author_name,
+            )
         )
-        .join(Board, Board.board_id == BoardPost.board_id)
+    return result
+
+
+def _count_posts(db: Session, conditions: list) -> int:
+    return int(
+        db.query(func.count(BoardPost.post_id))
         .join(User, User.user_id == BoardPost.author_id)
-        .outerjoin(PostComment, PostComment.post_id == BoardPost.post_id)
-        .group_by(BoardPost.post_id, Board.board_name, Board.board_type, User.name)
+        .filter(*conditions)
+        .scalar()
+        or 0
     )
 
 
+def _board_posts_conditions(board_id: int, current_user: User, batch_id: int | None) -> list:
+    conditions = [BoardPost.board_id == board_id]
+    if batch_id is not None:
+        conditions.append(BoardPost.batch_id == int(batch_id))
+    visible = _visible_posts_condition(current_user)
+    if visible is not None:
+        conditions.append(visible)
+    return conditions
+
+
 def get_posts(
     db: Session,
     board_id: int,
@@ -248,19 +348,72 @@ def get_posts(
     skip: int = 0,
     limit: int = 20,
     batch_id: int | None = None,
+    after: str | None = None,
 ) -> List[BoardPost]:
-    _sync_standard_boards(db)
-    query = _posts_query(db).filter(BoardPost.board_id == board_id)
+    """게시판 글 목록. after(커서)가 있으면 skip 대신 (created_at, post_id) keyset으로 이어서 읽는다."""
+    conditions = _board_posts_conditions(board_id, current_user, batch_id)
+    if after:
+        created_at, post_id = decode_cursor("board_posts", after, 2)
+        anchor_id = cursor_int(post_id)
+        anchor = anchor_value(BoardPost.created_at, BoardPost.post_id, anchor_id, parse_cursor_datetime(created_at))
+        conditions.append(keyset_desc(BoardPost.created_at, BoardPost.post_id, anchor, anchor_id))
+        skip = 0
+    rows = (
+        _posts_query(db)
+        .filter(*conditions)
+        .order_by(BoardPost.created_at.desc(), BoardPost.post_id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    return _serialize_rows(db, rows)
+
+
+def next_posts_cursor(posts: List[BoardPost], limit: int) -> str | None:
+    if not posts or len(posts) < limit:
+        return None
+    last = posts[-1]
+    return encode_cursor("board_posts", [last.created_at.isoformat() if last.created_at else None, int(last.post_id)])
+
+
+def count_posts(db: Session, board_id: int, current_user: User, batch_id: int | None = None) -> int:
+    return _count_posts(db, _board_posts_conditions(board_id, current_user, batch_id))
+
+
+def _all_posts_conditions(
+    db: Session,
+    current_user: User,
+    category: str | None,
+    search_q: str | None,
+    batch_id: int | None,
+) -> list:
+    registry = _board_registry(db)
+    conditions = []
     if batch_id is not None:
-        query = query.filter(BoardPost.batch_id == int(batch_id))
-    rows = query.order_by(BoardPost.created_at.desc()).offset(skip).limit(limit).all()
-    participant_batches = _participant_batch_ids(db, current_user) if is_participant(current_user) else None
-    result = []
-    for post, board_name, board_type, author_name, comment_count in rows:
-        if not _can_view_post(db, post, current_user, participant_batches=participant_batches):
-            continue
-        result.append(_serialize_post(post, board_name, board_type, author_name, comment_count))
-    return result
+        conditions.append(BoardPost.batch_id == int(batch_id))
+    if category:
+        normalized_category = _canonical_board_type(category, category)
+        if normalized_category in BOARD_PRIORITY:
+            board_ids = registry.ids_where(lambda board: board.board_type == normalized_category)
+        else:
+            board_ids = registry.ids_where(lambda board: category in (board.board_type, board.board_name))
+        conditions.append(BoardPost.board_id.in_(board_ids))
+    if search_q and search_q.strip():
+        keyword = f"%{search_q.strip()}%"
+        lowered = search_q.strip().lower()
+        matches = [
+            BoardPost.title.ilike(keyword),
+            BoardPost.content.ilike(keyword),
+            User.name.ilike(keyword),
+        ]
+        name_matched = registry.ids_where(lambda board: lowered in str(board.board_name or "").lower())
+        if name_matched:
+            matches.append(BoardPost.board_id.in_(name_matched))
+        conditions.append(or_(*matches))
+    visible = _visible_posts_condition(current_user)
+    if visible is not None:
+        conditions.append(visible)
+    return conditions
 
 
 def get_all_posts(
@@ -271,40 +424,63 @@ def get_all_posts(
     category: str | None = None,
     search_q: str | None = None,
     batch_id: int | None = None,
+    after: str | None = None,
 ) -> List[BoardPost]:
-    _sync_standard_boards(db)
-    query = _posts_query(db)
-    if batch_id is not None:
-        query = query.filter(BoardPost.batch_id == int(batch_id))
-    if category:
-        normalized_category = _canonical_board_type(category, category)
-        if normalized_category in BOARD_PRIORITY:
-            query = query.filter(Board.board_type == normalized_category)
-        else:
-            query = query.filter(or_(Board.board_type == category, Board.board_name == category))
-    if search_q and search_q.strip():
-        keyword = f"%{search_q.strip()}%"
-        query = query.filter(
-            or_(
-                BoardPost.title.ilike(keyword),
-                BoardPost.content.ilike(keyword),
-                User.name.ilike(keyword),
-                Board.board_name.ilike(keyword),
-            )
+    """전체 글 목록(공지 우선, 최신 번호 순). after(커서)가 있으면 skip 대신 (공지 여부, post_id) keyset으로 이어서 읽는다.
+
+    첫 페이지와 커서 페이지는 공지/일반 글을 나눠 각각 post_id 역순으로 읽어 (is_notice, post_id) 인덱스를 탄다.
+    skip 방식만 공지 순위 CASE 정렬 + OFFSET을 쓴다.
+    """
+    conditions = _all_posts_conditions(db, current_user, category, search_q, batch_id)
+    if not after and skip:
+        rows = (
+            _posts_query(db)
+            .filter(*conditions)
+            .order_by(_post_notice_order_expr(), BoardPost.post_id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
         )
-    rows = (
-        query.order_by(_post_notice_order_expr(), BoardPost.post_id.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-    participant_batches = _participant_batch_ids(db, current_user) if is_participant(current_user) else None
-    result = []
-    for post, board_name, board_type, author_name, comment_count in rows:
-        if not _can_view_post(db, post, current_user, participant_batches=participant_batches):
-            continue
-        result.append(_serialize_post(post, board_name, board_type, author_name, comment_count))
-    return result
+        return _serialize_rows(db, rows)
+    notice_rank, anchor_id = 0, None
+    if after:
+        rank, post_id = decode_cursor("all_posts", after, 2)
+        notice_rank, anchor_id = cursor_int(rank), cursor_int(post_id)
+    rows = []
+    if notice_rank == 0:
+        notice_conditions = [*conditions, BoardPost.is_notice == True]  # noqa: E712
+        if anchor_id is not None:
+            notice_conditions.append(BoardPost.post_id < anchor_id)
+        rows = _posts_query(db).filter(*notice_conditions).order_by(BoardPost.post_id.desc()).limit(limit).all()
+    if len(rows) < limit:
+        general_conditions = [*conditions, or_(BoardPost.is_notice == False, BoardPost.is_notice.is_(None))]  # noqa: E712
+        if notice_rank == 1 and anchor_id is not None:
+            general_conditions.append(BoardPost.post_id < anchor_id)
+        rows += (
+            _posts_query(db)
+            .filter(*general_conditions)
+            .order_by(BoardPost.post_id.desc())
+            .limit(limit - len(rows))
+            .all()
+        )
+    return _serialize_rows(db, rows)
+
+
+def next_all_posts_cursor(posts: List[BoardPost], limit: int) -> str | None:
+    if not posts or len(posts) < limit:
+        return None
+    last = posts[-1]
+    return encode_cursor("all_posts", [0 if bool(last.is_notice) else 1, int(last.post_id)])
+
+
+def count_all_posts(
+    db: Session,
+    current_user: User,
+    category: str | None = None,
+    search_q: str | None = None,
+    batch_id: int | None = None,
+) -> int:
+    return _count_posts(db, _all_posts_conditions(db, current_user, category, search_q, batch_id))
 
 
 def get_post(db: Session, post_id: int) -> BoardPost:
@@ -322,11 +498,11 @@ def get_post_with_meta(db: Session, post_id: int, current_user: User | None = No
     )
     if not row:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
-    post, board_name, board_type, author_name, comment_count = row
+    post = row[0]
     if current_user is not None:
         participant_batches = _participant_batch_ids(db, current_user) if is_participant(current_user) else None
         _ensure_can_view_post(db, post, current_user, participant_batches=participant_batches)
-    return _serialize_post(post, board_name, board_type, author_name, comment_count)
+    return _serialize_rows(db, [row])[0]
 
 
 def _post_snapshot(post: BoardPost) -> dict:
@@ -445,6 +621,16 @@ def delete_post(db: Session, post_id: int, current_user: User):
 
 
 def increment_view(db: Session, post_id: int, user_id: int):
+    if settings.BOARD_VIEW_BUFFER_ENABLED:
+        # 조회는 메모리 버퍼에만 기록하고 DB 반영은 view_counter_service flusher가 모아서 한다.
+        view_counter_service.record_view(db, post_id, user_id)
+        if view_counter_service.needs_inline_flush():
+            view_counter_service.flush(db)
+        return
+    _increment_view_now(db, post_id, user_id)
+
+
+def _increment_view_now(db: Session, post_id: int, user_id: int):
     if not db.query(BoardPost.post_id).filter(BoardPost.post_id == post_id).first():
         return
     exists = (
@@ -469,6 +655,17 @@ def increment_view(db: Session, post_id: int, user_id: int):
     db.commit()
 
 
+def apply_pending_views(post: BoardPost) -> BoardPost:
+    """아직 반영 전인 버퍼 조회 수를 응답용 view_count에 더한다(변경으로 추적되지 않도록 committed 값으로 설정).
+
+    버퍼의 조회는 모두 board_post_view에 없음을 확인하고 넣은 것이라 이미 반영된 조회를 다시 더하지 않는다.
+    """
+    pending = view_counter_service.pending_views(post.post_id)
+    if pending:
+        set_committed_value(post, "view_count", int(post.view_count or 0) + pending)
+    return post
+
+
 def get_comments(db: Session, post_id: int, current_user: User) -> List[PostComment]:
     post = get_post(db, post_id)
     participant_batches = _participant_batch_ids(db, current_user) if is_participant(current_user) else None
@@ -491,6 +688,8 @@ def create_comment(db: Session, post_id: int, data: PostCommentCreate, current_u
     _ensure_can_write_batch(db, current_user, post.batch_id)
     comment = PostComment(post_id=post_id, author_id=current_user.user_id, **data.model_dump())
     db.add(comment)
+    db.flush()
+    comment_counter_service.post_comment_added(db, post_id)
     db.commit()
     db.refresh(comment)
     mention_service.notify_mentions(
@@ -547,6 +746,8 @@ def delete_comment(db: Session, comment_id: int, current_user: User):
     _ensure_can_write_batch(db, current_user, comment.post.batch_id)
     post_id = int(comment.post_id)
     db.delete(comment)
+    db.flush()
+    comment_counter_service.post_comment_removed(db, post_id)
     db.commit()
     # [chatbot] 게시글 댓글 삭제 시 같은 doc_id 문서를 댓글 포함 내용으로 재동기화
     ChatbotService(db).safe_sync_board_post(
@@ -0,0 +1,258 @@
+"""[chatbot] LLM 단계별/RAG 입력·검색 지연 시간과 토큰 사용량을 프로세스 메모리에 집계하는 계측 서비스입니다."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+from app.config import settings
+from app.services import ai_slot_health_service
+from app.services import rag_context_service
+from app.services.rag_context_service import approx_token_count
+
+# 지연 시간 히스토그램 상한(초). 마지막 구간(+Inf)은 count로 표현한다.
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        value = max(0.0, float(seconds))
+        idx = bisect.bisect_left(LATENCY_BUCKETS, value)
+        if idx < len(self.buckets):
+            self.buckets[idx] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        # Prometheus histogram_quantile과 같이 구간 안에서 선형 보간한 추정치(초).
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, bucket_count in zip(LATENCY_BUCKETS, self.buckets):
+            if bucket_count and seen + bucket_count >= rank:
+                return min(self.max, lower + (upper - lower) * (rank - seen) / bucket_count)
+            seen += bucket_count
+            lower = upper
+        return self.max
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total * 1000 / self.count, 1) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.5) * 1000, 1),
+            "p95_ms": round(self.quantile(0.95) * 1000, 1),
+            "p99_ms": round(self.quantile(0.99) * 1000, 1),
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class _LlmSeries:
+    __slots__ = ("latency", "first_token", "errors", "prompt_tokens", "completion_tokens")
+
+    def __init__(self) -> None:
+        self.latency = _Histogram()
+        self.first_token = _Histogram()
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+
+class _RagSeries:
+    __slots__ = ("latency", "errors")
+
+    def __init__(self) -> None:
+        self.latency = _Histogram()
+        self.errors = 0
+
+
+_LOCK = threading.Lock()
+_LLM: dict[tuple[str, str, str], _LlmSeries] = {}
+_RAG: dict[tuple[str, str], _RagSeries] = {}
+_STARTED_AT = datetime.now(timezone.utc)
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, "CHATBOT_METRICS_ENABLED", True))
+
+
+def observe_llm(
+    *,
+    stage: str,
+    slot: str,
+    model: str,
+    seconds: float,
+    prompt: str = "",
+    system_prompt: str | None = None,
+    completion: str = "",
+    error: bool = False,
+    first_token_seconds: float | None = None,
+) -> None:
+    """LLM 호출 1건을 기록한다. 토큰 수는 rag_context_service의 근사 토크나이저로 센다."""
+    if not is_enabled():
+        return
+    prompt_tokens = approx_token_count(prompt) + approx_token_count(system_prompt or "")
+    completion_tokens = approx_token_count(completion) if completion else 0
+    key = (str(stage or "-"), str(slot or "unknown"), str(model or "-"))
+    with _LOCK:
+        series = _LLM.get(key)
+        if series is None:
+            series = _LLM[key] = _LlmSeries()
+        series.latency.observe(seconds)
+        if first_token_seconds is not None:
+            series.first_token.observe(first_token_seconds)
+        series.prompt_tokens += prompt_tokens
+        series.completion_tokens += completion_tokens
+        if error:
+            series.errors += 1
+
+
+def observe_rag(*, operation: str, source: str, seconds: float, error: bool = False) -> None:
+    """RAG 입력(insert)/검색(retrieve) 1건을 처리 경로(remote/local/cache)별로 기록한다."""
+    if not is_enabled():
+        return
+    key = (str(operation), str(source))
+    with _LOCK:
+        series = _RAG.get(key)
+        if series is None:
+            series = _RAG[key] = _RagSeries()
+        series.latency.observe(seconds)
+        if error:
+            series.errors += 1
+
+
+def reset() -> None:
+    global _STARTED_AT
+    with _LOCK:
+        _LLM.clear()
+        _RAG.clear()
+        _STARTED_AT = datetime.now(timezone.utc)
+    rag_context_service.reset_stats()
+
+
+def get_snapshot() -> dict[str, Any]:
+    """관리자 JSON 조회용 집계. 지연 시간이 긴 단계부터 정렬한다."""
+    with _LOCK:
+        llm = [
+            {
+                "stage": stage,
+                "slot": slot,
+                "model": model,
+                **series.latency.as_dict(),
+                "errors": series.errors,
+                "prompt_tokens": series.prompt_tokens,
+                "completion_tokens": series.completion_tokens,
+                "first_token_p50_ms": round(series.first_token.quantile(0.5) * 1000, 1) if series.first_token.count else None,
+                "total_seconds": round(series.latency.total, 3),
+            }
+            for (stage, slot, model), series in _LLM.items()
+        ]
+        rag = [
+            {
+                "operation": operation,
+                "source": source,
+                **series.latency.as_dict(),
+                "errors": series.errors,
+                "total_seconds": round(series.latency.total, 3),
+            }
+            for (operation, source), series in _RAG.items()
+        ]
+        started_at = _STARTED_AT
+    llm.sort(key=lambda row: -row["total_seconds"])
+    rag.sort(key=lambda row: -row["total_seconds"])
+    return {
+        "enabled": is_enabled(),
+        "started_at": started_at,
+        "llm": llm,
+        "rag": rag,
+        "slots": ai_slot_health_service.get_snapshot(),
+        "context": rag_context_service.get_stats(),
+    }
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs: dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs.items())
+
+
+def _render_histogram(lines: list[str], name: str, labels: dict[str, str], hist: _Histogram) -> None:
+    cumulative = 0
+    base = _labels(labels)
+    for upper, bucket_count in zip(LATENCY_BUCKETS, hist.buckets):
+        cumulative += bucket_count
+        lines.append(f'{name}_bucket{{{base},le="{upper:g}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{base},le="+Inf"}} {hist.count}')
+    lines.append(f"{name}_sum{{{base}}} {hist.total:.6f}")
+    lines.append(f"{name}_count{{{base}}} {hist.count}")
+
+
+def render_prometheus() -> str:
+    """Prometheus text exposition format(0.0.4)으로 렌더링한다."""
+    lines: list[str] = []
+    with _LOCK:
+        llm_items = list(_LLM.items())
+        rag_items = list(_RAG.items())
+        lines.append("# HELP chatbot_llm_request_duration_seconds LLM call latency by chatbot stage and model slot.")
+        lines.append("# TYPE chatbot_llm_request_duration_seconds histogram")
+        for (stage, slot, model), series in llm_items:
+            _render_histogram(
+                lines, "chatbot_llm_request_duration_seconds", {"stage": stage, "slot": slot, "model": model}, series.latency
+            )
+        lines.append("# HELP chatbot_llm_first_token_seconds Time to first streamed token.")
+        lines.append("# TYPE chatbot_llm_first_token_seconds histogram")
+        for (stage, slot, model), series in llm_items:
+            if series.first_token.count:
+                _render_histogram(
+                    lines, "chatbot_llm_first_token_seconds", {"stage": stage, "slot": slot, "model": model}, series.first_token
+                )
+        for metric, attr, help_text in (
+            ("chatbot_llm_errors_total", "errors", "Failed LLM calls."),
+            ("chatbot_llm_prompt_tokens_total", "prompt_tokens", "Approximate prompt tokens sent (system + user)."),
+            ("chatbot_llm_completion_tokens_total", "completion_tokens", "Approximate completion tokens received."),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for (stage, slot, model), series in llm_items:
+                labels = _labels({"stage": stage, "slot": slot, "model": model})
+                lines.append(f"{metric}{{{labels}}} {getattr(series, attr)}")
+        lines.append("# HELP chatbot_rag_request_duration_seconds RAG insert/retrieve latency by source (remote/local/cache).")
+        lines.append("# TYPE chatbot_rag_request_duration_seconds histogram")
+        for (operation, source), series in rag_items:
+            _render_histogram(
+                lines, "chatbot_rag_request_duration_seconds", {"operation": operation, "source": source}, series.latency
+            )
+        lines.append("# HELP chatbot_rag_errors_total Failed RAG insert/retrieve calls.")
+        lines.append("# TYPE chatbot_rag_errors_total counter")
+        for (operation, source), series in rag_items:
+            lines.append(f"chatbot_rag_errors_total{{{_labels({'operation': operation, 'source': source})}}} {series.errors}")
+    slots = ai_slot_health_service.get_snapshot()
+    lines.append("# HELP ai_slot_circuit_open Model slot circuit breaker state (0=closed, 1=open, 0.5=half_open).")
+    lines.append("# TYPE ai_slot_circuit_open gauge")
+    for row in slots:
+        value = {"open": 1, "half_open": 0.5}.get(row["state"], 0)
+        lines.append(f"ai_slot_circuit_open{{{_labels({'slot': row['slot']})}}} {value:g}")
+    for metric, key, help_text in (
+        ("ai_slot_short_circuits_total", "short_circuits", "Calls skipped because the slot circuit was open."),
+        ("ai_slot_hedges_total", "hedges", "Hedged requests sent to the slot."),
+        ("ai_slot_hedge_wins_total", "hedge_wins", "Hedged requests to the slot that answered first."),
+    ):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for row in slots:
+            lines.append(f"{metric}{{{_labels({'slot': row['slot']})}}} {row[key]}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,200 @@
+"""[chatbot] 관리자 질문 SQL/RAG 라우팅 로컬 분류기입니다. 규칙 → 로컬 모델 순으로 판단하고, 확신이 낮을 때만 LLM 라우터로 넘깁니다."""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.services import rag_cache_service
+
+ROUTE_SQL = "sql"
+ROUTE_RAG = "rag"
+ROUTES = (ROUTE_SQL, ROUTE_RAG)
+
+TIER_RULE = "rule"
+TIER_MODEL = "model"
+TIER_LLM = "llm"
+TIERS = (TIER_RULE, TIER_MODEL, TIER_LLM)
+
+# (패턴, 가중치). DB 수치 조회 신호와 문서 검색/요약 신호를 각각 점수화한다.
+_SQL_RULES: tuple[tuple[re.Pattern[str], float], ...] = (
+    (re.compile(r"몇\s*(명|개|건|번|회|팀|과제|주)|개수|갯수|건수|인원\s*수|합계|평균|비율|통계"), 2.0),
+    (re.compile(r"(가장|제일)\s*(높|낮|많|적|빠|늦|느)"), 2.0),
+    (re.compile(r"순위|랭킹|\btop\s*\d*\b|상위|하위|최고|최저|최대|최소"), 2.0),
+    (re.compile(r"진행률|출석률|참석률|달성률"), 1.0),
+    (re.compile(r"목록|리스트|명단|현황"), 1.0),
+    (re.compile(r"\d+\s*(%|퍼센트)?\s*(이상|이하|미만|초과)"), 1.0),
+)
+_RAG_RULES: tuple[tuple[re.Pattern[str], float], ...] = (
+    (re.compile(r"요약|정리해|설명해|관련"), 2.0),
+    (re.compile(r"내용|의견|피드백|조언|사례|방법|어떻게|왜"), 1.0),
+    (re.compile(r"코칭\s*노트|게시글|게시판|공지|문서|과제\s*기록|댓글"), 1.0),
+)
+
+_STATS_LOCK = threading.Lock()
+_STATS: dict[str, Counter] = {"tiers": Counter(), "routes": Counter()}
+
+_MODEL_LOCK = threading.Lock()
+# logged_since_train: 마지막 학습 이후 이 프로세스가 기록한 결정 수(로그는 상한/덮어쓰기로 건수가 늘지 않을 수 있음)
+# logged_count: 학습 전 최소 표본 확인용 로그 건수 캐시(None이면 다시 센다)
+_MODEL_STATE: dict[str, Any] = {"model": None, "samples": 0, "logged_since_train": 0, "logged_count": None}
+
+
+def _normalize(question: str) -> str:
+    return re.sub(r"\s+", " ", str(question or "")).strip().lower()
+
+
+def classify_by_rules(question: str) -> tuple[str | None, float]:
+    """규칙 점수로 (route, confidence)를 반환한다. 신호가 없으면 (None, 0.0)."""
+    text = _normalize(question)
+    sql_score = sum(weight for pattern, weight in _SQL_RULES if pattern.search(text))
+    rag_score = sum(weight for pattern, weight in _RAG_RULES if pattern.search(text))
+    if sql_score == rag_score:
+        return None, 0.0
+    top = max(sql_score, rag_score)
+    # 점수 차이 비율과 신호 강도(2점 이상이면 최대)를 함께 반영한다.
+    confidence = (abs(sql_score - rag_score) / (sql_score + rag_score)) * min(1.0, top / 2.0)
+    return (ROUTE_SQL if sql_score > rag_score else ROUTE_RAG), round(confidence, 4)
+
+
+def _features(text: str) -> list[str]:
+    # 한국어 조사/어미 변화에 덜 민감하도록 공백 제거 문자 bigram + 어절 단위를 함께 쓴다.
+    compact = _normalize(text).replace(" ", "")
+    grams = [compact[idx : idx + 2] for idx in range(max(0, len(compact) - 1))]
+    return grams + [f"w:{token}" for token in _normalize(text).split(" ") if token]
+
+
+class RouteModel:
+    """[chatbot] LLM 라우팅 로그로 학습하는 경량 나이브 베이즈 분류기(외부 의존성 없음)."""
+
+    def __init__(self, samples: list[tuple[str, str]]):
+        self.doc_counts: Counter = Counter()
+        self.token_counts: dict[str, Counter] = {route: Counter() for route in ROUTES}
+        for question, route in samples:
+            if route not in ROUTES:
+                continue
+            self.doc_counts[route] += 1
+            self.token_counts[route].update(_features(question))
+        self.vocab = set().union(*(set(counts) for counts in self.token_counts.values()))
+        self.totals = {route: sum(counts.values()) for route, counts in self.token_counts.items()}
+
+    def predict(self, question: str) -> tuple[str | None, float]:
+        if not all(self.doc_counts[route] for route in ROUTES):
+            return None, 0.0
+        features = _features(question)
+        total_docs = sum(self.doc_counts.values())
+        vocab_size = max(1, len(self.vocab))
+        log_probs: dict[str, float] = {}
+        for route in ROUTES:
+            score = math.log(self.doc_counts[route] / total_docs)
+            denominator = self.totals[route] + vocab_size
+            for feature in features:
+                score += math.log((self.token_counts[route][feature] + 1) / denominator)
+            log_probs[route] = score
+        best = max(log_probs, key=log_probs.get)
+        peak = log_probs[best]
+        norm = sum(math.exp(value - peak) for value in log_probs.values())
+        return best, round(1.0 / norm, 4)
+
+
+def record_llm_decision(db: Session, question: str, route: str) -> None:
+    # LLM 라우팅 결과를 학습 로그로 남긴다. 같은 질문은 최신 결정으로 덮어쓴다.
+    if route not in ROUTES or not _normalize(question):
+        return
+    rag_cache_service.put_entry(
+        db,
+        rag_cache_service.NAMESPACE_ROUTE_DECISION,
+        rag_cache_service.build_cache_key(_normalize(question)),
+        {"question": _normalize(question), "route": route},
+        max_entries=int(settings.CHATBOT_ROUTE_LOG_MAX_ENTRIES),
+    )
+    with _MODEL_LOCK:
+        _MODEL_STATE["logged_since_train"] += 1
+        _MODEL_STATE["logged_count"] = None
+
+
+def _load_model(db: Session) -> RouteModel | None:
+    # 로그가 최소 표본 수를 넘으면 학습하고, 이후 결정이 일정 건수 기록될 때마다 다시 학습한다.
+    with _MODEL_LOCK:
+        model = _MODEL_STATE["model"]
+        logged_since_train = int(_MODEL_STATE["logged_since_train"])
+        logged_count = _MODEL_STATE["logged_count"]
+    if model is not None:
+        if logged_since_train < max(1, int(settings.CHATBOT_ROUTE_MODEL_RETRAIN_EVERY)):
+            return model
+    else:
+        if logged_count is None:
+            logged_count = rag_cache_service.count_entries(db, rag_cache_service.NAMESPACE_ROUTE_DECISION)
+            with _MODEL_LOCK:
+                _MODEL_STATE["logged_count"] = logged_count
+        if logged_count < max(1, int(settings.CHATBOT_ROUTE_MODEL_MIN_SAMPLES)):
+            return None
+    payloads = rag_cache_service.list_payloads(db, rag_cache_service.NAMESPACE_ROUTE_DECISION)
+    samples = [
+        (str(row.get("question") or ""), str(row.get("route") or ""))
+        for row in payloads
+        if isinstance(row, dict)
+    ]
+    model = RouteModel(samples)
+    with _MODEL_LOCK:
+        _MODEL_STATE["model"] = model
+        _MODEL_STATE["samples"] = len(samples)
+        # 학습용 로그를 읽는 동안 기록된 결정은 다음 재학습 건수로 남긴다.
+        _MODEL_STATE["logged_since_train"] = max(0, int(_MODEL_STATE["logged_since_train"]) - logged_since_train)
+    return model
+
+
+def classify_locally(db: Session, question: str) -> tuple[str | None, str | None, float]:
+    """로컬 단계로 판단한다. 확신이 기준 미만이면 (None, None, confidence)를 반환해 LLM 라우터로 넘긴다."""
+    route, confidence = classify_by_rules(question)
+    if route is not None and confidence >= float(settings.CHATBOT_ROUTE_RULE_MIN_CONFIDENCE):
+        return route, TIER_RULE, confidence
+    if settings.CHATBOT_ROUTE_MODEL_ENABLED:
+        model = _load_model(db)
+        if model is not None:
+            route, confidence = model.predict(question)
+            if route is not None and confidence >= float(settings.CHATBOT_ROUTE_MODEL_MIN_CONFIDENCE):
+                return route, TIER_MODEL, confidence
+    return None, None, confidence
+
+
+def record_tier(tier: str, route: str) -> None:
+    with _STATS_LOCK:
+        _STATS["tiers"][tier] += 1
+        _STATS["routes"][route] += 1
+
+
+def reset_state() -> None:
+    with _STATS_LOCK:
+        _STATS["tiers"].clear()
+        _STATS["routes"].clear()
+    with _MODEL_LOCK:
+        _MODEL_STATE["model"] = None
+        _MODEL_STATE["samples"] = 0
+        _MODEL_STATE["logged_since_train"] = 0
+        _MODEL_STATE["logged_count"] = None
+
+
+def get_stats(db: Session) -> dict[str, Any]:
+    with _STATS_LOCK:
+        tiers = {tier: int(_STATS["tiers"].get(tier, 0)) for tier in TIERS}
+        routes = {route: int(_STATS["routes"].get(route, 0)) for route in ROUTES}
+    with _MODEL_LOCK:
+        trained_samples = int(_MODEL_STATE["samples"]) if _MODEL_STATE["model"] is not None else 0
+    decisions = sum(tiers.values())
+    return {
+        "local_enabled": bool(settings.CHATBOT_ROUTE_LOCAL_ENABLED),
+        "model_enabled": bool(settings.CHATBOT_ROUTE_MODEL_ENABLED),
+        "decisions": decisions,
+        "tiers": tiers,
+        "routes": routes,
+        "local_ratio": round((tiers[TIER_RULE] + tiers[TIER_MODEL]) / decisions, 4) if decisions else 0.0,
+        "logged_samples": rag_cache_service.count_entries(db, rag_cache_service.NAMESPACE_ROUTE_DECISION),
+        "model_trained_samples": trained_samples,
+    }
@@ -0,0 +1,137 @@
+"""[chatbot] SQL 생성/라우팅 프롬프트용 DB 스키마 가이드 프로세스 캐시입니다. 기동 시 한 번 introspect하고 스키마 보정 시 무효화합니다."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_SCHEMA_GUIDE = (
+    "tables:\n"
+    "- users(user_id, emp_id, name, role, department, is_active)\n"
+    "- projects(project_id, batch_id, project_name, organization, progress_rate, status, visibility)\n"
+    "- project_member(member_id, project_id, user_id, role, is_representative)\n"
+    "- coaching_notes(note_id, project_id, author_id, coaching_date, week_number, progress_rate, current_status)\n"
+    "- batch(batch_id, batch_name, start_date, end_date, status)\n"
+    "relations:\n"
+    "- project_member.user_id = users.user_id\n"
+    "- project_member.project_id = projects.project_id\n"
+    "- projects.batch_id = batch.batch_id\n"
+    "- coaching_notes.project_id = projects.project_id\n"
+    "- coaching_notes.author_id = users.user_id\n"
+)
+
+SEMANTIC_HINTS = (
+    "semantic_hints:\n"
+    "- 사용자의 과제 조회는 users -> project_member -> projects 조인을 우선 고려\n"
+    "- 사용자 식별은 users.name 또는 users.emp_id를 사용\n"
+    "- 코칭노트는 coaching_notes.project_id로 projects와 연결\n"
+)
+
+_LOCK = threading.Lock()
+# DB URL별 스키마 가이드와 그 가이드로 미리 조립한 프롬프트 템플릿
+_GUIDES: dict[str, str] = {}
+_PROMPTS: dict[tuple[str, str], str] = {}
+_STATS = {"builds": 0, "invalidations": 0}
+
+
+def _bind_key(bind: Engine | Connection) -> str:
+    engine = getattr(bind, "engine", bind)
+    return engine.url.render_as_string(hide_password=True)
+
+
+def build_schema_guide(bind: Engine | Connection) -> str:
+    """DB를 introspect해 테이블/컬럼/FK 메타데이터 가이드를 만든다."""
+    inspector = inspect(bind)
+    table_lines: list[str] = []
+    relation_lines: list[str] = []
+    for table_name in sorted(inspector.get_table_names()):
+        col_parts: list[str] = []
+        for col in inspector.get_columns(table_name):
+            attrs: list[str] = []
+            if bool(col.get("primary_key")):
+                attrs.append("pk")
+            if not bool(col.get("nullable", True)):
+                attrs.append("notnull")
+            attr_text = f"[{','.join(attrs)}]" if attrs else ""
+            col_parts.append(f"{col.get('name')}:{col.get('type') or ''}{attr_text}")
+        table_lines.append(f"- {table_name}({', '.join(col_parts)})")
+
+        for fk in inspector.get_foreign_keys(table_name):
+            local_cols = ",".join([str(v) for v in (fk.get("constrained_columns") or [])]) or "?"
+            ref_table = str(fk.get("referred_table") or "?")
+            ref_cols = ",".join([str(v) for v in (fk.get("referred_columns") or [])]) or "?"
+            relation_lines.append(f"- {table_name}.{local_cols} -> {ref_table}.{ref_cols}")
+
+    lines: list[str] = ["tables:"] + table_lines
+    if relation_lines:
+        lines.append("relations:")
+        lines.extend(relation_lines)
+    lines.append(SEMANTIC_HINTS)
+    return "\n".join(lines)
+
+
+def get_schema_guide(bind: Engine | Connection | None) -> str:
+    if bind is None:
+        return FALLBACK_SCHEMA_GUIDE
+    key = _bind_key(bind)
+    with _LOCK:
+        cached = _GUIDES.get(key)
+    if cached is not None:
+        return cached
+    try:
+        guide = build_schema_guide(bind)
+    except Exception as exc:
+        # introspection 실패는 캐시하지 않고 다음 요청에서 다시 시도한다.
+        logger.warning("[chatbot] failed to build dynamic sql schema metadata: %s", exc)
+        return FALLBACK_SCHEMA_GUIDE
+    with _LOCK:
+        _GUIDES[key] = guide
+        _STATS["builds"] += 1
+    return guide
+
+
+def get_prompt_template(bind: Engine | Connection | None, name: str, builder: Callable[[str], str]) -> str:
+    """스키마 가이드를 포함한 고정 프롬프트 부분을 스키마 버전마다 한 번만 조립한다."""
+    guide = get_schema_guide(bind)
+    if bind is None:
+        return builder(guide)
+    key = (_bind_key(bind), name)
+    with _LOCK:
+        cached = _PROMPTS.get(key)
+        if cached is not None and _GUIDES.get(key[0]) is guide:
+            return cached
+    template = builder(guide)
+    with _LOCK:
+        if _GUIDES.get(key[0]) is guide:
+            _PROMPTS[key] = template
+    return template
+
+
+def warm_up(bind: Engine | Connection) -> str:
+    invalidate(bind)
+    return get_schema_guide(bind)
+
+
+def invalidate(bind: Engine | Connection | None = None) -> None:
+    """스키마가 바뀌었을 때 호출한다. bind가 없으면 모든 DB의 캐시를 비운다."""
+    with _LOCK:
+        if bind is None:
+            _GUIDES.clear()
+            _PROMPTS.clear()
+        else:
+            key = _bind_key(bind)
+            _GUIDES.pop(key, None)
+            for prompt_key in [row for row in _PROMPTS if row[0] == key]:
+                _PROMPTS.pop(prompt_key, None)
+        _STATS["invalidations"] += 1
+
+
+def get_stats() -> dict[str, int]:
+    with _LOCK:
+        return {"cached_databases": len(_GUIDES), "cached_prompts": len(_PROMPTS), **_STATS}
@@ -3,18 +3,21 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import logging
 import mimetypes
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import date, datetime, timezone
-from typing import Any
+from typing import Any, AsyncIterator
 from urllib.parse import unquote, urlparse
 
-import httpx
 from fastapi import HTTPException
-from sqlalchemy import inspect, text
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -24,7 +27,18 @@ from app.models.coaching_note import CoachingComment, CoachingNote
 from app.models.document import ProjectDocument
 from app.models.project import Project, ProjectMember
 from app.models.user import User
-from app.services.ai_client import AIClient
+from app.services import (
+    chatbot_metrics_service,
+    chatbot_route_service,
+    chatbot_schema_service,
+    chatbot_sql_service,
+    http_pool,
+    rag_cache_service,
+    rag_context_service,
+    rag_ingest_service,
+    rag_local_index_service,
+)
+from app.services.ai_client import AIClient, resolve_slot
 from app.utils.permissions import is_admin, is_participant
 
 logger = logging.getLogger(__name__)
@@ -46,6 +60,8 @@ class ChatbotService:
         r"""\.(?:png|jpe?g|gif|webp|bmp|svg)(?:\?[^\s"'<>]*)?$""",
         flags=re.IGNORECASE,
     )
+    # [chatbot] UUID 파일명으로 저장되어 내용이 바뀌지 않는 업로드 경로
+    _IMMUTABLE_UPLOAD_PATH = "/uploads/editor_images/"
     _DOCUMENT_TYPE_LABELS = {
         "application": "지원서",
         "basic_consulting": "기초컨설팅 산출물",
@@ -55,12 +71,20 @@ class ChatbotService:
         "other_material": "기타 자료",
     }
 
+    # [chatbot] 요약/엔티티 프롬프트를 바꾸면 버전을 올려 기존 캐시를 무효화한다.
+    _SUMMARY_PROMPT_VERSION = "summary_entity.v1"
+    # [chatbot] 답변 프롬프트를 바꾸면 버전을 올려 기존 답변 캐시를 무효화한다.
+    _ANSWER_PROMPT_VERSION = "rag_answer.v1"
+    _RETRIEVE_CACHE_VERSION = "retrieve_rrf.v1"
+    _AI_DISABLED_ANSWER = "AI 기능이 비활성화되어 있어 검색 문맥만 제공합니다."
+    _EMPTY_ANSWER = "검색 결과를 바탕으로 답변을 생성하지 못했습니다."
+
     def __init__(self, db: Session):
         self.db = db
-        self._sql_schema_cache: str | None = None
         self._debug_llm_history: list[dict[str, Any]] = []
         self._debug_rag_result: dict[str, Any] | None = None
         self._debug_llm_live_emitted: bool = False
+        self._last_rag_context: rag_context_service.ContextBuild | None = None
 
     def _is_chat_debug_enabled(self) -> bool:
         return bool(getattr(settings, "CHAT_DEBUG_MODE", False))
@@ -110,6 +134,39 @@ class ChatbotService:
             self._clip_debug_text(response, 1000),
         )
 
+    def _llm_slot(self, client: Any) -> str:
+        # [chatbot] 지표 라벨용 model1~model4 슬롯. 테스트 대역 등 슬롯을 알 수 없으면 unknown.
+        resolver = getattr(client, "_resolve_slot", None)
+        try:
+            slot = resolver(str(getattr(client, "model_name", "") or "")) if callable(resolver) else None
+        except Exception:
+            slot = None
+        return slot if isinstance(slot, str) and slot else "unknown"
+
+    def _observe_llm(
+        self,
+        client: Any,
+        *,
+        stage: str,
+        started: float,
+        prompt: str,
+        system_prompt: str | None,
+        completion: str = "",
+        error: bool = False,
+        first_token_at: float | None = None,
+    ) -> None:
+        chatbot_metrics_service.observe_llm(
+            stage=stage,
+            slot=self._llm_slot(client),
+            model=str(getattr(client, "model_name", "") or "-"),
+            seconds=time.perf_counter() - started,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            completion=completion,
+            error=error,
+            first_token_seconds=(first_token_at - started) if first_token_at is not None else None,
+        )
+
     def _invoke_llm(
         self,
         *,
@@ -119,9 +176,15 @@ class ChatbotService:
         system_prompt: str | None,
         stage: str,
     ) -> str:
-        # [chatbot] debug 모드에서 LLM 프롬프트/응답 이력을 수집한다.
+        # [chatbot] debug 모드에서 LLM 프롬프트/응답 이력을 수집하고, 단계별 지연/토큰 지표는 항상 기록한다.
         client = AIClient.get_client(purpose, user_id=user_id)
-        output = self._normalize_text(client.invoke(prompt, system_prompt))
+        started = time.perf_counter()
+        try:
+            output = self._normalize_text(client.invoke(prompt, system_prompt))
+        except Exception:
+            self._observe_llm(client, stage=stage, started=started, prompt=prompt, system_prompt=system_prompt, error=True)
+            raise
+        self._observe_llm(client, stage=stage, started=started, prompt=prompt, system_prompt=system_prompt, completion=output)
         self._record_llm_history(
             stage=stage,
             model=str(getattr(client, "model_name", purpose)),
@@ -310,40 +373,156 @@ class ChatbotService:
             return self._normalize_text(" ".join(chunks))
         return self._normalize_text(str(message_content or ""))
 
+    def _image_caption_cache_key(self, image_url: str, *, prompt_text: str) -> str | None:
+        # [chatbot] 로컬 업로드 파일은 내용 digest, 에디터 업로드(UUID 파일명, 불변) URL은 URL 자체로 키를 만든다.
+        local_path = self._resolve_local_upload_file_path(image_url)
+        if local_path:
+            try:
+                digest = hashlib.sha256()
+                with open(local_path, "rb") as reader:
+                    for chunk in iter(lambda: reader.read(1024 * 1024), b""):
+                        digest.update(chunk)
+                source = f"file:{digest.hexdigest()}"
+            except OSError:
+                return None
+        elif self._IMMUTABLE_UPLOAD_PATH in urlparse(image_url).path:
+            source = f"url:{image_url}"
+        else:
+            return None
+        return rag_cache_service.build_cache_key(
+            str(settings.AI_IMAGE_MODEL_NAME or "").strip(),
+            prompt_text,
+            source,
+        )
+
+    def _image_caption_prompt_text(self) -> str:
+        return self._normalize_text(settings.AI_IMAGE_MODEL_PROMPT) or "이미지를 상세히 한글로 설명해주세요."
+
+    def _lookup_cached_image_caption(self, normalized_url: str, *, prompt_text: str) -> tuple[str | None, str]:
+        # [chatbot] (캐시 키, 캐시된 설명)을 반환한다. 캐시 대상이 아니거나 미스면 설명은 빈 문자열.
+        if not settings.RAG_IMAGE_CAPTION_CACHE_ENABLED:
+            return None, ""
+        cache_key = self._image_caption_cache_key(normalized_url, prompt_text=prompt_text)
+        if not cache_key:
+            return None, ""
+        cached = rag_cache_service.get_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_IMAGE_CAPTION,
+            cache_key,
+            ttl_seconds=float(settings.RAG_IMAGE_CAPTION_CACHE_TTL_SECONDS),
+        )
+        if isinstance(cached, dict) and self._normalize_text(cached.get("caption")):
+            self._emit_chat_debug("[chatbot][debug] image_caption cache hit url=%s", normalized_url)
+            return cache_key, self._normalize_text(cached.get("caption"))
+        return cache_key, ""
+
+    def _store_image_caption(self, cache_key: str | None, normalized_url: str, caption: str) -> None:
+        if not caption or not cache_key:
+            return
+        rag_cache_service.put_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_IMAGE_CAPTION,
+            cache_key,
+            {"caption": caption, "url": normalized_url},
+            max_entries=int(settings.RAG_IMAGE_CAPTION_CACHE_MAX_ENTRIES),
+            ttl_seconds=float(settings.RAG_IMAGE_CAPTION_CACHE_TTL_SECONDS),
+        )
+
     def _describe_single_image_ko(self, image_url: str, *, user_id: str) -> str:
         # [chatbot] 이미지 인식 LLM으로 이미지 설명(한국어)을 생성한다.
         normalized_url = self._normalize_image_url(image_url)
         if not normalized_url or not self._is_image_llm_ready():
             return ""
-        model_input_url = self._image_url_to_model_input(normalized_url)
-        prompt_text = self._normalize_text(settings.AI_IMAGE_MODEL_PROMPT) or "이미지를 상세히 한글로 설명해주세요."
-
+        prompt_text = self._image_caption_prompt_text()
+        cache_key, cached = self._lookup_cached_image_caption(normalized_url, prompt_text=prompt_text)
+        if cached:
+            return cached
+        caption = self._generate_image_caption_ko(normalized_url, prompt_text=prompt_text, user_id=user_id)
+        self._store_image_caption(cache_key, normalized_url, caption)
+        return caption
+
+    def _image_caption_client(self, user_id: str) -> tuple[Any, dict[str, str]] | None:
+        # [chatbot] 이미지 인식 호출용 OpenAI 클라이언트를 만든다(한 번의 설명 생성 요청에서 모든 이미지가 공유).
+        # SDK 자동 재시도는 끈다. 재시도마다 timeout이 새로 시작되어 이미지당 대기 시간 상한이 깨지기 때문이다.
         try:
             from openai import OpenAI
         except Exception:
-            return ""
-
+            return None
         try:
-            ai_client = AIClient(model_name=settings.AI_IMAGE_MODEL_NAME, user_id=user_id)
-            headers = ai_client._build_headers()
+            headers = AIClient(model_name=settings.AI_IMAGE_MODEL_NAME, user_id=user_id)._build_headers()
+            base_url = str(settings.AI_IMAGE_MODEL_BASE_URL).strip()
             client = OpenAI(
                 api_key=settings.OPENAI_API_KEY,
-                base_url=str(settings.AI_IMAGE_MODEL_BASE_URL).strip(),
+                base_url=base_url,
                 default_headers=headers,
+                http_client=http_pool.get_client(base_url),
+                max_retries=0,
             )
+        except Exception as exc:
+            logger.warning("[chatbot] image caption client init failed: %s", exc)
+            return None
+        return client, headers
+
+    def _generate_image_caption_ko(
+        self,
+        normalized_url: str,
+        *,
+        prompt_text: str,
+        user_id: str,
+        caption_client: tuple[Any, dict[str, str]] | None = None,
+        cancelled: threading.Event | None = None,
+    ) -> str:
+        # [chatbot] 기본/대체 스키마 시도가 AI_IMAGE_CAPTION_TIMEOUT_SECONDS 하나의 마감 시각을 나눠 쓴다.
+        # 병렬 생성에서 대기를 포기한 이미지(cancelled)는 다음 모델 호출을 시작하지 않는다.
+        deadline = time.monotonic() + self._image_caption_timeout_seconds()
+        if caption_client is None:
+            caption_client = self._image_caption_client(user_id)
+            if caption_client is None:
+                return ""
+        client, headers = caption_client
+        model_input_url = self._image_url_to_model_input(normalized_url)
+
+        try:
 
             def _invoke(content: list[dict[str, Any]]) -> str:
-                response = client.chat.completions.create(
-                    model=str(settings.AI_IMAGE_MODEL_NAME).strip(),
-                    messages=[{"role": "user", "content": content}],
-                    temperature=0.1,
-                    max_tokens=500,
-                    extra_headers=headers,
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or (cancelled is not None and cancelled.is_set()):
+                    return ""
+                started = time.perf_counter()
+                model_name = str(settings.AI_IMAGE_MODEL_NAME).strip()
+                try:
+                    response = client.chat.completions.create(
+                        model=model_name,
+                        messages=[{"role": "user", "content": content}],
+                        temperature=0.1,
+                        max_tokens=500,
+                        extra_headers=headers,
+                        timeout=remaining,
+                    )
+                except Exception:
+                    chatbot_metrics_service.observe_llm(
+                        stage="image_caption",
+                        slot="image",
+                        model=model_name,
+                        seconds=time.perf_counter() - started,
+                        prompt=prompt_text,
+                        error=True,
+                    )
+                    raise
+                output = ""
+                if response.choices:
+                    message = response.choices[0].message
+                    output = self._normalize_llm_message_text(getattr(message, "content", ""))
+                chatbot_metrics_service.observe_llm(
+                    stage="image_caption",
+                    slot="image",
+                    model=model_name,
+                    seconds=time.perf_counter() - started,
+                    prompt=prompt_text,
+                    completion=output,
                 )
                 if not response.choices:
                     return ""
-                message = response.choices[0].message
-                output = self._normalize_llm_message_text(getattr(message, "content", ""))
                 self._record_llm_history(
                     stage="image_caption",
                     model=str(settings.AI_IMAGE_MODEL_NAME).strip() or "image-model",
@@ -370,19 +549,91 @@ class ChatbotService:
             logger.warning("[chatbot] image caption generation failed for %s: %s", normalized_url, exc)
             return ""
 
+    def _image_caption_timeout_seconds(self) -> float:
+        return max(1.0, float(getattr(settings, "AI_IMAGE_CAPTION_TIMEOUT_SECONDS", 30.0) or 30.0))
+
+    def _generate_image_captions_parallel(self, urls: list[str], *, prompt_text: str, user_id: str) -> dict[str, str]:
+        # [chatbot] 이미지 인식 호출만 제한된 스레드 풀로 병렬 실행한다.
+        # DB 세션은 스레드 간 공유할 수 없으므로 캐시 조회/저장은 호출 스레드에서만 수행한다.
+        if not urls:
+            return {}
+        caption_client = self._image_caption_client(user_id)
+        if caption_client is None:
+            return {}
+        concurrency = max(1, int(getattr(settings, "AI_IMAGE_CAPTION_CONCURRENCY", 3) or 1))
+        if concurrency == 1 or len(urls) == 1:
+            return {
+                url: self._generate_image_caption_ko(
+                    url, prompt_text=prompt_text, user_id=user_id, caption_client=caption_client
+                )
+                for url in urls
+            }
+        # 이미지당 마감 시각은 호출 안에서 지키고, 전체 대기는 대기열을 고려해 라운드 수만큼 허용한다.
+        rounds = -(-len(urls) // concurrency)
+        deadline = self._image_caption_timeout_seconds() * rounds + 1.0
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=min(concurrency, len(urls)), thread_name_prefix="image-caption")
+        try:
+            futures = {
+                executor.submit(
+                    self._generate_image_caption_ko,
+                    url,
+                    prompt_text=prompt_text,
+                    user_id=user_id,
+                    caption_client=caption_client,
+                    cancelled=cancelled,
+                ): url
+                for url in urls
+            }
+            done, not_done = wait(futures, timeout=deadline)
+            results: dict[str, str] = {}
+            for future in done:
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as exc:
+                    logger.warning("[chatbot] image caption generation failed for %s: %s", futures[future], exc)
+            for future in not_done:
+                logger.warning("[chatbot] image caption generation timed out for %s", futures[future])
+            return results
+        finally:
+            # 대기 중인 이미지는 취소하고, 실행 중인 이미지는 진행 중 호출(이미지당 마감 시각으로 제한)만 마치고 멈춘다.
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _build_image_caption_entries(self, image_urls: list[str], *, user_id: str) -> list[dict[str, str]]:
         # [chatbot] 이미지 URL 목록을 기반으로 RAG content/metadata에 넣을 설명 목록을 만든다.
         if not image_urls:
             return []
         max_images = max(1, int(getattr(settings, "AI_IMAGE_MODEL_MAX_IMAGES", 3) or 3))
+        normalized_urls = [
+            url for url in (self._normalize_image_url(raw_url) for raw_url in image_urls[:max_images]) if url
+        ]
+        captions: dict[str, str] = {}
+        if normalized_urls and self._is_image_llm_ready():
+            prompt_text = self._image_caption_prompt_text()
+            cache_keys: dict[str, str | None] = {}
+            for url in dict.fromkeys(normalized_urls):
+                cache_keys[url], captions[url] = self._lookup_cached_image_caption(url, prompt_text=prompt_text)
+            # 같은 파일 내용(캐시 키)을 가리키는 URL은 대표 URL 하나만 이미지 인식 모델에 보낸다.
+            representative: dict[str, str] = {}
+            for url, caption in captions.items():
+                if not caption:
+                    representative.setdefault(cache_keys.get(url) or f"url:{url}", url)
+            generated = self._generate_image_captions_parallel(
+                list(representative.values()),
+                prompt_text=prompt_text,
+                user_id=user_id,
+            )
+            for url, caption in list(captions.items()):
+                if caption:
+                    continue
+                source_url = representative[cache_keys.get(url) or f"url:{url}"]
+                captions[url] = generated.get(source_url) or ""
+                if url == source_url:
+                    self._store_image_caption(cache_keys.get(url), url, captions[url])
         entries: list[dict[str, str]] = []
-        for raw_url in image_urls[:max_images]:
-            normalized_url = self._normalize_image_url(raw_url)
-            if not normalized_url:
-                continue
-            caption = self._describe_single_image_ko(normalized_url, user_id=user_id)
-            if not caption:
-                caption = "이미지가 포함된 문서입니다."
+        for normalized_url in normalized_urls:
+            caption = captions.get(normalized_url) or "이미지가 포함된 문서입니다."
             entries.append(
                 {
                     "url": normalized_url,
@@ -612,9 +863,12 @@ class ChatbotService:
 
     def _parse_route_decision(self, raw_text: str) -> str:
         # [chatbot] LLM이 반환한 JSON(route=sql|rag)을 파싱
+        return self._parse_route_value(raw_text) or "rag"
+
+    def _parse_route_value(self, raw_text: str) -> str | None:
         candidate = str(raw_text or "").strip()
         if not candidate:
-            return "rag"
+            return None
         fenced_match = re.search(r"```(?:json)?\s*(.*?)```", candidate, flags=re.DOTALL | re.IGNORECASE)
         if fenced_match:
             candidate = fenced_match.group(1).strip()
@@ -633,20 +887,26 @@ class ChatbotService:
                 except json.JSONDecodeError:
                     parsed = None
         route = str((parsed or {}).get("route") or "").strip().lower()
-        return route if route in {"sql", "rag"} else "rag"
-
-    def _decide_route_with_llm(self, *, question: str, user_id: str) -> str:
-        # [chatbot] 관리자 질문은 LLM이 SQL/RAG 라우팅을 JSON으로 결정
-        if not settings.AI_FEATURES_ENABLED:
-            self._emit_chat_debug("[chatbot][debug] route_decision skipped: AI_FEATURES_ENABLED=false")
-            return "rag"
-        try:
-            system_prompt = (
-                "당신은 질문 라우터입니다.\n"
-                "관리자 질문을 SQL 조회 또는 RAG 검색 중 하나로 분류하세요.\n"
-                "반드시 JSON 한 줄만 응답: {\"route\":\"sql|rag\",\"reason\":\"...\"}"
-            )
-            prompt = (
+        return route if route in {"sql", "rag"} else None
+
+    def _decide_route(self, *, question: str, user_id: str) -> str:
+        # [chatbot] 로컬 분류기(규칙/경량 모델)가 확신하면 LLM 라우터 호출을 생략한다.
+        if settings.CHATBOT_ROUTE_LOCAL_ENABLED:
+            route, tier, confidence = chatbot_route_service.classify_locally(self.db, question)
+            if route is not None and tier is not None:
+                self._emit_chat_debug(
+                    "[chatbot][debug] route_decision tier=%s route=%s confidence=%.2f", tier, route, confidence
+                )
+                chatbot_route_service.record_tier(tier, route)
+                return route
+        route = self._decide_route_with_llm(question=question, user_id=user_id)
+        chatbot_route_service.record_tier(chatbot_route_service.TIER_LLM, route)
+        return route
+
+    def _route_prompt_template(self) -> str:
+        # [chatbot] 스키마 가이드가 포함된 고정 부분은 스키마 버전마다 한 번만 조립한다.
+        def _build(guide: str) -> str:
+            return (
                 "분류 기준:\n"
                 "- SQL: 집계/순위/비교/개수/최저/최고/현황 등 DB 수치 조회가 필요한 질문\n"
                 "- SQL: 특정 사용자(이름/사번)의 과제/진행률/현황을 DB 조인으로 찾는 질문\n"
@@ -658,9 +918,23 @@ class ChatbotService:
                 "- 질문: 정수연 과제 뭐야? -> {\"route\":\"sql\",\"reason\":\"사용자-과제 매핑\"}\n"
                 "- 질문: N2SQL 관련 과제 알려줘 -> {\"route\":\"rag\",\"reason\":\"키워드/주제 기반 검색\"}\n"
                 "- 질문: A과제 이번주 코칭 노트 요약해줘 -> {\"route\":\"rag\",\"reason\":\"코칭노트 요약\"}\n\n"
-                f"{self._sql_schema_guide()}\n\n"
-                f"question: {self._normalize_text(question)}"
+                f"{guide}\n\n"
+            )
+
+        return chatbot_schema_service.get_prompt_template(self._schema_bind(), "route_decision", _build)
+
+    def _decide_route_with_llm(self, *, question: str, user_id: str) -> str:
+        # [chatbot] 관리자 질문은 LLM이 SQL/RAG 라우팅을 JSON으로 결정
+        if not settings.AI_FEATURES_ENABLED:
+            self._emit_chat_debug("[chatbot][debug] route_decision skipped: AI_FEATURES_ENABLED=false")
+            return "rag"
+        try:
+            system_prompt = (
+                "당신은 질문 라우터입니다.\n"
+                "관리자 질문을 SQL 조회 또는 RAG 검색 중 하나로 분류하세요.\n"
+                "반드시 JSON 한 줄만 응답: {\"route\":\"sql|rag\",\"reason\":\"...\"}"
             )
+            prompt = self._route_prompt_template() + f"question: {self._normalize_text(question)}"
             raw = self._invoke_llm(
                 purpose="general",
                 user_id=user_id,
@@ -668,7 +942,11 @@ class ChatbotService:
                 system_prompt=system_prompt,
                 stage="route_decision",
             )
-            return self._parse_route_decision(raw)
+            route = self._parse_route_value(raw)
+            if route is not None:
+                # [chatbot] 정상 파싱된 LLM 라우팅 결과만 로컬 모델 학습 로그로 남긴다.
+                chatbot_route_service.record_llm_decision(self.db, question, route)
+            return route or "rag"
         except Exception as exc:
             logger.warning("[chatbot] route decision failed: %s", exc)
             self._emit_chat_debug("[chatbot][debug] route_decision failed: %s", exc)
@@ -679,73 +957,12 @@ class ChatbotService:
         dialect = getattr(getattr(bind, "dialect", None), "name", None)
         return str(dialect or "").lower()
 
-    def _fallback_sql_schema_guide(self) -> str:
-        return (
-            "tables:\n"
-            "- users(user_id, emp_id, name, role, department, is_active)\n"
-            "- projects(project_id, batch_id, project_name, organization, progress_rate, status, visibility)\n"
-            "- project_member(member_id, project_id, user_id, role, is_representative)\n"
-            "- coaching_notes(note_id, project_id, author_id, coaching_date, week_number, progress_rate, current_status)\n"
-            "- batch(batch_id, batch_name, start_date, end_date, status)\n"
-            "relations:\n"
-            "- project_member.user_id = users.user_id\n"
-            "- project_member.project_id = projects.project_id\n"
-            "- projects.batch_id = batch.batch_id\n"
-            "- coaching_notes.project_id = projects.project_id\n"
-            "- coaching_notes.author_id = users.user_id\n"
-        )
+    def _schema_bind(self) -> Any:
+        return getattr(self.db, "bind", None)
 
     def _sql_schema_guide(self) -> str:
-        # [chatbot] SQL 생성용 메타데이터를 DB 스키마에서 동적으로 구성
-        if self._sql_schema_cache:
-            return self._sql_schema_cache
-        bind = getattr(self.db, "bind", None)
-        if bind is None:
-            self._sql_schema_cache = self._fallback_sql_schema_guide()
-            return self._sql_schema_cache
-        try:
-            inspector = inspect(bind)
-            table_names = sorted(inspector.get_table_names())
-            table_lines: list[str] = []
-            relation_lines: list[str] = []
-            for table_name in table_names:
-                columns = inspector.get_columns(table_name)
-                col_parts: list[str] = []
-                for col in columns:
-                    name = str(col.get("name"))
-                    col_type = str(col.get("type") or "")
-                    attrs: list[str] = []
-                    if bool(col.get("primary_key")):
-                        attrs.append("pk")
-                    if not bool(col.get("nullable", True)):
-                        attrs.append("notnull")
-                    attr_text = f"[{','.join(attrs)}]" if attrs else ""
-                    col_parts.append(f"{name}:{col_type}{attr_text}")
-                table_lines.append(f"- {table_name}({', '.join(col_parts)})")
-
-                for fk in inspector.get_foreign_keys(table_name):
-                    local_cols = ",".join([str(v) for v in (fk.get("constrained_columns") or [])]) or "?"
-                    ref_table = str(fk.get("referred_table") or "?")
-                    ref_cols = ",".join([str(v) for v in (fk.get("referred_columns") or [])]) or "?"
-                    relation_lines.append(f"- {table_name}.{local_cols} -> {ref_table}.{ref_cols}")
-
-            semantic_hints = (
-                "semantic_hints:\n"
-                "- 사용자의 과제 조회는 users -> project_member -> projects 조인을 우선 고려\n"
-                "- 사용자 식별은 users.name 또는 users.emp_id를 사용\n"
-                "- 코칭노트는 coaching_notes.project_id로 projects와 연결\n"
-            )
-            lines: list[str] = ["tables:"] + table_lines
-            if relation_lines:
-                lines.append("relations:")
-                lines.extend(relation_lines)
-            lines.append(semantic_hints)
-            self._sql_schema_cache = "\n".join(lines)
-            return self._sql_schema_cache
-        except Exception as exc:
-            logger.warning("[chatbot] failed to build dynamic sql schema metadata: %s", exc)
-            self._sql_schema_cache = self._fallback_sql_schema_guide()
-            return self._sql_schema_cache
+        # [chatbot] SQL 생성용 메타데이터는 DB 스키마에서 동적으로 구성하고 프로세스 단위로 재사용한다.
+        return chatbot_schema_service.get_schema_guide(self._schema_bind())
 
     def _extract_sql_from_text(self, raw_text: str) -> str:
         candidate = str(raw_text or "").strip()
@@ -806,31 +1023,37 @@ class ChatbotService:
         normalized = self._normalize_sql(sql)
         if re.search(r"\bLIMIT\s+\d+", normalized, flags=re.IGNORECASE):
             return normalized
-        return f"SELECT * FROM ({normalized}) AS chatbot_sql_result LIMIT 50"
+        return f"SELECT * FROM ({normalized}) AS chatbot_sql_result LIMIT {int(settings.CHATBOT_SQL_MAX_ROWS)}"
+
+    def _sql_generation_prompt_template(self) -> str:
+        dialect = self._db_dialect() or "sqlite"
+
+        def _build(guide: str) -> str:
+            return (
+                f"DB dialect: {dialect}\n"
+                f"{guide}\n"
+                "rules:\n"
+                "- 사람 이름/사번으로 과제를 찾는 질문은 users + project_member + projects 조인을 우선 사용하세요.\n"
+                "- 질문이 '이번주'를 포함하면 현재 주차 기준 조건을 사용하세요.\n"
+                "- 결과는 최대 50건 이내가 되도록 LIMIT을 사용하세요.\n"
+                "- 의미있는 컬럼명(project_name, progress_rate 등)을 반환하세요.\n"
+                "- 기술/키워드/주제(예: N2SQL) 기반 '관련 과제/관련 내용' 질문이면 SQL을 만들지 말고 {\"sql\":\"\"} 를 반환하세요.\n\n"
+            )
+
+        return chatbot_schema_service.get_prompt_template(self._schema_bind(), "sql_generation", _build)
 
     def _generate_sql_with_llm(self, *, question: str, user_id: str) -> str | None:
         if not settings.AI_FEATURES_ENABLED:
             self._emit_chat_debug("[chatbot][debug] sql_generation skipped: AI_FEATURES_ENABLED=false")
             return None
         try:
-            dialect = self._db_dialect() or "sqlite"
             system_prompt = (
                 "당신은 SQL 생성기입니다.\n"
                 "질문을 만족하는 단일 조회 SQL만 생성하세요.\n"
                 "반드시 JSON 한 줄로만 응답하세요: {\"sql\":\"...\"}\n"
                 "SELECT 또는 WITH만 허용하고, 데이터 변경/DDL/다중문/주석은 금지합니다."
             )
-            prompt = (
-                f"DB dialect: {dialect}\n"
-                f"{self._sql_schema_guide()}\n"
-                "rules:\n"
-                "- 사람 이름/사번으로 과제를 찾는 질문은 users + project_member + projects 조인을 우선 사용하세요.\n"
-                "- 질문이 '이번주'를 포함하면 현재 주차 기준 조건을 사용하세요.\n"
-                "- 결과는 최대 50건 이내가 되도록 LIMIT을 사용하세요.\n"
-                "- 의미있는 컬럼명(project_name, progress_rate 등)을 반환하세요.\n"
-                "- 기술/키워드/주제(예: N2SQL) 기반 '관련 과제/관련 내용' 질문이면 SQL을 만들지 말고 {\"sql\":\"\"} 를 반환하세요.\n\n"
-                f"question: {self._normalize_text(question)}"
-            )
+            prompt = self._sql_generation_prompt_template() + f"question: {self._normalize_text(question)}"
             raw = self._invoke_llm(
                 purpose="general",
                 user_id=user_id,
@@ -846,10 +1069,17 @@ class ChatbotService:
             return None
 
     def _execute_sql_query(self, sql: str) -> list[dict[str, Any]]:
+        # [chatbot] 요청 세션/트랜잭션과 분리된 읽기 전용 연결에서 제한 시간·EXPLAIN 점검·행/바이트 상한을 두고 실행한다.
         limited_sql = self._apply_default_limit(sql)
-        result = self.db.execute(text(limited_sql))
-        rows = result.mappings().all()
-        return [dict(row) for row in rows]
+        result = chatbot_sql_service.execute_read_only(self._schema_bind(), limited_sql)
+        self._emit_chat_debug(
+            "[chatbot][debug] sql executed rows=%s bytes=%s truncated=%s elapsed_ms=%s",
+            len(result.rows),
+            result.bytes,
+            result.truncated,
+            result.elapsed_ms,
+        )
+        return result.rows
 
     def _render_sql_rows(self, rows: list[dict[str, Any]]) -> str:
         if not rows:
@@ -998,6 +1228,52 @@ class ChatbotService:
             )
         return results
 
+    def _summary_cache_key(self, *, plain: str, source_label: str) -> str:
+        # [chatbot] LLM에 실제 전달되는 정규화 본문과 문서유형, 프롬프트 버전으로 키를 만든다.
+        return rag_cache_service.build_cache_key(
+            self._SUMMARY_PROMPT_VERSION,
+            str(source_label or ""),
+            self._truncate(plain, 5000),
+        )
+
+    def _get_cached_summary(
+        self,
+        cache_key: str,
+    ) -> tuple[str, list[dict[str, str]], list[dict[str, str]]] | None:
+        if not settings.RAG_SUMMARY_CACHE_ENABLED:
+            return None
+        payload = rag_cache_service.get_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_SUMMARY,
+            cache_key,
+            ttl_seconds=float(settings.RAG_SUMMARY_CACHE_TTL_SECONDS),
+        )
+        if not isinstance(payload, dict) or not self._normalize_text(payload.get("summary")):
+            return None
+        return (
+            self._normalize_text(payload.get("summary")),
+            self._normalize_entity_nodes(payload.get("entity_nodes")),
+            self._normalize_entity_relations(payload.get("entity_relations")),
+        )
+
+    def _store_cached_summary(
+        self,
+        cache_key: str,
+        summary: str,
+        entity_nodes: list[dict[str, str]],
+        entity_relations: list[dict[str, str]],
+    ) -> None:
+        if not settings.RAG_SUMMARY_CACHE_ENABLED:
+            return
+        rag_cache_service.put_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_SUMMARY,
+            cache_key,
+            {"summary": summary, "entity_nodes": entity_nodes, "entity_relations": entity_relations},
+            max_entries=int(settings.RAG_SUMMARY_CACHE_MAX_ENTRIES),
+            ttl_seconds=float(settings.RAG_SUMMARY_CACHE_TTL_SECONDS),
+        )
+
     def generate_ai_summary_and_entities(
         self,
         *,
@@ -1012,6 +1288,11 @@ class ChatbotService:
         if not settings.AI_FEATURES_ENABLED:
             self._emit_chat_debug("[chatbot][debug] rag_insert_summary skipped: AI_FEATURES_ENABLED=false")
             return self._truncate(plain, 280), [], []
+        cache_key = self._summary_cache_key(plain=plain, source_label=source_label)
+        cached = self._get_cached_summary(cache_key)
+        if cached is not None:
+            self._emit_chat_debug("[chatbot][debug] rag_insert_summary cache hit key=%s", cache_key[:12])
+            return cached
         try:
             system_prompt = (
                 "당신은 문서 요약 + 엔티티 추출기입니다.\n"
@@ -1038,9 +1319,12 @@ class ChatbotService:
             summarized = self._normalize_text(str(parsed.get("summary") or ""))
             entities = self._normalize_entity_nodes(parsed.get("entities"))
             relations = self._normalize_entity_relations(parsed.get("relations"))
-            return summarized or self._truncate(plain, 280), entities, relations
         except Exception:
             return self._truncate(plain, 280), [], []
+        if summarized:
+            # LLM이 정상 요약을 돌려준 경우만 캐시해 일시 장애의 폴백 결과가 고정되지 않도록 한다.
+            self._store_cached_summary(cache_key, summarized, entities, relations)
+        return summarized or self._truncate(plain, 280), entities, relations
 
     def generate_ai_summary(self, *, content: str, source_label: str, user_id: str) -> str:
         # [chatbot] 레거시 호환: 요약 문자열만 필요한 호출을 유지한다.
@@ -1120,13 +1404,116 @@ class ChatbotService:
                 "separator": " ",
             },
         }
-        response = httpx.post(
-            self._rag_url(settings.RAG_INSERT_ENDPOINT),
-            headers=self._rag_headers(),
-            json=payload,
-            timeout=float(settings.RAG_TIMEOUT_SECONDS),
+        # [chatbot] 원격 입력 성공 여부와 무관하게 로컬 검색 인덱스를 먼저 갱신해 원격 장애 시 폴백에 사용한다.
+        self._index_local_rag_document(data_payload)
+        started = time.perf_counter()
+        try:
+            response = http_pool.get_client(settings.RAG_BASE_URL).post(
+                self._rag_url(settings.RAG_INSERT_ENDPOINT),
+                headers=self._rag_headers(),
+                json=payload,
+                timeout=float(settings.RAG_TIMEOUT_SECONDS),
+            )
+            response.raise_for_status()
+        except Exception:
+            chatbot_metrics_service.observe_rag(
+                operation="insert", source="remote", seconds=time.perf_counter() - started, error=True
+            )
+            raise
+        chatbot_metrics_service.observe_rag(operation="insert", source="remote", seconds=time.perf_counter() - started)
+        self._invalidate_answer_cache(data_payload["permission_groups"])
+        self._invalidate_retrieve_cache(data_payload["permission_groups"])
+
+    def _index_local_rag_document(self, data_payload: dict[str, Any]) -> None:
+        if not rag_local_index_service.is_enabled():
+            return
+        started = time.perf_counter()
+        try:
+            rag_local_index_service.index_document(self.db, data_payload)
+            chatbot_metrics_service.observe_rag(operation="insert", source="local", seconds=time.perf_counter() - started)
+        except Exception as exc:
+            chatbot_metrics_service.observe_rag(
+                operation="insert", source="local", seconds=time.perf_counter() - started, error=True
+            )
+            logger.warning("[chatbot] local rag index update failed doc_id=%s: %s", data_payload.get("doc_id"), exc)
+
+    def _rag_retrieve_timeout(self) -> float:
+        # [chatbot] 로컬 폴백이 있으면 원격 검색을 더 짧은 timeout으로 포기할 수 있다.
+        fallback_timeout = float(getattr(settings, "RAG_LOCAL_INDEX_REMOTE_TIMEOUT_SECONDS", 0) or 0)
+        if rag_local_index_service.is_enabled() and fallback_timeout > 0:
+            return fallback_timeout
+        return float(settings.RAG_TIMEOUT_SECONDS)
+
+    def _retrieve_local_rag_documents(
+        self,
+        *,
+        query_text: str,
+        num_result_doc: int,
+        permission_groups: list[str],
+        remote_error: Exception | None = None,
+    ) -> dict[str, Any]:
+        started = time.perf_counter()
+        data = rag_local_index_service.search(
+            self.db,
+            query_text=query_text,
+            num_result_doc=num_result_doc,
+            permission_groups=permission_groups,
+        )
+        chatbot_metrics_service.observe_rag(
+            operation="retrieve", source="local", seconds=time.perf_counter() - started, error=data is None
+        )
+        if data is None:
+            # 로컬 인덱스가 비어 있으면 원격 오류를 그대로 전달한다.
+            if remote_error is not None:
+                raise remote_error
+            raise HTTPException(status_code=503, detail="로컬 RAG 인덱스가 비어 있습니다.")
+        self._emit_chat_debug(
+            "[chatbot][debug] rag_retrieve local hits=%s remote_error=%s",
+            len(self._extract_rag_hits(data)),
+            remote_error,
+        )
+        return data
+
+    def _retrieve_cache_key(self, *, query_text: str, num_result_doc: int, permission_groups: list[str]) -> str:
+        return rag_cache_service.build_cache_key(
+            self._RETRIEVE_CACHE_VERSION,
+            settings.RAG_INDEX_NAME,
+            self._normalize_question_for_cache(query_text),
+            "|".join(sorted(set(permission_groups))),
+            max(1, min(int(num_result_doc), 20)),
+        )
+
+    def _get_cached_retrieve(self, cache_key: str) -> dict[str, Any] | None:
+        if not settings.RAG_RETRIEVE_CACHE_ENABLED:
+            return None
+        started = time.perf_counter()
+        payload = rag_cache_service.get_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_RETRIEVE,
+            cache_key,
+            ttl_seconds=float(settings.RAG_RETRIEVE_CACHE_TTL_SECONDS),
+        )
+        if not isinstance(payload, dict):
+            return None
+        chatbot_metrics_service.observe_rag(operation="retrieve", source="cache", seconds=time.perf_counter() - started)
+        self._emit_chat_debug("[chatbot][debug] rag_retrieve cache hit key=%s", cache_key[:12])
+        return payload
+
+    def _store_cached_retrieve(self, cache_key: str, data: Any, permission_groups: list[str]) -> None:
+        # [chatbot] 원격 검색 결과만 캐시한다(로컬 폴백 결과는 원격 복구 후 바로 원격 결과를 쓰도록 제외).
+        if not settings.RAG_RETRIEVE_CACHE_ENABLED or not isinstance(data, dict):
+            return
+        if data.get("retriever") == "local":
+            return
+        rag_cache_service.put_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_RETRIEVE,
+            cache_key,
+            data,
+            max_entries=int(settings.RAG_RETRIEVE_CACHE_MAX_ENTRIES),
+            ttl_seconds=float(settings.RAG_RETRIEVE_CACHE_TTL_SECONDS),
+            tags=permission_groups,
         )
-        response.raise_for_status()
 
     def _retrieve_rag_documents(
         self,
@@ -1136,6 +1523,20 @@ class ChatbotService:
         permission_groups: list[str],
     ) -> dict[str, Any]:
         self._ensure_rag_ready()
+        if rag_local_index_service.is_primary():
+            return self._retrieve_local_rag_documents(
+                query_text=query_text,
+                num_result_doc=num_result_doc,
+                permission_groups=permission_groups,
+            )
+        cache_key = self._retrieve_cache_key(
+            query_text=query_text,
+            num_result_doc=num_result_doc,
+            permission_groups=permission_groups,
+        )
+        cached = self._get_cached_retrieve(cache_key)
+        if cached is not None:
+            return cached
         payload = {
             "index_name": settings.RAG_INDEX_NAME,
             "permission_groups": permission_groups,
@@ -1148,24 +1549,91 @@ class ChatbotService:
             self._rag_url(settings.RAG_RETRIEVE_RRF_ENDPOINT),
             self._clip_debug_text(json.dumps(payload, ensure_ascii=False), 3000),
         )
+        started = time.perf_counter()
         try:
-            response = httpx.post(
+            response = http_pool.get_client(settings.RAG_BASE_URL).post(
                 self._rag_url(settings.RAG_RETRIEVE_RRF_ENDPOINT),
                 headers=self._rag_headers(),
                 json=payload,
-                timeout=float(settings.RAG_TIMEOUT_SECONDS),
+                timeout=self._rag_retrieve_timeout(),
             )
             response.raise_for_status()
             data = response.json()
+            chatbot_metrics_service.observe_rag(
+                operation="retrieve", source="remote", seconds=time.perf_counter() - started
+            )
             self._emit_chat_debug(
                 "[chatbot][debug] rag_retrieve response status=%s body=%s",
                 getattr(response, "status_code", "-"),
                 self._clip_debug_text(json.dumps(data, ensure_ascii=False, default=str), 6000),
             )
-            return data
         except Exception as exc:
+            chatbot_metrics_service.observe_rag(
+                operation="retrieve", source="remote", seconds=time.perf_counter() - started, error=True
+            )
             self._emit_chat_debug("[chatbot][debug] rag_retrieve failed: %s", exc)
-            raise
+            if not rag_local_index_service.is_enabled():
+                raise
+            logger.warning("[chatbot] remote rag retrieve failed, using local index: %s", exc)
+            return self._retrieve_local_rag_documents(
+                query_text=query_text,
+                num_result_doc=num_result_doc,
+                permission_groups=permission_groups,
+                remote_error=exc,
+            )
+        self._store_cached_retrieve(cache_key, data, permission_groups)
+        return data
+
+    async def _aretrieve_rag_documents(
+        self,
+        *,
+        query_text: str,
+        num_result_doc: int,
+        permission_groups: list[str],
+    ) -> dict[str, Any]:
+        # [chatbot] 스트리밍 경로용 비동기 retrieve. 요청 payload와 로컬 폴백 규칙은 동기 버전과 동일하다.
+        self._ensure_rag_ready()
+        local_kwargs = {
+            "query_text": query_text,
+            "num_result_doc": num_result_doc,
+            "permission_groups": permission_groups,
+        }
+        if rag_local_index_service.is_primary():
+            return await run_in_threadpool(self._retrieve_local_rag_documents, **local_kwargs)
+        cache_key = self._retrieve_cache_key(**local_kwargs)
+        cached = await run_in_threadpool(self._get_cached_retrieve, cache_key)
+        if cached is not None:
+            return cached
+        payload = {
+            "index_name": settings.RAG_INDEX_NAME,
+            "permission_groups": permission_groups,
+            "query_text": query_text,
+            "num_result_doc": max(1, min(int(num_result_doc), 20)),
+            "fields_exclude": ["v_merge_title_content"],
+        }
+        started = time.perf_counter()
+        try:
+            response = await http_pool.get_async_client(settings.RAG_BASE_URL).post(
+                self._rag_url(settings.RAG_RETRIEVE_RRF_ENDPOINT),
+                headers=self._rag_headers(),
+                json=payload,
+                timeout=self._rag_retrieve_timeout(),
+            )
+            response.raise_for_status()
+            data = response.json()
+            chatbot_metrics_service.observe_rag(
+                operation="retrieve", source="remote", seconds=time.perf_counter() - started
+            )
+        except Exception as exc:
+            chatbot_metrics_service.observe_rag(
+                operation="retrieve", source="remote", seconds=time.perf_counter() - started, error=True
+            )
+            if not rag_local_index_service.is_enabled():
+                raise
+            logger.warning("[chatbot] remote rag retrieve failed, using local index: %s", exc)
+            return await run_in_threadpool(self._retrieve_local_rag_documents, remote_error=exc, **local_kwargs)
+        await run_in_threadpool(self._store_cached_retrieve, cache_key, data, permission_groups)
+        return data
 
     def _parse_additional_field(self, raw: Any) -> dict[str, Any]:
         if isinstance(raw, dict):
@@ -1202,30 +1670,34 @@ class ChatbotService:
             hits = fallback_hits if isinstance(fallback_hits, list) else []
         return [row for row in hits if isinstance(row, dict)]
 
-    def _serialize_rag_hit_for_llm(self, row: dict[str, Any]) -> str:
-        # [chatbot] LLM 문맥에는 content 일부가 아니라 hit 전체(JSON)를 전달한다.
-        source = row.get("_source") if isinstance(row.get("_source"), dict) else None
-        if source is None:
-            payload = row
-        else:
-            payload = dict(row)
-            payload["_source"] = source
-        try:
-            return json.dumps(payload, ensure_ascii=False, default=str)
-        except Exception:
-            return str(payload)
-
     def _build_llm_context_from_rag_payload(self, payload: dict[str, Any], *, num_result_doc: int) -> str:
-        # [chatbot] LLM 프롬프트용 검색 문맥을 hit 원본 전체 정보 기반으로 구성한다.
-        hits = self._extract_rag_hits(payload)
-        limit = max(1, min(int(num_result_doc), 20))
-        selected = hits[:limit]
-        if not selected:
-            return "검색 결과가 없습니다."
-        blocks: list[str] = []
-        for idx, row in enumerate(selected, start=1):
-            blocks.append(f"[{idx}] raw_hit_json:\n{self._serialize_rag_hit_for_llm(row)}")
-        return "\n\n".join(blocks)
+        # [chatbot] LLM 프롬프트용 검색 문맥을 필요한 필드만 남긴 hit JSON으로, 답변 모델 슬롯의 토큰 예산 안에서 구성한다.
+        build = rag_context_service.build_context(
+            self._extract_rag_hits(payload),
+            limit=max(1, min(int(num_result_doc), 20)),
+            budget=rag_context_service.token_budget_for_slot(resolve_slot(settings.AI_DEFAULT_MODEL)),
+        )
+        self._last_rag_context = build
+        self._emit_chat_debug("[chatbot][debug] rag_context %s", json.dumps(build.as_dict(), ensure_ascii=False))
+        return build.text
+
+    def _report_rag_prompt_size(self, *, system_prompt: str, prompt: str) -> None:
+        # [chatbot] 요청별 최종 프롬프트 크기(토큰)를 기록한다.
+        build = self._last_rag_context
+        if build is None:
+            return
+        _, tokenizer = rag_context_service.get_tokenizer()
+        prompt_tokens = tokenizer(system_prompt) + tokenizer(prompt)
+        rag_context_service.record_prompt(build, prompt_tokens)
+        logger.info(
+            "[chatbot] rag prompt tokens=%s context_tokens=%s budget=%s hits=%s/%s truncated=%s",
+            prompt_tokens,
+            build.tokens,
+            build.budget,
+            build.used_hits,
+            build.total_hits,
+            build.truncated,
+        )
 
     def _extract_references(self, payload: dict[str, Any]) -> list[dict[str, Any]]:
         hits = self._extract_rag_hits(payload)
@@ -1255,6 +1727,101 @@ class ChatbotService:
             )
         return refs
 
+    def _normalize_question_for_cache(self, question: str) -> str:
+        # [chatbot] 대소문자/공백/끝 문장부호 차이만 있는 질문은 같은 질문으로 본다.
+        normalized = self._normalize_text(question).lower()
+        return re.sub(r"[\s?!.~。？！]+$", "", normalized)
+
+    def _answer_cache_key(
+        self,
+        *,
+        question: str,
+        permission_groups: list[str],
+        admin: bool,
+        num_result_doc: int,
+    ) -> str:
+        return rag_cache_service.build_cache_key(
+            self._ANSWER_PROMPT_VERSION,
+            self._normalize_question_for_cache(question),
+            "|".join(sorted(permission_groups)),
+            "admin" if admin else "user",
+            max(1, min(int(num_result_doc), 20)),
+        )
+
+    def _get_cached_answer(self, cache_key: str) -> dict[str, Any] | None:
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED:
+            return None
+        payload = rag_cache_service.get_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_ANSWER,
+            cache_key,
+            ttl_seconds=float(settings.CHATBOT_ANSWER_CACHE_TTL_SECONDS),
+        )
+        if not isinstance(payload, dict) or not self._normalize_text(payload.get("answer")):
+            return None
+        self._emit_chat_debug("[chatbot][debug] answer cache hit key=%s", cache_key[:12])
+        return {"answer": str(payload.get("answer")), "references": list(payload.get("references") or [])}
+
+    def _store_cached_answer(self, cache_key: str, result: dict[str, Any], permission_groups: list[str]) -> None:
+        # [chatbot] LLM이 실제로 생성한 RAG 답변만 캐시한다(AI 비활성/빈 답변 폴백은 제외).
+        answer = self._normalize_text(result.get("answer"))
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED or not settings.AI_FEATURES_ENABLED:
+            return
+        if not answer or answer in {self._AI_DISABLED_ANSWER, self._EMPTY_ANSWER}:
+            return
+        rag_cache_service.put_entry(
+            self.db,
+            rag_cache_service.NAMESPACE_ANSWER,
+            cache_key,
+            {"answer": str(result.get("answer")), "references": list(result.get("references") or [])},
+            max_entries=int(settings.CHATBOT_ANSWER_CACHE_MAX_ENTRIES),
+            ttl_seconds=float(settings.CHATBOT_ANSWER_CACHE_TTL_SECONDS),
+            tags=permission_groups,
+        )
+
+    def _invalidation_tags(self, doc_permission_groups: list[str]) -> list[str]:
+        # [chatbot] batch 문서는 해당 batch 그룹만, 공용 문서(rag-public만 보유)는 공용 그룹 전체를 무효화한다.
+        specific = [group for group in doc_permission_groups if group != settings.RAG_PERMISSION_GROUP]
+        return specific or list(doc_permission_groups)
+
+    def _invalidate_answer_cache(self, doc_permission_groups: list[str]) -> None:
+        # [chatbot] 재동기화된 문서의 권한 그룹을 가진 답변 캐시만 삭제한다.
+        rag_cache_service.invalidate_tags(
+            self.db, rag_cache_service.NAMESPACE_ANSWER, self._invalidation_tags(doc_permission_groups)
+        )
+
+    def _invalidate_retrieve_cache(self, doc_permission_groups: list[str]) -> None:
+        # [chatbot] 재동기화된 문서가 검색될 수 있는 권한 그룹의 검색 결과 캐시만 삭제한다.
+        rag_cache_service.invalidate_tags(
+            self.db, rag_cache_service.NAMESPACE_RETRIEVE, self._invalidation_tags(doc_permission_groups)
+        )
+
+    def _build_rag_answer_prompts(self, *, query: str, context: str) -> tuple[str, str]:
+        system_prompt = (
+            "당신은 사내 지식 기반 어시스턴트입니다.\n"
+            "주어진 검색 문맥을 우선 사용해 답변하고, 모르면 모른다고 말하세요."
+        )
+        prompt = (
+            f"[질문]\n{query}\n\n"
+            f"[검색 문맥]\n{context}\n\n"
+            "답변은 한국어로 작성하고, 필요하면 근거 문서 제목을 함께 언급하세요.\n"
+            "검색 문맥에 image_urls가 있으면 답변에서도 관련 이미지를 함께 안내하세요."
+        )
+        return system_prompt, prompt
+
+    def _format_answer_references(self, refs: list[dict[str, Any]], *, num_result_doc: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "doc_id": row.get("doc_id"),
+                "title": row.get("title") or "제목 없음",
+                "score": row.get("score"),
+                "source_type": row.get("source_type"),
+                "batch_id": row.get("batch_id"),
+                "image_urls": row.get("image_urls") or [],
+            }
+            for row in refs[: max(1, min(int(num_result_doc), 20))]
+        ]
+
     def _answer_with_rag(
         self,
         *,
@@ -1279,16 +1846,8 @@ class ChatbotService:
         context = self._build_llm_context_from_rag_payload(raw, num_result_doc=num_result_doc)
 
         if settings.AI_FEATURES_ENABLED:
-            system_prompt = (
-                "당신은 사내 지식 기반 어시스턴트입니다.\n"
-                "주어진 검색 문맥을 우선 사용해 답변하고, 모르면 모른다고 말하세요."
-            )
-            prompt = (
-                f"[질문]\n{query}\n\n"
-                f"[검색 문맥]\n{context}\n\n"
-                "답변은 한국어로 작성하고, 필요하면 근거 문서 제목을 함께 언급하세요.\n"
-                "검색 문맥에 image_urls가 있으면 답변에서도 관련 이미지를 함께 안내하세요."
-            )
+            system_prompt, prompt = self._build_rag_answer_prompts(query=query, context=context)
+            self._report_rag_prompt_size(system_prompt=system_prompt, prompt=prompt)
             answer = self._invoke_llm(
                 purpose="general",
                 user_id=str(current_user.user_id),
@@ -1298,22 +1857,12 @@ class ChatbotService:
             )
         else:
             self._emit_chat_debug("[chatbot][debug] rag_answer skipped: AI_FEATURES_ENABLED=false")
-            answer = "AI 기능이 비활성화되어 있어 검색 문맥만 제공합니다."
+            answer = self._AI_DISABLED_ANSWER
         if not answer:
-            answer = "검색 결과를 바탕으로 답변을 생성하지 못했습니다."
+            answer = self._EMPTY_ANSWER
         return {
             "answer": answer,
-            "references": [
-                {
-                    "doc_id": row.get("doc_id"),
-                    "title": row.get("title") or "제목 없음",
-                    "score": row.get("score"),
-                    "source_type": row.get("source_type"),
-                    "batch_id": row.get("batch_id"),
-                    "image_urls": row.get("image_urls") or [],
-                }
-                for row in refs[: max(1, min(int(num_result_doc), 20))]
-            ],
+            "references": self._format_answer_references(refs, num_result_doc=num_result_doc),
         }
 
     def answer_with_rag(
@@ -1338,8 +1887,20 @@ class ChatbotService:
             raise HTTPException(status_code=400, detail="질문을 입력해주세요.")
 
         try:
+            # [chatbot] 같은 권한 범위의 반복 질문은 라우팅/검색/LLM 호출 없이 캐시 답변을 반환
+            permission_groups = self._permission_groups_for_user(current_user)
+            cache_key = self._answer_cache_key(
+                question=query,
+                permission_groups=permission_groups,
+                admin=is_admin(current_user),
+                num_result_doc=num_result_doc,
+            )
+            cached = self._get_cached_answer(cache_key)
+            if cached is not None:
+                return cached
+
             # [chatbot] 관리자 질문은 LLM JSON 라우팅 결과에 따라 SQL/RAG 경로를 선택
-            if is_admin(current_user) and self._decide_route_with_llm(
+            if is_admin(current_user) and self._decide_route(
                 question=query,
                 user_id=str(current_user.user_id),
             ) == "sql":
@@ -1349,11 +1910,13 @@ class ChatbotService:
 
             # [chatbot] 비관리자이거나 SQL 경로 실패 시 RAG 경로 사용
             try:
-                return self._answer_with_rag(
+                result = self._answer_with_rag(
                     current_user=current_user,
                     question=query,
                     num_result_doc=num_result_doc,
                 )
+                self._store_cached_answer(cache_key, result, permission_groups)
+                return result
             except Exception:
                 # [chatbot] 관리자 질문에서 RAG가 실패하면 SQL 경로를 재시도해 실패율을 낮춤
                 if is_admin(current_user):
@@ -1364,6 +1927,190 @@ class ChatbotService:
         finally:
             self._log_chat_debug_snapshot(question=query, current_user=current_user)
 
+    async def _astream_rag_answer(
+        self,
+        *,
+        current_user: User,
+        query: str,
+        num_result_doc: int,
+        permission_groups: list[str],
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        raw = await self._aretrieve_rag_documents(
+            query_text=query,
+            num_result_doc=num_result_doc,
+            permission_groups=permission_groups,
+        )
+        if self._is_chat_debug_enabled():
+            self._debug_rag_result = raw
+        refs = self._extract_references(raw)
+        # references를 먼저 보내 답변 생성 중에도 근거 문서를 표시할 수 있게 한다.
+        yield "references", {"references": self._format_answer_references(refs, num_result_doc=num_result_doc)}
+
+        if not settings.AI_FEATURES_ENABLED:
+            self._emit_chat_debug("[chatbot][debug] rag_answer skipped: AI_FEATURES_ENABLED=false")
+            answer = self._AI_DISABLED_ANSWER
+            yield "token", {"text": answer}
+            yield "done", {"answer": answer}
+            return
+
+        context = self._build_llm_context_from_rag_payload(raw, num_result_doc=num_result_doc)
+        system_prompt, prompt = self._build_rag_answer_prompts(query=query, context=context)
+        self._report_rag_prompt_size(system_prompt=system_prompt, prompt=prompt)
+        client = AIClient.get_client("general", user_id=str(current_user.user_id))
+        chunks: list[str] = []
+        started = time.perf_counter()
+        first_token_at: float | None = None
+        try:
+            async for piece in client.astream(prompt, system_prompt):
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                chunks.append(piece)
+                yield "token", {"text": piece}
+        except Exception:
+            self._observe_llm(
+                client,
+                stage="rag_answer_stream",
+                started=started,
+                prompt=prompt,
+                system_prompt=system_prompt,
+                completion="".join(chunks),
+                error=True,
+                first_token_at=first_token_at,
+            )
+            raise
+        answer = "".join(chunks).strip()
+        self._observe_llm(
+            client,
+            stage="rag_answer_stream",
+            started=started,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            completion=answer,
+            first_token_at=first_token_at,
+        )
+        self._record_llm_history(
+            stage="rag_answer_stream",
+            model=str(getattr(client, "model_name", "general")),
+            system_prompt=system_prompt,
+            prompt=prompt,
+            response=answer,
+        )
+        if not answer:
+            answer = self._EMPTY_ANSWER
+            yield "token", {"text": answer}
+        yield "done", {"answer": answer}
+
+    async def _sql_answer_events(
+        self,
+        *,
+        current_user: User,
+        query: str,
+    ) -> list[tuple[str, dict[str, Any]]] | None:
+        # [chatbot] SQL 경로(동기 DB/LLM 호출)는 스레드풀에서 실행하고 결과를 이벤트 목록으로 변환한다.
+        result = await run_in_threadpool(self._answer_with_sql, current_user=current_user, question=query)
+        if result is None:
+            return None
+        answer = str(result.get("answer") or "")
+        return [
+            ("references", {"references": list(result.get("references") or [])}),
+            ("token", {"text": answer}),
+            ("done", {"answer": answer}),
+        ]
+
+    async def stream_answer_with_rag(
+        self,
+        *,
+        current_user: User,
+        question: str,
+        num_result_doc: int = 5,
+        permission_groups: list[str] | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """[chatbot] (이벤트명, 데이터) 순서로 references → token* → done 이벤트를 생성한다.
+
+        관리자 SQL 경로는 토큰 스트리밍 대상이 아니므로 완성된 답변을 token 1건으로 보낸다.
+        """
+        self._debug_llm_history = []
+        self._debug_rag_result = None
+        self._debug_llm_live_emitted = False
+        query = self._normalize_text(question)
+        if not query:
+            raise HTTPException(status_code=400, detail="질문을 입력해주세요.")
+        user_id = str(current_user.user_id)
+        admin = is_admin(current_user)
+        groups = permission_groups if permission_groups is not None else self._permission_groups_for_user(current_user)
+        cache_key = self._answer_cache_key(
+            question=query,
+            permission_groups=groups,
+            admin=admin,
+            num_result_doc=num_result_doc,
+        )
+
+        try:
+            cached = await run_in_threadpool(self._get_cached_answer, cache_key)
+            if cached is not None:
+                yield "references", {"references": cached["references"]}
+                yield "token", {"text": cached["answer"]}
+                yield "done", {"answer": cached["answer"]}
+                return
+            if admin:
+                route = await run_in_threadpool(self._decide_route, question=query, user_id=user_id)
+                if route == "sql":
+                    sql_events = await self._sql_answer_events(current_user=current_user, query=query)
+                    if sql_events is not None:
+                        for event in sql_events:
+                            yield event
+                        return
+            emitted_tokens = False
+            streamed: dict[str, Any] = {}
+            try:
+                async for event in self._astream_rag_answer(
+                    current_user=current_user,
+                    query=query,
+                    num_result_doc=num_result_doc,
+                    permission_groups=groups,
+                ):
+                    if event[0] == "token":
+                        emitted_tokens = True
+                    elif event[0] == "references":
+                        streamed["references"] = event[1].get("references") or []
+                    elif event[0] == "done":
+                        streamed["answer"] = event[1].get("answer") or ""
+                        await run_in_threadpool(self._store_cached_answer, cache_key, streamed, groups)
+                    yield event
+            except Exception:
+                # [chatbot] 토큰 전송 전 RAG 실패 시에만 관리자 SQL 경로로 재시도할 수 있다.
+                if admin and not emitted_tokens:
+                    sql_events = await self._sql_answer_events(current_user=current_user, query=query)
+                    if sql_events is not None:
+                        for event in sql_events:
+                            yield event
+                        return
+                raise
+        finally:
+            self._log_chat_debug_snapshot(question=query, current_user=current_user)
+
+    def _enqueue_rag_sync(self, *, source_type: str, source_id: int, user_id: str, event_type: str) -> bool:
+        # [chatbot] 큐가 켜져 있으면 outbox에 적재만 하고 즉시 반환한다. 적재 실패 시 인라인 동기화로 폴백한다.
+        if not rag_ingest_service.is_queue_enabled():
+            return False
+        # [chatbot] 적재는 별도 세션에서 커밋/롤백해 요청 세션의 트랜잭션에 영향을 주지 않는다.
+        job_db = Session(bind=self.db.get_bind())
+        try:
+            rag_ingest_service.enqueue_job(
+                job_db,
+                source_type=source_type,
+                source_id=int(source_id),
+                event_type=str(event_type),
+                user_id=str(user_id),
+            )
+            return True
+        except Exception as exc:
+            job_db.rollback()
+            logger.warning("[chatbot] rag ingest enqueue failed, falling back to inline sync: %s", exc)
+            return False
+        finally:
+            job_db.close()
+
     def safe_sync_board_post(
         self,
         *,
@@ -1374,52 +2121,64 @@ class ChatbotService:
         # [chatbot] 게시글 등록/수정 시 RAG 자동 동기화
         if not self._is_rag_input_enabled():
             return
+        if self._enqueue_rag_sync(source_type="board_post", source_id=post_id, user_id=user_id, event_type=event_type):
+            return
         try:
-            from app.models.board import BoardPost  # local import to avoid cyclic side effects
-
-            post = self.db.query(BoardPost).filter(BoardPost.post_id == int(post_id)).first()
-            if not post:
-                return
-            batch_name = None
-            if post.batch_id is not None:
-                batch = self.db.query(Batch).filter(Batch.batch_id == int(post.batch_id)).first()
-                batch_name = batch.batch_name if batch else None
-            comment_count = len(list(getattr(post, "comments", []) or []))
-            board_content = self._build_board_post_content(post)
-            board_image_urls = self._collect_board_image_urls(post)
-            board_image_entries = self._build_image_caption_entries(board_image_urls, user_id=str(user_id))
-            board_content = self._append_image_caption_block(board_content, board_image_entries)
-            metadata = {
-                "source_type": "board_post",
-                "event_type": str(event_type),
-                "doc_schema": "board_post.v2",
-                "post_id": int(post.post_id),
-                "board_id": int(post.board_id),
-                "board_type": getattr(post.board, "board_type", None),
-                "board_name": getattr(post.board, "board_name", None),
-                "batch_id": int(post.batch_id) if post.batch_id is not None else None,
-                "batch_name": batch_name,
-                "author_id": int(post.author_id),
-                "comment_count": int(comment_count),
-                "last_comment_at": self._latest_comment_iso(list(getattr(post, "comments", []) or [])),
-                "updated_at": self._to_iso(post.updated_at or post.created_at),
-                "image_urls": [row.get("url") for row in board_image_entries],
-                "image_descriptions": board_image_entries,
-            }
-            self.upsert_rag_document(
-                doc_id=f"board_post:{int(post.post_id)}",
-                title=post.title or "게시글",
-                content=board_content,
-                metadata=metadata,
-                user_id=user_id,
-                permission_groups=self._permission_groups_for_batch(
-                    int(post.batch_id) if post.batch_id is not None else None
-                ),
-                created_time=post.updated_at or post.created_at,
-            )
+            self.sync_board_post(post_id=post_id, user_id=user_id, event_type=event_type)
         except Exception as exc:
             logger.warning("[chatbot] board post RAG sync skipped: %s", exc)
 
+    def sync_board_post(
+        self,
+        *,
+        post_id: int,
+        user_id: str,
+        event_type: str,
+    ) -> None:
+        # [chatbot] 게시글 RAG 동기화 본체. 실패는 예외로 올려 큐 워커가 재시도하도록 한다.
+        from app.models.board import BoardPost  # local import to avoid cyclic side effects
+
+        post = self.db.query(BoardPost).filter(BoardPost.post_id == int(post_id)).first()
+        if not post:
+            return
+        batch_name = None
+        if post.batch_id is not None:
+            batch = self.db.query(Batch).filter(Batch.batch_id == int(post.batch_id)).first()
+            batch_name = batch.batch_name if batch else None
+        comment_count = len(list(getattr(post, "comments", []) or []))
+        board_content = self._build_board_post_content(post)
+        board_image_urls = self._collect_board_image_urls(post)
+        board_image_entries = self._build_image_caption_entries(board_image_urls, user_id=str(user_id))
+        board_content = self._append_image_caption_block(board_content, board_image_entries)
+        metadata = {
+            "source_type": "board_post",
+            "event_type": str(event_type),
+            "doc_schema": "board_post.v2",
+            "post_id": int(post.post_id),
+            "board_id": int(post.board_id),
+            "board_type": getattr(post.board, "board_type", None),
+            "board_name": getattr(post.board, "board_name", None),
+            "batch_id": int(post.batch_id) if post.batch_id is not None else None,
+            "batch_name": batch_name,
+            "author_id": int(post.author_id),
+            "comment_count": int(comment_count),
+            "last_comment_at": self._latest_comment_iso(list(getattr(post, "comments", []) or [])),
+            "updated_at": self._to_iso(post.updated_at or post.created_at),
+            "image_urls": [row.get("url") for row in board_image_entries],
+            "image_descriptions": board_image_entries,
+        }
+        self.upsert_rag_document(
+            doc_id=f"board_post:{int(post.post_id)}",
+            title=post.title or "게시글",
+            content=board_content,
+            metadata=metadata,
+            user_id=user_id,
+            permission_groups=self._permission_groups_for_batch(
+                int(post.batch_id) if post.batch_id is not None else None
+            ),
+            created_time=post.updated_at or post.created_at,
+        )
+
     def safe_sync_coaching_note(
         self,
         *,
@@ -1430,49 +2189,61 @@ class ChatbotService:
         # [chatbot] 코칭노트 등록/수정 시 RAG 자동 동기화
         if not self._is_rag_input_enabled():
             return
+        if self._enqueue_rag_sync(source_type="coaching_note", source_id=note_id, user_id=user_id, event_type=event_type):
+            return
         try:
-            note = self.db.query(CoachingNote).filter(CoachingNote.note_id == int(note_id)).first()
-            if not note:
-                return
-            project = self.db.query(Project).filter(Project.project_id == int(note.project_id)).first()
-            if not project:
-                return
-            batch = self.db.query(Batch).filter(Batch.batch_id == int(project.batch_id)).first()
-            metadata = {
-                "source_type": "coaching_note",
-                "event_type": str(event_type),
-                "doc_schema": "coaching_note.v2",
-                "note_id": int(note.note_id),
-                "project_id": int(project.project_id),
-                "project_name": project.project_name,
-                "batch_id": int(project.batch_id),
-                "batch_name": batch.batch_name if batch else None,
-                "week_number": int(note.week_number) if note.week_number is not None else None,
-                "coaching_date": str(note.coaching_date) if note.coaching_date else None,
-                "author_id": int(note.author_id),
-            }
-            content, public_comments, coach_only_count = self._build_coaching_note_content(note, project)
-            note_image_urls = self._collect_coaching_note_image_urls(note, public_comments)
-            note_image_entries = self._build_image_caption_entries(note_image_urls, user_id=str(user_id))
-            content = self._append_image_caption_block(content, note_image_entries)
-            metadata["public_comment_count"] = int(len(public_comments))
-            metadata["coach_only_comment_count"] = int(coach_only_count)
-            metadata["last_public_comment_at"] = self._latest_comment_iso(public_comments)
-            metadata["updated_at"] = self._to_iso(note.updated_at or note.created_at or note.coaching_date)
-            metadata["image_urls"] = [row.get("url") for row in note_image_entries]
-            metadata["image_descriptions"] = note_image_entries
-            self.upsert_rag_document(
-                doc_id=f"coaching_note:{int(note.note_id)}",
-                title=f"{project.project_name} 코칭노트 {note.coaching_date}",
-                content=content,
-                metadata=metadata,
-                user_id=user_id,
-                permission_groups=self._permission_groups_for_batch(int(project.batch_id)),
-                created_time=note.updated_at or note.created_at or note.coaching_date,
-            )
+            self.sync_coaching_note(note_id=note_id, user_id=user_id, event_type=event_type)
         except Exception as exc:
             logger.warning("[chatbot] coaching note RAG sync skipped: %s", exc)
 
+    def sync_coaching_note(
+        self,
+        *,
+        note_id: int,
+        user_id: str,
+        event_type: str,
+    ) -> None:
+        # [chatbot] 코칭노트 RAG 동기화 본체. 실패는 예외로 올려 큐 워커가 재시도하도록 한다.
+        note = self.db.query(CoachingNote).filter(CoachingNote.note_id == int(note_id)).first()
+        if not note:
+            return
+        project = self.db.query(Project).filter(Project.project_id == int(note.project_id)).first()
+        if not project:
+            return
+        batch = self.db.query(Batch).filter(Batch.batch_id == int(project.batch_id)).first()
+        metadata = {
+            "source_type": "coaching_note",
+            "event_type": str(event_type),
+            "doc_schema": "coaching_note.v2",
+            "note_id": int(note.note_id),
+            "project_id": int(project.project_id),
+            "project_name": project.project_name,
+            "batch_id": int(project.batch_id),
+            "batch_name": batch.batch_name if batch else None,
+            "week_number": int(note.week_number) if note.week_number is not None else None,
+            "coaching_date": str(note.coaching_date) if note.coaching_date else None,
+            "author_id": int(note.author_id),
+        }
+        content, public_comments, coach_only_count = self._build_coaching_note_content(note, project)
+        note_image_urls = self._collect_coaching_note_image_urls(note, public_comments)
+        note_image_entries = self._build_image_caption_entries(note_image_urls, user_id=str(user_id))
+        content = self._append_image_caption_block(content, note_image_entries)
+        metadata["public_comment_count"] = int(len(public_comments))
+        metadata["coach_only_comment_count"] = int(coach_only_count)
+        metadata["last_public_comment_at"] = self._latest_comment_iso(public_comments)
+        metadata["updated_at"] = self._to_iso(note.updated_at or note.created_at or note.coaching_date)
+        metadata["image_urls"] = [row.get("url") for row in note_image_entries]
+        metadata["image_descriptions"] = note_image_entries
+        self.upsert_rag_document(
+            doc_id=f"coaching_note:{int(note.note_id)}",
+            title=f"{project.project_name} 코칭노트 {note.coaching_date}",
+            content=content,
+            metadata=metadata,
+            user_id=user_id,
+            permission_groups=self._permission_groups_for_batch(int(project.batch_id)),
+            created_time=note.updated_at or note.created_at or note.coaching_date,
+        )
+
     def safe_sync_project_document(
         self,
         *,
@@ -1483,48 +2254,60 @@ class ChatbotService:
         # [chatbot] 과제기록 등록/수정/복원/수동동기화 시 RAG 자동 동기화
         if not self._is_rag_input_enabled():
             return
+        if self._enqueue_rag_sync(source_type="project_document", source_id=doc_id, user_id=user_id, event_type=event_type):
+            return
         try:
-            doc = self.db.query(ProjectDocument).filter(ProjectDocument.doc_id == int(doc_id)).first()
-            if not doc:
-                return
-            project = self.db.query(Project).filter(Project.project_id == int(doc.project_id)).first()
-            if not project:
-                return
-            batch = self.db.query(Batch).filter(Batch.batch_id == int(project.batch_id)).first()
-            content, attachments = self._build_project_document_content(doc, project)
-            image_urls = self._collect_project_document_image_urls(doc, attachments)
-            image_entries = self._build_image_caption_entries(image_urls, user_id=str(user_id))
-            content = self._append_image_caption_block(content, image_entries)
-            metadata = {
-                "source_type": "project_document",
-                "event_type": str(event_type),
-                "doc_schema": "project_document.v1",
-                "document_id": int(doc.doc_id),
-                "doc_type": doc.doc_type,
-                "doc_type_label": self._document_type_label(doc.doc_type),
-                "project_id": int(project.project_id),
-                "project_name": project.project_name,
-                "batch_id": int(project.batch_id),
-                "batch_name": batch.batch_name if batch else None,
-                "author_id": int(doc.created_by),
-                "attachment_count": int(len(attachments)),
-                "updated_at": self._to_iso(doc.updated_at or doc.created_at),
-                "image_urls": [row.get("url") for row in image_entries],
-                "image_descriptions": image_entries,
-            }
-            self.upsert_rag_document(
-                doc_id=f"project_document:{int(doc.doc_id)}",
-                title=doc.title or self._document_type_label(doc.doc_type),
-                content=content,
-                metadata=metadata,
-                user_id=user_id,
-                permission_groups=self._permission_groups_for_batch(int(project.batch_id)),
-                created_time=doc.updated_at or doc.created_at,
-            )
-            self._emit_chat_debug(
-                "[chatbot][debug] project_document synced document_id=%s event_type=%s",
-                int(doc.doc_id),
-                str(event_type),
-            )
+            self.sync_project_document(doc_id=doc_id, user_id=user_id, event_type=event_type)
         except Exception as exc:
             logger.warning("[chatbot] project document RAG sync skipped: %s", exc)
+
+    def sync_project_document(
+        self,
+        *,
+        doc_id: int,
+        user_id: str,
+        event_type: str,
+    ) -> None:
+        # [chatbot] 과제기록 RAG 동기화 본체. 실패는 예외로 올려 큐 워커가 재시도하도록 한다.
+        doc = self.db.query(ProjectDocument).filter(ProjectDocument.doc_id == int(doc_id)).first()
+        if not doc:
+            return
+        project = self.db.query(Project).filter(Project.project_id == int(doc.project_id)).first()
+        if not project:
+            return
+        batch = self.db.query(Batch).filter(Batch.batch_id == int(project.batch_id)).first()
+        content, attachments = self._build_project_document_content(doc, project)
+        image_urls = self._collect_project_document_image_urls(doc, attachments)
+        image_entries = self._build_image_caption_entries(image_urls, user_id=str(user_id))
+        content = self._append_image_caption_block(content, image_entries)
+        metadata = {
+            "source_type": "project_document",
+            "event_type": str(event_type),
+            "doc_schema": "project_document.v1",
+            "document_id": int(doc.doc_id),
+            "doc_type": doc.doc_type,
+            "doc_type_label": self._document_type_label(doc.doc_type),
+            "project_id": int(project.project_id),
+            "project_name": project.project_name,
+            "batch_id": int(project.batch_id),
+            "batch_name": batch.batch_name if batch else None,
+            "author_id": int(doc.created_by),
+            "attachment_count": int(len(attachments)),
+            "updated_at": self._to_iso(doc.updated_at or doc.created_at),
+            "image_urls": [row.get("url") for row in image_entries],
+            "image_descriptions": image_entries,
+        }
+        self.upsert_rag_document(
+            doc_id=f"project_document:{int(doc.doc_id)}",
+            title=doc.title or self._document_type_label(doc.doc_type),
+            content=content,
+            metadata=metadata,
+            user_id=user_id,
+            permission_groups=self._permission_groups_for_batch(int(project.batch_id)),
+            created_time=doc.updated_at or doc.created_at,
+        )
+        self._emit_chat_debug(
+            "[chatbot][debug] project_document synced document_id=%s event_type=%s",
+            int(doc.doc_id),
+            str(event_type),
+        )
@@ -0,0 +1,241 @@
+"""[chatbot] SQL 답변용 LLM 생성 SQL을 요청 세션과 분리된 읽기 전용 연결에서 시간·행·바이트 제한을 두고 실행하는 서비스입니다."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# SQLite progress handler 호출 간격(VM 명령 수)
+SQLITE_PROGRESS_STEPS = 1000
+_ALIAS_STOPWORDS = {
+    "WHERE", "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "CROSS", "FULL", "ON", "USING", "GROUP",
+    "ORDER", "LIMIT", "HAVING", "UNION", "EXCEPT", "INTERSECT", "WINDOW", "NATURAL", "OFFSET",
+}
+_TABLE_REF_PATTERN = re.compile(r"\b(?:FROM|JOIN)\s+[\"`]?([A-Za-z_][\w]*)[\"`]?(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?", re.IGNORECASE)
+
+_LOCK = threading.Lock()
+_ENGINES: dict[str, Engine] = {}
+
+
+class SqlGuardError(ValueError):
+    """실행 전 점검(EXPLAIN)에서 거부된 SQL."""
+
+
+@dataclass
+class SqlResult:
+    rows: list[dict[str, Any]]
+    truncated: bool = False
+    bytes: int = 0
+    elapsed_ms: float = 0.0
+
+
+def _mark_read_only(engine: Engine) -> None:
+    # 전용 엔진 연결은 DB 세션 수준에서도 쓰기를 막는다.
+    dialect = engine.dialect.name
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _record):  # noqa: ANN001
+        cursor = dbapi_connection.cursor()
+        try:
+            if dialect == "sqlite":
+                cursor.execute("PRAGMA query_only = ON")
+            elif dialect in {"mysql", "mariadb"}:
+                cursor.execute("SET SESSION TRANSACTION READ ONLY")
+            elif dialect == "postgresql":
+                cursor.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+        finally:
+            cursor.close()
+
+
+def get_engine(default_bind: Any) -> Any:
+    """CHATBOT_SQL_DATABASE_URL(읽기 복제본 권장) 또는 기본 DB URL로 만든 읽기 전용 전용 엔진을 반환한다."""
+    url = str(getattr(settings, "CHATBOT_SQL_DATABASE_URL", "") or "").strip()
+    if not url:
+        bind = getattr(default_bind, "engine", default_bind)
+        bind_url = getattr(bind, "url", None)
+        # 메모리 SQLite는 연결마다 별도 DB이므로 전용 엔진을 만들 수 없어 기존 엔진의 새 연결을 쓴다.
+        if bind_url is None or (bind_url.get_backend_name() == "sqlite" and bind_url.database in (None, "", ":memory:")):
+            return bind
+        url = bind_url.render_as_string(hide_password=False)
+    with _LOCK:
+        engine = _ENGINES.get(url)
+        if engine is None:
+            connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+            engine = create_engine(url, connect_args=connect_args, pool_pre_ping=True)
+            _mark_read_only(engine)
+            _ENGINES[url] = engine
+        return engine
+
+
+def reset_state() -> None:
+    with _LOCK:
+        engines = list(_ENGINES.values())
+        _ENGINES.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+@contextmanager
+def _statement_timeout(conn: Connection, seconds: float) -> Iterator[None]:
+    """DB별 문장 실행 제한 시간. SQLite는 progress handler로 중단하고, MySQL/PostgreSQL은 세션 변수로 설정한다."""
+    dialect = conn.dialect.name
+    millis = int(max(0.0, float(seconds)) * 1000)
+    if millis <= 0:
+        yield
+        return
+    if dialect == "sqlite":
+        raw = conn.connection.dbapi_connection
+        deadline = time.monotonic() + millis / 1000
+        raw.set_progress_handler(lambda: 1 if time.monotonic() > deadline else 0, SQLITE_PROGRESS_STEPS)
+        try:
+            yield
+        finally:
+            raw.set_progress_handler(None, 0)
+        return
+    if dialect == "mysql":
+        conn.exec_driver_sql(f"SET SESSION max_execution_time = {millis}")
+        reset_sql = "SET SESSION max_execution_time = 0"
+    elif dialect == "mariadb":
+        conn.exec_driver_sql(f"SET SESSION max_statement_time = {millis / 1000:.3f}")
+        reset_sql = "SET SESSION max_statement_time = 0"
+    elif dialect == "postgresql":
+        conn.exec_driver_sql(f"SET statement_timeout = {millis}")
+        reset_sql = "RESET statement_timeout"
+    else:
+        yield
+        return
+    try:
+        yield
+    finally:
+        try:
+            conn.exec_driver_sql(reset_sql)
+        except Exception as exc:
+            logger.warning("[chatbot] sql timeout reset failed: %s", exc)
+
+
+def _table_aliases(sql: str) -> dict[str, str]:
+    aliases: dict[str, str] = {}
+    for table, alias in _TABLE_REF_PATTERN.findall(sql):
+        aliases[table.lower()] = table
+        if alias and alias.upper() not in _ALIAS_STOPWORDS:
+            aliases[alias.lower()] = table
+    return aliases
+
+
+def _sqlite_full_scans(conn: Connection, sql: str) -> list[tuple[str, int]]:
+    tables = {row[0].lower(): row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    aliases = _table_aliases(sql)
+    scans: list[tuple[str, int]] = []
+    for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")):
+        detail = str(row[-1] or "")
+        match = re.match(r"SCAN (?:TABLE )?([\w]+)(.*)$", detail)
+        # 인덱스만 훑는 경우(COVERING INDEX)는 전체 테이블 스캔으로 보지 않는다.
+        if not match or "INDEX" in match.group(2).upper():
+            continue
+        name = aliases.get(match.group(1).lower(), match.group(1))
+        table = tables.get(name.lower())
+        if table is None:  # CTE/서브쿼리 결과 스캔
+            continue
+        try:
+            # rowid 테이블은 MAX(rowid)가 인덱스 조회 한 번으로 얻는 행 수 근사치다.
+            estimate = conn.exec_driver_sql(f'SELECT MAX(_ROWID_) FROM "{table}"').scalar() or 0
+        except Exception:
+            continue
+        scans.append((table, int(estimate)))
+    return scans
+
+
+def _mysql_full_scans(conn: Connection, sql: str) -> list[tuple[str, int]]:
+    scans: list[tuple[str, int]] = []
+    for row in conn.execute(text(f"EXPLAIN {sql}")).mappings():
+        if str(row.get("type") or "").upper() == "ALL":
+            scans.append((str(row.get("table") or "-"), int(row.get("rows") or 0)))
+    return scans
+
+
+def _postgresql_full_scans(conn: Connection, sql: str) -> list[tuple[str, int]]:
+    scans: list[tuple[str, int]] = []
+    for row in conn.execute(text(f"EXPLAIN {sql}")):
+        match = re.search(r"Seq Scan on (\S+).*?rows=(\d+)", str(row[0]))
+        if match:
+            scans.append((match.group(1), int(match.group(2))))
+    return scans
+
+
+def check_plan(conn: Connection, sql: str, max_scan_rows: int) -> None:
+    """EXPLAIN 결과에서 예상 행 수가 max_scan_rows를 넘는 테이블 전체 스캔이 있으면 SqlGuardError를 낸다."""
+    if max_scan_rows <= 0:
+        return
+    inspectors = {
+        "sqlite": _sqlite_full_scans,
+        "mysql": _mysql_full_scans,
+        "mariadb": _mysql_full_scans,
+        "postgresql": _postgresql_full_scans,
+    }
+    inspector = inspectors.get(conn.dialect.name)
+    if inspector is None:
+        return
+    for table, estimate in inspector(conn, sql):
+        if estimate > max_scan_rows:
+            raise SqlGuardError(f"대용량 테이블 전체 스캔 거부: {table} (예상 {estimate}행 > {max_scan_rows})")
+
+
+def _row_bytes(row: dict[str, Any]) -> int:
+    return len(json.dumps(row, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def execute_read_only(
+    default_bind: Any,
+    sql: str,
+    *,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+    timeout_seconds: float | None = None,
+    max_scan_rows: int | None = None,
+) -> SqlResult:
+    """안전성 검사를 통과한 SELECT를 전용 읽기 전용 연결에서 실행한다. 행/바이트 상한에 닿으면 나머지는 읽지 않는다."""
+    row_cap = max(1, int(max_rows if max_rows is not None else settings.CHATBOT_SQL_MAX_ROWS))
+    byte_cap = int(max_bytes if max_bytes is not None else settings.CHATBOT_SQL_MAX_BYTES)
+    timeout = float(timeout_seconds if timeout_seconds is not None else settings.CHATBOT_SQL_TIMEOUT_SECONDS)
+    scan_cap = int(max_scan_rows if max_scan_rows is not None else settings.CHATBOT_SQL_MAX_SCAN_ROWS)
+    started = time.perf_counter()
+    rows: list[dict[str, Any]] = []
+    used_bytes = 0
+    truncated = False
+    with get_engine(default_bind).connect() as conn:
+        try:
+            with _statement_timeout(conn, timeout):
+                check_plan(conn, sql, scan_cap)
+                result = conn.execution_options(stream_results=True).execute(text(sql))
+                try:
+                    for mapping in result.mappings():
+                        row = dict(mapping)
+                        size = _row_bytes(row)
+                        if len(rows) >= row_cap or (byte_cap > 0 and used_bytes + size > byte_cap):
+                            truncated = True
+                            break
+                        rows.append(row)
+                        used_bytes += size
+                finally:
+                    result.close()
+        finally:
+            conn.rollback()
+    return SqlResult(
+        rows=rows,
+        truncated=truncated,
+        bytes=used_bytes,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
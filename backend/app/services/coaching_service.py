@@ -9,7 +9,7 @@ from app.models.batch import Batch
 from app.models.user import User
 from app.schemas.coaching_note import CoachingNoteCreate, CoachingNoteUpdate, CoachingCommentCreate
 from app.schemas.coaching_template import CoachingNoteTemplateCreate, CoachingNoteTemplateUpdate
-from app.services import mention_service, version_service
+from app.services import comment_counter_service, mention_service, version_service
 from app.services.chatbot_service import ChatbotService  # [chatbot] 코칭노트 RAG 동기화
 from app.utils.permissions import can_view_project, can_write_coaching_note, can_view_coach_only_comment, is_coach
 from typing import List
@@ -180,6 +180,8 @@ def create_comment(db: Session, note_id: int, data: CoachingCommentCreate, curre
         raise HTTPException(status_code=403, detail="코치들에게만 공유 설정은 관리자/코치만 사용할 수 있습니다.")
     comment = CoachingComment(note_id=note_id, author_id=current_user.user_id, **data.model_dump())
     db.add(comment)
+    db.flush()
+    comment_counter_service.note_comment_added(db, note_id, bool(comment.is_coach_only))
     db.commit()
     db.refresh(comment)
     mention_service.notify_mentions(
@@ -209,7 +211,10 @@ def delete_comment(db: Session, comment_id: int, current_user: User):
     if comment.author_id != current_user.user_id and current_user.role != "admin":
         raise HTTPException(status_code=403, detail="본인 댓글 또는 관리자만 삭제 가능합니다.")
     note_id = int(comment.note_id)
+    is_coach_only = bool(comment.is_coach_only)
     db.delete(comment)
+    db.flush()
+    comment_counter_service.note_comment_removed(db, note_id, is_coach_only)
     db.commit()
     # [chatbot] 코칭노트 댓글 삭제 시 같은 doc_id 문서를 공개댓글 포함 상태로 재동기화
     ChatbotService(db).safe_sync_coaching_note(
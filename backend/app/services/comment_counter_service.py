@@ -0,0 +1,135 @@
+"""게시글/코칭노트 댓글 수·최근 댓글 시각 비정규화 컬럼을 댓글 쓰기 트랜잭션 안에서 갱신하고 재계산하는 서비스입니다."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.board import BoardPost, PostComment
+from app.models.coaching_note import CoachingComment, CoachingNote
+
+
+def _public_note_comment(note_id_column) -> list:
+    # 코칭노트는 공개 댓글만 센다(코치 전용 댓글 제외).
+    return [
+        CoachingComment.note_id == note_id_column,
+        or_(CoachingComment.is_coach_only == False, CoachingComment.is_coach_only.is_(None)),  # noqa: E712
+    ]
+
+
+def _post_last_comment_at(post_id_column):
+    return select(func.max(PostComment.created_at)).where(PostComment.post_id == post_id_column).scalar_subquery()
+
+
+def _note_last_comment_at(note_id_column):
+    return select(func.max(CoachingComment.created_at)).where(*_public_note_comment(note_id_column)).scalar_subquery()
+
+
+def _decrement(column):
+    return case((column > 0, column - 1), else_=0)
+
+
+def post_comment_added(db: Session, post_id: int) -> None:
+    """댓글 INSERT flush 이후 같은 트랜잭션에서 호출한다. 동시 작성에도 누락이 없도록 원자적 증가 UPDATE를 쓰고,
+    최근 댓글 시각은 방금 넣은 댓글의 저장값(post_id 인덱스 조회)을 그대로 옮긴다."""
+    db.execute(
+        update(BoardPost)
+        .where(BoardPost.post_id == post_id)
+        .values(
+            comment_count=func.coalesce(BoardPost.comment_count, 0) + 1,
+            last_comment_at=_post_last_comment_at(BoardPost.post_id),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def post_comment_removed(db: Session, post_id: int) -> None:
+    """댓글 DELETE flush 이후 같은 트랜잭션에서 호출한다. 최근 댓글 시각은 남은 댓글에서 다시 읽는다."""
+    db.execute(
+        update(BoardPost)
+        .where(BoardPost.post_id == post_id)
+        .values(
+            comment_count=_decrement(func.coalesce(BoardPost.comment_count, 0)),
+            last_comment_at=_post_last_comment_at(BoardPost.post_id),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def note_comment_added(db: Session, note_id: int, is_coach_only: bool) -> None:
+    if is_coach_only:
+        return
+    db.execute(
+        update(CoachingNote)
+        .where(CoachingNote.note_id == note_id)
+        .values(
+            comment_count=func.coalesce(CoachingNote.comment_count, 0) + 1,
+            last_comment_at=_note_last_comment_at(CoachingNote.note_id),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def note_comment_removed(db: Session, note_id: int, is_coach_only: bool) -> None:
+    if is_coach_only:
+        return
+    db.execute(
+        update(CoachingNote)
+        .where(CoachingNote.note_id == note_id)
+        .values(
+            comment_count=_decrement(func.coalesce(CoachingNote.comment_count, 0)),
+            last_comment_at=_note_last_comment_at(CoachingNote.note_id),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def recompute_post_counters(db: Session, post_ids: Optional[Iterable[int]] = None) -> int:
+    """댓글 테이블 기준으로 값이 어긋난 게시글만 다시 계산하고 보정한 행 수를 반환한다(커밋은 호출자 몫)."""
+    count_sq = select(func.count(PostComment.comment_id)).where(PostComment.post_id == BoardPost.post_id).scalar_subquery()
+    last_sq = _post_last_comment_at(BoardPost.post_id)
+    stmt = update(BoardPost).where(
+        or_(
+            BoardPost.comment_count.is_(None),
+            BoardPost.comment_count != count_sq,
+            BoardPost.last_comment_at.is_distinct_from(last_sq),
+        )
+    )
+    if post_ids is not None:
+        stmt = stmt.where(BoardPost.post_id.in_([int(value) for value in post_ids]))
+    result = db.execute(
+        stmt.values(comment_count=count_sq, last_comment_at=last_sq).execution_options(synchronize_session=False)
+    )
+    return int(result.rowcount or 0)
+
+
+def recompute_note_counters(db: Session, note_ids: Optional[Iterable[int]] = None) -> int:
+    count_sq = (
+        select(func.count(CoachingComment.comment_id))
+        .where(*_public_note_comment(CoachingNote.note_id))
+        .scalar_subquery()
+    )
+    last_sq = _note_last_comment_at(CoachingNote.note_id)
+    stmt = update(CoachingNote).where(
+        or_(
+            CoachingNote.comment_count.is_(None),
+            CoachingNote.comment_count != count_sq,
+            CoachingNote.last_comment_at.is_distinct_from(last_sq),
+        )
+    )
+    if note_ids is not None:
+        stmt = stmt.where(CoachingNote.note_id.in_([int(value) for value in note_ids]))
+    result = db.execute(
+        stmt.values(comment_count=count_sq, last_comment_at=last_sq).execution_options(synchronize_session=False)
+    )
+    return int(result.rowcount or 0)
+
+
+def recompute_all(db: Session) -> dict:
+    """전체 재계산(복구 명령/스키마 보정 직후). 커밋까지 수행한다."""
+    posts = recompute_post_counters(db)
+    notes = recompute_note_counters(db)
+    db.commit()
+    return {"board_posts": posts, "coaching_notes": notes}
@@ -0,0 +1,90 @@
+"""[chatbot] RAG/LLM 호출용 프로세스 단위 HTTP 연결 풀입니다. base URL별 keep-alive 클라이언트를 재사용합니다."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_LOCK = threading.Lock()
+_SYNC_CLIENTS: dict[str, httpx.Client] = {}
+# AsyncClient의 연결은 생성한 이벤트 루프에 묶이므로 루프별로 따로 보관한다.
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_key(base_url: str) -> str:
+    # 경로가 달라도 같은 호스트면 같은 연결 풀을 쓴다.
+    url = httpx.URL(str(base_url or "").strip())
+    return f"{url.scheme}://{url.netloc.decode('ascii')}" if url.host else str(base_url or "").strip()
+
+
+def http2_enabled() -> bool:
+    # h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작한다.
+    return bool(settings.HTTP_POOL_HTTP2) and importlib.util.find_spec("h2") is not None
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max(1, int(settings.HTTP_POOL_MAX_CONNECTIONS)),
+        max_keepalive_connections=max(0, int(settings.HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS)),
+        keepalive_expiry=max(0.0, float(settings.HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS)),
+    )
+
+
+def get_client(base_url: str) -> httpx.Client:
+    """base URL(호스트)별 공유 동기 클라이언트를 반환한다. 요청 timeout은 호출부에서 지정한다."""
+    key = _pool_key(base_url)
+    with _LOCK:
+        client = _SYNC_CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(limits=_limits(), http2=http2_enabled())
+            _SYNC_CLIENTS[key] = client
+        return client
+
+
+def get_async_client(base_url: str) -> httpx.AsyncClient:
+    """현재 이벤트 루프에서 쓸 base URL(호스트)별 공유 비동기 클라이언트를 반환한다."""
+    key = _pool_key(base_url)
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=_limits(), http2=http2_enabled())
+            clients[key] = client
+        return client
+
+
+def close_all() -> None:
+    with _LOCK:
+        clients = list(_SYNC_CLIENTS.values())
+        _SYNC_CLIENTS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as exc:
+            logger.warning("[chatbot] http pool close failed: %s", exc)
+
+
+async def aclose_all() -> None:
+    """현재 이벤트 루프의 비동기 클라이언트와 동기 클라이언트를 모두 닫는다."""
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        clients = list((_ASYNC_CLIENTS.pop(loop, None) or {}).values())
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as exc:
+            logger.warning("[chatbot] async http pool close failed: %s", exc)
+    close_all()
+
@@ -4,16 +4,42 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from app.models.notification import Notification, NotificationPreference
 from typing import List, Optional
+from app.utils.pagination import (
+    anchor_value,
+    cursor_int,
+    decode_cursor,
+    encode_cursor,
+    keyset_desc,
+    parse_cursor_datetime,
+)
 
 
 SUPPORTED_FREQUENCIES = {"realtime", "daily"}
 
 
-def get_notifications(db: Session, user_id: int, unread_only: bool = False) -> List[Notification]:
+def get_notifications(
+    db: Session,
+    user_id: int,
+    unread_only: bool = False,
+    limit: int = 50,
+    after: Optional[str] = None,
+) -> List[Notification]:
     q = db.query(Notification).filter(Notification.user_id == user_id)
     if unread_only:
         q = q.filter(Notification.is_read == False)
-    return q.order_by(Notification.created_at.desc()).limit(50).all()
+    if after:
+        created_at, noti_id = decode_cursor("notifications", after, 2)
+        anchor_id = cursor_int(noti_id)
+        anchor = anchor_value(Notification.created_at, Notification.noti_id, anchor_id, parse_cursor_datetime(created_at))
+        q = q.filter(keyset_desc(Notification.created_at, Notification.noti_id, anchor, anchor_id))
+    return q.order_by(Notification.created_at.desc(), Notification.noti_id.desc()).limit(limit).all()
+
+
+def next_notifications_cursor(rows: List[Notification], limit: int) -> Optional[str]:
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor("notifications", [last.created_at.isoformat() if last.created_at else None, int(last.noti_id)])
 
 
 def mark_read(db: Session, noti_id: int, user_id: int) -> Notification:
@@ -0,0 +1,253 @@
+"""[chatbot] RAG 입력 보조 결과(요약/엔티티/이미지 설명)와 챗봇 답변/검색 결과 영속 캐시 서비스입니다. 네임스페이스별 TTL/LRU 정리, 태그 무효화, 적중 통계를 제공합니다."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.models.rag_cache import RagCacheEntry
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE_SUMMARY = "summary"
+NAMESPACE_IMAGE_CAPTION = "image_caption"
+NAMESPACE_ANSWER = "answer"
+NAMESPACE_ROUTE_DECISION = "route_decision"
+NAMESPACE_RETRIEVE = "retrieve"
+
+# 프로세스 단위 적중/미스 카운터. 적중 경로에서 DB에 쓰지 않으므로 적중 통계는 이 카운터만 사용한다.
+_STATS_LOCK = threading.Lock()
+_STATS: dict[str, dict[str, int]] = {}
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _bump(namespace: str, field: str, amount: int = 1) -> None:
+    with _STATS_LOCK:
+        row = _STATS.setdefault(
+            namespace,
+            {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "invalidations": 0},
+        )
+        row[field] = int(row.get(field, 0)) + int(amount)
+
+
+def reset_stats() -> None:
+    with _STATS_LOCK:
+        _STATS.clear()
+
+
+@contextmanager
+def _cache_session(db: Session) -> Iterator[Session]:
+    # 캐시 읽기/쓰기는 호출자 세션과 같은 엔진의 별도 세션에서 커밋/롤백해 요청 트랜잭션에 영향을 주지 않는다.
+    cache_db = Session(bind=db.get_bind())
+    try:
+        yield cache_db
+    finally:
+        cache_db.close()
+
+
+def build_cache_key(*parts: Any) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part if part is not None else "").encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def get_entry(db: Session, namespace: str, cache_key: str, *, ttl_seconds: float) -> Any | None:
+    """캐시 값을 반환한다. 없거나 TTL이 지났으면 None(미스).
+
+    적중 경로는 읽기 전용이다(적중 횟수/최근 사용 시각을 쓰지 않음). 만료 행은 다음 저장 시 함께 정리된다.
+    """
+    with _cache_session(db) as cache_db:
+        try:
+            query = cache_db.query(RagCacheEntry.payload).filter(
+                RagCacheEntry.namespace == namespace, RagCacheEntry.cache_key == cache_key
+            )
+            if ttl_seconds > 0:
+                query = query.filter(RagCacheEntry.created_at >= _utcnow() - timedelta(seconds=float(ttl_seconds)))
+            raw = query.scalar()
+        except Exception as exc:
+            logger.warning("[chatbot] rag cache read failed namespace=%s: %s", namespace, exc)
+            raw = None
+    if raw is None:
+        _bump(namespace, "misses")
+        return None
+    try:
+        payload = json.loads(raw)
+    except (TypeError, ValueError):
+        _bump(namespace, "misses")
+        return None
+    _bump(namespace, "hits")
+    return payload
+
+
+def _encode_tags(tags: list[str] | None) -> str | None:
+    cleaned = sorted({str(tag).strip() for tag in (tags or []) if str(tag or "").strip()})
+    return f"|{'|'.join(cleaned)}|" if cleaned else None
+
+
+def put_entry(
+    db: Session,
+    namespace: str,
+    cache_key: str,
+    value: Any,
+    *,
+    max_entries: int,
+    tags: list[str] | None = None,
+    ttl_seconds: float = 0,
+) -> None:
+    """값을 저장하고 만료 항목과 상한 초과분(오래 저장된 순)을 정리한다."""
+    with _cache_session(db) as cache_db:
+        _put_entry(cache_db, namespace, cache_key, value, max_entries=max_entries, tags=tags, ttl_seconds=ttl_seconds)
+
+
+def _put_entry(
+    db: Session,
+    namespace: str,
+    cache_key: str,
+    value: Any,
+    *,
+    max_entries: int,
+    tags: list[str] | None,
+    ttl_seconds: float,
+) -> None:
+    current = _utcnow()
+    try:
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        encoded_tags = _encode_tags(tags)
+        row = (
+            db.query(RagCacheEntry)
+            .filter(RagCacheEntry.namespace == namespace, RagCacheEntry.cache_key == cache_key)
+            .first()
+        )
+        if row is None:
+            db.add(
+                RagCacheEntry(
+                    namespace=namespace,
+                    cache_key=cache_key,
+                    payload=payload,
+                    tags=encoded_tags,
+                    created_at=current,
+                    last_used_at=current,
+                )
+            )
+        else:
+            row.payload = payload
+            row.tags = encoded_tags
+            row.created_at = current
+            row.last_used_at = current
+        db.commit()
+        _bump(namespace, "stores")
+        _evict(db, namespace, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    except Exception as exc:
+        db.rollback()
+        logger.warning("[chatbot] rag cache write failed namespace=%s: %s", namespace, exc)
+
+
+def _evict(db: Session, namespace: str, *, max_entries: int, ttl_seconds: float) -> None:
+    # 만료 항목을 지우고, 상한을 넘긴 만큼 가장 먼저 저장된 항목부터 삭제한다(FIFO, 조회 시 쓰기 없음).
+    evicted = 0
+    if ttl_seconds > 0:
+        cutoff = _utcnow() - timedelta(seconds=float(ttl_seconds))
+        evicted += int(
+            db.query(RagCacheEntry)
+            .filter(RagCacheEntry.namespace == namespace, RagCacheEntry.created_at < cutoff)
+            .delete(synchronize_session=False)
+            or 0
+        )
+    limit = int(max_entries)
+    if limit > 0:
+        total = db.query(func.count(RagCacheEntry.entry_id)).filter(RagCacheEntry.namespace == namespace).scalar() or 0
+        overflow = int(total) - limit
+        if overflow > 0:
+            stale_ids = [
+                int(entry_id)
+                for (entry_id,) in db.query(RagCacheEntry.entry_id)
+                .filter(RagCacheEntry.namespace == namespace)
+                .order_by(RagCacheEntry.created_at.asc(), RagCacheEntry.entry_id.asc())
+                .limit(overflow)
+                .all()
+            ]
+            if stale_ids:
+                db.query(RagCacheEntry).filter(RagCacheEntry.entry_id.in_(stale_ids)).delete(synchronize_session=False)
+                evicted += len(stale_ids)
+    if evicted:
+        db.commit()
+        _bump(namespace, "evictions", evicted)
+
+
+def invalidate_tags(db: Session, namespace: str, tags: list[str]) -> int:
+    """태그 중 하나라도 가진 항목을 삭제하고 삭제 건수를 반환한다."""
+    cleaned = sorted({str(tag).strip() for tag in (tags or []) if str(tag or "").strip()})
+    if not cleaned:
+        return 0
+    with _cache_session(db) as cache_db:
+        try:
+            deleted = (
+                cache_db.query(RagCacheEntry)
+                .filter(
+                    RagCacheEntry.namespace == namespace,
+                    or_(*[RagCacheEntry.tags.like(f"%|{tag}|%") for tag in cleaned]),
+                )
+                .delete(synchronize_session=False)
+            )
+            cache_db.commit()
+        except Exception as exc:
+            cache_db.rollback()
+            logger.warning("[chatbot] rag cache invalidation failed namespace=%s: %s", namespace, exc)
+            return 0
+    if deleted:
+        _bump(namespace, "invalidations", int(deleted))
+    return int(deleted or 0)
+
+
+def count_entries(db: Session, namespace: str) -> int:
+    return int(db.query(func.count(RagCacheEntry.entry_id)).filter(RagCacheEntry.namespace == namespace).scalar() or 0)
+
+
+def list_payloads(db: Session, namespace: str, *, limit: int | None = None) -> list[Any]:
+    """네임스페이스 항목 값을 최근 저장 순으로 반환한다(통계/적중 카운터는 갱신하지 않음)."""
+    query = (
+        db.query(RagCacheEntry.payload)
+        .filter(RagCacheEntry.namespace == namespace)
+        .order_by(RagCacheEntry.created_at.desc(), RagCacheEntry.entry_id.desc())
+    )
+    if limit is not None:
+        query = query.limit(max(1, int(limit)))
+    payloads: list[Any] = []
+    for (raw,) in query.all():
+        try:
+            payloads.append(json.loads(raw))
+        except (TypeError, ValueError):
+            continue
+    return payloads
+
+
+def get_stats(db: Session, namespace: str, *, enabled: bool) -> dict[str, Any]:
+    with _STATS_LOCK:
+        counters = dict(_STATS.get(namespace) or {})
+    entries = count_entries(db, namespace)
+    hits = int(counters.get("hits", 0))
+    misses = int(counters.get("misses", 0))
+    lookups = hits + misses
+    return {
+        "enabled": bool(enabled),
+        "entries": int(entries),
+        "hits": hits,
+        "misses": misses,
+        "stores": int(counters.get("stores", 0)),
+        "evictions": int(counters.get("evictions", 0)),
+        "invalidations": int(counters.get("invalidations", 0)),
+        "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+    }
@@ -0,0 +1,292 @@
+"""[chatbot] RAG 답변용 검색 문맥 조립 서비스입니다. 필요한 필드만 남기고 중복 청크를 병합한 뒤 모델 슬롯별 토큰 예산 안에서 점수 순으로 채웁니다."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Tokenizer = Callable[[str], int]
+
+# 답변 근거로 쓰이지 않거나 content와 중복되는 대용량 필드(이미지 설명은 content 하단 블록에 이미 포함).
+DROP_FIELDS = {
+    "_index",
+    "_id",
+    "additional_field",
+    "permission_groups",
+    "entity_nodes",
+    "entity_relations",
+    "image_descriptions",
+    "v_merge_title_content",
+    "doc_schema",
+    "event_type",
+    "chunk_id",
+    "chunk_index",
+}
+MAX_META_VALUE_CHARS = 300
+MAX_META_LIST_ITEMS = 10
+MIN_CONTENT_TOKENS = 32
+MIN_MERGE_OVERLAP_CHARS = 20
+MAX_MERGE_OVERLAP_CHARS = 1024  # 청크 overlap(128자)보다 넉넉하게, 긴 본문에서 비교 비용을 제한
+
+
+def approx_token_count(text: str) -> int:
+    # 외부 토크나이저 없이 쓰는 보수적 근사치: ASCII 4자당 1토큰, 그 외(한글 등) 문자당 1토큰.
+    value = str(text or "")
+    ascii_chars = sum(1 for ch in value if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(value) - ascii_chars)
+
+
+_TOKENIZERS: dict[str, Tokenizer] = {"approx": approx_token_count}
+_TOKENIZER_LOCK = threading.Lock()
+
+
+def register_tokenizer(name: str, tokenizer: Tokenizer) -> None:
+    with _TOKENIZER_LOCK:
+        _TOKENIZERS[str(name).strip().lower()] = tokenizer
+
+
+def _load_tokenizer(spec: str) -> Tokenizer:
+    if spec.startswith("tiktoken"):
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(spec.split(":", 1)[1] if ":" in spec else "cl100k_base")
+        return lambda text: len(encoding.encode(str(text or ""), disallowed_special=()))
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"unknown tokenizer: {spec}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def get_tokenizer(spec: str | None = None) -> tuple[str, Tokenizer]:
+    """`approx`, `tiktoken[:encoding]`, `패키지.모듈:함수` 또는 register_tokenizer로 등록한 이름을 받는다."""
+    name = str(spec if spec is not None else getattr(settings, "RAG_CONTEXT_TOKENIZER", "approx") or "approx").strip()
+    key = name.lower()
+    with _TOKENIZER_LOCK:
+        cached = _TOKENIZERS.get(key)
+    if cached is not None:
+        return key, cached
+    try:
+        tokenizer = _load_tokenizer(name)
+    except Exception as exc:
+        # 선택 의존성(tiktoken 등)이 없거나 로드에 실패하면 근사 토크나이저로 대체한다.
+        logger.warning("[chatbot] tokenizer %s unavailable, using approx: %s", name, exc)
+        tokenizer = approx_token_count
+    register_tokenizer(key, tokenizer)
+    return key, tokenizer
+
+
+def token_budget_for_slot(slot: str | None) -> int:
+    # 슬롯별 설정(AI_MODEL{n}_CONTEXT_TOKENS)이 0이면 공통 예산을 사용한다.
+    per_slot = int(getattr(settings, f"AI_{str(slot or '').upper()}_CONTEXT_TOKENS", 0) or 0) if slot else 0
+    return per_slot if per_slot > 0 else int(getattr(settings, "RAG_CONTEXT_TOKEN_BUDGET", 6000) or 6000)
+
+
+@dataclass
+class ContextBuild:
+    text: str
+    tokens: int
+    budget: int
+    tokenizer: str
+    total_hits: int
+    used_hits: int
+    merged_chunks: int = 0
+    dropped_duplicates: int = 0
+    truncated: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "tokens": self.tokens,
+            "budget": self.budget,
+            "tokenizer": self.tokenizer,
+            "total_hits": self.total_hits,
+            "used_hits": self.used_hits,
+            "merged_chunks": self.merged_chunks,
+            "dropped_duplicates": self.dropped_duplicates,
+            "truncated": self.truncated,
+        }
+
+
+def _compact_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= MAX_META_VALUE_CHARS else value[:MAX_META_VALUE_CHARS] + "…"
+    if isinstance(value, list):
+        return [_compact_value(item) for item in value[:MAX_META_LIST_ITEMS]]
+    if isinstance(value, dict):
+        return {key: _compact_value(item) for key, item in list(value.items())[:MAX_META_LIST_ITEMS]}
+    return value
+
+
+def compact_hit(row: dict[str, Any]) -> dict[str, Any]:
+    """hit 하나를 LLM 문맥용 dict로 줄인다. `_score`, 식별/제목/본문과 가벼운 메타데이터만 남긴다."""
+    source = row.get("_source") if isinstance(row.get("_source"), dict) else row
+    legacy = source.get("additional_field")
+    if isinstance(legacy, str):
+        try:
+            legacy = json.loads(legacy)
+        except ValueError:
+            legacy = None
+    merged: dict[str, Any] = dict(legacy) if isinstance(legacy, dict) else {}
+    merged.update(source)
+    out: dict[str, Any] = {}
+    score = row.get("_score", row.get("score"))
+    if score is not None:
+        out["_score"] = score
+    for key, value in merged.items():
+        if key in DROP_FIELDS or key == "_score" or value in (None, "", [], {}):
+            continue
+        out[key] = str(value) if key == "content" else _compact_value(value)
+    return out
+
+
+def _merge_overlapping(first: str, second: str) -> str | None:
+    """같은 문서의 두 청크를 포함/앞뒤 겹침 기준으로 합친다. 겹침이 없으면 None."""
+    if second in first:
+        return first
+    if first in second:
+        return second
+    max_overlap = min(len(first), len(second), MAX_MERGE_OVERLAP_CHARS)
+    for size in range(max_overlap, MIN_MERGE_OVERLAP_CHARS - 1, -1):
+        if first.endswith(second[:size]):
+            return first + second[size:]
+        if second.endswith(first[:size]):
+            return second + first[size:]
+    return None
+
+
+def _dedupe(hits: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], int, int]:
+    merged_chunks = 0
+    dropped = 0
+    by_doc: dict[str, dict[str, Any]] = {}
+    ordered: list[dict[str, Any]] = []
+    seen_contents: set[str] = set()
+    for hit in hits:
+        doc_id = str(hit.get("doc_id") or "")
+        content = str(hit.get("content") or "")
+        existing = by_doc.get(doc_id) if doc_id else None
+        if existing is not None:
+            # 같은 문서의 다른 청크는 앞선(점수가 높은) 항목에 합친다.
+            combined = _merge_overlapping(str(existing.get("content") or ""), content)
+            if combined is None:
+                combined = f"{existing.get('content') or ''}\n…\n{content}"
+            existing["content"] = combined
+            merged_chunks += 1
+            continue
+        fingerprint = " ".join(content.split())
+        if fingerprint and fingerprint in seen_contents:
+            dropped += 1
+            continue
+        if fingerprint:
+            seen_contents.add(fingerprint)
+        if doc_id:
+            by_doc[doc_id] = hit
+        ordered.append(hit)
+    return ordered, merged_chunks, dropped
+
+
+def _score_of(hit: dict[str, Any]) -> float:
+    try:
+        return float(hit.get("_score"))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _render(idx: int, hit: dict[str, Any]) -> str:
+    return f"[{idx}] hit_json:\n{json.dumps(hit, ensure_ascii=False, default=str)}"
+
+
+def _truncate_to_tokens(text: str, max_tokens: int, tokenizer: Tokenizer) -> str:
+    if tokenizer(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if tokenizer(text[:mid] + "…") <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + "…"
+
+
+def build_context(
+    hits: list[dict[str, Any]],
+    *,
+    limit: int,
+    budget: int,
+    tokenizer_spec: str | None = None,
+) -> ContextBuild:
+    """점수 순 hit 목록을 압축/중복 제거해 예산(budget 토큰) 안의 문맥 문자열로 만든다."""
+    tokenizer_name, tokenizer = get_tokenizer(tokenizer_spec)
+    compacted = [compact_hit(row) for row in hits if isinstance(row, dict)]
+    ranked = sorted(enumerate(compacted), key=lambda item: (-_score_of(item[1]), item[0]))
+    unique, merged_chunks, dropped = _dedupe([hit for _, hit in ranked])
+    selected = unique[: max(1, int(limit))]
+    blocks: list[str] = []
+    used = 0
+    truncated = False
+    for hit in selected:
+        block = _render(len(blocks) + 1, hit)
+        cost = tokenizer(block) + (1 if blocks else 0)
+        if used + cost <= budget:
+            blocks.append(block)
+            used += cost
+            continue
+        # 예산을 넘는 첫 문서는 본문을 남은 예산만큼 잘라 넣고 조립을 마친다.
+        truncated = True
+        overhead = tokenizer(_render(len(blocks) + 1, {**hit, "content": ""})) + (1 if blocks else 0)
+        remaining = budget - used - overhead
+        if remaining >= MIN_CONTENT_TOKENS and hit.get("content"):
+            clipped = {**hit, "content": _truncate_to_tokens(str(hit["content"]), remaining, tokenizer)}
+            block = _render(len(blocks) + 1, clipped)
+            blocks.append(block)
+            used += tokenizer(block) + (1 if len(blocks) > 1 else 0)
+        break
+    text = "\n\n".join(blocks) if blocks else "검색 결과가 없습니다."
+    return ContextBuild(
+        text=text,
+        tokens=tokenizer(text),
+        budget=int(budget),
+        tokenizer=tokenizer_name,
+        total_hits=len(compacted),
+        used_hits=len(blocks),
+        merged_chunks=merged_chunks,
+        dropped_duplicates=dropped,
+        truncated=truncated,
+    )
+
+
+# 프로세스 단위 프롬프트 크기 누적 통계 (/api/chatbot/metrics/stats의 context 항목)
+_STATS_LOCK = threading.Lock()
+_STATS = {"requests": 0, "prompt_tokens_total": 0, "prompt_tokens_max": 0, "context_tokens_total": 0, "truncated": 0}
+
+
+def record_prompt(context: ContextBuild, prompt_tokens: int) -> None:
+    with _STATS_LOCK:
+        _STATS["requests"] += 1
+        _STATS["prompt_tokens_total"] += int(prompt_tokens)
+        _STATS["prompt_tokens_max"] = max(_STATS["prompt_tokens_max"], int(prompt_tokens))
+        _STATS["context_tokens_total"] += int(context.tokens)
+        if context.truncated:
+            _STATS["truncated"] += 1
+
+
+def reset_stats() -> None:
+    with _STATS_LOCK:
+        for key in _STATS:
+            _STATS[key] = 0
+
+
+def get_stats() -> dict[str, Any]:
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+    requests = stats["requests"]
+    stats["prompt_tokens_avg"] = round(stats["prompt_tokens_total"] / requests, 1) if requests else 0.0
+    return stats
@@ -0,0 +1,291 @@
+"""[chatbot] RAG 입력 비동기 큐(outbox) 서비스입니다. 작업 적재/선점/재시도/dead-letter 흐름을 캡슐화합니다."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.rag_ingest_job import RagIngestJob
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_DEAD = "dead"
+JOB_STATUSES = (STATUS_PENDING, STATUS_RUNNING, STATUS_DONE, STATUS_DEAD)
+
+SOURCE_TYPES = ("board_post", "coaching_note", "project_document")
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def is_queue_enabled() -> bool:
+    return bool(getattr(settings, "RAG_INGEST_QUEUE_ENABLED", False))
+
+
+def build_doc_key(source_type: str, source_id: int) -> str:
+    return f"{source_type}:{int(source_id)}"
+
+
+def _clip_error(value: Any, limit: int = 2000) -> str:
+    raw = str(value or "")
+    return raw if len(raw) <= limit else f"{raw[:limit]}...(truncated)"
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    # 지수 백오프 + 10% 지터로 동시 재시도가 한 시점에 몰리지 않도록 한다.
+    base = max(0.0, float(settings.RAG_INGEST_RETRY_BASE_SECONDS))
+    cap = max(base, float(settings.RAG_INGEST_RETRY_MAX_SECONDS))
+    delay = min(cap, base * (2 ** max(0, int(attempts) - 1)))
+    return delay + random.uniform(0, delay * 0.1)
+
+
+def coalesce_window_seconds() -> float:
+    return max(0.0, float(getattr(settings, "RAG_INGEST_COALESCE_SECONDS", 0.0) or 0.0))
+
+
+def _coalesced_run_at(first_requested_at: datetime, current: datetime) -> datetime:
+    # 이벤트가 올 때마다 실행 시점을 윈도우만큼 미루되, 최초 요청 후 최대 대기 시간을 넘기지 않는다.
+    window = coalesce_window_seconds()
+    max_wait = max(window, float(getattr(settings, "RAG_INGEST_COALESCE_MAX_WAIT_SECONDS", window) or window))
+    return min(current + timedelta(seconds=window), first_requested_at + timedelta(seconds=max_wait))
+
+
+def enqueue_job(
+    db: Session,
+    *,
+    source_type: str,
+    source_id: int,
+    event_type: str,
+    user_id: str | None,
+) -> RagIngestJob:
+    """doc_id 단위로 대기 작업을 적재/병합하고 커밋한다. 요청 세션이 아닌 적재 전용 세션을 넘겨야 한다."""
+    if source_type not in SOURCE_TYPES:
+        raise ValueError(f"unsupported rag source_type: {source_type}")
+    current = _utcnow()
+    doc_key = build_doc_key(source_type, source_id)
+    requested_by = str(user_id) if user_id is not None else None
+    # 같은 doc_id의 대기 작업이 있으면 새 행을 만들지 않고 병합한다.
+    # 워커는 실행 시점의 최신 DB 상태를 읽으므로 마지막 이벤트 정보만 남기면 된다.
+    pending = (
+        db.query(RagIngestJob)
+        .filter(RagIngestJob.doc_key == doc_key, RagIngestJob.status == STATUS_PENDING)
+        .order_by(RagIngestJob.job_id.asc())
+        .first()
+    )
+    if pending is not None:
+        next_run_at = _coalesced_run_at(pending.created_at or current, current)
+        if int(pending.attempts or 0) > 0 and pending.next_run_at is not None:
+            # 실패 후 백오프 대기 중인 작업은 새 이벤트로 앞당기지 않는다(장애 중인 RAG 서버 보호).
+            next_run_at = max(pending.next_run_at, next_run_at)
+        merged = (
+            db.query(RagIngestJob)
+            .filter(RagIngestJob.job_id == int(pending.job_id), RagIngestJob.status == STATUS_PENDING)
+            .update(
+                {
+                    "event_type": str(event_type),
+                    "requested_by": requested_by,
+                    "coalesced_count": RagIngestJob.coalesced_count + 1,
+                    "next_run_at": next_run_at,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if merged:
+            db.refresh(pending)
+            return pending
+    job = RagIngestJob(
+        doc_key=doc_key,
+        source_type=source_type,
+        source_id=int(source_id),
+        event_type=str(event_type),
+        requested_by=requested_by,
+        status=STATUS_PENDING,
+        attempts=0,
+        max_attempts=max(1, int(settings.RAG_INGEST_MAX_ATTEMPTS)),
+        coalesced_count=0,
+        next_run_at=_coalesced_run_at(current, current),
+        created_at=current,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def reclaim_stale_jobs(db: Session, *, now: datetime | None = None) -> int:
+    # 워커가 처리 중 종료되어 lease가 만료된 작업을 다시 대기열로 돌린다.
+    current = now or _utcnow()
+    deadline = current - timedelta(seconds=float(settings.RAG_INGEST_LEASE_SECONDS))
+    updated = (
+        db.query(RagIngestJob)
+        .filter(
+            RagIngestJob.status == STATUS_RUNNING,
+            RagIngestJob.locked_at < deadline,
+        )
+        .update(
+            {
+                "status": STATUS_PENDING,
+                "locked_by": None,
+                "locked_at": None,
+                "next_run_at": current,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return int(updated or 0)
+
+
+def claim_next_job(db: Session, *, worker_id: str, now: datetime | None = None) -> RagIngestJob | None:
+    # 조건부 UPDATE(status=pending)로 선점해 여러 워커 프로세스가 같은 작업을 잡지 않도록 한다.
+    current = now or _utcnow()
+    candidates = (
+        db.query(RagIngestJob.job_id)
+        .filter(
+            RagIngestJob.status == STATUS_PENDING,
+            RagIngestJob.next_run_at <= current,
+        )
+        .order_by(RagIngestJob.next_run_at.asc(), RagIngestJob.job_id.asc())
+        .limit(5)
+        .all()
+    )
+    for (job_id,) in candidates:
+        claimed = (
+            db.query(RagIngestJob)
+            .filter(
+                RagIngestJob.job_id == int(job_id),
+                RagIngestJob.status == STATUS_PENDING,
+            )
+            .update(
+                {
+                    "status": STATUS_RUNNING,
+                    "locked_by": worker_id,
+                    "locked_at": current,
+                    "attempts": RagIngestJob.attempts + 1,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if claimed:
+            return db.query(RagIngestJob).filter(RagIngestJob.job_id == int(job_id)).first()
+    return None
+
+
+def run_job(db: Session, job: RagIngestJob) -> None:
+    from app.services.chatbot_service import ChatbotService  # local import to avoid cyclic side effects
+
+    svc = ChatbotService(db)
+    if not svc._is_rag_input_enabled():
+        raise HTTPException(status_code=503, detail="RAG 입력 기능이 비활성화되어 있습니다.")
+    user_id = str(job.requested_by or "system")
+    if job.source_type == "board_post":
+        svc.sync_board_post(post_id=int(job.source_id), user_id=user_id, event_type=job.event_type)
+    elif job.source_type == "coaching_note":
+        svc.sync_coaching_note(note_id=int(job.source_id), user_id=user_id, event_type=job.event_type)
+    elif job.source_type == "project_document":
+        svc.sync_project_document(doc_id=int(job.source_id), user_id=user_id, event_type=job.event_type)
+    else:
+        raise ValueError(f"unsupported rag source_type: {job.source_type}")
+
+
+def mark_job_done(db: Session, job_id: int) -> None:
+    db.query(RagIngestJob).filter(RagIngestJob.job_id == int(job_id)).update(
+        {
+            "status": STATUS_DONE,
+            "locked_by": None,
+            "locked_at": None,
+            "last_error": None,
+            "finished_at": _utcnow(),
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def mark_job_failed(db: Session, job_id: int, error: Any) -> RagIngestJob | None:
+    job = db.query(RagIngestJob).filter(RagIngestJob.job_id == int(job_id)).first()
+    if not job:
+        return None
+    current = _utcnow()
+    job.last_error = _clip_error(error)
+    job.locked_by = None
+    job.locked_at = None
+    if int(job.attempts or 0) >= int(job.max_attempts or 1):
+        # 최대 재시도 횟수를 넘기면 dead-letter로 격리하고 관리자 재시도를 기다린다.
+        job.status = STATUS_DEAD
+        job.finished_at = current
+    else:
+        job.status = STATUS_PENDING
+        job.next_run_at = current + timedelta(seconds=retry_delay_seconds(int(job.attempts or 1)))
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def process_next_job(db: Session, *, worker_id: str) -> bool:
+    """대기 작업 1건을 처리한다. 처리할 작업이 없으면 False를 반환한다."""
+    job = claim_next_job(db, worker_id=worker_id)
+    if job is None:
+        return False
+    job_id = int(job.job_id)
+    try:
+        run_job(db, job)
+    except Exception as exc:
+        db.rollback()
+        detail = getattr(exc, "detail", None) or exc
+        mark_job_failed(db, job_id, f"{type(exc).__name__}: {detail}")
+        return True
+    mark_job_done(db, job_id)
+    return True
+
+
+def retry_job(db: Session, job_id: int) -> RagIngestJob:
+    job = db.query(RagIngestJob).filter(RagIngestJob.job_id == int(job_id)).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="RAG 입력 작업을 찾을 수 없습니다.")
+    if job.status != STATUS_DEAD:
+        raise HTTPException(status_code=400, detail="dead 상태인 작업만 재시도할 수 있습니다.")
+    job.status = STATUS_PENDING
+    job.attempts = 0
+    job.next_run_at = _utcnow()
+    job.finished_at = None
+    job.last_error = None
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_queue_status(db: Session, *, dead_limit: int = 20) -> dict[str, Any]:
+    counts = {status: 0 for status in JOB_STATUSES}
+    for status, count in db.query(RagIngestJob.status, func.count(RagIngestJob.job_id)).group_by(RagIngestJob.status).all():
+        counts[str(status)] = int(count or 0)
+    coalesced_events = db.query(func.coalesce(func.sum(RagIngestJob.coalesced_count), 0)).scalar()
+    oldest_pending_at = (
+        db.query(func.min(RagIngestJob.created_at))
+        .filter(RagIngestJob.status == STATUS_PENDING)
+        .scalar()
+    )
+    dead_jobs = (
+        db.query(RagIngestJob)
+        .filter(RagIngestJob.status == STATUS_DEAD)
+        .order_by(RagIngestJob.finished_at.desc(), RagIngestJob.job_id.desc())
+        .limit(max(1, int(dead_limit)))
+        .all()
+    )
+    return {
+        "queue_enabled": is_queue_enabled(),
+        "counts": counts,
+        "coalesced_events": int(coalesced_events or 0),
+        "oldest_pending_at": oldest_pending_at,
+        "dead_jobs": dead_jobs,
+    }
@@ -0,0 +1,124 @@
+"""[chatbot] RAG 입력 큐 워커 풀입니다.
+
+Usage:
+  python -m app.services.rag_ingest_worker                # 기본 스레드 수로 상시 실행
+  python -m app.services.rag_ingest_worker --threads 4    # 워커 스레드 수 지정
+  python -m app.services.rag_ingest_worker --once         # 대기 작업만 비우고 종료
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import socket
+import threading
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services import rag_ingest_service
+
+logger = logging.getLogger(__name__)
+
+
+class RagIngestWorkerPool:
+    """[chatbot] outbox 테이블을 폴링해 RAG 입력 작업을 병렬로 처리합니다."""
+
+    def __init__(
+        self,
+        *,
+        threads: int = 2,
+        poll_interval: float | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.threads = max(1, int(threads))
+        self.poll_interval = float(
+            poll_interval if poll_interval is not None else settings.RAG_INGEST_POLL_INTERVAL_SECONDS
+        )
+        self.session_factory = session_factory
+        self._stop_event = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def _worker_id(self, index: int) -> str:
+        return f"{self._worker_prefix}:{index}"
+
+    def run_once(self, *, worker_id: str | None = None) -> int:
+        """처리 가능한 작업을 모두 비우고 처리한 건수를 반환한다."""
+        processed = 0
+        db = self.session_factory()
+        try:
+            rag_ingest_service.reclaim_stale_jobs(db)
+            while not self._stop_event.is_set():
+                if not rag_ingest_service.process_next_job(db, worker_id=worker_id or self._worker_id(0)):
+                    break
+                processed += 1
+                db.expire_all()
+        finally:
+            db.close()
+        return processed
+
+    def _loop(self, index: int) -> None:
+        worker_id = self._worker_id(index)
+        while not self._stop_event.is_set():
+            try:
+                processed = self.run_once(worker_id=worker_id)
+            except Exception as exc:
+                logger.warning("[chatbot] rag ingest worker %s loop failed: %s", worker_id, exc)
+                processed = 0
+            if not processed:
+                self._stop_event.wait(self.poll_interval)
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for index in range(self.threads):
+            thread = threading.Thread(
+                target=self._loop,
+                args=(index,),
+                name=f"rag-ingest-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info("[chatbot] rag ingest worker pool started threads=%s", self.threads)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="RAG 입력 큐 워커")
+    parser.add_argument("--threads", type=int, default=2, help="워커 스레드 수")
+    parser.add_argument("--poll-interval", type=float, default=None, help="대기 작업이 없을 때 폴링 간격(초)")
+    parser.add_argument("--once", action="store_true", help="대기 작업만 처리하고 종료")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    import app.models  # noqa: F401 - 모델 import로 metadata 등록
+
+    pool = RagIngestWorkerPool(threads=args.threads, poll_interval=args.poll_interval)
+    if args.once:
+        processed = pool.run_once()
+        print(f"RAG ingest processed: {processed}")
+        return
+    pool.start()
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    main()
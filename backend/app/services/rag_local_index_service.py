@@ -0,0 +1,394 @@
+"""[chatbot] 원격 RAG(`/retrieve-rrf`) 장애/지연 시 사용하는 프로세스 내장 하이브리드 검색 인덱스입니다. 단어 BM25와 문자 n-gram BM25 순위를 RRF로 결합합니다."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.rag_local_document import RagLocalDocument
+
+logger = logging.getLogger(__name__)
+
+MODE_FALLBACK = "fallback"
+MODE_PRIMARY = "primary"
+
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+# 제목/요약/엔티티는 본문보다 강하게 반영한다(토큰 반복 가중).
+_TITLE_WEIGHT = 3
+_SUMMARY_WEIGHT = 2
+_WORD_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, "RAG_LOCAL_INDEX_ENABLED", False))
+
+
+def is_primary() -> bool:
+    mode = str(getattr(settings, "RAG_LOCAL_INDEX_MODE", MODE_FALLBACK) or "").strip().lower()
+    return is_enabled() and mode == MODE_PRIMARY
+
+
+def _ngram_size() -> int:
+    return max(1, int(getattr(settings, "RAG_LOCAL_INDEX_NGRAM_SIZE", 2) or 2))
+
+
+def tokenize_words(text: str) -> list[str]:
+    return [token.lower() for token in _WORD_RE.findall(str(text or ""))]
+
+
+def tokenize_ngrams(text: str, size: int | None = None) -> list[str]:
+    # 한국어는 띄어쓰기/조사 변형이 많아 단어 단위 안에서 문자 n-gram을 만든다.
+    n = size or _ngram_size()
+    grams: list[str] = []
+    for word in tokenize_words(text):
+        if len(word) <= n:
+            grams.append(word)
+            continue
+        grams.extend(word[idx : idx + n] for idx in range(len(word) - n + 1))
+    return grams
+
+
+def _groups_tag(groups: list[str]) -> str:
+    return "|" + "|".join(sorted({str(g) for g in groups if str(g).strip()})) + "|"
+
+
+class _Field:
+    """한 가지 토큰화 방식의 역색인 + BM25 통계."""
+
+    def __init__(self):
+        self.postings: dict[str, dict[str, int]] = {}
+        self.lengths: dict[str, int] = {}
+        self.total_length = 0
+        self.doc_count = 0
+
+    def add(self, doc_id: str, tokens: list[str]) -> None:
+        counts = Counter(tokens)
+        for token, tf in counts.items():
+            self.postings.setdefault(token, {})[doc_id] = tf
+        self.lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+        self.doc_count = len(self.lengths)
+
+    def remove(self, doc_id: str, tokens: set[str]) -> None:
+        for token in tokens:
+            bucket = self.postings.get(token)
+            if bucket is None:
+                continue
+            bucket.pop(doc_id, None)
+            if not bucket:
+                self.postings.pop(token, None)
+        self.total_length -= self.lengths.pop(doc_id, 0)
+        self.doc_count = len(self.lengths)
+
+    def snapshot(self, tokens: set[str]) -> "_Field":
+        """질의 토큰의 posting과 해당 문서 길이만 복사한다(전체 통계는 값으로 보존)."""
+        view = _Field()
+        view.total_length = self.total_length
+        view.doc_count = self.doc_count
+        for token in tokens:
+            bucket = self.postings.get(token)
+            if bucket:
+                view.postings[token] = dict(bucket)
+                for doc_id in bucket:
+                    view.lengths[doc_id] = self.lengths.get(doc_id, 0)
+        return view
+
+    def rank(self, query_tokens: list[str], allowed: set[str] | None) -> list[tuple[str, float]]:
+        doc_count = self.doc_count
+        if not doc_count or not query_tokens:
+            return []
+        avg_length = max(1.0, self.total_length / doc_count)
+        scores: dict[str, float] = {}
+        for token, query_tf in Counter(query_tokens).items():
+            bucket = self.postings.get(token)
+            if not bucket:
+                continue
+            idf = math.log(1.0 + (doc_count - len(bucket) + 0.5) / (len(bucket) + 0.5))
+            for doc_id, tf in bucket.items():
+                if allowed is not None and doc_id not in allowed:
+                    continue
+                norm = tf + _BM25_K1 * (1 - _BM25_B + _BM25_B * self.lengths.get(doc_id, 0) / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_tf * idf * tf * (_BM25_K1 + 1) / norm
+        return sorted(scores.items(), key=lambda row: (-row[1], row[0]))
+
+
+class LocalHybridIndex:
+    """insert-doc payload를 받아 단어/문자 n-gram 두 역색인을 유지하고 권한 그룹 필터 후 RRF로 결합한다."""
+
+    def __init__(self, *, ngram_size: int = 2, max_chars: int = 4000):
+        self.ngram_size = max(1, int(ngram_size))
+        self.max_chars = max(0, int(max_chars))
+        self.words = _Field()
+        self.ngrams = _Field()
+        self.docs: dict[str, dict[str, Any]] = {}
+        self.groups: dict[str, set[str]] = {}
+        self._tokens: dict[str, tuple[set[str], set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def _index_text(self, payload: dict[str, Any]) -> str:
+        content = str(payload.get("content") or "")
+        if self.max_chars:
+            content = content[: self.max_chars]
+        title = str(payload.get("title") or "")
+        summary = str(payload.get("ai_summary") or "")
+        entities = " ".join(str(name) for name in (payload.get("entity_names") or []) if name)
+        return " ".join(
+            [title] * _TITLE_WEIGHT + [summary, entities] * _SUMMARY_WEIGHT + [content]
+        )
+
+    def upsert(self, payload: dict[str, Any]) -> None:
+        doc_id = str(payload.get("doc_id") or "").strip()
+        if not doc_id:
+            return
+        self.remove(doc_id)
+        text_value = self._index_text(payload)
+        words = tokenize_words(text_value)
+        grams = tokenize_ngrams(text_value, self.ngram_size)
+        self.words.add(doc_id, words)
+        self.ngrams.add(doc_id, grams)
+        self.docs[doc_id] = payload
+        self.groups[doc_id] = {str(g) for g in (payload.get("permission_groups") or [])}
+        self._tokens[doc_id] = (set(words), set(grams))
+
+    def remove(self, doc_id: str) -> None:
+        tokens = self._tokens.pop(doc_id, None)
+        if tokens is None:
+            return
+        self.words.remove(doc_id, tokens[0])
+        self.ngrams.remove(doc_id, tokens[1])
+        self.docs.pop(doc_id, None)
+        self.groups.pop(doc_id, None)
+
+    def snapshot(self, query_text: str) -> "LocalHybridIndex":
+        """질의에 필요한 posting/문서만 담은 읽기 전용 사본. 락 안에서 만들고 순위 계산은 락 밖에서 한다."""
+        view = LocalHybridIndex(ngram_size=self.ngram_size, max_chars=self.max_chars)
+        view.words = self.words.snapshot(set(tokenize_words(query_text)))
+        view.ngrams = self.ngrams.snapshot(set(tokenize_ngrams(query_text, self.ngram_size)))
+        # payload는 upsert 때 통째로 교체되므로 참조만 복사해도 된다.
+        for doc_id in set(view.words.lengths) | set(view.ngrams.lengths):
+            if doc_id in self.docs:
+                view.docs[doc_id] = self.docs[doc_id]
+                view.groups[doc_id] = self.groups.get(doc_id, set())
+        return view
+
+    def search(
+        self,
+        query_text: str,
+        *,
+        permission_groups: list[str],
+        limit: int,
+        rrf_k: int = 60,
+    ) -> list[tuple[str, float]]:
+        wanted = {str(g) for g in permission_groups}
+        allowed = {doc_id for doc_id, groups in self.groups.items() if groups & wanted}
+        if not allowed:
+            return []
+        fused: dict[str, float] = {}
+        for ranking in (
+            self.words.rank(tokenize_words(query_text), allowed),
+            self.ngrams.rank(tokenize_ngrams(query_text, self.ngram_size), allowed),
+        ):
+            for rank, (doc_id, _score) in enumerate(ranking, start=1):
+                fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (rrf_k + rank)
+        ordered = sorted(fused.items(), key=lambda row: (-row[1], row[0]))
+        return ordered[: max(1, int(limit))]
+
+
+_LOCK = threading.Lock()
+# DB 적재는 _LOCK 밖에서 한 스레드만 수행한다(검색/입력은 적재 중에도 기존 인덱스를 쓴다).
+_REFRESH_LOCK = threading.Lock()
+_INDEX: LocalHybridIndex | None = None
+# DB에서 마지막으로 반영한 updated_at. 다른 프로세스(워커)가 입력한 문서를 증분으로 가져온다.
+_SYNCED_AT: datetime | None = None
+# 문서별 반영 시각. 락 밖에서 읽은 오래된 행이 더 최신 입력을 덮어쓰지 않게 한다.
+_VERSIONS: dict[str, datetime] = {}
+# 첫 적재 중(_INDEX 없음) 입력된 문서. 적재 스냅샷에 빠졌을 수 있으므로 swap 때 함께 반영한다.
+_BUILD_PENDING: dict[str, tuple[datetime, dict[str, Any]]] = {}
+_CHECKED_AT = 0.0
+_STATS = {"indexed": 0, "searches": 0, "refreshed_rows": 0}
+
+
+def _new_index() -> LocalHybridIndex:
+    return LocalHybridIndex(
+        ngram_size=_ngram_size(),
+        max_chars=int(getattr(settings, "RAG_LOCAL_INDEX_MAX_CHARS", 4000) or 0),
+    )
+
+
+def reset_state() -> None:
+    global _INDEX, _SYNCED_AT, _CHECKED_AT
+    with _LOCK:
+        _INDEX = None
+        _SYNCED_AT = None
+        _VERSIONS.clear()
+        _BUILD_PENDING.clear()
+        _CHECKED_AT = 0.0
+        for key in _STATS:
+            _STATS[key] = 0
+
+
+def _load_rows(db: Session, since: datetime | None) -> list[tuple[str, datetime, dict[str, Any]]]:
+    query = db.query(RagLocalDocument.doc_id, RagLocalDocument.updated_at, RagLocalDocument.payload)
+    if since is not None:
+        query = query.filter(RagLocalDocument.updated_at >= since)
+    loaded: list[tuple[str, datetime, dict[str, Any]]] = []
+    for doc_id, updated_at, raw in query.order_by(RagLocalDocument.updated_at.asc()).all():
+        try:
+            loaded.append((str(doc_id), updated_at, json.loads(raw)))
+        except (TypeError, ValueError):
+            logger.warning("[chatbot] local rag index skipped broken payload doc_id=%s", doc_id)
+            loaded.append((str(doc_id), updated_at, {}))
+    return loaded
+
+
+def _is_fresh(force: bool) -> bool:
+    interval = float(getattr(settings, "RAG_LOCAL_INDEX_REFRESH_SECONDS", 5.0) or 0.0)
+    return _INDEX is not None and not force and time.monotonic() - _CHECKED_AT < interval
+
+
+def _apply_row(doc_id: str, updated_at: datetime | None, payload: dict[str, Any]) -> None:
+    # _LOCK 안에서 호출한다. 이미 더 최신(또는 같은) 버전을 반영한 문서는 건너뛴다.
+    global _SYNCED_AT
+    previous = _VERSIONS.get(doc_id)
+    if previous is not None and updated_at is not None and updated_at <= previous:
+        return
+    if updated_at is not None:
+        _VERSIONS[doc_id] = updated_at
+        if _SYNCED_AT is None or updated_at > _SYNCED_AT:
+            _SYNCED_AT = updated_at
+    if payload:
+        _INDEX.upsert(payload)
+
+
+def _refresh(db: Session, *, force: bool = False) -> LocalHybridIndex:
+    """DB 증분을 반영한 인덱스를 반환한다. 행 조회/파싱/첫 색인은 _LOCK 밖에서 하고 결과만 락 안에서 교체한다."""
+    global _INDEX, _SYNCED_AT, _CHECKED_AT
+    with _LOCK:
+        if _is_fresh(force):
+            return _INDEX
+        current = _INDEX
+    # 다른 스레드가 적재 중이면 기존 인덱스로 바로 검색하고, 인덱스가 아직 없을 때만 첫 적재를 기다린다.
+    if not _REFRESH_LOCK.acquire(blocking=current is None):
+        return current
+    try:
+        with _LOCK:
+            if _is_fresh(force):
+                return _INDEX
+            building = _INDEX is None
+            since = None if building else _SYNCED_AT
+        rows = _load_rows(db, since)
+        loaded = len(rows)
+        if building:
+            fresh = _new_index()
+            versions: dict[str, datetime] = {}
+            for doc_id, updated_at, payload in rows:
+                if payload:
+                    fresh.upsert(payload)
+                if updated_at is not None:
+                    versions[doc_id] = updated_at
+            synced_at = max(versions.values(), default=None)
+        with _LOCK:
+            if building:
+                _INDEX = fresh
+                _VERSIONS.clear()
+                _VERSIONS.update(versions)
+                _SYNCED_AT = synced_at
+                pending, rows = list(_BUILD_PENDING.items()), []
+                _BUILD_PENDING.clear()
+                for doc_id, (updated_at, payload) in pending:
+                    _apply_row(doc_id, updated_at, payload)
+            for doc_id, updated_at, payload in rows:
+                _apply_row(doc_id, updated_at, payload)
+            _STATS["refreshed_rows"] += loaded
+            _CHECKED_AT = time.monotonic()
+            return _INDEX
+    finally:
+        _REFRESH_LOCK.release()
+
+
+def warm_up(db: Session) -> None:
+    """기동 시 전체 문서를 미리 적재해 첫 검색 요청이 전체 적재를 기다리지 않게 한다(실패해도 기동은 계속)."""
+    try:
+        _refresh(db, force=True)
+    except Exception as exc:
+        logger.warning("[chatbot] local rag index warm-up failed: %s", exc)
+
+
+def index_document(db: Session, data: dict[str, Any]) -> None:
+    """insert-doc data payload를 로컬 저장소에 upsert하고 메모리 인덱스에 즉시 반영한다.
+
+    호출자 트랜잭션을 커밋/롤백하지 않도록 같은 엔진의 별도 세션에서 저장한다.
+    """
+    doc_id = str(data.get("doc_id") or "").strip()
+    if not doc_id:
+        return
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    updated_at = datetime.utcnow()
+    local_db = Session(bind=db.get_bind())
+    try:
+        row = local_db.query(RagLocalDocument).filter(RagLocalDocument.doc_id == doc_id).first()
+        if row is None:
+            row = RagLocalDocument(doc_id=doc_id)
+            local_db.add(row)
+        row.permission_groups = _groups_tag(list(data.get("permission_groups") or []))
+        row.payload = payload
+        row.updated_at = updated_at
+        local_db.commit()
+    except Exception:
+        local_db.rollback()
+        raise
+    finally:
+        local_db.close()
+    with _LOCK:
+        if _INDEX is not None:
+            _INDEX.upsert(json.loads(payload))
+            _VERSIONS[doc_id] = updated_at
+        elif _REFRESH_LOCK.locked():
+            _BUILD_PENDING[doc_id] = (updated_at, json.loads(payload))
+        _STATS["indexed"] += 1
+
+
+def search(
+    db: Session,
+    *,
+    query_text: str,
+    num_result_doc: int,
+    permission_groups: list[str],
+) -> dict[str, Any] | None:
+    """원격 `/retrieve-rrf`와 같은 응답 형태(hits.hits[]._source)를 반환한다. 인덱스가 비어 있으면 None."""
+    index = _refresh(db)
+    limit = max(1, min(int(num_result_doc), 20))
+    rrf_k = max(1, int(getattr(settings, "RAG_LOCAL_INDEX_RRF_K", 60) or 60))
+    # 락 안에서는 질의 토큰의 posting 사본만 뜨고, 순위 계산/_source 복사는 락 밖에서 한다.
+    with _LOCK:
+        if not len(index):
+            return None
+        view = index.snapshot(query_text)
+        _STATS["searches"] += 1
+    ranked = view.search(query_text, permission_groups=permission_groups, limit=limit, rrf_k=rrf_k)
+    hits = [{"_id": doc_id, "_score": round(score, 6), "_source": dict(view.docs[doc_id])} for doc_id, score in ranked]
+    return {"retriever": "local", "hits": {"total": {"value": len(hits)}, "hits": hits}}
+
+
+def get_stats() -> dict[str, Any]:
+    with _LOCK:
+        return {
+            "enabled": is_enabled(),
+            "mode": MODE_PRIMARY if is_primary() else MODE_FALLBACK,
+            "documents": len(_INDEX) if _INDEX is not None else 0,
+            "terms": (len(_INDEX.words.postings) + len(_INDEX.ngrams.postings)) if _INDEX is not None else 0,
+            **_STATS,
+        }
@@ -0,0 +1,261 @@
+"""[chatbot] 게시글/코칭노트/과제기록 RAG 일괄 재색인 서비스입니다. id 스트리밍, 배치 병렬 처리, 체크포인트 기반 재개를 제공합니다."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterator
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.board import BoardPost
+from app.models.coaching_note import CoachingNote
+from app.models.document import ProjectDocument
+from app.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TYPES = ("board_post", "coaching_note", "project_document")
+REINDEX_EVENT_TYPE = "reindex"
+
+
+@dataclass
+class ReindexFilters:
+    source_types: list[str] = field(default_factory=lambda: list(SOURCE_TYPES))
+    batch_id: int | None = None
+    updated_since: datetime | None = None
+
+    def signature(self) -> dict[str, Any]:
+        return {
+            "source_types": sorted(self.source_types),
+            "batch_id": self.batch_id,
+            "updated_since": self.updated_since.isoformat() if self.updated_since else None,
+        }
+
+
+@dataclass
+class SourceProgress:
+    # last_id: 이 id까지의 모든 배치가 끝났다(연속 완료 워터마크). 재개 시 last_id 초과부터 처리한다.
+    last_id: int = 0
+    done: int = 0
+    failed_ids: list[int] = field(default_factory=list)
+    finished: bool = False
+
+
+class ReindexCheckpoint:
+    """진행 상황을 JSON 파일로 원자적으로 저장한다. 파일 경로가 없으면 메모리에만 유지한다."""
+
+    def __init__(self, path: str | None, filters: ReindexFilters, *, reset: bool = False):
+        self.path = path
+        self.filters = filters
+        self.sources: dict[str, SourceProgress] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path) and not reset:
+            with open(path, encoding="utf-8") as fp:
+                saved = json.load(fp)
+            if saved.get("filters") != filters.signature():
+                raise ValueError("checkpoint filters differ from the current run; use --reset to start over")
+            self.sources = {key: SourceProgress(**value) for key, value in (saved.get("sources") or {}).items()}
+
+    def progress(self, source_type: str) -> SourceProgress:
+        with self._lock:
+            return self.sources.setdefault(source_type, SourceProgress())
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            body = {
+                "filters": self.filters.signature(),
+                "sources": {key: asdict(value) for key, value in self.sources.items()},
+                "saved_at": datetime.utcnow().isoformat(),
+            }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(body, fp, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _source_query(db: Session, source_type: str, filters: ReindexFilters, after_id: int):
+    if source_type == "board_post":
+        id_col = BoardPost.post_id
+        query = db.query(id_col)
+        if filters.batch_id is not None:
+            query = query.filter(BoardPost.batch_id == int(filters.batch_id))
+        updated_col = func.coalesce(BoardPost.updated_at, BoardPost.created_at)
+    elif source_type == "coaching_note":
+        id_col = CoachingNote.note_id
+        query = db.query(id_col)
+        if filters.batch_id is not None:
+            query = query.join(Project, Project.project_id == CoachingNote.project_id).filter(
+                Project.batch_id == int(filters.batch_id)
+            )
+        updated_col = func.coalesce(CoachingNote.updated_at, CoachingNote.created_at)
+    elif source_type == "project_document":
+        id_col = ProjectDocument.doc_id
+        query = db.query(id_col)
+        if filters.batch_id is not None:
+            query = query.join(Project, Project.project_id == ProjectDocument.project_id).filter(
+                Project.batch_id == int(filters.batch_id)
+            )
+        updated_col = func.coalesce(ProjectDocument.updated_at, ProjectDocument.created_at)
+    else:
+        raise ValueError(f"unknown source_type: {source_type}")
+    if filters.updated_since is not None:
+        query = query.filter(updated_col >= filters.updated_since)
+    return query.filter(id_col > int(after_id)).order_by(id_col.asc())
+
+
+def iter_source_ids(
+    db: Session,
+    source_type: str,
+    filters: ReindexFilters,
+    *,
+    after_id: int = 0,
+    batch_size: int = 50,
+    window_batches: int = 20,
+) -> Iterator[list[int]]:
+    """대상 id를 batch_size 단위 목록으로 스트리밍한다.
+
+    SQLite는 열린 읽기 커서가 다른 세션의 커밋을 막으므로, id 구간(window)마다 yield_per로 읽고
+    트랜잭션을 닫은 뒤 배치를 내보낸다. 메모리 사용량은 window 크기로 제한된다.
+    """
+    batch_size = max(1, int(batch_size))
+    window = batch_size * max(1, int(window_batches))
+    cursor_id = int(after_id)
+    while True:
+        ids = [
+            int(row_id)
+            for (row_id,) in _source_query(db, source_type, filters, cursor_id).limit(window).yield_per(batch_size)
+        ]
+        db.rollback()
+        for offset in range(0, len(ids), batch_size):
+            yield ids[offset : offset + batch_size]
+        if len(ids) < window:
+            return
+        cursor_id = ids[-1]
+
+
+def count_source_ids(db: Session, source_type: str, filters: ReindexFilters, *, after_id: int = 0) -> int:
+    return int(_source_query(db, source_type, filters, after_id).order_by(None).count())
+
+
+def _sync_one(svc: Any, source_type: str, source_id: int, user_id: str) -> None:
+    if source_type == "board_post":
+        svc.sync_board_post(post_id=source_id, user_id=user_id, event_type=REINDEX_EVENT_TYPE)
+    elif source_type == "coaching_note":
+        svc.sync_coaching_note(note_id=source_id, user_id=user_id, event_type=REINDEX_EVENT_TYPE)
+    else:
+        svc.sync_project_document(doc_id=source_id, user_id=user_id, event_type=REINDEX_EVENT_TYPE)
+
+
+def _run_batch(session_factory: Callable[[], Session], source_type: str, ids: list[int], user_id: str) -> list[int]:
+    # 배치마다 별도 세션을 사용한다(세션은 스레드 간 공유 불가).
+    from app.services.chatbot_service import ChatbotService
+
+    failed: list[int] = []
+    db = session_factory()
+    try:
+        svc = ChatbotService(db)
+        for source_id in ids:
+            try:
+                _sync_one(svc, source_type, source_id, user_id)
+            except Exception as exc:
+                db.rollback()
+                failed.append(int(source_id))
+                logger.warning("[chatbot] reindex failed %s:%s: %s", source_type, source_id, exc)
+    finally:
+        db.close()
+    return failed
+
+
+def reindex(
+    session_factory: Callable[[], Session],
+    *,
+    filters: ReindexFilters,
+    checkpoint: ReindexCheckpoint,
+    user_id: str = "system",
+    batch_size: int = 50,
+    workers: int = 4,
+    retry_failed: bool = False,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """체크포인트 이후 문서를 배치 단위로 병렬 재색인한다. 동시에 처리 중인 배치는 workers개로 제한한다."""
+    workers = max(1, int(workers))
+    batch_size = max(1, int(batch_size))
+    started = time.perf_counter()
+    totals = {"processed": 0, "succeeded": 0, "failed": 0}
+
+    def _report(source_type: str) -> None:
+        if on_progress is None:
+            return
+        elapsed = max(1e-9, time.perf_counter() - started)
+        on_progress({"source_type": source_type, **totals, "docs_per_sec": round(totals["processed"] / elapsed, 2)})
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rag-reindex") as pool:
+        for source_type in filters.source_types:
+            progress = checkpoint.progress(source_type)
+            if retry_failed and progress.failed_ids:
+                retry_ids, progress.failed_ids = sorted(progress.failed_ids), []
+                for offset in range(0, len(retry_ids), batch_size):
+                    ids = retry_ids[offset : offset + batch_size]
+                    failed = _run_batch(session_factory, source_type, ids, user_id)
+                    progress.failed_ids.extend(failed)
+                    totals["processed"] += len(ids)
+                    totals["succeeded"] += len(ids) - len(failed)
+                    totals["failed"] += len(failed)
+                checkpoint.save()
+            if progress.finished:
+                continue
+
+            # 완료 순서가 뒤섞여도 재개 지점이 누락되지 않도록 연속 완료된 배치까지만 last_id를 전진시킨다.
+            pending: dict[Future, list[int]] = {}
+            completed: dict[int, tuple[list[int], list[int]]] = {}
+            order: list[int] = []
+
+            def _drain(block_until_one: bool) -> None:
+                if not pending:
+                    return
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED if block_until_one else ALL_COMPLETED)
+                for fut in done:
+                    ids = pending.pop(fut)
+                    completed[ids[0]] = (ids, fut.result())
+                while order and order[0] in completed:
+                    ids, failed = completed.pop(order.pop(0))
+                    progress.last_id = ids[-1]
+                    progress.done += len(ids) - len(failed)
+                    progress.failed_ids.extend(failed)
+                    totals["processed"] += len(ids)
+                    totals["succeeded"] += len(ids) - len(failed)
+                    totals["failed"] += len(failed)
+                checkpoint.save()
+                _report(source_type)
+
+            reader = session_factory()
+            try:
+                for ids in iter_source_ids(reader, source_type, filters, after_id=progress.last_id, batch_size=batch_size):
+                    while len(pending) >= workers:
+                        _drain(True)
+                    order.append(ids[0])
+                    pending[pool.submit(_run_batch, session_factory, source_type, ids, user_id)] = ids
+                while pending:
+                    _drain(False)
+            finally:
+                reader.close()
+            progress.finished = True
+            checkpoint.save()
+
+    elapsed = time.perf_counter() - started
+    return {
+        **totals,
+        "elapsed_seconds": round(elapsed, 3),
+        "docs_per_sec": round(totals["processed"] / elapsed, 2) if elapsed > 0 else 0.0,
+        "sources": {key: asdict(value) for key, value in checkpoint.sources.items()},
+    }
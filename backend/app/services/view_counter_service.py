@@ -0,0 +1,216 @@
+"""게시글 조회수 write-behind 버퍼입니다. (post_id, user_id) 조회를 메모리(LRU)와 board_post_view로 중복 제거해 모았다가 주기적으로 일괄 반영합니다."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from sqlalchemy import case, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.board import BoardPost, BoardPostView
+
+logger = logging.getLogger(__name__)
+
+# 한 INSERT 문에 담는 최대 행 수 (SQLite 바인드 변수 상한 고려)
+INSERT_CHUNK_SIZE = 400
+
+_LOCK = threading.Lock()
+_FLUSH_LOCK = threading.Lock()
+_PENDING: dict[int, set[int]] = {}  # 아직 반영 전인 조회 (post_id -> user_id 집합)
+_INFLIGHT: dict[int, set[int]] = {}  # 반영 중인 조회 (커밋 전까지 조회수 보정에 포함)
+_PENDING_TOTAL = 0
+_RECORDED: "OrderedDict[tuple[int, int], None]" = OrderedDict()  # 이미 DB에 있는 조회 (LRU)
+
+_WAKE = threading.Event()
+_STOP = threading.Event()
+_FLUSHER: Optional[threading.Thread] = None
+
+
+def record_view(db: Session, post_id: int, user_id: int) -> bool:
+    """조회를 버퍼에 기록한다. 아직 DB에 반영되지 않은 신규 조회(버퍼에 있거나 새로 넣음)이면 True.
+
+    메모리(LRU)에 없는 쌍은 board_post_view 유니크 인덱스로 확인해(쓰기 없음) 재기동/LRU 축출 뒤의
+    재조회를 신규로 세지 않는다.
+    """
+    global _PENDING_TOTAL
+    key = (int(post_id), int(user_id))
+    with _LOCK:
+        if key in _RECORDED:
+            _RECORDED.move_to_end(key)
+            return False
+        if key[1] in _PENDING.get(key[0], ()) or key[1] in _INFLIGHT.get(key[0], ()):
+            return True
+    stored = (
+        db.query(BoardPostView.view_id)
+        .filter(BoardPostView.post_id == key[0], BoardPostView.user_id == key[1])
+        .first()
+    )
+    with _LOCK:
+        if stored is not None:
+            _remember({key[0]: {key[1]}})
+            return False
+        if key in _RECORDED:
+            return False
+        users = _PENDING.setdefault(key[0], set())
+        if key[1] not in users and key[1] not in _INFLIGHT.get(key[0], ()):
+            users.add(key[1])
+            _PENDING_TOTAL += 1
+    return True
+
+
+def needs_inline_flush() -> bool:
+    """버퍼가 상한에 닿았으면 flusher를 깨우고, flusher가 없으면 True(호출자가 flush)."""
+    with _LOCK:
+        full = _PENDING_TOTAL >= max(1, int(settings.BOARD_VIEW_BUFFER_MAX_PENDING))
+    if not full:
+        return False
+    if is_flusher_running():
+        _WAKE.set()
+        return False
+    return True
+
+
+def pending_views(post_id: int) -> int:
+    """아직 DB에 반영되지 않은 해당 게시글 조회 수 (상세 응답의 조회수 보정용)."""
+    with _LOCK:
+        return len(_PENDING.get(int(post_id), ())) + len(_INFLIGHT.get(int(post_id), ()))
+
+
+def _insert_ignore(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return sqlite_insert(BoardPostView).on_conflict_do_nothing()
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert(BoardPostView).on_conflict_do_nothing()
+    # MySQL/MariaDB
+    return insert(BoardPostView).prefix_with("IGNORE")
+
+
+def _remember(batch: dict[int, set[int]]) -> None:
+    limit = max(0, int(settings.BOARD_VIEW_DEDUP_CACHE_SIZE))
+    for post_id, user_ids in batch.items():
+        for user_id in user_ids:
+            _RECORDED[(post_id, user_id)] = None
+            _RECORDED.move_to_end((post_id, user_id))
+    while len(_RECORDED) > limit:
+        _RECORDED.popitem(last=False)
+
+
+def flush(db: Session) -> int:
+    """버퍼를 비워 조회 기록을 INSERT-IGNORE로 일괄 넣고, 실제로 들어간 건수만큼 view_count를 한 번에 올린다.
+
+    다른 프로세스가 이미 넣은 (post_id, user_id)는 유니크 제약으로 무시되어 중복 집계되지 않는다.
+    실패하면 버퍼에 되돌려 다음 주기에 다시 시도한다. 반영한 조회 수를 반환한다.
+    """
+    global _PENDING, _INFLIGHT, _PENDING_TOTAL
+    with _FLUSH_LOCK:
+        with _LOCK:
+            batch, _PENDING, _PENDING_TOTAL = _PENDING, {}, 0
+            _INFLIGHT = batch
+        if not batch:
+            return 0
+        try:
+            live_posts = set(db.scalars(select(BoardPost.post_id).where(BoardPost.post_id.in_(list(batch)))))
+            deltas: dict[int, int] = {}
+            for post_id in sorted(live_posts):
+                user_ids = sorted(batch[post_id])
+                for start in range(0, len(user_ids), INSERT_CHUNK_SIZE):
+                    chunk = user_ids[start : start + INSERT_CHUNK_SIZE]
+                    result = db.execute(
+                        _insert_ignore(db).values([{"post_id": post_id, "user_id": user_id} for user_id in chunk])
+                    )
+                    inserted = int(result.rowcount) if result.rowcount is not None and result.rowcount >= 0 else len(chunk)
+                    if inserted:
+                        deltas[post_id] = deltas.get(post_id, 0) + inserted
+            if deltas:
+                db.execute(
+                    update(BoardPost)
+                    .where(BoardPost.post_id.in_(list(deltas)))
+                    .values(
+                        view_count=func.coalesce(BoardPost.view_count, 0)
+                        + case(deltas, value=BoardPost.post_id, else_=0)
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            with _LOCK:
+                for post_id, user_ids in batch.items():
+                    merged = _PENDING.setdefault(post_id, set())
+                    _PENDING_TOTAL += len(user_ids - merged)
+                    merged.update(user_ids)
+                _INFLIGHT = {}
+            raise
+        with _LOCK:
+            _INFLIGHT = {}
+            _remember({post_id: batch[post_id] for post_id in live_posts})
+        return sum(deltas.values())
+
+
+def _flush_loop(session_factory: Callable[[], Session], interval: float) -> None:
+    while not _STOP.is_set():
+        _WAKE.wait(interval)
+        _WAKE.clear()
+        db = session_factory()
+        try:
+            flush(db)
+        except Exception as exc:
+            logger.warning("board view flush failed: %s", exc)
+        finally:
+            db.close()
+
+
+def is_flusher_running() -> bool:
+    return _FLUSHER is not None and _FLUSHER.is_alive()
+
+
+def start_flusher(session_factory: Callable[[], Session], interval: float | None = None) -> None:
+    global _FLUSHER
+    if is_flusher_running():
+        return
+    _STOP.clear()
+    _WAKE.clear()
+    seconds = max(0.1, float(interval if interval is not None else settings.BOARD_VIEW_FLUSH_INTERVAL_SECONDS))
+    _FLUSHER = threading.Thread(
+        target=_flush_loop,
+        args=(session_factory, seconds),
+        name="board-view-flusher",
+        daemon=True,
+    )
+    _FLUSHER.start()
+
+
+def stop_flusher(session_factory: Callable[[], Session] | None = None, timeout: float = 10.0) -> None:
+    """flusher를 멈추고 session_factory가 주어지면 남은 조회를 마지막으로 반영한다."""
+    global _FLUSHER
+    _STOP.set()
+    _WAKE.set()
+    if _FLUSHER is not None:
+        _FLUSHER.join(timeout=timeout)
+        _FLUSHER = None
+    if session_factory is None:
+        return
+    db = session_factory()
+    try:
+        flush(db)
+    except Exception as exc:
+        logger.warning("board view final flush failed: %s", exc)
+    finally:
+        db.close()
+
+
+def reset_state() -> None:
+    global _PENDING, _INFLIGHT, _PENDING_TOTAL
+    with _LOCK:
+        _PENDING, _INFLIGHT, _PENDING_TOTAL = {}, {}, 0
+        _RECORDED.clear()
+
@@ -0,0 +1,64 @@
+"""목록 API keyset(cursor) 페이지네이션 공용 유틸리티입니다."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_, select
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(kind: str, values: List[Any]) -> str:
+    """목록 종류(kind)와 마지막 행의 정렬 키를 불투명한 URL-safe 문자열로 만든다."""
+    payload = json.dumps({"k": kind, "v": values}, ensure_ascii=False, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(kind: str, token: str, size: int) -> List[Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        values = payload["v"]
+        if payload.get("k") != kind or not isinstance(values, list) or len(values) != size:
+            raise ValueError(kind)
+        return values
+    except (ValueError, KeyError, TypeError, UnicodeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+
+def cursor_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+
+def parse_cursor_datetime(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+
+def anchor_value(column, id_column, anchor_id: int, fallback: Any = None):
+    """커서 기준 행의 정렬 컬럼 값을 DB에서 다시 읽는 스칼라 서브쿼리.
+
+    DB에 저장된 값끼리 비교하므로 SQLite 날짜 문자열 형식 차이로 같은 시각 행이 중복/누락되지 않는다.
+    기준 행이 삭제되었으면 커서에 담긴 값(fallback)을 쓴다.
+    """
+    # 바깥 목록 쿼리와 같은 테이블이어도 상관 서브쿼리가 되지 않도록 correlate(None)으로 고정한다.
+    anchor = select(column).where(id_column == anchor_id).correlate(None).scalar_subquery()
+    return anchor if fallback is None else func.coalesce(anchor, fallback)
+
+
+def keyset_desc(sort_column, id_column, sort_anchor, anchor_id: int):
+    """(sort_column desc, id_column desc) 정렬에서 커서 행 다음(더 오래된) 행 조건."""
+    return or_(sort_column < sort_anchor, and_(sort_column == sort_anchor, id_column < anchor_id))
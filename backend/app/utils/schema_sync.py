@@ -7,9 +7,10 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.schema import CreateColumn, CreateIndex, MetaData
 
 
-def sync_missing_schema_objects(engine: Engine, metadata: MetaData) -> None:
-    """모델 메타데이터 기준으로 누락된 컬럼/인덱스를 DB에 추가한다."""
+def sync_missing_schema_objects(engine: Engine, metadata: MetaData) -> int:
+    """모델 메타데이터 기준으로 누락된 컬럼/인덱스를 DB에 추가하고 추가한 객체 수를 반환한다."""
     inspector = inspect(engine)
+    changed = 0
     existing_tables = set(inspector.get_table_names())
     preparer = engine.dialect.identifier_preparer
 
@@ -30,6 +31,7 @@ def sync_missing_schema_objects(engine: Engine, metadata: MetaData) -> None:
                     continue
                 column_sql = str(CreateColumn(column).compile(dialect=engine.dialect)).strip()
                 conn.execute(text(f"ALTER TABLE {table_sql} ADD COLUMN {column_sql}"))
+                changed += 1
 
             existing_index_names = {
                 str(row.get("name"))
@@ -40,3 +42,5 @@ def sync_missing_schema_objects(engine: Engine, metadata: MetaData) -> None:
                 if not index.name or index.name in existing_index_names:
                     continue
                 conn.execute(CreateIndex(index))
+                changed += 1
+    return changed
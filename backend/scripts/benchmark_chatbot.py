@@ -0,0 +1,284 @@
+"""[chatbot] 챗봇 핫패스(질문 API + RAG 입력 동기화) 부하 벤치마크.
+
+임시 SQLite DB와 가짜 RAG/LLM 서버(scripts/chatbot_fake_servers.py)를 띄운 뒤
+백엔드 앱을 uvicorn으로 실행해 실제 HTTP 경로로 측정한다. 실서비스에는 접속하지 않는다.
+
+Usage:
+  python scripts/benchmark_chatbot.py                                  # 기본: 동시 사용자 8명
+  python scripts/benchmark_chatbot.py --users 32 --ask-requests 400 --sync-requests 200
+  python scripts/benchmark_chatbot.py --llm-latency-ms 800 --rag-latency-ms 80 --stream
+  python scripts/benchmark_chatbot.py --json > bench.json              # 결과를 JSON으로 출력
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+QUESTIONS = [
+    "이번주 코칭 노트 요약해줘",
+    "N2SQL 관련 과제 알려줘",
+    "최근 공지 내용 정리해줘",
+    "과제 진행 중 어려움에 대한 코치 피드백 알려줘",
+    "데이터 파이프라인 관련 게시글 요약",
+]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """nearest-rank 백분위수(ms)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(name: str, latencies_ms: list[float], errors: int, elapsed_s: float) -> dict:
+    total = len(latencies_ms) + errors
+    return {
+        "phase": name,
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "throughput_rps": round(total / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+        "p50_ms": round(percentile(latencies_ms, 50), 2),
+        "p95_ms": round(percentile(latencies_ms, 95), 2),
+        "p99_ms": round(percentile(latencies_ms, 99), 2),
+        "max_ms": round(max(latencies_ms), 2) if latencies_ms else 0.0,
+        "elapsed_s": round(elapsed_s, 3),
+    }
+
+
+def run_concurrently(name: str, total: int, users: int, task) -> dict:
+    """task(index)를 users개 스레드로 total회 실행하고 지연 분포를 집계한다."""
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def _one(index: int) -> None:
+        nonlocal errors
+        started = time.perf_counter()
+        try:
+            ok = task(index)
+        except Exception:
+            ok = False
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with lock:
+            if ok:
+                latencies.append(elapsed_ms)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, users), thread_name_prefix=f"bench-{name}") as pool:
+        list(pool.map(_one, range(max(0, total))))
+    return summarize(name, latencies, errors, time.perf_counter() - started)
+
+
+def configure_settings(settings, *, rag_url: str, llm_url: str, args) -> None:
+    settings.CHATBOT_ENABLED = True
+    settings.AI_FEATURES_ENABLED = True
+    settings.RAG_ENABLED = True
+    settings.RAG_INPUT_ENABLED = True
+    settings.RAG_BASE_URL = rag_url
+    settings.RAG_API_KEY = "bench-rag-key"
+    settings.AI_CREDENTIAL_KEY = "bench-credential"
+    settings.OPENAI_API_KEY = "bench-openai-key"
+    for slot in range(1, 5):
+        setattr(settings, f"AI_MODEL{slot}_BASE_URL", f"{llm_url}/v1")
+    settings.AI_IMAGE_MODEL_BASE_URL = ""
+    settings.RAG_INGEST_QUEUE_ENABLED = False
+    settings.CHAT_DEBUG_MODE = False
+    # 반복 질문 캐시가 켜져 있으면 핫패스가 아닌 캐시 적중을 재게 되므로 기본은 끈다.
+    settings.CHATBOT_ANSWER_CACHE_ENABLED = bool(args.answer_cache)
+    settings.RAG_SUMMARY_CACHE_ENABLED = bool(args.answer_cache)
+
+
+def seed_database(SessionLocal, *, posts: int) -> dict:
+    from datetime import date
+
+    from app.models.batch import Batch
+    from app.models.board import Board, BoardPost
+    from app.models.user import User
+
+    db = SessionLocal()
+    try:
+        admin = User(emp_id="bench_admin", name="Bench Admin", role="admin", department="QA")
+        participant = User(emp_id="bench_user", name="Bench User", role="participant", department="QA")
+        db.add_all([admin, participant])
+        db.add(Batch(batch_name="벤치마크 차수", start_date=date(2026, 1, 1), end_date=date(2026, 12, 31), status="ongoing"))
+        board = Board(board_name="벤치마크", board_type="chat")
+        db.add(board)
+        db.commit()
+        post_ids = []
+        for idx in range(max(1, posts)):
+            post = BoardPost(
+                board_id=board.board_id,
+                author_id=participant.user_id,
+                title=f"벤치마크 게시글 {idx + 1}",
+                content=f"<p>벤치마크 본문 {idx + 1}. 데이터 파이프라인과 N2SQL 적용 경험을 공유합니다.</p>",
+            )
+            db.add(post)
+            db.flush()
+            post_ids.append(int(post.post_id))
+        db.commit()
+        return {"admin_user_id": int(admin.user_id), "post_ids": post_ids}
+    finally:
+        db.close()
+
+
+def run_benchmark(args) -> dict:
+    import httpx
+
+    from chatbot_fake_servers import BackgroundServer, FakeServerOptions, create_fake_llm_app, create_fake_rag_app
+
+    rag_server = BackgroundServer(
+        create_fake_rag_app(
+            FakeServerOptions(
+                latency_ms=args.rag_latency_ms,
+                jitter_ms=args.rag_jitter_ms,
+                error_rate=args.rag_error_rate,
+                content_chars=args.content_chars,
+                seed=args.seed,
+            )
+        )
+    ).start()
+    llm_server = BackgroundServer(
+        create_fake_llm_app(
+            FakeServerOptions(
+                latency_ms=args.llm_latency_ms,
+                jitter_ms=args.llm_jitter_ms,
+                error_rate=args.llm_error_rate,
+                answer_chars=args.answer_chars,
+                stream_chunks=args.stream_chunks,
+                seed=args.seed,
+            )
+        )
+    ).start()
+
+    from app.config import settings
+    from app.database import SessionLocal
+    from app.main import app
+    from app.services.chatbot_service import ChatbotService
+
+    configure_settings(settings, rag_url=rag_server.base_url, llm_url=llm_server.base_url, args=args)
+    api_server = BackgroundServer(app).start()
+    try:
+        seeded = seed_database(SessionLocal, posts=args.posts)
+        base_url = api_server.base_url
+        login = httpx.post(f"{base_url}/api/auth/login", json={"emp_id": args.emp_id}, timeout=10)
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        local = threading.local()
+
+        def _client() -> httpx.Client:
+            if getattr(local, "client", None) is None:
+                local.client = httpx.Client(base_url=base_url, headers=headers, timeout=args.timeout)
+            return local.client
+
+        def _ask(index: int) -> bool:
+            question = f"{QUESTIONS[index % len(QUESTIONS)]} #{index}"
+            if args.stream:
+                with _client().stream(
+                    "POST", "/api/chatbot/ask/stream", json={"question": question, "num_result_doc": args.num_docs}
+                ) as resp:
+                    body = "".join(resp.iter_text())
+                return resp.status_code == 200 and "event: done" in body
+            resp = _client().post("/api/chatbot/ask", json={"question": question, "num_result_doc": args.num_docs})
+            return resp.status_code == 200
+
+        def _sync(index: int) -> bool:
+            # safe_sync_*는 실패를 삼키므로 내부 upsert를 직접 호출해 오류도 집계한다.
+            post_ids = seeded["post_ids"]
+            db = SessionLocal()
+            try:
+                ChatbotService(db).sync_board_post(
+                    post_id=post_ids[index % len(post_ids)],
+                    user_id=str(seeded["admin_user_id"]),
+                    event_type="update",
+                )
+                return True
+            finally:
+                db.close()
+
+        results = []
+        if args.warmup:
+            run_concurrently("warmup", args.warmup, args.users, _ask)
+        results.append(run_concurrently("ask_stream" if args.stream else "ask", args.ask_requests, args.users, _ask))
+        results.append(run_concurrently("rag_sync", args.sync_requests, args.users, _sync))
+        return {
+            "config": {
+                "users": args.users,
+                "rag_latency_ms": args.rag_latency_ms,
+                "llm_latency_ms": args.llm_latency_ms,
+                "rag_error_rate": args.rag_error_rate,
+                "llm_error_rate": args.llm_error_rate,
+                "content_chars": args.content_chars,
+                "answer_chars": args.answer_chars,
+                "answer_cache": bool(args.answer_cache),
+            },
+            "results": results,
+        }
+    finally:
+        api_server.stop()
+        llm_server.stop()
+        rag_server.stop()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from chatbot_fake_servers import add_server_options
+
+    parser = argparse.ArgumentParser(description="챗봇 질문/RAG 동기화 부하 벤치마크 (가짜 RAG/LLM 서버 사용)")
+    parser.add_argument("--users", type=int, default=8, help="동시 사용자(스레드) 수")
+    parser.add_argument("--ask-requests", type=int, default=100, help="질문 API 총 호출 수")
+    parser.add_argument("--sync-requests", type=int, default=50, help="RAG 입력 동기화 총 호출 수")
+    parser.add_argument("--warmup", type=int, default=5, help="측정 전 워밍업 질문 수")
+    parser.add_argument("--stream", action="store_true", help="/ask 대신 /ask/stream(SSE)을 측정")
+    parser.add_argument("--answer-cache", action="store_true", help="답변/요약 캐시를 켠 상태로 측정")
+    parser.add_argument("--num-docs", type=int, default=5, help="질문당 num_result_doc")
+    parser.add_argument("--posts", type=int, default=20, help="동기화 대상 게시글 수")
+    parser.add_argument("--emp-id", default="bench_user", help="질문 사용자 사번 (bench_admin이면 관리자 라우팅 경로)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="HTTP 요청 timeout(초)")
+    add_server_options(parser, "rag-")
+    add_server_options(parser, "llm-")
+    parser.add_argument("--content-chars", type=int, default=800, help="RAG 검색 결과 문서당 본문 길이")
+    parser.add_argument("--answer-chars", type=int, default=400, help="LLM 답변 길이")
+    parser.add_argument("--stream-chunks", type=int, default=20, help="LLM 스트리밍 청크 수")
+    parser.add_argument("--seed", type=int, default=None, help="가짜 서버 지연/오류 난수 시드")
+    parser.add_argument("--db-path", default=None, help="임시 SQLite DB 경로(기본: 임시 디렉터리)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    # 앱 모듈을 import하기 전에 DB 경로를 정해야 운영 DB를 건드리지 않는다.
+    tmp_dir = tempfile.mkdtemp(prefix="chatbot-bench-")
+    db_path = args.db_path or os.path.join(tmp_dir, "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("UPLOAD_DIR", os.path.join(tmp_dir, "uploads"))
+
+    report = run_benchmark(args)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    print("Chatbot benchmark result")
+    for key, value in report["config"].items():
+        print(f"  {key}: {value}")
+    print(f"  {'phase':<12}{'reqs':>7}{'errors':>8}{'rps':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for row in report["results"]:
+        print(
+            f"  {row['phase']:<12}{row['requests']:>7}{row['errors']:>8}{row['throughput_rps']:>9}"
+            f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""[chatbot] 부하 테스트용 가짜 RAG 서버와 OpenAI 호환 가짜 LLM 서버.
+
+Usage:
+  python scripts/chatbot_fake_servers.py rag --port 8100 --latency-ms 50 --error-rate 0.01
+  python scripts/chatbot_fake_servers.py llm --port 8200 --latency-ms 300 --answer-chars 600 --stream-chunks 30
+
+실제 서비스 대신 연결하려면 .env에 아래처럼 지정한다.
+  RAG_BASE_URL=http://127.0.0.1:8100
+  AI_MODEL1_BASE_URL=http://127.0.0.1:8200/v1
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class FakeServerOptions:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    # RAG: 검색 결과 문서당 본문 길이 / LLM: 답변 길이
+    content_chars: int = 800
+    answer_chars: int = 400
+    stream_chunks: int = 20
+    seed: int | None = None
+
+
+class _Behavior:
+    def __init__(self, options: FakeServerOptions):
+        self.options = options
+        self._random = random.Random(options.seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    async def delay(self, scale: float = 1.0) -> None:
+        jitter = self._random.uniform(-self.options.jitter_ms, self.options.jitter_ms) if self.options.jitter_ms else 0.0
+        seconds = max(0.0, (self.options.latency_ms + jitter) * scale / 1000.0)
+        if seconds:
+            await asyncio.sleep(seconds)
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = self.options.error_rate > 0 and self._random.random() < self.options.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+
+
+def _filler(length: int, seed_text: str = "") -> str:
+    base = f"{seed_text} 코칭 진행 상황과 다음 단계 계획을 정리한 테스트 문장입니다. "
+    repeated = base * (max(1, int(length)) // max(1, len(base)) + 1)
+    return repeated[: max(1, int(length))]
+
+
+def create_fake_rag_app(options: FakeServerOptions | None = None) -> FastAPI:
+    """`/insert-doc`, `/retrieve-rrf`를 흉내 내는 가짜 RAG 서버."""
+    behavior = _Behavior(options or FakeServerOptions())
+    app = FastAPI(title="fake-rag")
+    app.state.behavior = behavior
+    app.state.docs = {}
+
+    @app.post("/insert-doc")
+    async def insert_doc(request: Request):
+        payload = await request.json()
+        await behavior.delay()
+        if behavior.should_fail():
+            return JSONResponse(status_code=500, content={"detail": "fake rag insert failure"})
+        data = payload.get("data") or {}
+        doc_id = str(data.get("doc_id") or "")
+        if not doc_id:
+            return JSONResponse(status_code=422, content={"detail": "data.doc_id is required"})
+        app.state.docs[doc_id] = data
+        return {"result": "ok", "doc_id": doc_id}
+
+    @app.post("/retrieve-rrf")
+    async def retrieve_rrf(request: Request):
+        payload = await request.json()
+        await behavior.delay()
+        if behavior.should_fail():
+            return JSONResponse(status_code=500, content={"detail": "fake rag retrieve failure"})
+        groups = set(payload.get("permission_groups") or [])
+        limit = max(1, int(payload.get("num_result_doc") or 5))
+        # 입력된 문서 중 권한 그룹이 겹치는 문서를 우선 반환하고, 부족하면 합성 문서로 채운다.
+        stored = [
+            doc for doc in list(app.state.docs.values()) if not groups or groups & set(doc.get("permission_groups") or [])
+        ][:limit]
+        hits = [
+            {
+                "_score": round(10.0 - idx, 3),
+                "_source": {**doc, "content": str(doc.get("content") or "")[: behavior.options.content_chars]},
+            }
+            for idx, doc in enumerate(stored)
+        ]
+        for idx in range(len(hits), limit):
+            hits.append(
+                {
+                    "_score": round(5.0 - idx * 0.1, 3),
+                    "_source": {
+                        "doc_id": f"board_post:{900000 + idx}",
+                        "title": f"합성 문서 {idx + 1}",
+                        "content": _filler(behavior.options.content_chars, str(payload.get("query_text") or "")),
+                        "source_type": "board_post",
+                        "permission_groups": sorted(groups) or ["rag-public"],
+                    },
+                }
+            )
+        return {"hits": {"total": {"value": len(hits)}, "hits": hits}}
+
+    @app.get("/stats")
+    async def stats():
+        return {"requests": behavior.requests, "errors": behavior.errors, "docs": len(app.state.docs)}
+
+    return app
+
+
+def _fake_completion_text(messages: list[dict], answer_chars: int) -> str:
+    system_prompt = " ".join(str(m.get("content") or "") for m in messages if m.get("role") == "system")
+    user_prompt = " ".join(str(m.get("content") or "") for m in messages if m.get("role") == "user")
+    # 챗봇 내부 단계(JSON 응답 요구)는 파싱 가능한 최소 JSON을 돌려준다.
+    if "질문 라우터" in system_prompt:
+        return json.dumps({"route": "rag", "reason": "fake"}, ensure_ascii=False)
+    if "SQL 생성기" in system_prompt:
+        return json.dumps({"sql": ""})
+    if "요약 + 엔티티" in system_prompt:
+        return json.dumps(
+            {"summary": _filler(120, "요약"), "entities": [], "relations": []},
+            ensure_ascii=False,
+        )
+    return _filler(answer_chars, user_prompt[-40:].strip())
+
+
+def _chunks(text: str, count: int) -> list[str]:
+    size = max(1, len(text) // max(1, int(count)))
+    return [text[idx : idx + size] for idx in range(0, len(text), size)]
+
+
+def create_fake_llm_app(options: FakeServerOptions | None = None) -> FastAPI:
+    """OpenAI 호환 `/v1/chat/completions`(일반/스트리밍)를 흉내 내는 가짜 LLM 서버."""
+    behavior = _Behavior(options or FakeServerOptions())
+    app = FastAPI(title="fake-llm")
+    app.state.behavior = behavior
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": f"model{idx}", "object": "model"} for idx in range(1, 5)]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        model = str(payload.get("model") or "model1")
+        text = _fake_completion_text(list(payload.get("messages") or []), behavior.options.answer_chars)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        if behavior.should_fail():
+            await behavior.delay()
+            return JSONResponse(status_code=500, content={"error": {"message": "fake llm failure", "code": 500}})
+
+        if not payload.get("stream"):
+            await behavior.delay()
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(text), "total_tokens": len(text)},
+            }
+
+        pieces = _chunks(text, behavior.options.stream_chunks)
+
+        async def _stream():
+            # 첫 토큰까지 지연의 절반, 나머지는 청크 사이에 나눠 보낸다.
+            await behavior.delay(0.5)
+            for piece in pieces:
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                await behavior.delay(0.5 / max(1, len(pieces)))
+            done = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            }
+            yield f"data: {json.dumps(done)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(_stream(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def stats():
+        return {"requests": behavior.requests, "errors": behavior.errors}
+
+    return app
+
+
+class BackgroundServer:
+    """uvicorn 서버를 데몬 스레드에서 띄운다. 벤치마크/테스트에서 실제 HTTP 경로를 태우기 위해 사용."""
+
+    def __init__(self, app: FastAPI, *, host: str = "127.0.0.1", port: int = 0):
+        import uvicorn
+
+        self.config = uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="on")
+        self.server = uvicorn.Server(self.config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        sockets = [sock for server in (self.server.servers or []) for sock in server.sockets]
+        host, port = sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, timeout: float = 10.0) -> "BackgroundServer":
+        self.thread.start()
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError("fake server failed to start")
+            time.sleep(0.02)
+        return self
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
+
+
+def add_server_options(parser: argparse.ArgumentParser, prefix: str = "") -> None:
+    parser.add_argument(f"--{prefix}latency-ms", type=float, default=0.0, help="응답 지연(ms)")
+    parser.add_argument(f"--{prefix}jitter-ms", type=float, default=0.0, help="지연 편차(±ms)")
+    parser.add_argument(f"--{prefix}error-rate", type=float, default=0.0, help="500 응답 비율(0~1)")
+
+
+def options_from_args(args: argparse.Namespace, prefix: str = "", **extra) -> FakeServerOptions:
+    key = prefix.replace("-", "_")
+    return FakeServerOptions(
+        latency_ms=float(getattr(args, f"{key}latency_ms")),
+        jitter_ms=float(getattr(args, f"{key}jitter_ms")),
+        error_rate=float(getattr(args, f"{key}error_rate")),
+        **extra,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="챗봇 부하 테스트용 가짜 RAG/LLM 서버")
+    parser.add_argument("kind", choices=["rag", "llm"], help="실행할 가짜 서버 종류")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    add_server_options(parser)
+    parser.add_argument("--content-chars", type=int, default=800, help="RAG 검색 결과 문서당 본문 길이")
+    parser.add_argument("--answer-chars", type=int, default=400, help="LLM 답변 길이")
+    parser.add_argument("--stream-chunks", type=int, default=20, help="LLM 스트리밍 청크 수")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    options = options_from_args(
+        args,
+        content_chars=args.content_chars,
+        answer_chars=args.answer_chars,
+        stream_chunks=args.stream_chunks,
+    )
+    app = create_fake_rag_app(options) if args.kind == "rag" else create_fake_llm_app(options)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+
+
+if __name__ == "__main__":
+    main()
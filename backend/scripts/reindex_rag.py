@@ -0,0 +1,109 @@
+"""[chatbot] 게시글/코칭노트/과제기록을 RAG 인덱스에 일괄 재색인한다.
+
+대상 id를 스트리밍으로 읽어 배치 단위로 병렬 처리하고, 진행 상황을 체크포인트 파일에 저장한다.
+중단 후 같은 명령을 다시 실행하면 마지막으로 완료된 지점부터 이어서 처리한다.
+
+Usage:
+  python scripts/reindex_rag.py --dry-run                              # 대상 건수만 출력
+  python scripts/reindex_rag.py --workers 4 --batch-size 50
+  python scripts/reindex_rag.py --source-type coaching_note --batch-id 2
+  python scripts/reindex_rag.py --updated-since 2026-01-01 --checkpoint reindex_2026.json
+  python scripts/reindex_rag.py --retry-failed                         # 실패한 문서만 다시 처리
+  python scripts/reindex_rag.py --reset                                # 체크포인트를 무시하고 처음부터
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services import rag_reindex_service
+from app.services.chatbot_service import ChatbotService
+
+
+def _parse_since(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid date: {value}") from exc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RAG 일괄 재색인")
+    parser.add_argument(
+        "--source-type",
+        action="append",
+        choices=list(rag_reindex_service.SOURCE_TYPES),
+        help="대상 문서 유형 (여러 번 지정 가능, 기본: 전체)",
+    )
+    parser.add_argument("--batch-id", type=int, default=None, help="차수(batch_id) 필터")
+    parser.add_argument("--updated-since", type=_parse_since, default=None, help="수정(없으면 생성) 시각 하한, ISO 형식")
+    parser.add_argument("--batch-size", type=int, default=50, help="배치당 문서 수")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 처리할 배치 수")
+    parser.add_argument("--user-id", default="system", help="LLM 호출 이력에 남길 사용자 id")
+    parser.add_argument("--checkpoint", default="rag_reindex_checkpoint.json", help="체크포인트 파일 경로")
+    parser.add_argument("--reset", action="store_true", help="기존 체크포인트를 무시하고 처음부터 실행")
+    parser.add_argument("--retry-failed", action="store_true", help="체크포인트에 기록된 실패 문서를 다시 처리")
+    parser.add_argument("--dry-run", action="store_true", help="대상 건수만 출력")
+    args = parser.parse_args()
+
+    filters = rag_reindex_service.ReindexFilters(
+        source_types=args.source_type or list(rag_reindex_service.SOURCE_TYPES),
+        batch_id=args.batch_id,
+        updated_since=args.updated_since,
+    )
+    try:
+        checkpoint = rag_reindex_service.ReindexCheckpoint(args.checkpoint, filters, reset=args.reset)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    db = SessionLocal()
+    try:
+        if not ChatbotService(db)._is_rag_input_enabled():
+            parser.error("RAG 입력이 비활성화되어 있습니다. RAG_ENABLED/RAG_INPUT_ENABLED/RAG_API_KEY 설정을 확인하세요.")
+        print("RAG reindex targets")
+        for source_type in filters.source_types:
+            progress = checkpoint.progress(source_type)
+            remaining = 0 if progress.finished else rag_reindex_service.count_source_ids(
+                db, source_type, filters, after_id=progress.last_id
+            )
+            print(
+                f"  {source_type}: remaining={remaining} last_id={progress.last_id} "
+                f"done={progress.done} failed={len(progress.failed_ids)}"
+            )
+    finally:
+        db.close()
+    if args.dry_run:
+        return
+
+    def _on_progress(row):
+        print(
+            f"  [{row['source_type']}] processed={row['processed']} failed={row['failed']} "
+            f"docs/sec={row['docs_per_sec']}",
+            flush=True,
+        )
+
+    result = rag_reindex_service.reindex(
+        SessionLocal,
+        filters=filters,
+        checkpoint=checkpoint,
+        user_id=args.user_id,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        retry_failed=args.retry_failed,
+        on_progress=_on_progress,
+    )
+    print("RAG reindex result")
+    print(f"  processed: {result['processed']}")
+    print(f"  succeeded: {result['succeeded']}")
+    print(f"  failed: {result['failed']}")
+    print(f"  elapsed_seconds: {result['elapsed_seconds']}")
+    print(f"  docs_per_sec: {result['docs_per_sec']}")
+    if result["failed"]:
+        print(f"  failed ids are kept in {args.checkpoint}; rerun with --retry-failed")
+
+
+if __name__ == "__main__":
+    main()
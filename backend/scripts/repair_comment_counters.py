@@ -0,0 +1,32 @@
+"""Recompute denormalized comment counters.
+
+Recalculates board_post.comment_count/last_comment_at and
+coaching_notes.comment_count/last_comment_at (public comments only)
+from the comment tables and fixes rows that drifted.
+
+Usage:
+  python scripts/repair_comment_counters.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services import comment_counter_service
+
+
+def main():
+    db = SessionLocal()
+    try:
+        result = comment_counter_service.recompute_all(db)
+    finally:
+        db.close()
+
+    print("Comment counter repair result")
+    print(f"  board_posts_fixed: {result['board_posts']}")
+    print(f"  coaching_notes_fixed: {result['coaching_notes']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,9 +30,16 @@ app.dependency_overrides[get_db] = override_get_db
 
 @pytest.fixture(autouse=True)
 def setup_db():
+    from app.services import board_registry_service, view_counter_service
+
+    # 테스트마다 테이블을 다시 만들므로 이전 테스트의 게시판 캐시와 조회수 버퍼를 비운다.
+    board_registry_service.reset_state()
+    view_counter_service.reset_state()
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+    board_registry_service.reset_state()
+    view_counter_service.reset_state()
 
 
 @pytest.fixture
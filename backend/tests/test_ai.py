@@ -7,7 +7,7 @@ from app.models.project import Project
 from app.models.coaching_note import CoachingNote
 from app.models.document import ProjectDocument
 from app.models.ai_content import AIGeneratedContent
-from datetime import date
+from datetime import date, datetime, timedelta
 
 
 @pytest.fixture
@@ -222,6 +222,162 @@ def test_generate_summary_managed_separately_by_week(client, seed_users, project
     assert {row.week_number for row in active_rows} == {1, 2}
 
 
+def _add_note(db, project, coach, issue, week_number=None):
+    note = CoachingNote(
+        project_id=project.project_id,
+        author_id=coach.user_id,
+        coaching_date=date(2026, 2, 1),
+        week_number=week_number,
+        current_status="진행 중",
+        progress_rate=60,
+        main_issue=issue,
+        next_action="다음 액션",
+    )
+    db.add(note)
+    db.commit()
+    return note
+
+
+def test_generate_summary_incremental_feeds_only_changed_notes(client, seed_users, project_with_notes, db, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "AI_INCREMENTAL_SUMMARY_ENABLED", True)
+    monkeypatch.setattr(settings, "AI_INCREMENTAL_MAX_UPDATES", 2)
+    project_id = project_with_notes.project_id
+    base_note = db.query(CoachingNote).filter(CoachingNote.project_id == project_id).first()
+    url = f"/api/projects/{project_id}/summary"
+    headers = auth_headers(client, "admin001")
+
+    with patch("app.services.ai_service.AIClient") as MockClient:
+        mock_instance = MagicMock()
+        mock_instance.model_name = "qwen3"
+        mock_instance.invoke.side_effect = ["summary v1", "summary v2", "summary v3", "summary v4", "summary v5"]
+        MockClient.get_client.return_value = mock_instance
+
+        first = client.post(url, json={}, headers=headers)
+        assert first.status_code == 200, first.text
+        assert first.json()["generation_mode"] == "full"
+
+        _add_note(db, project_with_notes, seed_users["coach"], "새 이슈: 라벨링 지연")
+        second = client.post(url, json={"force_regenerate": True}, headers=headers)
+        assert second.json()["generation_mode"] == "incremental"
+        prompt = str(mock_instance.invoke.call_args[0][0])
+        assert "=== 기존 요약 ===\nsummary v1" in prompt
+        assert "새 이슈: 라벨링 지연" in prompt
+        assert "AI 모델 선택" not in prompt
+        # 같은 초에 저장된 노트도 변경으로 보므로, 이미 반영된 노트는 과거로 돌려 다음 증분 대상에서 뺀다.
+        db.query(CoachingNote).filter(CoachingNote.project_id == project_id).update(
+            {"updated_at": datetime(2000, 1, 1)}, synchronize_session=False
+        )
+        db.commit()
+
+        # 이전 생성 이후 수정된 노트도 증분 대상이다.
+        base_note.main_issue = "수정된 이슈"
+        base_note.updated_at = datetime(2999, 1, 1)
+        db.commit()
+        third = client.post(url, json={"force_regenerate": True}, headers=headers)
+        assert third.json()["generation_mode"] == "incremental"
+        prompt = str(mock_instance.invoke.call_args[0][0])
+        assert "summary v2" in prompt
+        assert "수정된 이슈" in prompt
+        assert "새 이슈: 라벨링 지연" not in prompt
+
+        # 증분 횟수가 상한(2)에 도달하면 전체 노트로 다시 생성한다.
+        _add_note(db, project_with_notes, seed_users["coach"], "세 번째 이슈")
+        fourth = client.post(url, json={"force_regenerate": True}, headers=headers)
+        assert fourth.json()["generation_mode"] == "full"
+        prompt = str(mock_instance.invoke.call_args[0][0])
+        assert "기존 요약" not in prompt
+        assert "새 이슈: 라벨링 지연" in prompt and "세 번째 이슈" in prompt
+
+        # full_rebuild 요청은 변경 노트가 있어도 전체 재생성한다.
+        _add_note(db, project_with_notes, seed_users["coach"], "네 번째 이슈")
+        fifth = client.post(url, json={"full_rebuild": True}, headers=headers)
+        assert fifth.json()["generation_mode"] == "full"
+        assert "세 번째 이슈" in str(mock_instance.invoke.call_args[0][0])
+
+    active = (
+        db.query(AIGeneratedContent)
+        .filter(
+            AIGeneratedContent.project_id == project_id,
+            AIGeneratedContent.content_type == "summary",
+            AIGeneratedContent.is_active == True,  # noqa: E712
+        )
+        .all()
+    )
+    assert [(row.content, row.incremental_count) for row in active] == [("summary v5", 0)]
+
+
+def test_note_edited_in_same_second_as_generation_counts_as_change(client, seed_users, project_with_notes, db, monkeypatch):
+    from app.config import settings
+    from app.services.ai_service import AIService
+
+    monkeypatch.setattr(settings, "AI_INCREMENTAL_SUMMARY_ENABLED", True)
+    project_id = project_with_notes.project_id
+    with patch("app.services.ai_service.AIClient") as MockClient:
+        mock_instance = MagicMock()
+        mock_instance.model_name = "qwen3"
+        mock_instance.invoke.return_value = "summary v1"
+        MockClient.get_client.return_value = mock_instance
+        assert client.post(f"/api/projects/{project_id}/summary", json={}, headers=auth_headers(client, "admin001")).status_code == 200
+
+    previous = (
+        db.query(AIGeneratedContent)
+        .filter(AIGeneratedContent.project_id == project_id, AIGeneratedContent.is_active == True)  # noqa: E712
+        .one()
+    )
+    notes = db.query(CoachingNote).filter(CoachingNote.project_id == project_id).all()
+    for note in notes:
+        note.updated_at = previous.created_at - timedelta(seconds=1)
+    db.commit()
+    svc = AIService(db)
+    assert svc.has_note_changes(project_id, "summary") is False
+
+    # 초 단위 타임스탬프에서는 생성 직후 같은 초의 수정이 생성 시각과 같게 저장된다.
+    notes[0].updated_at = previous.created_at
+    db.commit()
+    assert svc.has_note_changes(project_id, "summary") is True
+    _previous, delta = svc._plan_incremental(project_id, "summary", notes)
+    assert [n.note_id for n in delta] == [notes[0].note_id]
+
+
+def test_generate_qa_set_incremental_rebuilds_when_source_note_deleted(client, seed_users, project_with_notes, db, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "AI_INCREMENTAL_SUMMARY_ENABLED", True)
+    monkeypatch.setattr(settings, "AI_INCREMENTAL_MAX_UPDATES", 4)
+    project_id = project_with_notes.project_id
+    url = f"/api/projects/{project_id}/qa-set"
+    headers = auth_headers(client, "coach001")
+    extra = _add_note(db, project_with_notes, seed_users["coach"], "삭제될 이슈")
+
+    with patch("app.services.ai_service.AIClient") as MockClient:
+        mock_instance = MagicMock()
+        mock_instance.model_name = "qwen3"
+        mock_instance.invoke.side_effect = ['[{"question":"q1"}]', '[{"question":"q2"}]', '[{"question":"q3"}]']
+        MockClient.get_client.return_value = mock_instance
+
+        assert client.post(url, json={}, headers=headers).json()["generation_mode"] == "full"
+        _add_note(db, project_with_notes, seed_users["coach"], "추가 이슈")
+        resp = client.post(url, json={"force_regenerate": True}, headers=headers)
+        assert resp.json()["generation_mode"] == "incremental"
+        prompt = str(mock_instance.invoke.call_args[0][0])
+        assert '=== 기존 Q&A ===\n[{"question":"q1"}]' in prompt
+        assert "추가 이슈" in prompt and "삭제될 이슈" not in prompt
+
+        # 이전 결과의 원본 노트가 삭제되면 기존 Q&A를 신뢰할 수 없으므로 전체 재생성한다.
+        db.delete(extra)
+        db.commit()
+        resp = client.post(url, json={"force_regenerate": True}, headers=headers)
+        assert resp.json()["generation_mode"] == "full"
+        assert "기존 Q&A" not in str(mock_instance.invoke.call_args[0][0])
+
+    listed = client.get(url + "s", headers=headers).json()
+    assert [(row["content"], row["generation_mode"], row["incremental_count"]) for row in listed] == [
+        ('[{"question":"q3"}]', "full", 0)
+    ]
+
+
 def test_dashboard_forbidden_for_participant(client, seed_users, seed_batch):
     headers = auth_headers(client, "user001")
     resp = client.get(f"/api/dashboard?batch_id={seed_batch.batch_id}", headers=headers)
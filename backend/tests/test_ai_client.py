@@ -1,12 +1,23 @@
 """AI Client 모델 선택/재시도 동작을 검증합니다."""
 
 import sys
+import threading
 import types
 
+import pytest
+
+from app.services import ai_slot_health_service
 from app.services.ai_client import AIClient
 from app.config import settings
 
 
+@pytest.fixture(autouse=True)
+def _reset_slot_health():
+    ai_slot_health_service.reset_state()
+    yield
+    ai_slot_health_service.reset_state()
+
+
 class _FakeMessage:
     def __init__(self, content):
         self.content = content
@@ -95,3 +106,212 @@ def test_ai_client_uses_slot_model_name_for_api_call(monkeypatch):
             del sys.modules["openai"]
         else:
             sys.modules["openai"] = original
+
+
+def test_ai_client_astream_yields_deltas_and_falls_back_before_first_token():
+    import asyncio
+
+    calls = []
+
+    def _chunk(text):
+        delta = types.SimpleNamespace(content=text)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(delta=delta)])
+
+    class _FakeStream:
+        def __init__(self, parts):
+            self._parts = list(parts)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if not self._parts:
+                raise StopAsyncIteration
+            return _chunk(self._parts.pop(0))
+
+    async def _create(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise Exception('Error code: 404 - {"error":{"type":"NotFoundError","code":404}}')
+        assert kwargs["stream"] is True
+        return _FakeStream(["안녕", "", "하세요"])
+
+    class _FakeAsyncSDKClient:
+        def __init__(self, **kwargs):
+            self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=_create))
+
+    fake_module = types.SimpleNamespace(AsyncOpenAI=_FakeAsyncSDKClient)
+    original = sys.modules.get("openai")
+    sys.modules["openai"] = fake_module
+    try:
+        client = AIClient(model_name="openai/gpt-oss-120b", user_id="1")
+
+        async def _collect():
+            return [piece async for piece in client.astream("질문", "시스템")]
+
+        assert asyncio.run(_collect()) == ["안녕", "하세요"]
+        assert len(calls) == 2
+        assert calls[1]["model"] == settings.AI_DEFAULT_MODEL
+    finally:
+        if original is None:
+            del sys.modules["openai"]
+        else:
+            sys.modules["openai"] = original
+
+
+def _install_fake_openai(monkeypatch, create_by_url):
+    # base_url(슬롯)별로 다른 create 동작을 주입한다.
+    class _FakeSDKClient:
+        def __init__(self, **kwargs):
+            create = create_by_url[kwargs["base_url"]]
+            self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=_FakeSDKClient))
+
+
+def test_ai_client_circuit_breaker_skips_failing_slot_until_reset(monkeypatch):
+    monkeypatch.setattr(settings, "AI_CIRCUIT_FAILURE_THRESHOLD", 2, raising=False)
+    monkeypatch.setattr(settings, "AI_CIRCUIT_RESET_SECONDS", 60, raising=False)
+    monkeypatch.setattr(settings, "AI_CALL_TIMEOUT_SECONDS", 7.5, raising=False)
+    calls = []
+
+    def _slow_slot(**kwargs):
+        calls.append(("model4", kwargs))
+        raise Exception("Request timed out.")
+
+    def _healthy_slot(**kwargs):
+        calls.append(("model1", kwargs))
+        return _FakeResponse("ok")
+
+    _install_fake_openai(
+        monkeypatch, {settings.AI_MODEL4_BASE_URL: _slow_slot, settings.AI_MODEL1_BASE_URL: _healthy_slot}
+    )
+    client = AIClient(model_name="openai/gpt-oss-120b", user_id="1")
+
+    # 장애 슬롯은 예외 대신 다음 후보 슬롯으로 넘어가고, 같은 슬롯의 중복 후보는 다시 시도하지 않는다.
+    assert client.invoke("질문") == "ok"
+    assert client.invoke("질문") == "ok"
+    assert [slot for slot, _ in calls] == ["model4", "model1", "model4", "model1"]
+    assert all(kwargs["timeout"] == 7.5 for _, kwargs in calls)
+
+    calls.clear()
+    assert client.invoke("질문", timeout=2) == "ok"
+    assert [slot for slot, _ in calls] == ["model1"]
+    assert calls[0][1]["timeout"] == 2
+    health = {row["slot"]: row for row in ai_slot_health_service.get_snapshot()}
+    assert health["model4"]["state"] == "open"
+    assert health["model4"]["short_circuits"] == 1
+    assert health["model1"]["state"] == "closed"
+
+    # 재시도 대기 시간이 지나면 시험 호출 1건을 보내고, 실패하면 바로 다시 연다.
+    monkeypatch.setattr(settings, "AI_CIRCUIT_RESET_SECONDS", 0, raising=False)
+    calls.clear()
+    assert client.invoke("질문") == "ok"
+    assert [slot for slot, _ in calls] == ["model4", "model1"]
+    assert {row["slot"]: row for row in ai_slot_health_service.get_snapshot()}["model4"]["state"] == "open"
+
+
+def test_ai_client_raises_when_every_slot_circuit_is_open(monkeypatch):
+    monkeypatch.setattr(settings, "AI_CIRCUIT_FAILURE_THRESHOLD", 1, raising=False)
+    calls = []
+
+    def _down(**kwargs):
+        calls.append(kwargs)
+        raise Exception("Connection error.")
+
+    _install_fake_openai(monkeypatch, {settings.AI_MODEL1_BASE_URL: _down})
+    client = AIClient(model_name="model1", user_id="1")
+    with pytest.raises(RuntimeError, match="Connection error"):
+        client.invoke("질문")
+    with pytest.raises(RuntimeError, match="서킷 브레이커"):
+        client.invoke("질문")
+    assert len(calls) == 1
+
+
+class _FakeStream:
+    # 헤지 경쟁 호출은 stream=True로 받는다. gate가 열리거나 스트림이 닫힐 때까지 첫 조각을 보내지 않는다.
+    def __init__(self, content, gate=None):
+        self.content = content
+        self.gate = gate
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        if self.gate is not None:
+            while not self.gate.is_set() and not self.closed.is_set():
+                self.gate.wait(0.01)
+        if self.closed.is_set():
+            raise Exception("stream closed")
+        for piece in (self.content[:2], self.content[2:]):
+            yield types.SimpleNamespace(choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=piece))])
+
+    def close(self):
+        self.closed.set()
+
+
+def test_ai_client_hedges_slow_slot_to_another_healthy_slot(monkeypatch):
+    monkeypatch.setattr(settings, "AI_HEDGE_AFTER_SECONDS", 0.05, raising=False)
+    release = threading.Event()
+    calls = []
+    streams = []
+
+    def _hanging_slot(**kwargs):
+        calls.append(("model4", threading.current_thread().name, kwargs.get("stream")))
+        streams.append(_FakeStream("slow", gate=release))
+        return streams[-1]
+
+    def _fast_slot(**kwargs):
+        calls.append(("model1", threading.current_thread().name, kwargs.get("stream")))
+        return _FakeStream("fast")
+
+    _install_fake_openai(
+        monkeypatch, {settings.AI_MODEL4_BASE_URL: _hanging_slot, settings.AI_MODEL1_BASE_URL: _fast_slot}
+    )
+    try:
+        client = AIClient(model_name="openai/gpt-oss-120b", user_id="1")
+        assert client.invoke("질문") == "fast"
+        # 첫 요청은 호출 스레드에서, 헤지 요청만 헤지 풀에서 실행하고 진 쪽 스트림은 닫는다.
+        assert [(slot, stream) for slot, _, stream in calls] == [("model4", True), ("model1", True)]
+        assert calls[0][1] == threading.current_thread().name
+        assert calls[1][1].startswith("ai-hedge")
+        assert streams[0].closed.is_set()
+        health = {row["slot"]: row for row in ai_slot_health_service.get_snapshot()}
+        assert (health["model1"]["hedges"], health["model1"]["hedge_wins"]) == (1, 1)
+        assert health["model4"]["failures"] == 0
+    finally:
+        release.set()
+
+    # 헤지 지연 안에 응답한 호출은 중복 요청을 보내지 않는다.
+    calls.clear()
+    assert client.invoke("질문") == "slow"
+    assert [slot for slot, _, _ in calls] == ["model4"]
+
+
+def test_ai_client_closes_hedge_stream_when_primary_wins(monkeypatch):
+    monkeypatch.setattr(settings, "AI_HEDGE_AFTER_SECONDS", 0.01, raising=False)
+    primary_gate = threading.Event()
+    hedge_started = threading.Event()
+    hedge_streams = []
+
+    def _primary_slot(**kwargs):
+        return _FakeStream("primary", gate=primary_gate)
+
+    def _hedge_slot(**kwargs):
+        hedge_streams.append(_FakeStream("hedge", gate=threading.Event()))
+        hedge_started.set()
+        primary_gate.set()
+        return hedge_streams[-1]
+
+    _install_fake_openai(
+        monkeypatch, {settings.AI_MODEL4_BASE_URL: _primary_slot, settings.AI_MODEL1_BASE_URL: _hedge_slot}
+    )
+    client = AIClient(model_name="openai/gpt-oss-120b", user_id="1")
+    assert client.invoke("질문") == "primary"
+    assert hedge_started.is_set()
+    for _ in range(100):
+        if hedge_streams[0].closed.is_set():
+            break
+        threading.Event().wait(0.01)
+    assert hedge_streams[0].closed.is_set()
+    health = {row["slot"]: row for row in ai_slot_health_service.get_snapshot()}
+    assert (health["model1"]["hedges"], health["model1"]["hedge_wins"]) == (1, 0)
+    assert health["model1"]["failures"] == 0
@@ -0,0 +1,157 @@
+"""차수 단위 AI 요약/Q&A 일괄 생성 작업(병렬 실행, 진행 조회, 변경 없는 과제 건너뛰기)을 검증하는 테스트입니다."""
+
+import threading
+import time
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from tests.conftest import auth_headers
+from app.models.ai_content import AIGeneratedContent
+from app.models.coaching_note import CoachingNote
+from app.models.project import Project
+
+
+def _seed_projects(db, seed_batch, seed_users):
+    projects = []
+    for idx in range(3):
+        project = Project(batch_id=seed_batch.batch_id, project_name=f"과제{idx}", organization="Org", visibility="public")
+        db.add(project)
+        db.flush()
+        projects.append(project)
+    for project in projects[:2]:
+        db.add(CoachingNote(
+            project_id=project.project_id,
+            author_id=seed_users["coach"].user_id,
+            coaching_date=date(2026, 3, 2),
+            week_number=1,
+            current_status=f"{project.project_name} 상태",
+            progress_rate=40,
+            main_issue=f"{project.project_name} 이슈",
+            next_action="다음 액션",
+        ))
+    db.commit()
+    return projects
+
+
+def _wait_for_job(client, headers, job_id, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        data = client.get(f"/api/ai-summary-jobs/{job_id}", headers=headers).json()
+        if data["status"] == "done" or time.monotonic() > deadline:
+            return data
+        time.sleep(0.02)
+
+
+def test_batch_summary_job_runs_concurrently_and_skips_unchanged(client, db, seed_users, seed_batch, monkeypatch):
+    from app.config import settings
+    from app.services import ai_summary_job_service
+
+    monkeypatch.setattr(settings, "AI_SUMMARY_JOB_CONCURRENCY", 4)
+    ai_summary_job_service.reset_state()
+    projects = _seed_projects(db, seed_batch, seed_users)
+    headers = auth_headers(client, "coach001")
+    url = f"/api/batches/{seed_batch.batch_id}/ai-summary-jobs"
+    # 두 과제의 첫 호출이 동시에 진행 중이어야 barrier를 통과한다(순차 실행이면 timeout으로 실패).
+    barrier = threading.Barrier(2, timeout=5)
+    calls = []
+
+    def _invoke(prompt, system_prompt=None):
+        calls.append(prompt)
+        if len(calls) <= 2:
+            barrier.wait()
+        return f"생성 결과 {len(calls)}"
+
+    with patch("app.services.ai_service.AIClient") as MockClient:
+        mock_instance = MagicMock()
+        mock_instance.model_name = "qwen3"
+        mock_instance.invoke.side_effect = _invoke
+        MockClient.get_client.return_value = mock_instance
+
+        resp = client.post(url, json={"week_number": 1, "content_types": ["summary"]}, headers=headers)
+        assert resp.status_code == 202, resp.text
+        assert resp.json()["total_count"] == 3
+        job = _wait_for_job(client, headers, resp.json()["job_id"])
+        assert (job["status"], job["done_count"], job["skipped_count"], job["failed_count"]) == ("done", 2, 1, 0)
+        assert job["progress_rate"] == 100
+        by_project = {item["project_id"]: item for item in job["items"]}
+        assert by_project[projects[2].project_id]["status"] == "skipped"
+        assert by_project[projects[0].project_id]["project_name"] == "과제0"
+        assert by_project[projects[0].project_id]["generation_mode"] == "full"
+
+        # 노트가 바뀌지 않은 과제는 LLM을 호출하지 않고 건너뛴다.
+        resp = client.post(url, json={"week_number": 1, "content_types": ["summary"]}, headers=headers)
+        job = _wait_for_job(client, headers, resp.json()["job_id"])
+        assert (job["done_count"], job["skipped_count"]) == (0, 3)
+        assert len(calls) == 2
+
+        db.add(CoachingNote(
+            project_id=projects[0].project_id,
+            author_id=seed_users["coach"].user_id,
+            coaching_date=date(2026, 3, 4),
+            week_number=1,
+            main_issue="추가 이슈",
+        ))
+        db.commit()
+        resp = client.post(url, json={"week_number": 1, "content_types": ["summary"]}, headers=headers)
+        job = _wait_for_job(client, headers, resp.json()["job_id"])
+        assert (job["done_count"], job["skipped_count"]) == (1, 2)
+        changed = next(item for item in job["items"] if item["project_id"] == projects[0].project_id)
+        assert changed["generation_mode"] == "incremental"
+        assert "추가 이슈" in calls[-1] and "과제0 이슈" not in calls[-1]
+
+    db.expire_all()
+    active = (
+        db.query(AIGeneratedContent)
+        .filter(AIGeneratedContent.content_type == "summary", AIGeneratedContent.is_active == True)  # noqa: E712
+        .all()
+    )
+    assert {(row.project_id, row.week_number) for row in active} == {(projects[0].project_id, 1), (projects[1].project_id, 1)}
+    ai_summary_job_service.reset_state()
+
+
+def test_batch_summary_job_validation_and_active_job_reuse(client, db, seed_users, seed_batch):
+    from app.services import ai_summary_job_service
+
+    _seed_projects(db, seed_batch, seed_users)
+    url = f"/api/batches/{seed_batch.batch_id}/ai-summary-jobs"
+    assert client.post(url, json={}, headers=auth_headers(client, "user001")).status_code == 403
+
+    headers = auth_headers(client, "admin001")
+    assert client.post("/api/batches/9999/ai-summary-jobs", json={}, headers=headers).status_code == 404
+    assert client.post(url, json={"content_types": ["insight"]}, headers=headers).status_code == 400
+    assert client.get("/api/ai-summary-jobs/9999", headers=headers).status_code == 404
+
+    # 같은 조건의 작업이 진행 중이면 새 작업을 만들지 않고 기존 작업 진행 상황을 반환한다.
+    pending, created = ai_summary_job_service.create_job(
+        db, batch_id=seed_batch.batch_id, requested_by=seed_users["admin"].user_id
+    )
+    assert created and pending.total_count == 6
+    resp = client.post(url, json={"content_types": ["qa_set", "summary"]}, headers=headers)
+    assert resp.status_code == 202
+    assert resp.json()["job_id"] == pending.job_id
+    assert resp.json()["status"] == "pending"
+    assert {item["content_type"] for item in resp.json()["items"]} == {"summary", "qa_set"}
+
+
+def test_jobs_left_active_by_restart_are_closed_as_failed(client, db, seed_users, seed_batch):
+    from app.models.ai_summary_job import AISummaryJobItem
+    from app.services import ai_summary_job_service
+
+    _seed_projects(db, seed_batch, seed_users)
+    job, _created = ai_summary_job_service.create_job(
+        db, batch_id=seed_batch.batch_id, requested_by=seed_users["admin"].user_id
+    )
+    items = db.query(AISummaryJobItem).filter(AISummaryJobItem.job_id == job.job_id).order_by(AISummaryJobItem.item_id).all()
+    items[0].status = "done"
+    items[1].status = "running"
+    job.status = "running"
+    job.done_count = 1
+    db.commit()
+
+    assert ai_summary_job_service.fail_interrupted_jobs(db) == 1
+    data = client.get(f"/api/ai-summary-jobs/{job.job_id}", headers=auth_headers(client, "admin001")).json()
+    assert data["status"] == "done"
+    assert data["finished_at"] is not None
+    assert (data["done_count"], data["failed_count"]) == (1, 5)
+    assert data["progress_rate"] == 100
+    assert ai_summary_job_service.fail_interrupted_jobs(db) == 0
@@ -150,3 +150,52 @@ def test_participant_cannot_comment_on_other_batch_post(client, db, seed_users,
     )
     assert comment_resp.status_code == 403
 
+
+def test_post_lists_apply_batch_privacy_before_pagination(client, db, seed_users, seed_boards):
+    from app.models.board import BoardPost
+    from app.models.project import Project, ProjectMember
+
+    tip_board_id = seed_boards[2].board_id
+    batch1, batch2 = _seed_two_batches(db)
+    _grant_batch_scope(db, seed_users["participant"].user_id, batch1.batch_id)
+    member = _create_participant(db, "user778", "과제 소속 참여자")
+    project = Project(batch_id=batch1.batch_id, project_name="소속 과제", organization="Dev")
+    db.add(project)
+    db.flush()
+    db.add(ProjectMember(project_id=project.project_id, user_id=member.user_id, role="member"))
+    author_id = seed_users["admin"].user_id
+    # 최신 글(id가 큰 글)이 타 차수 비공개라 예전 방식이면 참여자 첫 페이지가 비어 있었다.
+    layout = [(batch1, True), (batch1, True), (batch2, False), (batch2, False)] + [(batch2, True)] * 4
+    for idx, (batch, private) in enumerate(layout):
+        db.add(
+            BoardPost(
+                board_id=tip_board_id,
+                author_id=author_id,
+                title=f"글 {idx}",
+                content="본문",
+                batch_id=batch.batch_id,
+                is_batch_private=private,
+            )
+        )
+    db.commit()
+
+    participant_headers = auth_headers(client, "user001")
+    first = client.get(f"/api/boards/{tip_board_id}/posts?skip=0&limit=3", headers=participant_headers)
+    assert first.status_code == 200, first.text
+    assert first.headers["X-Total-Count"] == "4"
+    assert len(first.json()) == 3
+    second = client.get(f"/api/boards/{tip_board_id}/posts?skip=3&limit=3", headers=participant_headers)
+    assert [row["title"] for row in first.json() + second.json()] == ["글 3", "글 2", "글 1", "글 0"]
+
+    all_posts = client.get("/api/boards/posts?limit=2", headers=participant_headers)
+    assert all_posts.headers["X-Total-Count"] == "4"
+    assert [row["title"] for row in all_posts.json()] == ["글 3", "글 2"]
+
+    # 직접 권한이 없는 참여자는 소속 과제의 차수 비공개 글을 본다.
+    member_view = client.get("/api/boards/posts?limit=50", headers=auth_headers(client, member.emp_id))
+    assert member_view.headers["X-Total-Count"] == "4"
+    observer_view = client.get("/api/boards/posts?limit=1", headers=auth_headers(client, "obs001"))
+    assert observer_view.headers["X-Total-Count"] == "2"
+    assert [row["title"] for row in observer_view.json()] == ["글 3"]
+    admin_view = client.get(f"/api/boards/{tip_board_id}/posts?limit=1", headers=auth_headers(client, "admin001"))
+    assert admin_view.headers["X-Total-Count"] == "8"
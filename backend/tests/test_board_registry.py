@@ -0,0 +1,96 @@
+"""게시판 레지스트리 캐시(정상 상태 board 테이블 무조회, 변경 시 무효화, 관리자 정합화)를 검증하는 테스트입니다."""
+import re
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from tests.conftest import auth_headers, engine
+
+_BOARD_TABLE = re.compile(r"\bboard\b(?!_)", re.IGNORECASE)
+
+
+@contextmanager
+def _count_board_queries():
+    statements = []
+
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if _BOARD_TABLE.search(statement):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_execute)
+
+
+def test_board_and_post_lists_skip_board_table_once_registry_is_warm(client, seed_users, seed_boards):
+    headers = auth_headers(client, "coach001")
+    tip_board_id = seed_boards[2].board_id
+    created = client.post(
+        f"/api/boards/{tip_board_id}/posts",
+        json={"title": "레지스트리", "content": "본문", "is_notice": False},
+        headers=headers,
+    )
+    assert created.status_code == 200, created.text
+    assert created.json()["board_name"] == "팁공유"
+    assert client.get("/api/boards", headers=headers).status_code == 200
+
+    with _count_board_queries() as statements:
+        boards = client.get("/api/boards", headers=headers)
+        posts = client.get(f"/api/boards/{tip_board_id}/posts", headers=headers)
+        all_posts = client.get("/api/boards/posts", params={"category": "tip", "q": "팁"}, headers=headers)
+    assert statements == []
+    assert [row["board_type"] for row in boards.json()] == ["notice", "question", "tip", "chat"]
+    assert [row["board_type"] for row in posts.json()] == ["tip"]
+    # 게시판 이름 검색도 레지스트리의 board_id 목록으로 처리된다.
+    assert [row["title"] for row in all_posts.json()] == ["레지스트리"]
+
+
+def test_board_registry_invalidates_on_board_changes_and_admin_sync(client, db, seed_users, seed_boards):
+    from app.models.board import Board
+
+    headers = auth_headers(client, "admin001")
+    assert [row["board_name"] for row in client.get("/api/boards", headers=headers).json()][2] == "팁공유"
+
+    # ORM으로 게시판이 바뀌면 커밋 후 다음 조회에서 다시 읽는다.
+    legacy = Board(board_name="자유게시판", board_type="free")
+    db.add(legacy)
+    tip = db.query(Board).filter(Board.board_id == seed_boards[2].board_id).first()
+    tip.board_name = "팁"
+    db.commit()
+    assert client.get("/api/boards", headers=headers).json()[2]["board_name"] == "팁"
+
+    # 관리자 정합화는 표준 이름을 복구하고 별칭 게시판(free → chat)을 병합한다.
+    denied = client.post("/api/boards/sync", headers=auth_headers(client, "coach001"))
+    assert denied.status_code == 403
+    synced = client.post("/api/boards/sync", headers=headers)
+    assert synced.status_code == 200, synced.text
+    assert [row["board_name"] for row in synced.json()] == ["공지사항", "질문", "팁공유", "잡담"]
+    assert client.get("/api/boards", headers=headers).json() == synced.json()
+    db.expire_all()
+    assert db.query(Board).count() == 4
+
+
+def test_board_registry_commit_hook_only_for_sessions_that_touched_board(db, seed_users, seed_boards):
+    from app.models.board import Board
+    from app.models.notification import Notification
+    from app.services import board_registry_service
+
+    version = board_registry_service.current_version()
+    db.add(Notification(user_id=seed_users["coach"].user_id, noti_type="notice_posted", title="알림"))
+    db.commit()
+    assert board_registry_service.current_version() == version
+
+    tip = db.query(Board).filter(Board.board_id == seed_boards[2].board_id).first()
+    tip.description = "설명 변경"
+    db.flush()
+    flushed = board_registry_service.current_version()
+    assert flushed > version
+    db.commit()
+    assert board_registry_service.current_version() == flushed + 1
+
+    # 커밋 후 훅은 한 번만 돌고, 이후 board와 무관한 커밋은 무효화하지 않는다.
+    db.add(Notification(user_id=seed_users["coach"].user_id, noti_type="notice_posted", title="알림 2"))
+    db.commit()
+    assert board_registry_service.current_version() == flushed + 1
@@ -0,0 +1,81 @@
+"""게시글 조회수 write-behind 버퍼(요청 경로 무쓰기, 일괄 반영, 중복 무시)를 검증하는 테스트입니다."""
+
+from app.models.board import BoardPost, BoardPostView
+from tests.conftest import auth_headers
+
+
+def _create_post(client, headers, board_id: int, title: str) -> int:
+    res = client.post(
+        f"/api/boards/{board_id}/posts",
+        json={"title": title, "content": "본문", "is_notice": False},
+        headers=headers,
+    )
+    assert res.status_code == 200, res.text
+    return res.json()["post_id"]
+
+
+def test_post_views_are_buffered_and_flushed_in_bulk(client, db, seed_users, seed_boards):
+    from app.services import view_counter_service
+
+    coach_headers = auth_headers(client, "coach001")
+    admin_headers = auth_headers(client, "admin001")
+    post_id = _create_post(client, coach_headers, seed_boards[2].board_id, "버퍼 조회")
+
+    assert client.get(f"/api/boards/posts/{post_id}", headers=coach_headers).json()["view_count"] == 1
+    assert client.get(f"/api/boards/posts/{post_id}", headers=admin_headers).json()["view_count"] == 2
+    # 요청 경로에서는 DB에 쓰지 않는다.
+    assert db.query(BoardPostView).count() == 0
+    assert db.query(BoardPost.view_count).filter(BoardPost.post_id == post_id).scalar() == 0
+
+    assert view_counter_service.flush(db) == 2
+    db.expire_all()
+    assert db.query(BoardPostView).count() == 2
+    assert db.query(BoardPost.view_count).filter(BoardPost.post_id == post_id).scalar() == 2
+    assert view_counter_service.pending_views(post_id) == 0
+
+    # 반영된 조회는 다시 열어도 버퍼에 쌓이지 않는다.
+    assert client.get(f"/api/boards/posts/{post_id}", headers=coach_headers).json()["view_count"] == 2
+    assert view_counter_service.flush(db) == 0
+
+    # 재기동(메모리 초기화) 뒤에도 이미 저장된 조회는 board_post_view로 확인해 다시 세지 않는다.
+    view_counter_service.reset_state()
+    assert client.get(f"/api/boards/posts/{post_id}", headers=admin_headers).json()["view_count"] == 2
+    assert client.get(f"/api/boards/posts/{post_id}", headers=coach_headers).json()["view_count"] == 2
+    assert view_counter_service.pending_views(post_id) == 0
+    assert view_counter_service.flush(db) == 0
+
+
+def test_flush_ignores_views_already_stored_and_deleted_posts(client, db, seed_users, seed_boards):
+    from app.services import view_counter_service
+
+    headers = auth_headers(client, "coach001")
+    kept_id = _create_post(client, headers, seed_boards[2].board_id, "남는 글")
+    deleted_id = _create_post(client, headers, seed_boards[2].board_id, "지울 글")
+    for user in ("admin", "coach", "participant"):
+        assert view_counter_service.record_view(db, kept_id, seed_users[user].user_id)
+    assert view_counter_service.record_view(db, deleted_id, seed_users["admin"].user_id)
+    # 버퍼에 담긴 뒤 다른 워커 프로세스가 먼저 반영한 조회
+    db.add(BoardPostView(post_id=kept_id, user_id=seed_users["admin"].user_id))
+    db.query(BoardPost).filter(BoardPost.post_id == kept_id).update({"view_count": 1})
+    db.commit()
+    assert client.delete(f"/api/boards/posts/{deleted_id}", headers=headers).status_code == 200
+
+    assert view_counter_service.flush(db) == 2
+    db.expire_all()
+    assert db.query(BoardPost.view_count).filter(BoardPost.post_id == kept_id).scalar() == 3
+    assert db.query(BoardPostView).filter(BoardPostView.post_id == kept_id).count() == 3
+    assert db.query(BoardPostView).filter(BoardPostView.post_id == deleted_id).count() == 0
+
+
+def test_full_buffer_flushes_inline_without_background_flusher(client, db, seed_users, seed_boards, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "BOARD_VIEW_BUFFER_MAX_PENDING", 2)
+    post_id = _create_post(client, auth_headers(client, "coach001"), seed_boards[2].board_id, "상한")
+    client.get(f"/api/boards/posts/{post_id}", headers=auth_headers(client, "coach001"))
+    assert db.query(BoardPostView).count() == 0
+    view = client.get(f"/api/boards/posts/{post_id}", headers=auth_headers(client, "admin001"))
+    assert view.json()["view_count"] == 2
+    db.expire_all()
+    assert db.query(BoardPostView).count() == 2
+    assert db.query(BoardPost.view_count).filter(BoardPost.post_id == post_id).scalar() == 2
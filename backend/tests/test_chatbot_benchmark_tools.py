@@ -0,0 +1,82 @@
+"""[chatbot] 부하 벤치마크용 가짜 RAG/LLM 서버와 지연 집계 도구를 검증하는 테스트입니다."""
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from scripts import benchmark_chatbot, chatbot_fake_servers
+
+
+def test_fake_rag_server_returns_inserted_docs_within_permission_groups():
+    # [chatbot] 가짜 RAG 서버는 입력 문서를 권한 그룹으로 필터링하고 부족한 결과는 합성 문서로 채워야 한다.
+    app = chatbot_fake_servers.create_fake_rag_app(chatbot_fake_servers.FakeServerOptions(content_chars=50))
+    client = TestClient(app)
+
+    inserted = client.post(
+        "/insert-doc",
+        json={"data": {"doc_id": "board_post:1", "title": "공지", "content": "본문" * 100, "permission_groups": ["g1"]}},
+    )
+    assert inserted.status_code == 200, inserted.text
+    client.post("/insert-doc", json={"data": {"doc_id": "board_post:2", "content": "비공개", "permission_groups": ["g2"]}})
+
+    resp = client.post("/retrieve-rrf", json={"query_text": "공지", "num_result_doc": 3, "permission_groups": ["g1"]})
+    hits = resp.json()["hits"]["hits"]
+    assert len(hits) == 3
+    assert hits[0]["_source"]["doc_id"] == "board_post:1"
+    assert len(hits[0]["_source"]["content"]) == 50
+    assert all(hit["_source"]["doc_id"] != "board_post:2" for hit in hits)
+    assert client.get("/stats").json() == {"requests": 3, "errors": 0, "docs": 2}
+
+
+def test_fake_servers_inject_configured_error_rate():
+    # [chatbot] error_rate=1이면 모든 요청이 500으로 실패하고 오류 건수가 집계되어야 한다.
+    options = chatbot_fake_servers.FakeServerOptions(error_rate=1.0, seed=7)
+    rag = TestClient(chatbot_fake_servers.create_fake_rag_app(options))
+    llm = TestClient(chatbot_fake_servers.create_fake_llm_app(options))
+
+    assert rag.post("/retrieve-rrf", json={"query_text": "q"}).status_code == 500
+    assert llm.post("/v1/chat/completions", json={"messages": []}).status_code == 500
+    assert rag.get("/stats").json()["errors"] == 1
+    assert llm.get("/stats").json()["errors"] == 1
+
+
+def test_fake_llm_server_works_with_ai_client_and_streaming(monkeypatch):
+    # [chatbot] 가짜 LLM 서버는 OpenAI SDK 기반 AIClient의 일반/스트리밍 호출에 모두 응답해야 한다.
+    from app.config import settings
+    from app.services.ai_client import AIClient
+
+    server = chatbot_fake_servers.BackgroundServer(
+        chatbot_fake_servers.create_fake_llm_app(chatbot_fake_servers.FakeServerOptions(answer_chars=60, stream_chunks=4))
+    ).start()
+    try:
+        monkeypatch.setattr(settings, "AI_MODEL1_BASE_URL", f"{server.base_url}/v1", raising=False)
+        monkeypatch.setattr(settings, "AI_CREDENTIAL_KEY", "bench-credential", raising=False)
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "bench-openai-key", raising=False)
+        client = AIClient(model_name="model1", user_id="1")
+
+        answer = client.invoke("답변 해주세요", system_prompt="당신은 코칭 어시스턴트입니다.")
+        assert len(answer) == 60
+
+        async def _collect():
+            return [piece async for piece in client.astream("답변 해주세요", system_prompt="당신은 코칭 어시스턴트입니다.")]
+
+        pieces = asyncio.run(_collect())
+        assert len(pieces) > 1
+        assert "".join(pieces) == answer
+        assert '"route": "rag"' in client.invoke("질문", system_prompt="당신은 질문 라우터입니다.")
+    finally:
+        server.stop()
+
+
+def test_benchmark_summary_reports_percentiles_and_throughput():
+    # [chatbot] 벤치마크 집계는 nearest-rank p50/p95/p99와 오류율/처리량을 보고해야 한다.
+    latencies = [float(value) for value in range(1, 101)]
+    assert benchmark_chatbot.percentile(latencies, 50) == 50.0
+    assert benchmark_chatbot.percentile(latencies, 95) == 95.0
+    assert benchmark_chatbot.percentile(latencies, 99) == 99.0
+    assert benchmark_chatbot.percentile([], 99) == 0.0
+
+    row = benchmark_chatbot.run_concurrently("unit", 20, 4, lambda index: index % 10 != 0)
+    assert row["requests"] == 20
+    assert row["errors"] == 2
+    assert row["error_rate"] == 0.1
+    assert row["throughput_rps"] > 0
@@ -0,0 +1,103 @@
+"""[chatbot] RAG 답변 검색 문맥 조립(필드 압축, 청크 병합, 토큰 예산) 동작을 검증하는 테스트입니다."""
+
+
+def _hit(doc_id, score, content, **extra):
+    return {"_id": doc_id, "_score": score, "_source": {"doc_id": doc_id, "title": doc_id, "content": content, **extra}}
+
+
+def test_context_drops_heavy_fields_and_merges_overlapping_chunks():
+    # [chatbot] 엔티티/이미지 설명 같은 대용량 필드는 빼고, 같은 문서의 겹치는 청크는 하나로 합쳐야 한다.
+    from app.services import rag_context_service
+
+    overlap = "공통으로 겹치는 청크 경계 문장입니다."
+    hits = [
+        _hit(
+            "board_post:1",
+            9.0,
+            "앞부분 본문. " + overlap,
+            entity_nodes=[{"name": "N2SQL", "type": "technology"}] * 50,
+            entity_relations=[{"source": "A", "relation": "uses", "target": "B"}] * 50,
+            image_descriptions=[{"url": "/a.png", "description": "설명" * 200}],
+            permission_groups=["rag-public"],
+            entity_names=["N2SQL"],
+            batch_name="2026년 1차",
+        ),
+        _hit("board_post:1", 7.0, overlap + " 뒷부분 본문."),
+        _hit("coaching_note:2", 5.0, "앞부분 본문. " + overlap),
+        _hit("board_post:3", 3.0, "다른 문서"),
+    ]
+    build = rag_context_service.build_context(hits, limit=5, budget=5000, tokenizer_spec="approx")
+
+    assert "entity_nodes" not in build.text
+    assert "image_descriptions" not in build.text
+    assert "permission_groups" not in build.text
+    assert '"entity_names": ["N2SQL"]' in build.text
+    assert '"batch_name": "2026년 1차"' in build.text
+    assert f"앞부분 본문. {overlap} 뒷부분 본문." in build.text
+    assert build.merged_chunks == 1
+    assert build.dropped_duplicates == 1
+    assert build.used_hits == 2
+    assert build.text.index("board_post:1") < build.text.index("board_post:3")
+    assert build.tokens == rag_context_service.approx_token_count(build.text)
+
+
+def test_context_packs_highest_scores_within_token_budget():
+    # [chatbot] 점수가 높은 문서부터 예산까지 채우고, 넘치는 문서는 본문을 잘라 넣은 뒤 조립을 멈춰야 한다.
+    from app.services import rag_context_service
+
+    hits = [
+        _hit("low", 1.0, "낮은 점수 " * 50),
+        _hit("high", 9.0, "높은 점수 " * 50),
+        _hit("mid", 5.0, "중간 점수 " * 200),
+    ]
+    build = rag_context_service.build_context(hits, limit=5, budget=500, tokenizer_spec="approx")
+
+    assert build.tokens <= 500
+    assert build.truncated is True
+    assert build.used_hits == 2
+    assert build.text.index('"high"') < build.text.index('"mid"')
+    assert '"low"' not in build.text
+    assert "…" in build.text
+
+
+def test_context_tokenizer_is_pluggable_and_budget_follows_model_slot(db, monkeypatch):
+    # [chatbot] 등록한 토크나이저와 답변 모델 슬롯별 예산으로 문맥을 만들고 요청별 프롬프트 크기를 기록해야 한다.
+    from app.config import settings
+    from app.services import rag_context_service
+    from app.services.chatbot_service import ChatbotService
+
+    rag_context_service.register_tokenizer("chars", len)
+    monkeypatch.setattr(settings, "RAG_CONTEXT_TOKENIZER", "chars", raising=False)
+    monkeypatch.setattr(settings, "RAG_CONTEXT_TOKEN_BUDGET", 100000, raising=False)
+    monkeypatch.setattr(settings, "AI_DEFAULT_MODEL", "model2", raising=False)
+    monkeypatch.setattr(settings, "AI_MODEL2_CONTEXT_TOKENS", 300, raising=False)
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    rag_context_service.reset_stats()
+    assert rag_context_service.get_tokenizer("missing.module:count")[1] is rag_context_service.approx_token_count
+
+    payload = {"hits": {"hits": [_hit("board_post:1", 2.0, "가" * 1000)]}}
+    monkeypatch.setattr(ChatbotService, "_retrieve_rag_documents", lambda self, **kwargs: payload)
+    captured = {}
+
+    def _fake_invoke(self, *, purpose, user_id, prompt, system_prompt=None, stage="general"):  # noqa: ANN001
+        captured["prompt"] = prompt
+        return "답변"
+
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", _fake_invoke)
+    svc = ChatbotService(db)
+    from app.models.user import User
+
+    user = User(user_id=1, emp_id="u1", name="U", role="admin")
+    svc._answer_with_rag(current_user=user, question="질문", num_result_doc=5)
+
+    assert svc._last_rag_context.budget == 300
+    assert svc._last_rag_context.tokenizer == "chars"
+    assert len(svc._last_rag_context.text) <= 300
+    stats = rag_context_service.get_stats()
+    assert stats["requests"] == 1
+    assert stats["truncated"] == 1
+    assert stats["prompt_tokens_max"] >= len(captured["prompt"])
+    # 관리자 지표 JSON(/api/chatbot/metrics/stats)의 context 항목으로 노출된다.
+    from app.services import chatbot_metrics_service
+
+    assert chatbot_metrics_service.get_snapshot()["context"]["requests"] == 1
@@ -115,7 +115,7 @@ def test_chatbot_upsert_rag_document_includes_metadata_and_ai_summary(db, monkey
         captured["timeout"] = timeout
         return _FakeResponse()
 
-    monkeypatch.setattr("httpx.post", _fake_post)
+    monkeypatch.setattr("httpx.Client.post", lambda self, url, **kwargs: _fake_post(url, **kwargs))
 
     svc = ChatbotService(db)
     svc.upsert_rag_document(
@@ -166,7 +166,7 @@ def test_chatbot_upsert_rag_document_works_when_chatbot_disabled(db, monkeypatch
         called["count"] += 1
         return _FakeResponse()
 
-    monkeypatch.setattr("httpx.post", _fake_post)
+    monkeypatch.setattr("httpx.Client.post", lambda self, url, **kwargs: _fake_post(url, **kwargs))
 
     svc = ChatbotService(db)
     svc.upsert_rag_document(
@@ -213,7 +213,7 @@ def test_chatbot_upsert_rag_document_includes_graph_entities_metadata(db, monkey
             ],
         )
 
-    monkeypatch.setattr("httpx.post", _fake_post)
+    monkeypatch.setattr("httpx.Client.post", lambda self, url, **kwargs: _fake_post(url, **kwargs))
     monkeypatch.setattr(
         ChatbotService,
         "generate_ai_summary_and_entities",
@@ -732,7 +732,7 @@ def test_chatbot_extract_references_keeps_additional_field_compat(db):
 
 
 def test_chatbot_answer_with_rag_passes_full_hit_json_context_to_llm(db, seed_users, monkeypatch):
-    # [chatbot] RAG 답변 문맥은 content 일부가 아닌 hit 원본 전체(JSON)를 LLM에 전달해야 한다.
+    # [chatbot] RAG 답변 문맥은 예산 안에서 content 일부가 아닌 전체와 점수/메타데이터를 hit JSON으로 LLM에 전달해야 한다.
     from app.config import settings
     from app.services.chatbot_service import ChatbotService
 
@@ -958,3 +958,242 @@ def test_chatbot_debug_mode_logs_rag_result_and_llm_history(db, seed_users, monk
     assert any("board_post:1" in row for row in logs)
     assert any("[chatbot][debug][llm-live] stage=rag_answer" in row for row in logs)
     assert any("llm_history_count=1" in row for row in logs)
+
+
+def test_chatbot_image_captions_run_in_parallel_and_keep_order(db, monkeypatch):
+    # [chatbot] 이미지 설명은 제한된 동시성으로 병렬 생성하되 입력 순서를 유지해야 한다.
+    import threading
+    import time
+
+    from app.config import settings
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "AI_IMAGE_MODEL_MAX_IMAGES", 3, raising=False)
+    monkeypatch.setattr(settings, "AI_IMAGE_CAPTION_CONCURRENCY", 3, raising=False)
+    monkeypatch.setattr(settings, "RAG_IMAGE_CAPTION_CACHE_ENABLED", False, raising=False)
+    monkeypatch.setattr(ChatbotService, "_is_image_llm_ready", lambda self: True)
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _slow_generate(self, normalized_url, *, prompt_text, user_id, **kwargs):  # noqa: ANN001
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.3 if normalized_url.endswith("1.png") else 0.1)
+        with lock:
+            active["now"] -= 1
+        return f"설명:{normalized_url.rsplit('/', 1)[-1]}"
+
+    monkeypatch.setattr(ChatbotService, "_generate_image_caption_ko", _slow_generate)
+    monkeypatch.setattr(ChatbotService, "_image_caption_client", lambda self, user_id: (object(), {}))
+
+    svc = ChatbotService(db)
+    started = time.monotonic()
+    entries = svc._build_image_caption_entries(
+        ["/uploads/a/1.png", "/uploads/a/2.png", "/uploads/a/3.png", "/uploads/a/4.png"],
+        user_id="1",
+    )
+    elapsed = time.monotonic() - started
+
+    assert [row["caption"] for row in entries] == ["설명:1.png", "설명:2.png", "설명:3.png"]
+    assert active["peak"] == 3
+    assert elapsed < 0.5
+
+
+def test_chatbot_image_caption_timeout_falls_back_to_default_caption(db, monkeypatch):
+    # [chatbot] 제한 시간 안에 끝나지 않은 이미지 설명은 기본 문구로 대체하고 나머지 결과는 유지해야 한다.
+    import time
+
+    from app.config import settings
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "AI_IMAGE_CAPTION_CONCURRENCY", 2, raising=False)
+    monkeypatch.setattr(settings, "RAG_IMAGE_CAPTION_CACHE_ENABLED", False, raising=False)
+    monkeypatch.setattr(ChatbotService, "_is_image_llm_ready", lambda self: True)
+    monkeypatch.setattr(ChatbotService, "_image_caption_timeout_seconds", lambda self: 0.2)
+
+    def _generate(self, normalized_url, *, prompt_text, user_id, **kwargs):  # noqa: ANN001
+        if normalized_url.endswith("slow.png"):
+            time.sleep(2.0)
+        return "빠른 설명"
+
+    monkeypatch.setattr(ChatbotService, "_generate_image_caption_ko", _generate)
+    monkeypatch.setattr(ChatbotService, "_image_caption_client", lambda self, user_id: (object(), {}))
+
+    svc = ChatbotService(db)
+    started = time.monotonic()
+    entries = svc._build_image_caption_entries(["/uploads/a/slow.png", "/uploads/a/fast.png"], user_id="1")
+
+    assert time.monotonic() - started < 1.5
+    assert entries[0]["caption"] == "이미지가 포함된 문서입니다."
+    assert entries[1]["caption"] == "빠른 설명"
+
+
+def test_chatbot_image_caption_schema_retry_shares_one_deadline_and_client(db, monkeypatch):
+    # [chatbot] 대체 스키마 재시도는 남은 시간만 쓰고, 병렬 생성은 클라이언트 하나를 공유하며 SDK 재시도를 끈다.
+    import time
+    from types import SimpleNamespace
+
+    from app.config import settings
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "AI_IMAGE_CAPTION_CONCURRENCY", 2, raising=False)
+    monkeypatch.setattr(ChatbotService, "_image_caption_timeout_seconds", lambda self: 0.5)
+    timeouts = []
+
+    def _create(**kwargs):  # noqa: ANN003
+        timeouts.append(kwargs["timeout"])
+        time.sleep(0.3)
+        return SimpleNamespace(choices=[])
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=_create)))
+    openai_kwargs = []
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: openai_kwargs.append(kwargs) or fake_client)
+    assert ChatbotService(db)._image_caption_client("1")[0] is fake_client
+    assert openai_kwargs[0]["max_retries"] == 0
+    built = []
+
+    def _client(self, user_id):  # noqa: ANN001
+        built.append(user_id)
+        return fake_client, {}
+
+    monkeypatch.setattr(ChatbotService, "_image_caption_client", _client)
+    svc = ChatbotService(db)
+    results = svc._generate_image_captions_parallel(
+        ["https://cdn.example.com/a.png", "https://cdn.example.com/b.png"], prompt_text="설명", user_id="1"
+    )
+
+    assert results == {"https://cdn.example.com/a.png": "", "https://cdn.example.com/b.png": ""}
+    assert built == ["1"]
+    # 이미지당 기본 스키마 1회 + 남은 시간(0.5 - 0.3)으로 대체 스키마 1회
+    assert len(timeouts) == 4
+    assert all(value <= 0.5 for value in timeouts)
+    assert all(value <= 0.25 for value in sorted(timeouts)[:2])
+
+
+def _parse_sse_events(body: str) -> list[tuple[str, dict]]:
+    import json
+
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        events.append((lines.get("event"), json.loads(lines.get("data") or "{}")))
+    return events
+
+
+def test_chatbot_ask_stream_endpoint_streams_references_tokens_and_done(client, seed_users, monkeypatch):
+    # [chatbot] 스트리밍 질문 API는 references → token* → done 순서의 SSE 이벤트를 보내야 한다.
+    from app.config import settings
+    from app.services.ai_client import AIClient
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "CHATBOT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    captured = {}
+
+    async def _fake_aretrieve(self, *, query_text, num_result_doc, permission_groups):  # noqa: ANN001
+        captured["permission_groups"] = permission_groups
+        return {
+            "hits": {
+                "hits": [
+                    {
+                        "_score": 3.2,
+                        "_source": {"doc_id": "board_post:1", "title": "공지", "content": "본문", "source_type": "board_post"},
+                    }
+                ]
+            }
+        }
+
+    async def _fake_astream(self, prompt, system_prompt=None):  # noqa: ANN001
+        captured["prompt"] = prompt
+        for piece in ["첫 ", "번째 ", "답변"]:
+            yield piece
+
+    monkeypatch.setattr(ChatbotService, "_aretrieve_rag_documents", _fake_aretrieve)
+    monkeypatch.setattr(AIClient, "astream", _fake_astream)
+
+    headers = auth_headers(client, "user001")
+    resp = client.post("/api/chatbot/ask/stream", json={"question": "공지 요약", "num_result_doc": 3}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse_events(resp.text)
+    assert [name for name, _ in events] == ["references", "token", "token", "token", "done"]
+    assert events[0][1]["references"][0]["doc_id"] == "board_post:1"
+    assert "".join(data["text"] for name, data in events if name == "token") == "첫 번째 답변"
+    assert events[-1][1]["answer"] == "첫 번째 답변"
+    assert "rag-public" in captured["permission_groups"]
+    assert "공지 요약" in captured["prompt"]
+
+
+def test_chatbot_ask_stream_uses_own_session_and_closes_it_after_stream(client, seed_users, monkeypatch):
+    # [chatbot] 스트리밍 본문은 요청 의존성 세션이 닫힌 뒤 실행되므로 전용 세션을 쓰고 끝나면 닫아야 한다.
+    from sqlalchemy import text
+
+    from app.config import settings
+    from app.services.chatbot_service import ChatbotService
+    from tests.conftest import engine
+
+    monkeypatch.setattr(settings, "CHATBOT_ENABLED", True, raising=False)
+    sessions = []
+
+    async def _fake_stream(self, **kwargs):  # noqa: ANN001
+        sessions.append(self.db)
+        self.db.execute(text("SELECT 1"))
+        assert self.db.in_transaction()
+        yield "done", {"answer": "답변", "references": []}
+
+    monkeypatch.setattr(ChatbotService, "stream_answer_with_rag", _fake_stream)
+    checked_out = engine.pool.checkedout()
+    headers = auth_headers(client, "user001")
+    resp = client.post("/api/chatbot/ask/stream", json={"question": "세션 확인"}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert [name for name, _ in _parse_sse_events(resp.text)] == ["done"]
+    assert len(sessions) == 1
+    assert not sessions[0].in_transaction()
+    assert engine.pool.checkedout() == checked_out
+
+
+def test_chatbot_ask_stream_endpoint_blocks_when_feature_off_and_reports_errors(client, seed_users, monkeypatch):
+    # [chatbot] 기능이 꺼지면 503, 스트리밍 중 실패는 error 이벤트로 전달해야 한다.
+    from app.config import settings
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "CHATBOT_ENABLED", False, raising=False)
+    headers = auth_headers(client, "user001")
+    blocked = client.post("/api/chatbot/ask/stream", json={"question": "질문"}, headers=headers)
+    assert blocked.status_code == 503, blocked.text
+
+    monkeypatch.setattr(settings, "CHATBOT_ENABLED", True, raising=False)
+
+    async def _broken_aretrieve(self, **kwargs):  # noqa: ANN001
+        raise RuntimeError("rag down")
+
+    monkeypatch.setattr(ChatbotService, "_aretrieve_rag_documents", _broken_aretrieve)
+    resp = client.post("/api/chatbot/ask/stream", json={"question": "질문"}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    events = _parse_sse_events(resp.text)
+    assert events[-1][0] == "error"
+    assert events[-1][1]["status_code"] == 500
+
+
+def test_chatbot_ask_stream_admin_sql_route_sends_full_answer(client, seed_users, monkeypatch):
+    # [chatbot] 관리자 SQL 경로는 완성된 SQL 답변을 token 1건으로 보내야 한다.
+    from app.config import settings
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "CHATBOT_ENABLED", True, raising=False)
+    monkeypatch.setattr(ChatbotService, "_decide_route_with_llm", lambda self, *, question, user_id: "sql")
+    monkeypatch.setattr(
+        ChatbotService,
+        "_answer_with_sql",
+        lambda self, *, current_user, question: {"answer": "SQL 답변", "references": []},
+    )
+
+    headers = auth_headers(client, "admin001")
+    resp = client.post("/api/chatbot/ask/stream", json={"question": "과제 수"}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    events = _parse_sse_events(resp.text)
+    assert [name for name, _ in events] == ["references", "token", "done"]
+    assert events[1][1]["text"] == "SQL 답변"
@@ -0,0 +1,188 @@
+"""[chatbot] 원격 RAG 장애 대비 로컬 하이브리드 검색 인덱스(BM25 + n-gram + RRF) 동작을 검증하는 테스트입니다."""
+import httpx
+import pytest
+
+
+def _enable_rag(monkeypatch, settings):
+    monkeypatch.setattr(settings, "RAG_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_INPUT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_BASE_URL", "http://rag.local", raising=False)
+    monkeypatch.setattr(settings, "RAG_API_KEY", "rag-api-key", raising=False)
+    monkeypatch.setattr(settings, "AI_CREDENTIAL_KEY", "credential-key", raising=False)
+    monkeypatch.setattr(settings, "RAG_LOCAL_INDEX_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_LOCAL_INDEX_MODE", "fallback", raising=False)
+
+
+class _InsertOk:
+    def raise_for_status(self):
+        return None
+
+
+def _seed_documents(svc):
+    docs = [
+        ("board_post:1", "데이터 파이프라인 구축 후기", "Airflow로 배치 파이프라인을 만들었습니다.", ["rag-public"]),
+        ("coaching_note:2", "N2SQL 코칭 노트", "자연어 질의를 SQL로 변환하는 N2SQL 적용 코칭", ["rag-public", "batch-1"]),
+        ("coaching_note:3", "비공개 과제 코칭", "다른 차수의 N2SQL 파이프라인 검토", ["batch-2"]),
+    ]
+    for doc_id, title, content, groups in docs:
+        svc.upsert_rag_document(
+            doc_id=doc_id,
+            title=title,
+            content=content,
+            metadata={"source_type": doc_id.split(":")[0]},
+            user_id="1",
+            ai_summary=title,
+            permission_groups=groups,
+        )
+
+
+def test_local_index_ranks_with_bm25_ngram_fusion_and_permission_groups():
+    # [chatbot] 단어/문자 n-gram 순위를 RRF로 결합하고 권한 그룹이 겹치지 않는 문서는 제외해야 한다.
+    from app.services.rag_local_index_service import LocalHybridIndex, tokenize_ngrams
+
+    assert tokenize_ngrams("코칭노트 AI", 2) == ["코칭", "칭노", "노트", "ai"]
+
+    index = LocalHybridIndex(ngram_size=2)
+    index.upsert({"doc_id": "a", "title": "코칭노트 작성 가이드", "content": "주간 코칭 기록", "permission_groups": ["g1"]})
+    index.upsert({"doc_id": "b", "title": "파이프라인 회고", "content": "코칭노트는 아님", "permission_groups": ["g1"]})
+    index.upsert({"doc_id": "c", "title": "코칭노트 비공개", "content": "코칭노트", "permission_groups": ["g2"]})
+
+    ranked = index.search("코칭노트 작성법", permission_groups=["g1"], limit=5)
+    assert [doc_id for doc_id, _ in ranked] == ["a", "b"]
+    assert ranked[0][1] > ranked[1][1]
+    # 락 밖 순위 계산용 사본은 전체 인덱스와 같은 결과를 내고, 원본이 바뀌어도 영향받지 않는다.
+    view = index.snapshot("코칭노트 작성법")
+    assert view.search("코칭노트 작성법", permission_groups=["g1"], limit=5) == ranked
+    assert "회고" not in view.words.postings
+
+    # 같은 doc_id 재입력은 이전 토큰을 지우고 교체한다.
+    index.upsert({"doc_id": "a", "title": "회의록", "content": "회의", "permission_groups": ["g1"]})
+    assert [doc_id for doc_id, _ in index.search("코칭노트", permission_groups=["g1"], limit=5)] == ["b"]
+    assert "작성" not in index.words.postings
+    assert view.search("코칭노트 작성법", permission_groups=["g1"], limit=5) == ranked
+
+
+def test_remote_retrieve_failure_falls_back_to_local_index(db, monkeypatch):
+    # [chatbot] 원격 retrieve-rrf가 실패하면 sync 때 저장한 문서로 같은 응답 형태를 만들어 반환해야 한다.
+    from app.config import settings
+    from app.services import rag_local_index_service
+    from app.services.chatbot_service import ChatbotService
+
+    _enable_rag(monkeypatch, settings)
+    rag_local_index_service.reset_state()
+
+    def _post(self, url, **kwargs):  # noqa: ANN001
+        if url.endswith("/retrieve-rrf"):
+            raise httpx.ConnectTimeout("rag down")
+        return _InsertOk()
+
+    monkeypatch.setattr(httpx.Client, "post", _post)
+    svc = ChatbotService(db)
+    _seed_documents(svc)
+
+    data = svc._retrieve_rag_documents(query_text="N2SQL 코칭", num_result_doc=5, permission_groups=["rag-public", "batch-1"])
+    assert data["retriever"] == "local"
+    refs = svc._extract_references(data)
+    assert refs[0]["doc_id"] == "coaching_note:2"
+    assert refs[0]["source_type"] == "coaching_note"
+    assert "coaching_note:3" not in [row["doc_id"] for row in refs]
+
+    # 다른 프로세스에서 새로 시작한 인덱스도 DB에 저장된 문서로 복원된다.
+    rag_local_index_service.reset_state()
+    restored = svc._retrieve_rag_documents(query_text="파이프라인", num_result_doc=5, permission_groups=["rag-public"])
+    assert [hit["_source"]["doc_id"] for hit in restored["hits"]["hits"]] == ["board_post:1"]
+    assert rag_local_index_service.get_stats()["documents"] == 3
+
+
+def test_local_index_primary_mode_skips_remote_and_async_path(db, monkeypatch):
+    # [chatbot] primary 모드는 원격 검색을 호출하지 않고, 스트리밍(비동기) 경로도 같은 로컬 결과를 사용해야 한다.
+    import asyncio
+
+    from app.config import settings
+    from app.services import rag_local_index_service
+    from app.services.chatbot_service import ChatbotService
+
+    _enable_rag(monkeypatch, settings)
+    rag_local_index_service.reset_state()
+    remote_calls = []
+
+    def _post(self, url, **kwargs):  # noqa: ANN001
+        remote_calls.append(url)
+        return _InsertOk()
+
+    async def _apost(self, url, **kwargs):  # noqa: ANN001
+        remote_calls.append(url)
+        raise httpx.ReadTimeout("slow rag")
+
+    monkeypatch.setattr(httpx.Client, "post", _post)
+    monkeypatch.setattr(httpx.AsyncClient, "post", _apost)
+    svc = ChatbotService(db)
+    _seed_documents(svc)
+    remote_calls.clear()
+
+    async_data = asyncio.run(
+        svc._aretrieve_rag_documents(query_text="데이터 파이프라인", num_result_doc=3, permission_groups=["rag-public"])
+    )
+    assert async_data["hits"]["hits"][0]["_source"]["doc_id"] == "board_post:1"
+    assert len(remote_calls) == 1
+
+    monkeypatch.setattr(settings, "RAG_LOCAL_INDEX_MODE", "primary", raising=False)
+    data = svc._retrieve_rag_documents(query_text="데이터 파이프라인", num_result_doc=3, permission_groups=["rag-public"])
+    assert data["hits"]["hits"][0]["_source"]["doc_id"] == "board_post:1"
+    assert len(remote_calls) == 1
+
+
+def test_local_fallback_disabled_or_empty_raises_remote_error(db, monkeypatch):
+    # [chatbot] 로컬 인덱스가 비어 있거나 꺼져 있으면 원격 오류를 그대로 전달해야 한다.
+    from app.config import settings
+    from app.services import rag_local_index_service
+    from app.services.chatbot_service import ChatbotService
+
+    _enable_rag(monkeypatch, settings)
+    rag_local_index_service.reset_state()
+
+    def _post(self, url, **kwargs):  # noqa: ANN001
+        raise httpx.ConnectError("rag down")
+
+    monkeypatch.setattr(httpx.Client, "post", _post)
+    svc = ChatbotService(db)
+    with pytest.raises(httpx.ConnectError):
+        svc._retrieve_rag_documents(query_text="질문", num_result_doc=3, permission_groups=["rag-public"])
+
+    monkeypatch.setattr(settings, "RAG_LOCAL_INDEX_ENABLED", False, raising=False)
+    with pytest.raises(httpx.ConnectError):
+        svc.upsert_rag_document(
+            doc_id="board_post:1", title="공지", content="본문", metadata={}, user_id="1", ai_summary="요약"
+        )
+    from app.models.rag_local_document import RagLocalDocument
+
+    assert db.query(RagLocalDocument).count() == 0
+
+
+def test_local_index_document_uses_own_session_and_refresh_keeps_newer_version(db, seed_batch, monkeypatch):
+    # [chatbot] 로컬 저장은 호출자 트랜잭션을 건드리지 않고, 락 밖에서 읽은 오래된 행이 최신 입력을 덮어쓰면 안 된다.
+    from datetime import datetime, timedelta
+
+    from app.models.batch import Batch
+    from app.models.rag_local_document import RagLocalDocument
+    from app.services import rag_local_index_service
+
+    rag_local_index_service.reset_state()
+    rag_local_index_service.warm_up(db)
+    db.add(Batch(batch_name="로컬 색인 세션", start_date=seed_batch.start_date, end_date=seed_batch.end_date))
+    rag_local_index_service.index_document(
+        db, {"doc_id": "board_post:1", "title": "새 제목 파이프라인", "content": "본문", "permission_groups": ["g1"]}
+    )
+    assert db.new
+    db.rollback()
+    assert db.query(Batch).filter(Batch.batch_name == "로컬 색인 세션").count() == 0
+    assert db.query(RagLocalDocument).count() == 1
+
+    stale = (
+        "board_post:1",
+        datetime.utcnow() - timedelta(minutes=5),
+        {"doc_id": "board_post:1", "title": "옛 제목", "content": "본문", "permission_groups": ["g1"]},
+    )
+    monkeypatch.setattr(rag_local_index_service, "_load_rows", lambda _db, _since: [stale])
+    index = rag_local_index_service._refresh(db, force=True)
+    assert index.docs["board_post:1"]["title"] == "새 제목 파이프라인"
@@ -0,0 +1,128 @@
+"""[chatbot] LLM 단계별/RAG 입력·검색 지연 지표 수집과 Prometheus/관리자 조회 API를 검증하는 테스트입니다."""
+import httpx
+import pytest
+
+from tests.conftest import auth_headers
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    from app.services import chatbot_metrics_service
+
+    chatbot_metrics_service.reset()
+    yield
+    chatbot_metrics_service.reset()
+
+
+def test_histogram_quantiles_and_prometheus_rendering():
+    # [chatbot] 구간 보간 분위수와 누적 bucket/라벨 이스케이프가 Prometheus 형식을 따라야 한다.
+    from app.services import chatbot_metrics_service
+
+    for seconds in (0.2, 0.2, 0.2, 0.8, 3.0):
+        chatbot_metrics_service.observe_llm(
+            stage="rag_answer", slot="model1", model='qwen"3', seconds=seconds, prompt="a" * 40, completion="가나"
+        )
+    chatbot_metrics_service.observe_llm(stage="rag_answer", slot="model1", model='qwen"3', seconds=9.0, error=True)
+    chatbot_metrics_service.observe_rag(operation="retrieve", source="remote", seconds=0.04)
+
+    row = chatbot_metrics_service.get_snapshot()["llm"][0]
+    assert (row["count"], row["errors"], row["prompt_tokens"], row["completion_tokens"]) == (6, 1, 50, 10)
+    assert 100.0 < row["p50_ms"] <= 250.0
+    assert 5000.0 < row["p95_ms"] <= 9000.0
+    assert row["max_ms"] == 9000.0
+
+    text = chatbot_metrics_service.render_prometheus()
+    labels = 'stage="rag_answer",slot="model1",model="qwen\\"3"'
+    assert f'chatbot_llm_request_duration_seconds_bucket{{{labels},le="0.25"}} 3' in text
+    assert f'chatbot_llm_request_duration_seconds_bucket{{{labels},le="1"}} 4' in text
+    assert f'chatbot_llm_request_duration_seconds_bucket{{{labels},le="+Inf"}} 6' in text
+    assert f"chatbot_llm_request_duration_seconds_count{{{labels}}} 6" in text
+    assert f"chatbot_llm_errors_total{{{labels}}} 1" in text
+    assert 'chatbot_rag_request_duration_seconds_bucket{operation="retrieve",source="remote",le="0.05"} 1' in text
+    assert "# TYPE chatbot_rag_errors_total counter" in text
+
+
+def test_chatbot_service_records_llm_stages_and_rag_timings(db, monkeypatch):
+    # [chatbot] _invoke_llm 성공/실패, 원격 insert, 원격 검색 실패 후 로컬 폴백이 단계/경로별로 기록되어야 한다.
+    from app.config import settings
+    from app.services import chatbot_metrics_service, rag_local_index_service
+    from app.services.ai_client import AIClient
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "RAG_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_INPUT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_BASE_URL", "http://rag.local", raising=False)
+    monkeypatch.setattr(settings, "RAG_API_KEY", "rag-api-key", raising=False)
+    monkeypatch.setattr(settings, "AI_CREDENTIAL_KEY", "credential-key", raising=False)
+    monkeypatch.setattr(settings, "RAG_LOCAL_INDEX_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_LOCAL_INDEX_MODE", "fallback", raising=False)
+    monkeypatch.setattr(settings, "RAG_RETRIEVE_CACHE_ENABLED", False, raising=False)
+    rag_local_index_service.reset_state()
+
+    class _InsertOk:
+        def raise_for_status(self):
+            return None
+
+    def _post(self, url, **kwargs):  # noqa: ANN001
+        if url.endswith("/retrieve-rrf"):
+            raise httpx.ConnectTimeout("rag down")
+        return _InsertOk()
+
+    monkeypatch.setattr(httpx.Client, "post", _post)
+    calls = []
+
+    def _invoke(self, prompt, system_prompt=None):  # noqa: ANN001
+        calls.append(prompt)
+        if "fail" in prompt:
+            raise RuntimeError("model timeout")
+        return "SELECT 1"
+
+    monkeypatch.setattr(AIClient, "invoke", _invoke)
+    svc = ChatbotService(db)
+    assert svc._invoke_llm(purpose="general", user_id="1", prompt="질문", system_prompt="시스템", stage="sql_generation") == "SELECT 1"
+    with pytest.raises(RuntimeError):
+        svc._invoke_llm(purpose="general", user_id="1", prompt="fail", system_prompt=None, stage="sql_generation")
+    svc.upsert_rag_document(
+        doc_id="board_post:1", title="공지", content="파이프라인 공지", metadata={}, user_id="1", ai_summary="요약"
+    )
+    svc._retrieve_rag_documents(query_text="파이프라인", num_result_doc=3, permission_groups=["rag-public"])
+
+    snapshot = chatbot_metrics_service.get_snapshot()
+    llm = {(row["stage"], row["slot"]): row for row in snapshot["llm"]}
+    assert llm[("sql_generation", "model1")]["count"] == 2
+    assert llm[("sql_generation", "model1")]["errors"] == 1
+    assert llm[("sql_generation", "model1")]["model"] == settings.AI_DEFAULT_MODEL
+    rag = {(row["operation"], row["source"]): row for row in snapshot["rag"]}
+    assert rag[("insert", "remote")]["count"] == 1 and rag[("insert", "remote")]["errors"] == 0
+    assert rag[("insert", "local")]["count"] == 1
+    assert rag[("retrieve", "remote")]["errors"] == 1
+    assert rag[("retrieve", "local")]["count"] == 1 and rag[("retrieve", "local")]["errors"] == 0
+
+
+def test_metrics_endpoints_require_admin_or_scrape_token(client, seed_users, monkeypatch):
+    # [chatbot] Prometheus 엔드포인트는 관리자 또는 수집 토큰만, JSON 조회/초기화는 관리자만 허용한다.
+    from app.config import settings
+    from app.services import chatbot_metrics_service
+
+    chatbot_metrics_service.observe_llm(stage="route_decision", slot="model2", model="gemma3", seconds=0.3)
+    assert client.get("/api/chatbot/metrics").status_code == 401
+    assert client.get("/api/chatbot/metrics", headers=auth_headers(client, "user001")).status_code == 403
+
+    admin = auth_headers(client, "admin001")
+    resp = client.get("/api/chatbot/metrics", headers=admin)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'chatbot_llm_request_duration_seconds_count{stage="route_decision",slot="model2",model="gemma3"} 1' in resp.text
+
+    monkeypatch.setattr(settings, "CHATBOT_METRICS_TOKEN", "scrape-secret", raising=False)
+    assert client.get("/api/chatbot/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+    assert client.get("/api/chatbot/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    assert client.get("/api/chatbot/metrics/stats", headers=auth_headers(client, "coach001")).status_code == 403
+    stats = client.get("/api/chatbot/metrics/stats", headers=admin).json()
+    assert stats["llm"][0]["stage"] == "route_decision"
+    assert stats["llm"][0]["p50_ms"] > 0
+    assert set(stats["context"]) >= {"requests", "prompt_tokens_avg", "truncated"}
+    reset = client.post("/api/chatbot/metrics/reset", headers=admin).json()
+    assert reset["llm"] == []
+    assert reset["context"]["requests"] == 0
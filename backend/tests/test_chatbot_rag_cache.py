@@ -0,0 +1,501 @@
+"""[chatbot] RAG 입력 요약/엔티티 캐시 동작을 검증하는 테스트입니다."""
+import json
+from datetime import datetime, timedelta
+
+from tests.conftest import auth_headers
+
+
+def _fake_llm(calls):
+    def _invoke(self, *, purpose, user_id, prompt, system_prompt, stage):  # noqa: ANN001
+        calls.append(prompt)
+        return json.dumps(
+            {
+                "summary": f"요약 {len(calls)}",
+                "entities": [{"name": "N2SQL", "type": "technology", "description": "텍스트-투-SQL"}],
+                "relations": [{"source": "A과제", "relation": "uses", "target": "N2SQL"}],
+            },
+            ensure_ascii=False,
+        )
+
+    return _invoke
+
+
+def test_summary_cache_reuses_result_for_same_normalized_content(db, monkeypatch):
+    # [chatbot] 본문이 같으면(공백/HTML 차이 무시) LLM을 다시 호출하지 않고 캐시 결과를 재사용해야 한다.
+    from app.config import settings
+    from app.services import rag_cache_service
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_SUMMARY_CACHE_ENABLED", True, raising=False)
+    rag_cache_service.reset_stats()
+    calls = []
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", _fake_llm(calls))
+
+    svc = ChatbotService(db)
+    first = svc.generate_ai_summary_and_entities(content="<p>A과제가  N2SQL을 사용합니다.</p>", source_label="board_post", user_id="1")
+    second = svc.generate_ai_summary_and_entities(content="A과제가 N2SQL을 사용합니다.", source_label="board_post", user_id="2")
+
+    assert len(calls) == 1
+    assert second == first
+    assert second[1][0]["name"] == "N2SQL"
+    assert second[2][0]["relation"] == "uses"
+
+    svc.generate_ai_summary_and_entities(content="A과제가 N2SQL을 사용합니다.", source_label="coaching_note", user_id="1")
+    svc.generate_ai_summary_and_entities(content="다른 본문", source_label="board_post", user_id="1")
+    assert len(calls) == 3
+
+    stats = rag_cache_service.get_stats(db, rag_cache_service.NAMESPACE_SUMMARY, enabled=True)
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["entries"] == 3
+
+
+def test_summary_cache_skips_failed_llm_and_respects_toggle(db, monkeypatch):
+    # [chatbot] LLM 실패 폴백 결과는 캐시하지 않고, 캐시 토글이 꺼지면 매번 LLM을 호출해야 한다.
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_SUMMARY_CACHE_ENABLED", True, raising=False)
+
+    def _broken(self, **kwargs):  # noqa: ANN001
+        raise RuntimeError("llm down")
+
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", _broken)
+    svc = ChatbotService(db)
+    summary, _, _ = svc.generate_ai_summary_and_entities(content="장애 중 본문", source_label="board_post", user_id="1")
+    assert summary == "장애 중 본문"
+    assert db.query(RagCacheEntry).count() == 0
+
+    calls = []
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", _fake_llm(calls))
+    monkeypatch.setattr(settings, "RAG_SUMMARY_CACHE_ENABLED", False, raising=False)
+    svc.generate_ai_summary_and_entities(content="장애 중 본문", source_label="board_post", user_id="1")
+    svc.generate_ai_summary_and_entities(content="장애 중 본문", source_label="board_post", user_id="1")
+    assert len(calls) == 2
+    assert db.query(RagCacheEntry).count() == 0
+
+
+def test_summary_cache_ttl_and_fifo_eviction_without_writes_on_hit(db, monkeypatch):
+    # [chatbot] 적중은 DB에 쓰지 않고, TTL이 지난 항목은 미스로 처리하며, 상한을 넘기면 가장 먼저 저장된 항목부터 정리해야 한다.
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_SUMMARY_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_SUMMARY_CACHE_TTL_SECONDS", 3600, raising=False)
+    monkeypatch.setattr(settings, "RAG_SUMMARY_CACHE_MAX_ENTRIES", 2, raising=False)
+    calls = []
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", _fake_llm(calls))
+    svc = ChatbotService(db)
+
+    svc.generate_ai_summary_and_entities(content="문서 A", source_label="board_post", user_id="1")
+    svc.generate_ai_summary_and_entities(content="문서 B", source_label="board_post", user_id="1")
+    # 같은 시각으로 기록되는 경우를 피하려고 A를 B보다 먼저 저장된 것으로 돌린다.
+    for offset, row in zip((20, 10), db.query(RagCacheEntry).order_by(RagCacheEntry.entry_id).all()):
+        row.created_at = row.created_at - timedelta(seconds=offset)
+        row.last_used_at = row.created_at
+    db.commit()
+    before = {row.cache_key: row.last_used_at for row in db.query(RagCacheEntry).all()}
+
+    svc.generate_ai_summary_and_entities(content="문서 A", source_label="board_post", user_id="1")
+    assert len(calls) == 2
+    db.expire_all()
+    assert {row.cache_key: row.last_used_at for row in db.query(RagCacheEntry).all()} == before
+
+    # 방금 적중했어도 A가 가장 먼저 저장됐으므로 C 저장 시 A가 밀려난다.
+    svc.generate_ai_summary_and_entities(content="문서 C", source_label="board_post", user_id="1")
+    assert len(calls) == 3
+    assert db.query(RagCacheEntry).count() == 2
+    svc.generate_ai_summary_and_entities(content="문서 C", source_label="board_post", user_id="1")
+    assert len(calls) == 3
+    svc.generate_ai_summary_and_entities(content="문서 A", source_label="board_post", user_id="1")
+    assert len(calls) == 4
+
+    for row in db.query(RagCacheEntry).all():
+        row.created_at = datetime.utcnow() - timedelta(hours=2)
+    db.commit()
+    svc.generate_ai_summary_and_entities(content="문서 C", source_label="board_post", user_id="1")
+    assert len(calls) == 5
+    # 만료 항목은 다음 저장 때 함께 정리된다.
+    assert db.query(RagCacheEntry).count() == 1
+
+
+def test_chatbot_cache_stats_endpoint_admin_only(client, db, seed_users, monkeypatch):
+    # [chatbot] 관리자는 요약 캐시 적중 통계를 조회할 수 있어야 한다.
+    from app.services import rag_cache_service
+
+    rag_cache_service.reset_stats()
+    rag_cache_service.put_entry(db, rag_cache_service.NAMESPACE_SUMMARY, "k1", {"summary": "s"}, max_entries=10)
+    assert rag_cache_service.get_entry(db, rag_cache_service.NAMESPACE_SUMMARY, "k1", ttl_seconds=60) == {"summary": "s"}
+
+    denied = client.get("/api/chatbot/cache/stats", headers=auth_headers(client, "coach001"))
+    assert denied.status_code == 403, denied.text
+
+    resp = client.get("/api/chatbot/cache/stats", headers=auth_headers(client, "admin001"))
+    assert resp.status_code == 200, resp.text
+    summary = resp.json()["summary"]
+    assert summary["entries"] == 1
+    assert summary["hits"] == 1
+    assert summary["stores"] == 1
+    assert resp.json()["image_caption"]["entries"] == 0
+    assert resp.json()["answer"]["entries"] == 0
+    assert resp.json()["retrieve"]["entries"] == 0
+
+
+def test_image_caption_cache_reuses_caption_by_file_digest_and_immutable_url(db, tmp_path, monkeypatch):
+    # [chatbot] 같은 이미지 파일(내용 digest)이나 불변 업로드 URL은 이미지 인식 모델을 한 번만 호출해야 한다.
+    from app.config import settings
+    from app.services import rag_cache_service
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path), raising=False)
+    monkeypatch.setattr(settings, "RAG_IMAGE_CAPTION_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(ChatbotService, "_is_image_llm_ready", lambda self: True)
+    rag_cache_service.reset_stats()
+
+    image_dir = tmp_path / "boards" / "1"
+    image_dir.mkdir(parents=True)
+    (image_dir / "a.png").write_bytes(b"same-image-bytes")
+    (image_dir / "b.png").write_bytes(b"same-image-bytes")
+    (image_dir / "c.png").write_bytes(b"other-image-bytes")
+
+    calls = []
+
+    def _fake_generate(self, normalized_url, *, prompt_text, user_id, **kwargs):  # noqa: ANN001
+        calls.append(normalized_url)
+        return f"설명 {len(calls)}"
+
+    monkeypatch.setattr(ChatbotService, "_generate_image_caption_ko", _fake_generate)
+    svc = ChatbotService(db)
+
+    first = svc._build_image_caption_entries(["/uploads/boards/1/a.png", "/uploads/boards/1/b.png"], user_id="1")
+    assert [row["caption"] for row in first] == ["설명 1", "설명 1"]
+    assert len(calls) == 1
+
+    svc._build_image_caption_entries(["/uploads/boards/1/c.png"], user_id="1")
+    assert len(calls) == 2
+
+    remote_immutable = "https://cdn.example.com/uploads/editor_images/2024/uuid.png"
+    remote_mutable = "https://cdn.example.com/static/banner.png"
+    for _ in range(2):
+        svc._build_image_caption_entries([remote_immutable, remote_mutable], user_id="1")
+    assert calls.count("/uploads/editor_images/2024/uuid.png") == 1
+    assert calls.count(remote_mutable) == 2
+
+    stats = rag_cache_service.get_stats(db, rag_cache_service.NAMESPACE_IMAGE_CAPTION, enabled=True)
+    # a/b는 같은 동기화 안에서 대표 이미지 1건으로 묶이므로 캐시 적중은 두 번째 불변 URL 조회 1건이다.
+    assert stats["hits"] == 1
+    assert stats["entries"] == 3
+
+
+def test_image_caption_cache_does_not_store_empty_caption(db, tmp_path, monkeypatch):
+    # [chatbot] 이미지 인식 실패(빈 설명)는 캐시하지 않아 다음 동기화에서 다시 시도해야 한다.
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path), raising=False)
+    monkeypatch.setattr(settings, "RAG_IMAGE_CAPTION_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(ChatbotService, "_is_image_llm_ready", lambda self: True)
+    (tmp_path / "x.png").write_bytes(b"bytes")
+    calls = []
+
+    def _failing_generate(self, normalized_url, *, prompt_text, user_id, **kwargs):  # noqa: ANN001
+        calls.append(normalized_url)
+        return ""
+
+    monkeypatch.setattr(ChatbotService, "_generate_image_caption_ko", _failing_generate)
+    svc = ChatbotService(db)
+    entries = svc._build_image_caption_entries(["/uploads/x.png"], user_id="1")
+    svc._build_image_caption_entries(["/uploads/x.png"], user_id="1")
+
+    assert entries[0]["caption"] == "이미지가 포함된 문서입니다."
+    assert len(calls) == 2
+    assert db.query(RagCacheEntry).count() == 0
+
+
+def _fake_rag_answer(monkeypatch, calls):
+    from app.config import settings
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "CHATBOT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "CHATBOT_ANSWER_CACHE_ENABLED", True, raising=False)
+
+    def _retrieve(self, *, query_text, num_result_doc, permission_groups):  # noqa: ANN001
+        calls["retrieve"].append(list(permission_groups))
+        return {"hits": {"hits": [{"_source": {"doc_id": "board_post:1", "title": "공지", "content": "본문"}}]}}
+
+    def _invoke(self, *, purpose, user_id, prompt, system_prompt, stage):  # noqa: ANN001
+        calls["llm"].append(stage)
+        return f"답변 {len(calls['llm'])}"
+
+    monkeypatch.setattr(ChatbotService, "_retrieve_rag_documents", _retrieve)
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", _invoke)
+    monkeypatch.setattr(ChatbotService, "_decide_route_with_llm", lambda self, **kwargs: "rag")
+
+
+def test_answer_cache_reuses_answer_for_same_question_and_permission_scope(db, seed_users, seed_batch, monkeypatch):
+    # [chatbot] 같은 권한 범위의 반복 질문은 검색/LLM 없이 캐시 답변을 반환하고, 권한 범위가 다르면 분리되어야 한다.
+    from app.models.project import Project, ProjectMember
+    from app.services import rag_cache_service
+    from app.services.chatbot_service import ChatbotService
+
+    rag_cache_service.reset_stats()
+    calls = {"retrieve": [], "llm": []}
+    _fake_rag_answer(monkeypatch, calls)
+    svc = ChatbotService(db)
+
+    first = svc.answer_with_rag(current_user=seed_users["coach"], question="이번주 공지 알려줘?", num_result_doc=5)
+    second = svc.answer_with_rag(current_user=seed_users["coach"], question="  이번주   공지 알려줘 ", num_result_doc=5)
+    assert second == first
+    assert len(calls["retrieve"]) == 1
+    assert len(calls["llm"]) == 1
+
+    # 배치 권한이 없는 참여자는 같은 질문이라도 코치 캐시를 재사용하지 않는다.
+    svc.answer_with_rag(current_user=seed_users["participant"], question="이번주 공지 알려줘", num_result_doc=5)
+    assert len(calls["retrieve"]) == 2
+    assert calls["retrieve"][1] == ["rag-public"]
+
+    project = Project(batch_id=seed_batch.batch_id, project_name="A과제", organization="Dev")
+    db.add(project)
+    db.commit()
+    db.add(ProjectMember(project_id=project.project_id, user_id=seed_users["participant"].user_id, role="member"))
+    db.commit()
+    # 과제 배정으로 권한 그룹이 코치와 같아지면 같은 검색 범위이므로 코치 답변을 재사용한다.
+    shared = svc.answer_with_rag(current_user=seed_users["participant"], question="이번주 공지 알려줘", num_result_doc=5)
+    assert shared == first
+    assert len(calls["retrieve"]) == 2
+
+    stats = rag_cache_service.get_stats(db, rag_cache_service.NAMESPACE_ANSWER, enabled=True)
+    assert stats["hits"] == 2
+    assert stats["entries"] == 2
+
+
+def test_answer_cache_skips_ai_disabled_fallback(db, seed_users, monkeypatch):
+    # [chatbot] AI 비활성 폴백 답변은 캐시하지 않아야 한다.
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services.chatbot_service import ChatbotService
+
+    calls = {"retrieve": [], "llm": []}
+    _fake_rag_answer(monkeypatch, calls)
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", False, raising=False)
+    svc = ChatbotService(db)
+
+    for _ in range(2):
+        out = svc.answer_with_rag(current_user=seed_users["participant"], question="공지 알려줘", num_result_doc=5)
+        assert out["answer"] == ChatbotService._AI_DISABLED_ANSWER
+    assert len(calls["retrieve"]) == 2
+    assert db.query(RagCacheEntry).count() == 0
+
+
+def test_answer_cache_invalidated_by_permission_group_on_upsert(db, seed_users, seed_batch, monkeypatch):
+    # [chatbot] 문서가 재동기화되면 그 문서의 권한 그룹을 가진 답변 캐시만 무효화해야 한다.
+    import httpx
+
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services import rag_cache_service
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "RAG_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_INPUT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_BASE_URL", "http://rag.local", raising=False)
+    monkeypatch.setattr(settings, "RAG_API_KEY", "rag-api-key", raising=False)
+    monkeypatch.setattr(settings, "AI_CREDENTIAL_KEY", "credential-key", raising=False)
+
+    class _Resp:
+        def raise_for_status(self):
+            return None
+
+    monkeypatch.setattr(httpx.Client, "post", lambda *args, **kwargs: _Resp())
+    rag_cache_service.reset_stats()
+    batch_group = f"batch-{seed_batch.batch_id}"
+    for key, groups in (("public", ["rag-public"]), ("batch", ["rag-public", batch_group]), ("other", ["rag-public", "batch-999"])):
+        rag_cache_service.put_entry(
+            db, rag_cache_service.NAMESPACE_ANSWER, key, {"answer": key, "references": []}, max_entries=10, tags=groups
+        )
+
+    svc = ChatbotService(db)
+    svc.upsert_rag_document(
+        doc_id="coaching_note:1",
+        title="노트",
+        content="본문",
+        metadata={"source_type": "coaching_note"},
+        user_id="1",
+        ai_summary="요약",
+        permission_groups=["rag-public", batch_group],
+    )
+    assert sorted(row.cache_key for row in db.query(RagCacheEntry).all()) == ["other", "public"]
+
+    svc.upsert_rag_document(
+        doc_id="board_post:1",
+        title="공지",
+        content="본문",
+        metadata={"source_type": "board_post"},
+        user_id="1",
+        ai_summary="요약",
+    )
+    assert db.query(RagCacheEntry).count() == 0
+    stats = rag_cache_service.get_stats(db, rag_cache_service.NAMESPACE_ANSWER, enabled=True)
+    assert stats["invalidations"] == 3
+
+
+def test_answer_cache_uses_own_session_and_stores_many_permission_tags(db, seed_users, seed_batch):
+    # [chatbot] 캐시 읽기/쓰기/무효화가 호출자 세션의 미커밋 작업을 커밋하거나 되돌리면 안 된다.
+    from app.models.batch import Batch
+    from app.models.rag_cache import RagCacheEntry
+    from app.services import rag_cache_service
+
+    groups = ["rag-public"] + [f"batch-{idx}" for idx in range(1, 121)]
+    db.add(Batch(batch_name="캐시 세션 분리", start_date=seed_batch.start_date, end_date=seed_batch.end_date))
+    rag_cache_service.put_entry(
+        db, rag_cache_service.NAMESPACE_ANSWER, "admin", {"answer": "a", "references": []}, max_entries=10, tags=groups
+    )
+    assert rag_cache_service.get_entry(db, rag_cache_service.NAMESPACE_ANSWER, "missing", ttl_seconds=60) is None
+    assert db.new
+    db.rollback()
+    assert db.query(Batch).filter(Batch.batch_name == "캐시 세션 분리").count() == 0
+
+    row = db.query(RagCacheEntry).filter(RagCacheEntry.cache_key == "admin").one()
+    assert len(row.tags) > 500
+    assert rag_cache_service.invalidate_tags(db, rag_cache_service.NAMESPACE_ANSWER, ["batch-120"]) == 1
+    assert db.query(RagCacheEntry).count() == 0
+
+
+def test_answer_cache_shared_between_stream_and_ask_endpoints(client, seed_users, monkeypatch):
+    # [chatbot] 스트리밍으로 완성된 답변도 캐시되어 다음 스트리밍/일반 질문은 검색·LLM 없이 응답해야 한다.
+    from app.config import settings
+    from app.services.ai_client import AIClient
+    from app.services.chatbot_service import ChatbotService
+    from tests.test_chatbot_feature import _parse_sse_events
+
+    monkeypatch.setattr(settings, "CHATBOT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "CHATBOT_ANSWER_CACHE_ENABLED", True, raising=False)
+    calls = {"retrieve": 0}
+
+    async def _fake_aretrieve(self, *, query_text, num_result_doc, permission_groups):  # noqa: ANN001
+        calls["retrieve"] += 1
+        return {"hits": {"hits": [{"_source": {"doc_id": "board_post:1", "title": "공지", "content": "본문"}}]}}
+
+    async def _fake_astream(self, prompt, system_prompt=None):  # noqa: ANN001
+        for piece in ["캐시 ", "답변"]:
+            yield piece
+
+    monkeypatch.setattr(ChatbotService, "_aretrieve_rag_documents", _fake_aretrieve)
+    monkeypatch.setattr(AIClient, "astream", _fake_astream)
+
+    headers = auth_headers(client, "user001")
+    first = client.post("/api/chatbot/ask/stream", json={"question": "공지 요약"}, headers=headers)
+    second = client.post("/api/chatbot/ask/stream", json={"question": "공지 요약?"}, headers=headers)
+    assert first.status_code == 200 and second.status_code == 200
+    assert calls["retrieve"] == 1
+    events = _parse_sse_events(second.text)
+    assert [name for name, _ in events] == ["references", "token", "done"]
+    assert events[-1][1]["answer"] == "캐시 답변"
+    assert events[0][1]["references"][0]["doc_id"] == "board_post:1"
+
+    asked = client.post("/api/chatbot/ask", json={"question": "공지 요약"}, headers=headers)
+    assert asked.status_code == 200, asked.text
+    assert asked.json()["answer"] == "캐시 답변"
+    assert calls["retrieve"] == 1
+
+
+def test_retrieve_cache_reuses_remote_result_and_invalidates_by_group(db, monkeypatch):
+    # [chatbot] 정규화 질의 + 권한 그룹이 같은 검색은 원격 retrieve-rrf를 다시 호출하지 않고, 문서 upsert 시 해당 그룹만 무효화해야 한다.
+    import httpx
+
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services import rag_cache_service, rag_local_index_service
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "RAG_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_INPUT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_BASE_URL", "http://rag.local", raising=False)
+    monkeypatch.setattr(settings, "RAG_API_KEY", "rag-api-key", raising=False)
+    monkeypatch.setattr(settings, "AI_CREDENTIAL_KEY", "credential-key", raising=False)
+    monkeypatch.setattr(settings, "RAG_RETRIEVE_CACHE_ENABLED", True, raising=False)
+    rag_cache_service.reset_stats()
+    rag_local_index_service.reset_state()
+    retrieve_calls = []
+
+    class _Resp:
+        def __init__(self, body):
+            self._body = body
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return self._body
+
+    def _post(self, url, **kwargs):  # noqa: ANN001
+        if url.endswith("/retrieve-rrf"):
+            retrieve_calls.append(kwargs["json"]["permission_groups"])
+            return _Resp({"hits": {"hits": [{"_score": 1.0, "_source": {"doc_id": f"board_post:{len(retrieve_calls)}"}}]}})
+        return _Resp({})
+
+    monkeypatch.setattr(httpx.Client, "post", _post)
+    svc = ChatbotService(db)
+
+    first = svc._retrieve_rag_documents(query_text="N2SQL 과제?", num_result_doc=5, permission_groups=["rag-public", "batch-1"])
+    second = svc._retrieve_rag_documents(query_text="n2sql 과제", num_result_doc=5, permission_groups=["batch-1", "rag-public"])
+    assert second == first
+    assert len(retrieve_calls) == 1
+    svc._retrieve_rag_documents(query_text="n2sql 과제", num_result_doc=5, permission_groups=["rag-public"])
+    svc._retrieve_rag_documents(query_text="n2sql 과제", num_result_doc=3, permission_groups=["rag-public"])
+    assert len(retrieve_calls) == 3
+
+    svc.upsert_rag_document(
+        doc_id="coaching_note:1",
+        title="노트",
+        content="본문",
+        metadata={"source_type": "coaching_note"},
+        user_id="1",
+        ai_summary="요약",
+        permission_groups=["rag-public", "batch-1"],
+    )
+    remaining = db.query(RagCacheEntry).filter(RagCacheEntry.namespace == rag_cache_service.NAMESPACE_RETRIEVE).all()
+    assert len(remaining) == 2
+    svc._retrieve_rag_documents(query_text="n2sql 과제", num_result_doc=5, permission_groups=["rag-public", "batch-1"])
+    assert len(retrieve_calls) == 4
+
+    stats = rag_cache_service.get_stats(db, rag_cache_service.NAMESPACE_RETRIEVE, enabled=True)
+    assert stats["hits"] == 1
+    assert stats["invalidations"] == 1
+
+
+def test_retrieve_cache_skips_local_fallback_results(db, monkeypatch):
+    # [chatbot] 원격 장애로 로컬 인덱스가 답한 결과는 캐시하지 않아 원격 복구 후 바로 원격 결과를 사용해야 한다.
+    import httpx
+
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services import rag_local_index_service
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "RAG_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_BASE_URL", "http://rag.local", raising=False)
+    monkeypatch.setattr(settings, "RAG_API_KEY", "rag-api-key", raising=False)
+    monkeypatch.setattr(settings, "AI_CREDENTIAL_KEY", "credential-key", raising=False)
+    monkeypatch.setattr(settings, "RAG_RETRIEVE_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_LOCAL_INDEX_ENABLED", True, raising=False)
+    rag_local_index_service.reset_state()
+    rag_local_index_service.index_document(
+        db, {"doc_id": "board_post:1", "title": "N2SQL 공지", "content": "본문", "permission_groups": ["rag-public"]}
+    )
+
+    def _down(self, url, **kwargs):  # noqa: ANN001
+        raise httpx.ConnectError("rag down")
+
+    monkeypatch.setattr(httpx.Client, "post", _down)
+    data = ChatbotService(db)._retrieve_rag_documents(query_text="N2SQL", num_result_doc=5, permission_groups=["rag-public"])
+    assert data["retriever"] == "local"
+    assert db.query(RagCacheEntry).count() == 0
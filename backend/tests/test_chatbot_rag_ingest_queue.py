@@ -0,0 +1,301 @@
+"""[chatbot] RAG 입력 비동기 큐(outbox)와 워커 동작을 검증하는 테스트입니다."""
+from datetime import datetime, timedelta
+
+from tests.conftest import TestingSession, auth_headers
+
+
+def _enable_rag(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "RAG_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_INPUT_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_BASE_URL", "http://rag.local", raising=False)
+    monkeypatch.setattr(settings, "RAG_API_KEY", "rag-api-key", raising=False)
+    monkeypatch.setattr(settings, "AI_CREDENTIAL_KEY", "credential-key", raising=False)
+    monkeypatch.setattr(settings, "RAG_INGEST_QUEUE_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "RAG_INGEST_COALESCE_SECONDS", 0, raising=False)
+
+
+def test_rag_ingest_board_create_enqueues_job_instead_of_inline_sync(client, db, seed_users, seed_boards, monkeypatch):
+    # [chatbot] 큐가 켜져 있으면 게시글 저장 시 인라인 upsert 대신 작업만 적재해야 한다.
+    from app.models.rag_ingest_job import RagIngestJob
+    from app.services.chatbot_service import ChatbotService
+
+    _enable_rag(monkeypatch)
+
+    def _fail_upsert(self, **kwargs):  # noqa: ANN001
+        raise AssertionError("inline upsert must not run when queue is enabled")
+
+    monkeypatch.setattr(ChatbotService, "upsert_rag_document", _fail_upsert)
+
+    headers = auth_headers(client, "coach001")
+    resp = client.post(
+        f"/api/boards/{seed_boards[2].board_id}/posts",
+        json={"title": "큐 테스트", "content": "본문", "is_notice": False},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+    post_id = resp.json()["post_id"]
+
+    jobs = db.query(RagIngestJob).all()
+    assert len(jobs) == 1
+    assert jobs[0].doc_key == f"board_post:{post_id}"
+    assert jobs[0].status == "pending"
+    assert jobs[0].event_type == "create"
+
+
+def test_rag_ingest_coalesces_repeated_events_for_same_doc(client, db, seed_users, seed_boards, monkeypatch):
+    # [chatbot] 댓글 연속 등록처럼 같은 doc_id 이벤트가 몰리면 대기 작업 1건으로 병합해야 한다.
+    from app.config import settings
+    from app.models.rag_ingest_job import RagIngestJob
+    from app.services.chatbot_service import ChatbotService
+
+    _enable_rag(monkeypatch)
+    monkeypatch.setattr(settings, "RAG_INGEST_COALESCE_SECONDS", 30, raising=False)
+    monkeypatch.setattr(settings, "RAG_INGEST_COALESCE_MAX_WAIT_SECONDS", 120, raising=False)
+    monkeypatch.setattr(ChatbotService, "upsert_rag_document", lambda self, **kwargs: None)
+
+    headers = auth_headers(client, "coach001")
+    resp = client.post(
+        f"/api/boards/{seed_boards[2].board_id}/posts",
+        json={"title": "병합 테스트", "content": "본문", "is_notice": False},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+    post_id = resp.json()["post_id"]
+    for idx in range(3):
+        comment = client.post(
+            f"/api/boards/posts/{post_id}/comments",
+            json={"content": f"댓글 {idx}"},
+            headers=headers,
+        )
+        assert comment.status_code == 200, comment.text
+
+    jobs = db.query(RagIngestJob).all()
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job.doc_key == f"board_post:{post_id}"
+    assert job.event_type == "comment_create"
+    assert job.coalesced_count == 3
+    # 실행 시점은 윈도우만큼 미뤄지되 최초 요청 후 최대 대기 시간을 넘기지 않는다.
+    assert job.next_run_at > datetime.utcnow()
+    assert job.next_run_at <= job.created_at + timedelta(seconds=120)
+
+
+def test_rag_ingest_does_not_merge_into_running_job(db, monkeypatch):
+    # [chatbot] 처리 중인 작업은 이전 상태를 읽었을 수 있으므로 새 이벤트는 별도 작업으로 적재해야 한다.
+    from app.models.rag_ingest_job import RagIngestJob
+    from app.services import rag_ingest_service
+
+    _enable_rag(monkeypatch)
+    first = rag_ingest_service.enqueue_job(db, source_type="coaching_note", source_id=7, event_type="create", user_id="1")
+    claimed = rag_ingest_service.claim_next_job(db, worker_id="w1")
+    assert int(claimed.job_id) == int(first.job_id)
+
+    second = rag_ingest_service.enqueue_job(db, source_type="coaching_note", source_id=7, event_type="update", user_id="1")
+    assert int(second.job_id) != int(first.job_id)
+    assert db.query(RagIngestJob).count() == 2
+
+
+def test_rag_ingest_merge_keeps_retry_backoff_of_failed_job(db, monkeypatch):
+    # [chatbot] 실패 후 백오프 대기 중인 작업에 새 이벤트가 병합되어도 재시도 시점을 앞당기지 않아야 한다.
+    from app.models.rag_ingest_job import RagIngestJob
+    from app.services import rag_ingest_service
+
+    _enable_rag(monkeypatch)
+    job = rag_ingest_service.enqueue_job(db, source_type="coaching_note", source_id=9, event_type="create", user_id="1")
+    backoff_until = datetime.utcnow() + timedelta(minutes=10)
+    db.query(RagIngestJob).filter(RagIngestJob.job_id == job.job_id).update(
+        {"attempts": 1, "next_run_at": backoff_until}, synchronize_session=False
+    )
+    db.commit()
+
+    merged = rag_ingest_service.enqueue_job(db, source_type="coaching_note", source_id=9, event_type="update", user_id="1")
+    assert int(merged.job_id) == int(job.job_id)
+    assert merged.event_type == "update"
+    assert merged.next_run_at >= backoff_until - timedelta(seconds=1)
+
+
+def test_rag_ingest_worker_processes_job_and_marks_done(db, seed_users, seed_boards, monkeypatch):
+    # [chatbot] 워커는 대기 작업을 선점해 upsert를 수행하고 done으로 표시해야 한다.
+    from app.models.board import BoardPost
+    from app.models.rag_ingest_job import RagIngestJob
+    from app.services import rag_ingest_service
+    from app.services.chatbot_service import ChatbotService
+    from app.services.rag_ingest_worker import RagIngestWorkerPool
+
+    _enable_rag(monkeypatch)
+    post = BoardPost(
+        board_id=seed_boards[1].board_id,
+        author_id=seed_users["coach"].user_id,
+        title="워커 처리",
+        content="본문",
+    )
+    db.add(post)
+    db.commit()
+    db.refresh(post)
+
+    captured = []
+
+    def _fake_upsert(self, **kwargs):  # noqa: ANN001
+        captured.append(kwargs)
+
+    monkeypatch.setattr(ChatbotService, "upsert_rag_document", _fake_upsert)
+
+    rag_ingest_service.enqueue_job(
+        db,
+        source_type="board_post",
+        source_id=int(post.post_id),
+        event_type="create",
+        user_id=str(seed_users["coach"].user_id),
+    )
+    processed = RagIngestWorkerPool(threads=1, session_factory=TestingSession).run_once(worker_id="test-worker")
+
+    assert processed == 1
+    assert captured and captured[0]["doc_id"] == f"board_post:{post.post_id}"
+    db.expire_all()
+    job = db.query(RagIngestJob).first()
+    assert job.status == "done"
+    assert job.attempts == 1
+    assert job.finished_at is not None
+
+
+def test_rag_ingest_failure_backs_off_then_dead_letters(db, seed_users, seed_boards, monkeypatch):
+    # [chatbot] 실패 시 백오프 후 재시도하고, 최대 시도 횟수를 넘기면 dead로 격리해야 한다.
+    from app.config import settings
+    from app.models.board import BoardPost
+    from app.models.rag_ingest_job import RagIngestJob
+    from app.services import rag_ingest_service
+    from app.services.chatbot_service import ChatbotService
+
+    _enable_rag(monkeypatch)
+    monkeypatch.setattr(settings, "RAG_INGEST_MAX_ATTEMPTS", 2, raising=False)
+    post = BoardPost(
+        board_id=seed_boards[1].board_id,
+        author_id=seed_users["coach"].user_id,
+        title="실패 처리",
+        content="본문",
+    )
+    db.add(post)
+    db.commit()
+    db.refresh(post)
+
+    def _broken_upsert(self, **kwargs):  # noqa: ANN001
+        raise RuntimeError("rag down")
+
+    monkeypatch.setattr(ChatbotService, "upsert_rag_document", _broken_upsert)
+
+    job = rag_ingest_service.enqueue_job(
+        db,
+        source_type="board_post",
+        source_id=int(post.post_id),
+        event_type="update",
+        user_id="1",
+    )
+    job_id = int(job.job_id)
+
+    assert rag_ingest_service.process_next_job(db, worker_id="w1") is True
+    job = db.query(RagIngestJob).filter(RagIngestJob.job_id == job_id).first()
+    db.refresh(job)
+    assert job.status == "pending"
+    assert job.attempts == 1
+    assert "rag down" in (job.last_error or "")
+    assert job.next_run_at > datetime.utcnow()
+
+    # 백오프 시간이 지나기 전에는 다시 선점되지 않는다.
+    assert rag_ingest_service.process_next_job(db, worker_id="w1") is False
+
+    job.next_run_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    assert rag_ingest_service.process_next_job(db, worker_id="w1") is True
+    db.refresh(job)
+    assert job.status == "dead"
+    assert job.attempts == 2
+
+
+def test_rag_ingest_reclaims_jobs_with_expired_lease(db, monkeypatch):
+    # [chatbot] lease가 만료된 running 작업은 다시 pending으로 회수해야 한다.
+    from app.config import settings
+    from app.models.rag_ingest_job import RagIngestJob
+    from app.services import rag_ingest_service
+
+    monkeypatch.setattr(settings, "RAG_INGEST_LEASE_SECONDS", 60, raising=False)
+    now = datetime.utcnow()
+    db.add(
+        RagIngestJob(
+            doc_key="board_post:1",
+            source_type="board_post",
+            source_id=1,
+            event_type="create",
+            status="running",
+            attempts=1,
+            max_attempts=5,
+            next_run_at=now - timedelta(minutes=5),
+            locked_by="dead-worker",
+            locked_at=now - timedelta(minutes=5),
+        )
+    )
+    db.commit()
+
+    assert rag_ingest_service.reclaim_stale_jobs(db, now=now) == 1
+    job = db.query(RagIngestJob).first()
+    db.refresh(job)
+    assert job.status == "pending"
+    assert job.locked_by is None
+
+
+def test_rag_ingest_status_and_retry_endpoints_admin_only(client, db, seed_users):
+    # [chatbot] 관리자는 큐 상태를 조회하고 dead 작업을 재시도할 수 있어야 한다.
+    from app.models.rag_ingest_job import RagIngestJob
+
+    now = datetime.utcnow()
+    dead = RagIngestJob(
+        doc_key="coaching_note:3",
+        source_type="coaching_note",
+        source_id=3,
+        event_type="update",
+        status="dead",
+        attempts=5,
+        max_attempts=5,
+        next_run_at=now,
+        last_error="RuntimeError: rag down",
+        finished_at=now,
+    )
+    pending = RagIngestJob(
+        doc_key="board_post:9",
+        source_type="board_post",
+        source_id=9,
+        event_type="create",
+        status="pending",
+        attempts=0,
+        max_attempts=5,
+        next_run_at=now,
+    )
+    db.add_all([dead, pending])
+    db.commit()
+    dead_id = int(dead.job_id)
+    pending_id = int(pending.job_id)
+
+    denied = client.get("/api/chatbot/ingest/status", headers=auth_headers(client, "user001"))
+    assert denied.status_code == 403, denied.text
+
+    headers = auth_headers(client, "admin001")
+    status_resp = client.get("/api/chatbot/ingest/status", headers=headers)
+    assert status_resp.status_code == 200, status_resp.text
+    body = status_resp.json()
+    assert body["counts"]["dead"] == 1
+    assert body["counts"]["pending"] == 1
+    assert body["oldest_pending_at"] is not None
+    assert body["dead_jobs"][0]["job_id"] == dead_id
+    assert "rag down" in body["dead_jobs"][0]["last_error"]
+
+    not_dead = client.post(f"/api/chatbot/ingest/jobs/{pending_id}/retry", headers=headers)
+    assert not_dead.status_code == 400, not_dead.text
+
+    retried = client.post(f"/api/chatbot/ingest/jobs/{dead_id}/retry", headers=headers)
+    assert retried.status_code == 200, retried.text
+    assert retried.json()["status"] == "pending"
+    assert retried.json()["attempts"] == 0
+
+    missing = client.post("/api/chatbot/ingest/jobs/99999/retry", headers=headers)
+    assert missing.status_code == 404, missing.text
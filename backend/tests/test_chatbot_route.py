@@ -0,0 +1,162 @@
+"""[chatbot] 관리자 질문 SQL/RAG 라우팅 로컬 분류기(규칙/경량 모델) 동작을 검증하는 테스트입니다."""
+import json
+
+from tests.conftest import auth_headers
+
+
+def test_route_rules_classify_clear_questions_and_defer_ambiguous_ones():
+    # [chatbot] 집계/순위 질문은 sql, 요약/관련 질문은 rag로 판단하고 신호가 약하거나 섞이면 판단을 보류해야 한다.
+    from app.services import chatbot_route_service
+
+    assert chatbot_route_service.classify_by_rules("이번주 진행률이 가장 낮은 과제가 뭐야?") == ("sql", 1.0)
+    assert chatbot_route_service.classify_by_rules("참여자가 몇 명이야") == ("sql", 1.0)
+    assert chatbot_route_service.classify_by_rules("A과제 이번주 코칭 노트 요약해줘") == ("rag", 1.0)
+    assert chatbot_route_service.classify_by_rules("N2SQL 관련 과제 알려줘") == ("rag", 1.0)
+    assert chatbot_route_service.classify_by_rules("정수연 과제 뭐야?") == (None, 0.0)
+
+    route, confidence = chatbot_route_service.classify_by_rules("코칭노트가 가장 많은 과제")
+    assert route == "sql"
+    assert confidence < 0.8
+
+
+def test_route_decision_skips_llm_when_rules_are_confident(db, seed_users, monkeypatch):
+    # [chatbot] 규칙으로 확신할 수 있는 관리자 질문은 LLM 라우터를 호출하지 않아야 한다.
+    from app.services import chatbot_route_service
+    from app.services.chatbot_service import ChatbotService
+
+    chatbot_route_service.reset_state()
+    calls = []
+
+    def _fake_llm_route(self, *, question, user_id):  # noqa: ANN001
+        calls.append(question)
+        return "rag"
+
+    monkeypatch.setattr(ChatbotService, "_decide_route_with_llm", _fake_llm_route)
+    svc = ChatbotService(db)
+
+    assert svc._decide_route(question="과제별 평균 진행률 알려줘", user_id="1") == "sql"
+    assert svc._decide_route(question="지난주 공지 요약해줘", user_id="1") == "rag"
+    assert calls == []
+    assert svc._decide_route(question="정수연 과제 뭐야?", user_id="1") == "rag"
+    assert calls == ["정수연 과제 뭐야?"]
+
+    stats = chatbot_route_service.get_stats(db)
+    assert stats["tiers"] == {"rule": 2, "model": 0, "llm": 1}
+    assert stats["routes"] == {"sql": 1, "rag": 2}
+    assert stats["local_ratio"] == round(2 / 3, 4)
+
+
+def test_route_local_classifier_can_be_disabled(db, monkeypatch):
+    # [chatbot] 로컬 분류기를 끄면 기존처럼 모든 관리자 질문을 LLM 라우터가 결정해야 한다.
+    from app.config import settings
+    from app.services import chatbot_route_service
+    from app.services.chatbot_service import ChatbotService
+
+    chatbot_route_service.reset_state()
+    monkeypatch.setattr(settings, "CHATBOT_ROUTE_LOCAL_ENABLED", False, raising=False)
+    monkeypatch.setattr(ChatbotService, "_decide_route_with_llm", lambda self, *, question, user_id: "rag")
+
+    assert ChatbotService(db)._decide_route(question="과제별 평균 진행률 알려줘", user_id="1") == "rag"
+    assert chatbot_route_service.get_stats(db)["tiers"]["llm"] == 1
+
+
+def test_route_model_learns_from_logged_llm_decisions(db, monkeypatch):
+    # [chatbot] LLM 라우팅 로그가 쌓이면 경량 모델이 학습되어 비슷한 질문은 LLM 없이 판단해야 한다.
+    from app.config import settings
+    from app.services import chatbot_route_service
+    from app.services.chatbot_service import ChatbotService
+
+    chatbot_route_service.reset_state()
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "CHATBOT_ROUTE_MODEL_MIN_SAMPLES", 6, raising=False)
+    monkeypatch.setattr(settings, "CHATBOT_ROUTE_MODEL_MIN_CONFIDENCE", 0.8, raising=False)
+    monkeypatch.setattr(ChatbotService, "_sql_schema_guide", lambda self: "")
+    labels = {
+        "김코치 담당 과제 뭐야": "sql",
+        "이영희 담당 과제 뭐야": "sql",
+        "박철수 담당 과제 뭐야": "sql",
+        "N2SQL 기술 소개해줘": "rag",
+        "RAG 기술 소개해줘": "rag",
+        "LLM 기술 소개해줘": "rag",
+    }
+    llm_calls = []
+
+    def _fake_invoke(self, *, purpose, user_id, prompt, system_prompt, stage):  # noqa: ANN001
+        question = prompt.rsplit("question: ", 1)[-1]
+        llm_calls.append(question)
+        return json.dumps({"route": labels.get(question, "rag"), "reason": "테스트"})
+
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", _fake_invoke)
+    svc = ChatbotService(db)
+    for question, route in labels.items():
+        assert svc._decide_route(question=question, user_id="1") == route
+    assert len(llm_calls) == 6
+
+    assert svc._decide_route(question="최민수 담당 과제 뭐야", user_id="1") == "sql"
+    assert svc._decide_route(question="Graph 기술 소개해줘", user_id="1") == "rag"
+    assert len(llm_calls) == 6
+    stats = chatbot_route_service.get_stats(db)
+    assert stats["tiers"]["model"] == 2
+    assert stats["logged_samples"] == 6
+    assert stats["model_trained_samples"] == 6
+
+
+def test_route_model_retrains_after_new_decisions_even_when_log_is_full(db, monkeypatch):
+    # [chatbot] 로그가 상한에 도달하거나 같은 질문이 덮어써도 새 결정이 쌓이면 재학습하고, 학습 후에는 로그 건수를 세지 않아야 한다.
+    from app.config import settings
+    from app.services import chatbot_route_service, rag_cache_service
+
+    chatbot_route_service.reset_state()
+    monkeypatch.setattr(settings, "CHATBOT_ROUTE_MODEL_MIN_SAMPLES", 2, raising=False)
+    monkeypatch.setattr(settings, "CHATBOT_ROUTE_MODEL_RETRAIN_EVERY", 2, raising=False)
+    monkeypatch.setattr(settings, "CHATBOT_ROUTE_LOG_MAX_ENTRIES", 2, raising=False)
+    chatbot_route_service.record_llm_decision(db, "김코치 담당 과제 뭐야", "sql")
+    chatbot_route_service.record_llm_decision(db, "RAG 기술 소개해줘", "rag")
+    first = chatbot_route_service._load_model(db)
+    assert first is not None
+
+    counted = []
+    original_count = rag_cache_service.count_entries
+    monkeypatch.setattr(
+        rag_cache_service, "count_entries", lambda *args, **kwargs: counted.append(1) or original_count(*args, **kwargs)
+    )
+    chatbot_route_service.record_llm_decision(db, "RAG 기술 소개해줘", "sql")
+    assert chatbot_route_service._load_model(db) is first
+    chatbot_route_service.record_llm_decision(db, "LLM 기술 소개해줘", "rag")
+    second = chatbot_route_service._load_model(db)
+    assert second is not first
+    assert rag_cache_service.count_entries(db, rag_cache_service.NAMESPACE_ROUTE_DECISION) == 2
+    assert chatbot_route_service._load_model(db) is second
+    assert len(counted) == 1
+
+
+def test_route_failed_llm_decision_is_not_logged(db, monkeypatch):
+    # [chatbot] LLM 응답을 파싱하지 못한 기본값(rag)은 학습 로그에 남기지 않아야 한다.
+    from app.config import settings
+    from app.models.rag_cache import RagCacheEntry
+    from app.services.chatbot_service import ChatbotService
+
+    monkeypatch.setattr(settings, "AI_FEATURES_ENABLED", True, raising=False)
+    monkeypatch.setattr(ChatbotService, "_sql_schema_guide", lambda self: "")
+    monkeypatch.setattr(ChatbotService, "_invoke_llm", lambda self, **kwargs: "모르겠습니다")
+
+    assert ChatbotService(db)._decide_route_with_llm(question="정수연 과제 뭐야?", user_id="1") == "rag"
+    assert db.query(RagCacheEntry).count() == 0
+
+
+def test_route_stats_endpoint_admin_only(client, seed_users):
+    # [chatbot] 관리자는 라우팅 단계별 결정 통계를 조회할 수 있어야 한다.
+    from app.services import chatbot_route_service
+
+    chatbot_route_service.reset_state()
+    chatbot_route_service.record_tier(chatbot_route_service.TIER_RULE, "sql")
+
+    denied = client.get("/api/chatbot/route/stats", headers=auth_headers(client, "coach001"))
+    assert denied.status_code == 403, denied.text
+
+    resp = client.get("/api/chatbot/route/stats", headers=auth_headers(client, "admin001"))
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["tiers"]["rule"] == 1
+    assert body["routes"]["sql"] == 1
+    assert body["local_ratio"] == 1.0
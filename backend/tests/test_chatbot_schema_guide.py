@@ -0,0 +1,71 @@
+"""[chatbot] SQL 스키마 가이드 프로세스 캐시와 스키마 보정 시 무효화 동작을 검증하는 테스트입니다."""
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
+
+
+def test_schema_guide_is_introspected_once_across_service_instances(db, monkeypatch):
+    # [chatbot] 요청마다 새 ChatbotService를 만들어도 스키마 introspection은 한 번만 수행해야 한다.
+    from app.services import chatbot_schema_service
+    from app.services.chatbot_service import ChatbotService
+
+    calls = []
+    original = chatbot_schema_service.build_schema_guide
+
+    def _counting_build(bind):  # noqa: ANN001
+        calls.append(bind)
+        return original(bind)
+
+    monkeypatch.setattr(chatbot_schema_service, "build_schema_guide", _counting_build)
+    chatbot_schema_service.invalidate()
+
+    first = ChatbotService(db)._sql_schema_guide()
+    second = ChatbotService(db)._sql_schema_guide()
+    assert first == second
+    assert "project_member(" in first
+    assert len(calls) == 1
+
+    route_prompt = ChatbotService(db)._route_prompt_template()
+    assert ChatbotService(db)._route_prompt_template() is route_prompt
+    assert first in route_prompt
+    assert "DB dialect: sqlite" in ChatbotService(db)._sql_generation_prompt_template()
+    assert len(calls) == 1
+
+
+def test_schema_guide_rebuilt_after_schema_sync_adds_column(tmp_path):
+    # [chatbot] 스키마 보정으로 컬럼이 추가되면 무효화 후 새 컬럼이 가이드에 반영되어야 한다.
+    from app.services import chatbot_schema_service
+    from app.utils.schema_sync import sync_missing_schema_objects
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    old_meta = MetaData()
+    Table("sample", old_meta, Column("sample_id", Integer, primary_key=True))
+    old_meta.create_all(engine)
+
+    guide = chatbot_schema_service.warm_up(engine)
+    assert "sample(sample_id:INTEGER[pk,notnull])" in guide
+
+    new_meta = MetaData()
+    Table("sample", new_meta, Column("sample_id", Integer, primary_key=True), Column("label", String(20)))
+    assert sync_missing_schema_objects(engine, new_meta) == 1
+    assert sync_missing_schema_objects(engine, new_meta) == 0
+
+    assert "label" not in chatbot_schema_service.get_schema_guide(engine)
+    chatbot_schema_service.invalidate(engine)
+    assert "label:VARCHAR(20)" in chatbot_schema_service.get_schema_guide(engine)
+    engine.dispose()
+
+
+def test_schema_guide_falls_back_without_caching_failures(monkeypatch):
+    # [chatbot] introspection 실패 시 기본 가이드를 반환하되 실패 결과는 캐시하지 않아야 한다.
+    from app.services import chatbot_schema_service
+
+    engine = create_engine("sqlite://")
+    chatbot_schema_service.invalidate(engine)
+
+    def _broken(bind):  # noqa: ANN001
+        raise RuntimeError("inspect failed")
+
+    monkeypatch.setattr(chatbot_schema_service, "build_schema_guide", _broken)
+    assert chatbot_schema_service.get_schema_guide(engine) == chatbot_schema_service.FALLBACK_SCHEMA_GUIDE
+    monkeypatch.undo()
+    assert chatbot_schema_service.get_schema_guide(engine).startswith("tables:")
+    assert chatbot_schema_service.get_schema_guide(None) == chatbot_schema_service.FALLBACK_SCHEMA_GUIDE
@@ -0,0 +1,55 @@
+"""[chatbot] SQL 답변의 읽기 전용 전용 연결 실행(제한 시간, EXPLAIN 점검, 행/바이트 상한)을 검증하는 테스트입니다."""
+import pytest
+from sqlalchemy.exc import OperationalError
+
+
+@pytest.fixture(autouse=True)
+def _reset_sql_engines():
+    from app.services import chatbot_sql_service
+
+    chatbot_sql_service.reset_state()
+    yield
+    chatbot_sql_service.reset_state()
+
+
+def test_sql_answer_runs_on_read_only_connection_with_row_and_byte_caps(db, seed_users):
+    # [chatbot] 요청 세션과 분리된 읽기 전용 연결에서 실행하고, 행/바이트 상한에 닿으면 잘라서 반환해야 한다.
+    from app.models.user import User
+    from app.services import chatbot_sql_service
+    from app.services.chatbot_service import ChatbotService
+
+    svc = ChatbotService(db)
+    rows = svc._execute_sql_query("SELECT emp_id, name FROM users ORDER BY user_id")
+    assert [row["emp_id"] for row in rows] == ["admin001", "coach001", "user001", "obs001"]
+
+    bind = db.get_bind()
+    capped = chatbot_sql_service.execute_read_only(bind, "SELECT emp_id FROM users ORDER BY user_id", max_rows=2)
+    assert [row["emp_id"] for row in capped.rows] == ["admin001", "coach001"]
+    assert capped.truncated is True
+    by_bytes = chatbot_sql_service.execute_read_only(bind, "SELECT emp_id FROM users ORDER BY user_id", max_bytes=40)
+    assert len(by_bytes.rows) == 1
+    assert by_bytes.truncated is True
+
+    # 안전성 검사를 우회한 쓰기 문장도 전용 연결(query_only)에서는 실패해야 한다.
+    with pytest.raises(OperationalError):
+        chatbot_sql_service.execute_read_only(bind, "DELETE FROM users")
+    assert db.query(User).count() == 4
+
+
+def test_sql_guard_rejects_large_full_scans_and_interrupts_slow_queries(db, seed_users):
+    # [chatbot] EXPLAIN에서 큰 테이블 전체 스캔은 실행 전에 거부하고, 제한 시간을 넘는 문장은 중단해야 한다.
+    from app.services import chatbot_sql_service
+
+    bind = db.get_bind()
+    with pytest.raises(chatbot_sql_service.SqlGuardError, match="users"):
+        chatbot_sql_service.execute_read_only(bind, "SELECT u.name FROM users u WHERE u.name = 'Coach'", max_scan_rows=3)
+    indexed = chatbot_sql_service.execute_read_only(
+        bind, "SELECT name FROM users WHERE user_id = 2", max_scan_rows=3
+    )
+    assert indexed.rows == [{"name": "Coach"}]
+    small = chatbot_sql_service.execute_read_only(bind, "SELECT u.name FROM users u WHERE u.name = 'Coach'", max_scan_rows=10)
+    assert small.rows == [{"name": "Coach"}]
+
+    endless = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT MAX(x) AS x FROM c"
+    with pytest.raises(OperationalError, match="interrupted"):
+        chatbot_sql_service.execute_read_only(bind, endless, timeout_seconds=0.2)
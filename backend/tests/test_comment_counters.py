@@ -0,0 +1,82 @@
+"""게시글/코칭노트 댓글 수·최근 댓글 시각 비정규화 컬럼 갱신과 재계산을 검증하는 테스트입니다."""
+
+from datetime import date
+
+from app.models.board import BoardPost, PostComment
+from app.models.coaching_note import CoachingComment, CoachingNote
+from app.models.project import Project
+from tests.conftest import auth_headers
+
+
+def test_post_comment_counter_follows_create_delete_and_repair(client, db, seed_users, seed_boards):
+    from app.services import comment_counter_service
+
+    headers = auth_headers(client, "coach001")
+    tip_board_id = seed_boards[2].board_id
+    post_id = client.post(
+        f"/api/boards/{tip_board_id}/posts",
+        json={"title": "댓글 수", "content": "본문", "is_notice": False},
+        headers=headers,
+    ).json()["post_id"]
+
+    comment_ids = []
+    for idx in range(2):
+        res = client.post(f"/api/boards/posts/{post_id}/comments", json={"content": f"댓글 {idx}"}, headers=headers)
+        assert res.status_code == 200, res.text
+        comment_ids.append(res.json()["comment_id"])
+    listed = client.get(f"/api/boards/{tip_board_id}/posts", headers=headers).json()[0]
+    assert listed["comment_count"] == 2
+    assert listed["last_comment_at"] is not None
+    assert client.get(f"/api/boards/posts/{post_id}", headers=headers).json()["comment_count"] == 2
+
+    for comment_id in comment_ids:
+        assert client.delete(f"/api/boards/comments/{comment_id}", headers=headers).status_code == 200
+    listed = client.get("/api/boards/posts", headers=headers).json()[0]
+    assert listed["comment_count"] == 0
+    assert listed["last_comment_at"] is None
+
+    # 서비스를 거치지 않고 넣은 댓글처럼 값이 어긋나면 복구 명령이 해당 행만 다시 계산한다.
+    db.add(PostComment(post_id=post_id, author_id=seed_users["admin"].user_id, content="직접 입력"))
+    db.commit()
+    assert comment_counter_service.recompute_all(db) == {"board_posts": 1, "coaching_notes": 0}
+    db.expire_all()
+    post = db.query(BoardPost).filter(BoardPost.post_id == post_id).first()
+    assert post.comment_count == 1
+    assert post.last_comment_at is not None
+    assert comment_counter_service.recompute_all(db) == {"board_posts": 0, "coaching_notes": 0}
+
+
+def test_note_comment_counter_counts_public_comments_only(client, db, seed_batch, seed_users):
+    from app.services import comment_counter_service
+
+    project = Project(batch_id=seed_batch.batch_id, project_name="댓글 과제", organization="Org", visibility="public")
+    db.add(project)
+    db.commit()
+    headers = auth_headers(client, "coach001")
+    note = client.post(
+        f"/api/projects/{project.project_id}/notes",
+        json={"coaching_date": str(date(2026, 3, 2)), "current_status": "진행"},
+        headers=headers,
+    )
+    assert note.status_code == 200, note.text
+    note_id = note.json()["note_id"]
+
+    public = client.post(f"/api/notes/{note_id}/comments", json={"content": "공개"}, headers=headers).json()
+    coach_only = client.post(
+        f"/api/notes/{note_id}/comments", json={"content": "코치 전용", "is_coach_only": True}, headers=headers
+    ).json()
+    notes = client.get(f"/api/projects/{project.project_id}/notes", headers=headers).json()
+    assert notes[0]["comment_count"] == 1
+    assert notes[0]["last_comment_at"] is not None
+
+    assert client.delete(f"/api/comments/{coach_only['comment_id']}", headers=headers).status_code == 200
+    assert client.get(f"/api/notes/{note_id}", headers=headers).json()["comment_count"] == 1
+    assert client.delete(f"/api/comments/{public['comment_id']}", headers=headers).status_code == 200
+    detail = client.get(f"/api/notes/{note_id}", headers=headers).json()
+    assert detail["comment_count"] == 0
+    assert detail["last_comment_at"] is None
+
+    db.add(CoachingComment(note_id=note_id, author_id=seed_users["coach"].user_id, content="직접", is_coach_only=True))
+    db.commit()
+    assert comment_counter_service.recompute_note_counters(db) == 0
+    assert db.query(CoachingNote).filter(CoachingNote.note_id == note_id).first().comment_count == 0
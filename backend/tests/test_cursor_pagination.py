@@ -0,0 +1,128 @@
+"""목록 API keyset(cursor) 페이지네이션(게시판/알림/통합 검색)을 검증하는 테스트입니다."""
+
+from datetime import datetime
+
+from app.models.board import BoardPost
+from app.models.notification import Notification
+from app.models.project import Project
+from tests.conftest import auth_headers
+
+SAME_SECOND = datetime(2026, 3, 2, 9, 30, 0)
+
+
+def _follow(client, url: str, headers, params: dict, cursor_of):
+    pages = []
+    after = None
+    while True:
+        query = dict(params)
+        if after:
+            query["after"] = after
+        res = client.get(url, params=query, headers=headers)
+        assert res.status_code == 200, res.text
+        pages.append(res)
+        after = cursor_of(res)
+        if not after:
+            return pages
+
+
+def test_board_post_cursor_pages_match_offset_pages_with_same_second_rows(client, db, seed_users, seed_boards):
+    tip_board_id = seed_boards[2].board_id
+    author_id = seed_users["admin"].user_id
+    # 같은 초에 만든 글(파이썬 값)과 서버 기본값 시각 글이 섞여 있어도 중복/누락이 없어야 한다.
+    for idx in range(5):
+        db.add(BoardPost(board_id=tip_board_id, author_id=author_id, title=f"동시 {idx}", content="본문", created_at=SAME_SECOND))
+    for idx in range(2):
+        db.add(BoardPost(board_id=tip_board_id, author_id=author_id, title=f"최근 {idx}", content="본문", is_notice=idx == 0))
+    db.commit()
+    headers = auth_headers(client, "coach001")
+
+    url = f"/api/boards/{tip_board_id}/posts"
+    offset_ids = [row["post_id"] for row in client.get(url, params={"limit": 50}, headers=headers).json()]
+    pages = _follow(client, url, headers, {"limit": 2}, lambda res: res.headers.get("X-Next-Cursor"))
+    cursor_ids = [row["post_id"] for page in pages for row in page.json()]
+    assert cursor_ids == offset_ids
+    assert len(set(cursor_ids)) == 7
+    # 전체 건수는 첫 페이지에서만 센다.
+    assert pages[0].headers["X-Total-Count"] == "7"
+    assert all("X-Total-Count" not in page.headers for page in pages[1:])
+
+    all_url = "/api/boards/posts"
+    offset_all = [row["post_id"] for row in client.get(all_url, params={"limit": 50}, headers=headers).json()]
+    pages = _follow(client, all_url, headers, {"limit": 3}, lambda res: res.headers.get("X-Next-Cursor"))
+    assert [row["post_id"] for page in pages for row in page.json()] == offset_all
+    # 공지가 먼저 오고, 공지 페이지 경계를 넘어도 일반 글이 이어진다.
+    assert pages[0].json()[0]["title"] == "최근 0"
+
+    # skip 방식은 그대로 동작하고, 잘못된 커서는 400으로 거부한다.
+    assert [row["post_id"] for row in client.get(url, params={"skip": 2, "limit": 2}, headers=headers).json()] == offset_ids[2:4]
+    assert client.get(url, params={"after": "잘못된"}, headers=headers).status_code == 400
+    other_kind = client.get(all_url, params={"limit": 1}, headers=headers).headers["X-Next-Cursor"]
+    assert client.get(url, params={"after": other_kind}, headers=headers).status_code == 400
+
+
+def test_all_posts_cursor_crosses_notice_pages_in_order(client, db, seed_users, seed_boards):
+    author_id = seed_users["admin"].user_id
+    for idx in range(5):
+        db.add(BoardPost(board_id=seed_boards[2].board_id, author_id=author_id, title=f"공지 {idx}", content="본문", is_notice=True))
+    for idx in range(4):
+        # is_notice가 NULL인 예전 글도 일반 글로 이어져야 한다.
+        is_notice = None if idx == 0 else False
+        db.add(BoardPost(board_id=seed_boards[2].board_id, author_id=author_id, title=f"일반 {idx}", content="본문", is_notice=is_notice))
+    db.commit()
+    headers = auth_headers(client, "coach001")
+
+    offset_all = [row["post_id"] for row in client.get("/api/boards/posts", params={"limit": 50}, headers=headers).json()]
+    pages = _follow(client, "/api/boards/posts", headers, {"limit": 2}, lambda res: res.headers.get("X-Next-Cursor"))
+    titles = [row["title"] for page in pages for row in page.json()]
+    assert [row["post_id"] for page in pages for row in page.json()] == offset_all
+    assert titles == [f"공지 {idx}" for idx in range(4, -1, -1)] + [f"일반 {idx}" for idx in range(3, -1, -1)]
+    # skip 방식도 같은 순서다.
+    skipped = client.get("/api/boards/posts", params={"skip": 4, "limit": 2}, headers=headers).json()
+    assert [row["title"] for row in skipped] == ["공지 0", "일반 3"]
+
+
+def test_notification_cursor_pages_cover_all_rows_once(client, db, seed_users):
+    user_id = seed_users["coach"].user_id
+    for idx in range(4):
+        db.add(Notification(user_id=user_id, noti_type="notice_posted", title=f"알림 {idx}", created_at=SAME_SECOND))
+    db.add(Notification(user_id=user_id, noti_type="notice_posted", title="최근 알림"))
+    db.commit()
+    headers = auth_headers(client, "coach001")
+
+    pages = _follow(client, "/api/notifications", headers, {"limit": 2}, lambda res: res.headers.get("X-Next-Cursor"))
+    titles = [row["title"] for page in pages for row in page.json()]
+    assert titles == ["최근 알림", "알림 3", "알림 2", "알림 1", "알림 0"]
+    assert len(client.get("/api/notifications", headers=headers).json()) == 5
+
+
+def test_workspace_search_cursor_merges_types_without_duplicates(client, db, seed_batch, seed_users, seed_boards):
+    author_id = seed_users["admin"].user_id
+    for idx in range(3):
+        db.add(Project(batch_id=seed_batch.batch_id, project_name=f"커서검색 과제 {idx}", organization="Org", created_at=SAME_SECOND))
+    for idx in range(3):
+        db.add(
+            BoardPost(
+                board_id=seed_boards[2].board_id,
+                author_id=author_id,
+                title=f"커서검색 글 {idx}",
+                content="본문",
+                created_at=SAME_SECOND,
+            )
+        )
+    db.commit()
+    headers = auth_headers(client, "admin001")
+
+    full = client.get("/api/search", params={"q": "커서검색", "limit": 50}, headers=headers).json()
+    pages = _follow(
+        client,
+        "/api/search",
+        headers,
+        {"q": "커서검색", "types": "project,board", "limit": 2},
+        lambda res: res.json()["next_cursor"],
+    )
+    keys = [(row["type"], row["id"]) for page in pages for row in page.json()["results"]]
+    assert keys == [(row["type"], row["id"]) for row in full["results"]]
+    assert len(set(keys)) == 6
+    # 같은 시각이면 과제가 게시글보다 먼저, 같은 유형은 최신 id 순이다.
+    assert [key[0] for key in keys] == ["project"] * 3 + ["board"] * 3
+    assert full["next_cursor"] is None
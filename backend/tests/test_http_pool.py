@@ -0,0 +1,60 @@
+"""[chatbot] RAG/LLM 공유 HTTP 연결 풀 동작을 검증합니다."""
+
+import asyncio
+import sys
+import types
+
+from app.config import settings
+from app.services import http_pool
+from app.services.ai_client import AIClient
+
+
+def test_http_pool_reuses_client_per_host_and_recreates_after_close(monkeypatch):
+    monkeypatch.setattr(settings, "HTTP_POOL_MAX_CONNECTIONS", 7, raising=False)
+    http_pool.close_all()
+
+    first = http_pool.get_client("http://rag.local:8000")
+    assert http_pool.get_client("http://rag.local:8000/retrieve-rrf") is first
+    assert http_pool.get_client("http://llm.local/v1") is not first
+    assert first._transport._pool._max_connections == 7
+
+    http_pool.close_all()
+    assert first.is_closed
+    assert http_pool.get_client("http://rag.local:8000") is not first
+    http_pool.close_all()
+
+
+def test_http_pool_async_clients_are_bound_to_event_loop():
+    async def _get():
+        client = http_pool.get_async_client("http://rag.local")
+        assert http_pool.get_async_client("http://rag.local/x") is client
+        await http_pool.aclose_all()
+        assert client.is_closed
+        return client
+
+    assert asyncio.run(_get()) is not None
+
+
+def test_ai_client_passes_shared_http_client_to_sdk():
+    captured = []
+
+    class _FakeSDKClient:
+        def __init__(self, **kwargs):
+            captured.append(kwargs)
+
+    fake_module = types.SimpleNamespace(OpenAI=_FakeSDKClient)
+    original = sys.modules.get("openai")
+    sys.modules["openai"] = fake_module
+    try:
+        AIClient(model_name="model1", user_id="1")._get_client()
+        AIClient(model_name="model1", user_id="2")._get_client()
+    finally:
+        if original is None:
+            del sys.modules["openai"]
+        else:
+            sys.modules["openai"] = original
+        http_pool.close_all()
+
+    assert len(captured) == 2
+    assert captured[0]["http_client"] is captured[1]["http_client"]
+    assert captured[0]["default_headers"]["User-ID"] == "1"
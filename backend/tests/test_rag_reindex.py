@@ -0,0 +1,117 @@
+"""[chatbot] RAG 일괄 재색인(배치 병렬 처리, 필터, 체크포인트 재개) 동작을 검증하는 테스트입니다."""
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from tests.conftest import TestingSession
+
+
+def _seed_posts(db, seed_users, seed_boards, seed_batch, count=7):
+    from app.models.board import BoardPost
+
+    post_ids = []
+    for idx in range(count):
+        post = BoardPost(
+            board_id=seed_boards[0].board_id,
+            author_id=seed_users["participant"].user_id,
+            title=f"공지 {idx}",
+            content="본문",
+            batch_id=seed_batch.batch_id if idx % 2 == 0 else None,
+        )
+        db.add(post)
+        db.flush()
+        post_ids.append(int(post.post_id))
+    db.commit()
+    return post_ids
+
+
+def test_reindex_processes_batches_in_parallel_with_filters(db, seed_users, seed_boards, seed_batch, monkeypatch):
+    # [chatbot] 필터에 맞는 문서만 배치 단위로 병렬 재색인하고 처리량을 보고해야 한다.
+    from app.services import rag_reindex_service
+    from app.services.chatbot_service import ChatbotService
+
+    post_ids = _seed_posts(db, seed_users, seed_boards, seed_batch)
+    synced = []
+    lock = threading.Lock()
+
+    def _fake_sync(self, *, post_id, user_id, event_type):  # noqa: ANN001
+        with lock:
+            synced.append((post_id, event_type))
+
+    monkeypatch.setattr(ChatbotService, "sync_board_post", _fake_sync)
+    filters = rag_reindex_service.ReindexFilters(source_types=["board_post"], batch_id=seed_batch.batch_id)
+    assert rag_reindex_service.count_source_ids(db, "board_post", filters) == 4
+    assert list(rag_reindex_service.iter_source_ids(db, "board_post", filters, batch_size=3, window_batches=1)) == [
+        post_ids[0::2][:3],
+        post_ids[0::2][3:],
+    ]
+
+    result = rag_reindex_service.reindex(
+        TestingSession,
+        filters=filters,
+        checkpoint=rag_reindex_service.ReindexCheckpoint(None, filters),
+        batch_size=1,
+        workers=2,
+    )
+    assert sorted(pid for pid, _ in synced) == post_ids[0::2]
+    assert {event for _, event in synced} == {"reindex"}
+    assert result["processed"] == 4
+    assert result["succeeded"] == 4
+    assert result["docs_per_sec"] > 0
+    assert result["sources"]["board_post"]["last_id"] == post_ids[-1]
+
+    future = rag_reindex_service.ReindexFilters(source_types=["board_post"], updated_since=datetime(2999, 1, 1))
+    assert rag_reindex_service.count_source_ids(db, "board_post", future) == 0
+
+
+def test_reindex_resumes_from_checkpoint_and_retries_failed(db, seed_users, seed_boards, seed_batch, monkeypatch, tmp_path):
+    # [chatbot] 중단되면 연속 완료된 배치까지 저장하고, 재실행 시 그 이후부터 이어서 처리해야 한다.
+    from app.services import rag_reindex_service
+    from app.services.chatbot_service import ChatbotService
+
+    post_ids = _seed_posts(db, seed_users, seed_boards, seed_batch)
+    checkpoint_path = str(tmp_path / "reindex.json")
+    filters = rag_reindex_service.ReindexFilters(source_types=["board_post"])
+    synced = []
+
+    def _crashing_sync(self, *, post_id, user_id, event_type):  # noqa: ANN001
+        if post_id == post_ids[1]:
+            raise RuntimeError("rag insert failed")
+        if post_id == post_ids[4]:
+            raise KeyboardInterrupt
+        synced.append(post_id)
+
+    monkeypatch.setattr(ChatbotService, "sync_board_post", _crashing_sync)
+    with pytest.raises(KeyboardInterrupt):
+        rag_reindex_service.reindex(
+            TestingSession,
+            filters=filters,
+            checkpoint=rag_reindex_service.ReindexCheckpoint(checkpoint_path, filters),
+            batch_size=2,
+            workers=1,
+        )
+    with open(checkpoint_path, encoding="utf-8") as fp:
+        saved = json.load(fp)
+    assert saved["sources"]["board_post"]["last_id"] == post_ids[3]
+    assert saved["sources"]["board_post"]["failed_ids"] == [post_ids[1]]
+
+    synced.clear()
+    monkeypatch.setattr(ChatbotService, "sync_board_post", lambda self, *, post_id, user_id, event_type: synced.append(post_id))
+    result = rag_reindex_service.reindex(
+        TestingSession,
+        filters=filters,
+        checkpoint=rag_reindex_service.ReindexCheckpoint(checkpoint_path, filters),
+        batch_size=2,
+        workers=2,
+        retry_failed=True,
+    )
+    assert sorted(synced) == sorted([post_ids[1]] + post_ids[4:])
+    assert result["failed"] == 0
+    assert result["sources"]["board_post"]["finished"] is True
+
+    with pytest.raises(ValueError):
+        rag_reindex_service.ReindexCheckpoint(
+            checkpoint_path, rag_reindex_service.ReindexFilters(source_types=["board_post"], batch_id=1)
+        )
@@ -28,6 +28,58 @@ async function apiFetch(path, options = {}) {
   return res.json();
 }
 
+// [chatbot] SSE(text/event-stream) 응답을 읽어 이벤트별 핸들러(onReferences/onToken/onDone)로 전달한다.
+async function apiStreamEvents(path, options = {}, handlers = {}) {
+  const token = Auth.getToken();
+  const headers = { 'Content-Type': 'application/json', Accept: 'text/event-stream', ...(options.headers || {}) };
+  if (token) headers['Authorization'] = `Bearer ${token}`;
+
+  const res = await fetch(API_BASE + path, { ...options, headers });
+  if (res.status === 401) {
+    Auth.clear();
+    Router.go('/login');
+    throw new Error('Unauthorized');
+  }
+  if (!res.ok || !res.body) {
+    const err = await res.json().catch(() => ({ detail: res.statusText }));
+    throw new Error(err.detail || 'API Error');
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result = null;
+  const dispatch = (block) => {
+    let event = 'message';
+    const dataLines = [];
+    block.split('\n').forEach((line) => {
+      if (line.startsWith('event:')) event = line.slice(6).trim();
+      else if (line.startsWith('data:')) dataLines.push(line.slice(5).trim());
+    });
+    if (!dataLines.length) return;
+    const data = JSON.parse(dataLines.join('\n'));
+    if (event === 'references') handlers.onReferences?.(data.references || []);
+    else if (event === 'token') handlers.onToken?.(data.text || '');
+    else if (event === 'done') {
+      result = data;
+      handlers.onDone?.(data);
+    } else if (event === 'error') throw new Error(data.detail || 'API Error');
+  };
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let idx = buffer.indexOf('\n\n');
+    while (idx >= 0) {
+      dispatch(buffer.slice(0, idx));
+      buffer = buffer.slice(idx + 2);
+      idx = buffer.indexOf('\n\n');
+    }
+  }
+  if (buffer.trim()) dispatch(buffer);
+  return result;
+}
+
 const API = {
   // Auth
   login: (emp_id) => apiFetch('/api/auth/login', { method: 'POST', body: JSON.stringify({ emp_id }) }),
@@ -350,6 +402,18 @@ const API = {
       }),
     }
   ),
+  // [chatbot] 챗봇 스트리밍 질문 API (SSE: references → token* → done | error)
+  askChatbotStream: (question, numResultDoc = 5, handlers = {}) => apiStreamEvents(
+    '/api/chatbot/ask/stream',
+    {
+      method: 'POST',
+      body: JSON.stringify({
+        question: String(question || ''),
+        num_result_doc: Number(numResultDoc) || 5,
+      }),
+    },
+    handlers
+  ),
 
   // Sessions (single)
   getSession: (id) => apiFetch(`/api/sessions/${id}`),
@@ -164,11 +164,40 @@ const ChatbotWidget = {
       }
     };
 
+    // [chatbot] 스트리밍 응답은 토큰이 도착하는 대로 말풍선에 이어 붙이고, 완료 시 참고 문서를 렌더링한다.
+    let answerEl = null;
+    let answerText = '';
+    let references = [];
+    const render = () => {
+      if (!answerEl) {
+        removeLoading();
+        answerEl = this._appendMessage('assistant', '');
+      }
+      if (!answerEl) return;
+      answerEl.innerHTML = `${Fmt.escape(answerText)}${this._renderReferences(references)}`;
+      const wrap = document.getElementById('chatbot-messages');
+      if (wrap) wrap.scrollTop = wrap.scrollHeight;
+    };
+
     try {
-      const result = await API.askChatbot(question, 5);
-      removeLoading();
-      const body = `${Fmt.escape(result?.answer || '답변을 생성하지 못했습니다.')}${this._renderReferences(result?.references)}`;
-      this._appendMessage('assistant', body);
+      try {
+        const result = await API.askChatbotStream(question, 5, {
+          onReferences: (refs) => { references = refs; },
+          onToken: (text) => {
+            answerText += text;
+            render();
+          },
+        });
+        answerText = result?.answer || answerText || '답변을 생성하지 못했습니다.';
+        render();
+      } catch (streamErr) {
+        // [chatbot] 토큰을 받기 전 스트리밍이 실패하면(프록시 미지원 등) 일반 질문 API로 재시도한다.
+        if (answerEl) throw streamErr;
+        const result = await API.askChatbot(question, 5);
+        answerText = result?.answer || '답변을 생성하지 못했습니다.';
+        references = result?.references || [];
+        render();
+      }
     } catch (err) {
       removeLoading();
       this._appendMessage('assistant', `오류: ${Fmt.escape(err.message || '챗봇 호출 실패')}`);